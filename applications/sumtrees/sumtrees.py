@@ -36,13 +36,6 @@ import socket
 import math
 import csv
 import json
-
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2.7
-    import Queue as queue
 import multiprocessing
 
 import dendropy
@@ -55,6 +48,9 @@ from dendropy.utility import messaging
 from dendropy.utility import timeprocessing
 from dendropy.utility import bitprocessing
 from dendropy.utility import textprocessing
+from dendropy.dataio import treeindex
+from dendropy.dataio import taxonscan
+from dendropy.datamodel import taxonmodel
 
 ##############################################################################
 ## Preamble
@@ -90,13 +86,14 @@ def _read_into_tree_array(
         error_message_func,
         log_frequency,
         debug_mode,
+        initial_tree_offset=0,
         ):
     if not log_frequency:
         tree_array.read_from_files(
             files=tree_sources,
             schema=schema,
             rooting=rooting,
-            tree_offset=tree_offset,
+            tree_offset=max(0, tree_offset - initial_tree_offset),
             store_tree_weights=use_tree_weights,
             preserve_underscores=preserve_underscores,
             ignore_unrecognized_keyword_arguments=True,
@@ -120,6 +117,8 @@ def _read_into_tree_array(
                     current_tree_offset=current_tree_offset,
                     coda=coda,
                     ), wrap=False)
+        # burn-in trees are skipped by the yielder without being built
+        num_skipped_trees = max(0, tree_offset - initial_tree_offset)
         tree_yielder = dendropy.Tree.yield_from_files(
                 tree_sources,
                 schema=schema,
@@ -127,6 +126,7 @@ def _read_into_tree_array(
                 store_tree_weights=use_tree_weights,
                 preserve_underscores=preserve_underscores,
                 rooting=rooting,
+                tree_offset=num_skipped_trees,
                 ignore_unrecognized_keyword_arguments=True,
                 )
         current_source_index = None
@@ -136,7 +136,7 @@ def _read_into_tree_array(
                 current_yielder_index = tree_yielder.current_file_index
                 if current_yielder_index != current_source_index:
                     current_source_index = current_yielder_index
-                    current_tree_offset = 0
+                    current_tree_offset = initial_tree_offset + num_skipped_trees
                     source_name = tree_yielder.current_file_name
                     if source_name is None:
                         source_name = "<stdin>"
@@ -157,6 +157,41 @@ def _read_into_tree_array(
             e.exception_tree_offset = current_tree_offset
             raise e
 
+def _is_partitionable_tree_source(tree_source, schema):
+    """
+    Returns |True| if the trees of ``tree_source`` can be split up into chunks
+    to be analyzed by separate worker processes.
+    """
+    return treeindex.is_indexable_source(tree_source, schema)
+
+def _partition_tree_source(tree_source, schema, tree_offset, num_chunks):
+    """
+    Splits up the trees of ``tree_source``, skipping the first ``tree_offset``
+    trees, into up to ``num_chunks`` chunks of approximately equal size. Returns
+    a list of (task name, (path, source parts), initial tree offset) tuples.
+    """
+    index = treeindex.TreeFileIndex.build(path=tree_source, schema=schema)
+    total_num_trees = len(index)
+    chunks = []
+    trees_before = 0
+    for collection_offset in range(index.num_collections):
+        num_trees = index.num_trees(collection_offset)
+        start = max(0, tree_offset - trees_before)
+        if start < num_trees:
+            collection_num_chunks = max(1, (num_chunks * (num_trees - start)) // max(1, total_num_trees - tree_offset))
+            for chunk_start, chunk_stop in index.partition(
+                    num_chunks=collection_num_chunks,
+                    collection_offset=collection_offset,
+                    start=start):
+                task_name = "{} [trees {}-{}]".format(tree_source, trees_before + chunk_start, trees_before + chunk_stop - 1)
+                parts = index.source_parts(
+                        collection_offset=collection_offset,
+                        start=chunk_start,
+                        stop=chunk_stop)
+                chunks.append((task_name, (tree_source, parts), trees_before + chunk_start))
+        trees_before += num_trees
+    return chunks
+
 class TreeAnalysisWorker(multiprocessing.Process):
 
     def __init__(self,
@@ -164,7 +199,9 @@ class TreeAnalysisWorker(multiprocessing.Process):
             work_queue,
             results_queue,
             source_schema,
-            taxon_labels,
+            taxon_accessions,
+            num_taxon_accessions,
+            taxon_namespace_key,
             tree_offset,
             is_source_trees_rooted,
             preserve_underscores,
@@ -182,9 +219,13 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.work_queue = work_queue
         self.results_queue = results_queue
         self.source_schema = source_schema
-        self.taxon_labels = taxon_labels
-        self.taxon_namespace = dendropy.TaxonNamespace(self.taxon_labels)
+        # the taxa are recreated at the same accession indexes as in the main
+        # process, so that split bitmasks are the same in all processes
+        self.taxon_namespace = taxonmodel.new_taxon_namespace_from_accessions(
+                taxon_accessions,
+                num_taxon_accessions)
         self.taxon_namespace.is_mutable = False
+        self.taxon_namespace_key = taxon_namespace_key
         self.tree_offset = tree_offset
         self.is_source_trees_rooted = is_source_trees_rooted
         self.rooting_interpretation = dendropy.get_rooting_argument(is_rooted=self.is_source_trees_rooted)
@@ -198,7 +239,12 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.messenger = messenger
         self.messenger_lock = messenger_lock
         self.kill_received = False
-        self.tree_array = dendropy.TreeArray(
+        self.num_tasks_received = 0
+        self.num_tasks_completed = 0
+        self.debug_mode = debug_mode
+
+    def new_tree_array(self):
+        tree_array = dendropy.TreeArray(
                 taxon_namespace=self.taxon_namespace,
                 is_rooted_trees=self.is_source_trees_rooted,
                 ignore_edge_lengths=self.ignore_edge_lengths,
@@ -207,10 +253,8 @@ class TreeAnalysisWorker(multiprocessing.Process):
                 ultrametricity_precision=self.ultrametricity_precision,
                 taxon_label_age_map=self.taxon_label_age_map,
                 )
-        self.tree_array.worker_name = self.name
-        self.num_tasks_received = 0
-        self.num_tasks_completed = 0
-        self.debug_mode = debug_mode
+        tree_array.worker_name = self.name
+        return tree_array
 
     def send_message(self, msg, level, wrap=True):
         if self.messenger is None:
@@ -234,16 +278,24 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.send_message(msg, messaging.ConsoleMessenger.ERROR_MESSAGING_LEVEL, wrap=wrap)
 
     def run(self):
+        # the results are passed back referencing the taxon namespace of the
+        # main process, which is shared under the same key, rather than
+        # bringing along a copy of the namespace of this process
+        taxonmodel.share_taxon_namespace(self.taxon_namespace, key=self.taxon_namespace_key)
         while not self.kill_received:
-            try:
-                tree_source = self.work_queue.get_nowait()
-            except queue.Empty:
+            # Blocking here (rather than giving up as soon as the queue appears
+            # to be empty) avoids finishing before the items put on the queue
+            # by the main process have become available; the end of the work
+            # is signaled by a |None| item.
+            work_item = self.work_queue.get()
+            if work_item is None:
                 break
+            task_index, task_name, tree_source, initial_tree_offset = work_item
             self.num_tasks_received += 1
             # self.send_info("Received task {task_count}: '{task_name}'".format(
             self.send_info("Received task: '{task_name}'".format(
                 task_count=self.num_tasks_received,
-                task_name=tree_source), wrap=False)
+                task_name=task_name), wrap=False)
             # self.tree_array.read_from_files(
             #     files=[tree_source],
             #     schema=self.source_schema,
@@ -253,9 +305,18 @@ class TreeAnalysisWorker(multiprocessing.Process):
             #     store_tree_weights=self.use_tree_weights,
             #     ignore_unrecognized_keyword_arguments=True,
             #     )
+            # Each task is analyzed into its own tree array, so that the
+            # results can be merged in the order of the sources, regardless of
+            # the order in which the tasks are completed.
+            tree_array = self.new_tree_array()
+            chunk_source = None
             try:
+                if isinstance(tree_source, tuple):
+                    # a chunk of a source file: (path, source parts)
+                    chunk_source = treeindex.open_source_parts(*tree_source)
+                    tree_source = chunk_source
                 _read_into_tree_array(
-                        tree_array=self.tree_array,
+                        tree_array=tree_array,
                         tree_sources=[tree_source],
                         schema=self.source_schema,
                         taxon_namespace=self.taxon_namespace,
@@ -267,22 +328,27 @@ class TreeAnalysisWorker(multiprocessing.Process):
                         error_message_func=self.send_error,
                         log_frequency=self.log_frequency,
                         debug_mode=self.debug_mode,
+                        initial_tree_offset=initial_tree_offset,
                         )
             except (KeyboardInterrupt, Exception) as e:
                 e.worker_name = self.name
                 self.results_queue.put(e)
                 break
+            finally:
+                if chunk_source is not None:
+                    chunk_source.close()
             if self.kill_received:
                 break
             self.num_tasks_completed += 1
+            self.results_queue.put((task_index, tree_array))
             # self.send_info("Completed task {task_count}: '{task_name}'".format(
             self.send_info("Completed task: '{task_name}'".format(
                 task_count=self.num_tasks_received,
-                task_name=tree_source), wrap=False)
+                task_name=task_name), wrap=False)
         if self.kill_received:
             self.send_warning("Terminating in response to kill request")
         else:
-            self.results_queue.put(self.tree_array)
+            self.results_queue.put((None, self.name))
 
 class TreeProcessor(object):
 
@@ -394,10 +460,17 @@ class TreeProcessor(object):
         # taxon definition
         if taxon_namespace is not None:
             self.info_message("Using taxon names provided by user")
+        elif schema in ("nexus/newick", "nexus", "newick"):
+            self.info_message("Pre-loading taxon names based on taxon definitions or first tree in each source")
+            taxon_namespace, _ = taxonscan.scan_taxon_namespace(
+                    files=tree_sources,
+                    schema=schema,
+                    preserve_underscores=preserve_underscores)
         else:
             tdfpath = tree_sources[0]
             self.info_message("Pre-loading taxon names based on first tree in source '{}'".format(tdfpath))
             taxon_namespace = self.discover_taxa(tdfpath, schema, preserve_underscores=preserve_underscores)
+        taxon_accessions, num_taxon_accessions = taxonmodel.get_taxon_accessions(taxon_namespace)
         taxon_labels = [t.label for t in taxon_namespace]
         self.info_message("{} taxa defined: {}".format( len(taxon_labels), taxon_labels))
         # max_idx_width = int(math.floor(math.log(len(taxon_labels), 10))) + 1
@@ -413,11 +486,26 @@ class TreeProcessor(object):
         # load up queue
         self.info_message("Creating work queue")
         work_queue = multiprocessing.Queue()
-        for f in tree_sources:
-            work_queue.put(f)
+        if len(tree_sources) == 1 and _is_partitionable_tree_source(tree_sources[0], schema):
+            # A single source is split up into chunks (several per process,
+            # to balance the load), each of which is analyzed as a separate
+            # task. The trees of the burn-in are skipped when partitioning.
+            self.info_message("Partitioning trees in source '{}'".format(tree_sources[0]))
+            tasks = _partition_tree_source(
+                    tree_source=tree_sources[0],
+                    schema=schema,
+                    tree_offset=tree_offset,
+                    num_chunks=self.num_processes * 4)
+        else:
+            tasks = [(f, f, 0) for f in tree_sources]
+        for task_index, (task_name, tree_source, initial_tree_offset) in enumerate(tasks):
+            work_queue.put((task_index, task_name, tree_source, initial_tree_offset))
+        for idx in range(self.num_processes):
+            work_queue.put(None)
 
         # launch processes
         self.info_message("Launching {} worker processes".format(self.num_processes))
+        taxon_namespace_key = taxonmodel.share_taxon_namespace(taxon_namespace)
         results_queue = multiprocessing.Queue()
         messenger_lock = multiprocessing.Lock()
         workers = []
@@ -428,7 +516,9 @@ class TreeProcessor(object):
                     work_queue=work_queue,
                     results_queue=results_queue,
                     source_schema=schema,
-                    taxon_labels=taxon_labels,
+                    taxon_accessions=taxon_accessions,
+                    num_taxon_accessions=num_taxon_accessions,
+                    taxon_namespace_key=taxon_namespace_key,
                     tree_offset=tree_offset,
                     is_source_trees_rooted=self.is_source_trees_rooted,
                     preserve_underscores=preserve_underscores,
@@ -454,20 +544,28 @@ class TreeProcessor(object):
                 use_tree_weights=self.use_tree_weights,
                 ultrametricity_precision=self.ultrametricity_precision,
                 )
+        task_results = {}
         try:
             while result_count < self.num_processes:
                 result = results_queue.get()
                 if isinstance(result, Exception) or isinstance(result, KeyboardInterrupt):
                     self.info_message("Exception raised in worker process '{}'".format(result.worker_name))
                     raise result
-                master_tree_array.update(result)
-                self.info_message("Recovered results from worker process '{}'".format(result.worker_name))
-                result_count += 1
+                task_index, task_result = result
+                if task_index is None:
+                    self.info_message("Recovered results from worker process '{}'".format(task_result))
+                    result_count += 1
+                else:
+                    task_results[task_index] = task_result
                 # self.info_message("Recovered results from {} of {} worker processes".format(result_count, self.num_processes))
         except (Exception, KeyboardInterrupt) as e:
             for worker in workers:
                 worker.terminate()
             raise
+        finally:
+            taxonmodel.unshare_taxon_namespace(taxon_namespace)
+        for task_index in sorted(task_results):
+            master_tree_array.update(task_results[task_index])
         self.info_message("All {} worker processes terminated".format(self.num_processes))
         return master_tree_array
 
@@ -1104,7 +1202,9 @@ def main():
             const="max",
             dest="multiprocess",
             help=(
-                 "Run in parallel mode using as many processors as available, up to the number of sources."
+                 "Run in parallel mode using as many processors as available, up to the number of sources"
+                 " (a single NEXUS or Newick source file is split up into chunks of trees that are"
+                 " analyzed in parallel)."
                  ))
     multiprocessing_options.add_argument("-m", "--multiprocessing",
             dest="multiprocess",
@@ -1458,13 +1558,18 @@ def main():
     ## Multiprocessing Setup
 
     num_cpus = multiprocessing.cpu_count()
-    if len(tree_sources) > 1 and args.multiprocess is not None:
+    is_partitionable_source = (len(tree_sources) == 1
+            and _is_partitionable_tree_source(tree_sources[0], args.input_format))
+    if (len(tree_sources) > 1 or is_partitionable_source) and args.multiprocess is not None:
         if (
                 args.multiprocess.lower() == "max"
                 or args.multiprocess == "#"
                 or args.multiprocess == "*"
             ):
-            num_processes = min(num_cpus, len(tree_sources))
+            if is_partitionable_source:
+                num_processes = num_cpus
+            else:
+                num_processes = min(num_cpus, len(tree_sources))
         # elif args.multiprocess == "@":
         #     num_processes = len(tree_sources)
         else:
@@ -1483,10 +1588,10 @@ def main():
             try:
                 mp = int(args.multiprocess)
                 if mp > 1:
-                    messenger.info("Number of valid sources is less than 2: forcing serial processing")
+                    messenger.info("Number of valid sources is less than 2 and source cannot be partitioned: forcing serial processing")
             except ValueError:
                 pass
-        if len(tree_sources) > 1 and num_cpus > 1:
+        if (len(tree_sources) > 1 or is_partitionable_source) and num_cpus > 1:
             messenger.info(
                     ("Multiple processors ({num_cpus}) available:"
                     " consider using the '-M' or '-m' options to"
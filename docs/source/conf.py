@@ -233,6 +233,7 @@ rst_prolog = """
 .. |Bipartition| replace:: :class:`~dendropy.datamodel.treemodel.Bipartition`
 .. |TreeList| replace:: :class:`~dendropy.datamodel.treecollectionmodel.TreeList`
 .. |TreeArray| replace:: :class:`~dendropy.datamodel.treecollectionmodel.TreeArray`
+.. |CompactTree| replace:: :class:`~dendropy.datamodel.compacttreemodel.CompactTree`
 .. |SplitDistribution| replace:: :class:`~dendropy.datamodel.treecollectionmodel.SplitDistribution`
 .. |SplitDistributionSummarizer| replace:: :class:`~dendropy.datamodel.treecollectionmodel.SplitDistributionSummarizer`
 .. |DataSet| replace:: :class:`~dendropy.datamodel.datasetmodel.DataSet`
@@ -254,6 +255,7 @@ rst_prolog = """
 .. |AnnotationSet| replace:: :class:`~dendropy.datamodel.basemodel.AnnotationSet`
 .. |Annotable| replace:: :class:`~dendropy.datamodel.basemodel.Annotable`
 .. |PhylogeneticDistanceMatrix| replace:: :class:`~dendropy.calculate.phylogeneticdistance.PhylogeneticDistanceMatrix`
+.. |MrcaIndex| replace:: :class:`~dendropy.calculate.phylogeneticdistance.MrcaIndex`
 .. |AsciiTreePlot| replace:: :class:`~dendropy.datamodel.treemodel.AsciiTreePlot`
 
 .. |get| replace::  :py:meth:`get`
@@ -245,7 +245,8 @@ class PhylogeneticDistanceMatrix(object):
         self._taxon_phylogenetic_distances = {}
         self._taxon_phylogenetic_path_steps = {}
         self._taxon_phylogenetic_path_edges = {}
-        self._mrca = {}
+        self._mrca_index = None
+        self._taxon_mrca_nodes = {}
 
     def compile_from_tree(self, tree):
         """
@@ -258,7 +259,6 @@ class PhylogeneticDistanceMatrix(object):
         # for i1, t1 in enumerate(self.taxon_namespace):
         #     self._taxon_phylogenetic_distances[t1] = {}
         #     self._taxon_phylogenetic_path_steps[t1] = {}
-        #     self._mrca[t1] = {}
         self._tree_length = 0.0
         self._num_edges = 0
         if self.is_store_path_edges:
@@ -297,11 +297,10 @@ class PhylogeneticDistanceMatrix(object):
                             if self.is_store_path_edges:
                                 self._taxon_phylogenetic_path_edges[desc1.taxon] = {}
                                 self._taxon_phylogenetic_path_edges[desc1.taxon][desc1.taxon] = []
-                            self._mrca[desc1.taxon] = {desc1.taxon: desc1}
+                            self._taxon_mrca_nodes[desc1.taxon] = desc1
                         for c2 in children[cidx1+1:]:
                             for desc2, (desc2_plen, desc2_psteps, desc2_pedges) in c2.desc_paths.items():
                                 self._mapped_taxa.add(desc2.taxon)
-                                self._mrca[desc1.taxon][desc2.taxon] = c1.parent_node
                                 # self._all_distinct_mapped_taxa_pairs.add( tuple([desc1.taxon, desc2.taxon]) )
                                 self._all_distinct_mapped_taxa_pairs.add( frozenset([desc1.taxon, desc2.taxon]) )
                                 if c2.edge_length is None:
@@ -316,6 +315,7 @@ class PhylogeneticDistanceMatrix(object):
                                     pedges = tuple(node.desc_paths[desc1][2] + [c2.edge] + desc2_pedges[::-1])
                                     self._taxon_phylogenetic_path_edges[desc1.taxon][desc2.taxon] = pedges
                     del(c1.desc_paths)
+        self._mrca_index = MrcaIndex.from_tree(tree)
         self._mirror_lookups()
         # assert self._tree_length == tree.length()
 
@@ -333,7 +333,6 @@ class PhylogeneticDistanceMatrix(object):
         for ddata in (
                 self._taxon_phylogenetic_distances,
                 self._taxon_phylogenetic_path_steps,
-                self._mrca,
                 ):
             for taxon1 in ddata:
                 for taxon2 in ddata[taxon1]:
@@ -357,7 +356,7 @@ class PhylogeneticDistanceMatrix(object):
                 and (self._taxon_phylogenetic_distances == o._taxon_phylogenetic_distances)
                 and (self._taxon_phylogenetic_path_steps == o._taxon_phylogenetic_path_steps)
                 and (self._taxon_phylogenetic_path_edges == o._taxon_phylogenetic_path_edges)
-                and (self._mrca == o._mrca)
+                and (self._taxon_mrca_nodes == o._taxon_mrca_nodes)
                 and (self._tree_length == o._tree_length)
                 and (self._num_edges == o._num_edges)
                 )
@@ -382,11 +381,13 @@ class PhylogeneticDistanceMatrix(object):
         o._all_distinct_mapped_taxa_pairs = set(self._all_distinct_mapped_taxa_pairs)
         o._tree_length = self._tree_length
         o._num_edges = self._num_edges
+        # not modified once compiled
+        o._mrca_index = self._mrca_index
+        o._taxon_mrca_nodes = dict(self._taxon_mrca_nodes)
         for src, dest in (
                 (self._taxon_phylogenetic_distances, o._taxon_phylogenetic_distances,),
                 (self._taxon_phylogenetic_path_steps, o._taxon_phylogenetic_path_steps,),
                 (self._taxon_phylogenetic_path_edges, o._taxon_phylogenetic_path_edges,),
-                (self._mrca, o._mrca,),
                 ):
             for t1 in src:
                 dest[t1] = {}
@@ -398,7 +399,7 @@ class PhylogeneticDistanceMatrix(object):
         """
         Returns MRCA of two taxon objects.
         """
-        return self._mrca[taxon1][taxon2]
+        return self._mrca_index.mrca(self._taxon_mrca_nodes[taxon1], self._taxon_mrca_nodes[taxon2])
 
     def distance(self,
             taxon1,
@@ -875,7 +876,8 @@ class PhylogeneticDistanceMatrix(object):
         if is_shuffle_phylogenetic_path_steps:
             to_shuffle.append("_taxon_phylogenetic_path_steps")
         if is_shuffle_mrca:
-            to_shuffle.append("_mrca")
+            self._taxon_mrca_nodes = dict(
+                    (current_to_shuffled_taxon_map[t], nd) for t, nd in self._taxon_mrca_nodes.items())
         for attr_name in to_shuffle:
             src = getattr(self, attr_name)
             dest = {}
@@ -1413,7 +1415,7 @@ class NodeDistanceMatrix(object):
         self._num_edges = None
         self._node_phylogenetic_distances = {}
         self._node_phylogenetic_path_steps = {}
-        self._mrca = {}
+        self._mrca_index = None
 
     def compile_from_tree(self, tree):
         self.clear()
@@ -1428,7 +1430,6 @@ class NodeDistanceMatrix(object):
             if node1 not in self._node_phylogenetic_distances:
                 self._node_phylogenetic_distances[node1] = {node1: 0.0}
                 self._node_phylogenetic_path_steps[node1] = {node1: 0}
-                self._mrca[node1] = {node1: node1}
             children = node1.child_nodes()
             for ch_idx, ch1 in enumerate(children):
                 ch1_elen = ch1.edge.length if ch1.edge.length is not None else 0.0
@@ -1445,8 +1446,6 @@ class NodeDistanceMatrix(object):
                 self._node_phylogenetic_path_steps[node1][ch1] = 1
                 self._node_phylogenetic_path_steps[ch1][node1] = 1
                 for ch2 in children[ch_idx+1:]:
-                    self._mrca[ch1][ch2] = node1
-                    self._mrca[ch2][ch1] = node1
                     ch2_elen = ch2.edge.length if ch2.edge.length is not None else 0.0
                     d = ch1_elen + ch2_elen
                     self._node_phylogenetic_distances[ch1][ch2] = d
@@ -1474,13 +1473,7 @@ class NodeDistanceMatrix(object):
                     if snd1 not in self._node_phylogenetic_distances[snd2]:
                         self._node_phylogenetic_distances[snd2][snd1] = self._node_phylogenetic_distances[node1][snd1] + self._node_phylogenetic_distances[node1][snd2]
                         self._node_phylogenetic_path_steps[snd2][snd1] = self._node_phylogenetic_path_steps[node1][snd1] + self._node_phylogenetic_path_steps[node1][snd2]
-                    if snd1 not in self._mrca:
-                        self._mrca[snd1] = {}
-                    if snd2 not in self._mrca:
-                        self._mrca[snd2] = {}
-                    if snd2 not in self._mrca[snd1]:
-                        self._mrca[snd1][snd2] = node1
-                        self._mrca[snd2][snd1] = node1
+        self._mrca_index = MrcaIndex.from_tree(tree)
 
     def __eq__(self, o):
         if self.node_namespace is not o.node_namespace:
@@ -1488,7 +1481,7 @@ class NodeDistanceMatrix(object):
         return (True
                 and (self._node_phylogenetic_distances == o._node_phylogenetic_distances)
                 and (self._node_phylogenetic_path_steps == o._node_phylogenetic_path_steps)
-                and (self._mrca == o._mrca)
+                and (self._mrca_index.seed_node is o._mrca_index.seed_node)
                 and (self._tree_length == o._tree_length)
                 and (self._num_edges == o._num_edges)
                 )
@@ -1510,10 +1503,11 @@ class NodeDistanceMatrix(object):
         o = self.__class__()
         o._tree_length = self._tree_length
         o._num_edges = self._num_edges
+        # not modified once compiled
+        o._mrca_index = self._mrca_index
         for src, dest in (
                 (self._node_phylogenetic_distances, o._node_phylogenetic_distances,),
                 (self._node_phylogenetic_path_steps, o._node_phylogenetic_path_steps,),
-                (self._mrca, o._mrca,),
                 ):
             for t1 in src:
                 dest[t1] = {}
@@ -1525,7 +1519,7 @@ class NodeDistanceMatrix(object):
         """
         Returns MRCA of two node objects.
         """
-        return self._mrca[node1][node2]
+        return self._mrca_index.mrca(node1, node2)
 
     def distance(self,
             node1,
@@ -1599,3 +1593,230 @@ class NodeDistanceMatrix(object):
                 normalization_factor = 1.0
         return dmatrix, normalization_factor
 
+
+class MrcaIndex(object):
+    """
+    Answers queries of the most-recent common ancestors (MRCA's) of nodes on
+    a tree, and of the distances between them, in constant time.
+
+    The index is built in time and space linear in the number of nodes, and is
+    a snapshot of the tree when it is built: it does not update if the tree
+    changes.
+
+    The nodes are indexed by their position in the pre-order sequence of the
+    tree. The MRCA of two distinct nodes is then the parent of the node
+    nearest to the root that is in between them in this sequence (not
+    counting the first one), which is found with range minimum queries. These
+    are split over blocks of a fixed number of nodes, with the minima of runs
+    of whole blocks precomputed for all run lengths that are powers of two.
+    """
+
+    # Number of nodes in each block for range minimum queries.
+    _block_size = 32
+
+    @classmethod
+    def from_tree(cls, tree):
+        mrca_index = cls()
+        mrca_index.compile_from_tree(tree=tree)
+        return mrca_index
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._nodes = []
+        self._node_positions = {}
+        self._parent_positions = []
+        self._depths = []
+        self._depth_keys = []
+        self._block_minima = []
+        self._taxon_position_ranges = {}
+        self._root_distances = []
+
+    def compile_from_tree(self, tree):
+        self.clear()
+        nodes = self._nodes
+        node_positions = self._node_positions
+        parent_positions = self._parent_positions
+        depths = self._depths
+        root_distances = self._root_distances
+        taxon_position_ranges = self._taxon_position_ranges
+        for position, node in enumerate(tree.preorder_node_iter()):
+            nodes.append(node)
+            node_positions[node] = position
+            if position == 0:
+                parent_positions.append(-1)
+                depths.append(0)
+                root_distances.append(0.0)
+            else:
+                parent_position = node_positions[node._parent_node]
+                parent_positions.append(parent_position)
+                depths.append(depths[parent_position] + 1)
+                edge_length = node.edge.length
+                if edge_length is None:
+                    edge_length = 0.0
+                root_distances.append(root_distances[parent_position] + edge_length)
+            if node.taxon is not None and not node._child_nodes:
+                try:
+                    first_position, last_position = taxon_position_ranges[node.taxon]
+                except KeyError:
+                    first_position = position
+                taxon_position_ranges[node.taxon] = (first_position, position)
+        # depth first, position to break ties (and to recover the node)
+        num_nodes = len(nodes)
+        self._depth_keys = [depth * num_nodes + position for position, depth in enumerate(depths)]
+        keys = self._depth_keys
+        block_size = self._block_size
+        level_minima = [min(keys[i:i+block_size]) for i in range(0, num_nodes, block_size)]
+        self._block_minima = [level_minima]
+        num_blocks = len(level_minima)
+        span = 1
+        while span * 2 <= num_blocks:
+            level_minima = [x if x < y else y for x, y in zip(level_minima, level_minima[span:])]
+            self._block_minima.append(level_minima)
+            span *= 2
+
+    def _min_depth_key(self, start, stop):
+        # minimum depth key of the nodes at positions ``start`` to ``stop``,
+        # inclusive
+        keys = self._depth_keys
+        block_size = self._block_size
+        start_block = start // block_size
+        stop_block = stop // block_size
+        if start_block == stop_block:
+            return min(keys[start:stop+1])
+        key = min(min(keys[start:(start_block+1)*block_size]), min(keys[stop_block*block_size:stop+1]))
+        num_blocks = stop_block - start_block - 1
+        if num_blocks:
+            level = num_blocks.bit_length() - 1
+            level_minima = self._block_minima[level]
+            key = min(key, level_minima[start_block+1], level_minima[stop_block-(1<<level)])
+        return key
+
+    def _mrca_position(self, position1, position2):
+        if position1 == position2:
+            return position1
+        if position1 > position2:
+            position1, position2 = position2, position1
+        key = self._min_depth_key(position1 + 1, position2)
+        return self._parent_positions[key % len(self._nodes)]
+
+    def mrca(self, *nodes, **kwargs):
+        """
+        Returns the MRCA of the nodes given as arguments or, if they are given
+        by the keyword argument ``taxa`` instead, of the leaves associated
+        with these |Taxon| objects.
+
+        Parameters
+        ----------
+        \*nodes : |Node| objects
+            Nodes on the tree.
+        taxa : collections.Iterable [|Taxon|]
+            |Taxon| objects associated with leaves of the tree.
+
+        Returns
+        -------
+        |Node| or |None|
+            The MRCA of the nodes or of the leaves associated with the
+            |Taxon| objects, or |None| if any of the |Taxon| objects is not
+            associated with a leaf of the tree. A |KeyError| is raised if any
+            of the nodes is not on the tree.
+        """
+        if "taxa" in kwargs:
+            if nodes:
+                raise TypeError("Cannot specify both nodes and 'taxa'")
+            first_position = None
+            for taxon in kwargs.pop("taxa"):
+                try:
+                    taxon_first_position, taxon_last_position = self._taxon_position_ranges[taxon]
+                except KeyError:
+                    return None
+                if first_position is None:
+                    first_position = taxon_first_position
+                    last_position = taxon_last_position
+                else:
+                    first_position = min(first_position, taxon_first_position)
+                    last_position = max(last_position, taxon_last_position)
+        else:
+            first_position = None
+            for node in nodes:
+                position = self._node_positions[node]
+                if first_position is None:
+                    first_position = last_position = position
+                elif position < first_position:
+                    first_position = position
+                elif position > last_position:
+                    last_position = position
+        if kwargs:
+            raise TypeError("Unsupported keyword arguments: {}".format(kwargs))
+        if first_position is None:
+            raise ValueError("No nodes or taxa specified")
+        # the MRCA of the first and the last nodes in pre-order is the MRCA
+        # of all of the nodes
+        return self._nodes[self._mrca_position(first_position, last_position)]
+
+    def _is_indexed_taxa(self, taxa):
+        # whether all of ``taxa`` are indexed and still associated with the
+        # first and last leaves with which they are indexed
+        nodes = self._nodes
+        for taxon in taxa:
+            try:
+                first_position, last_position = self._taxon_position_ranges[taxon]
+            except KeyError:
+                return False
+            if nodes[first_position].taxon is not taxon or nodes[last_position].taxon is not taxon:
+                return False
+        return True
+
+    def depth(self, node):
+        """
+        Returns the number of edges between the root or seed node and ``node``.
+        """
+        return self._depths[self._node_positions[node]]
+
+    def distance_from_root(self, node):
+        """
+        Returns the sum of the lengths of the edges between the root or seed
+        node and ``node``, with edges without lengths taken to be of length 0.
+        """
+        return self._root_distances[self._node_positions[node]]
+
+    def distance(self,
+            node1,
+            node2,
+            is_weighted_edge_distances=True):
+        """
+        Returns distance between node1 and node2.
+        """
+        if is_weighted_edge_distances:
+            return self.patristic_distance(node1, node2)
+        else:
+            return self.path_edge_count(node1, node2)
+
+    def patristic_distance(self, node1, node2):
+        """
+        Returns patristic distance between two node objects.
+        """
+        position1 = self._node_positions[node1]
+        position2 = self._node_positions[node2]
+        root_distances = self._root_distances
+        return (root_distances[position1]
+                + root_distances[position2]
+                - 2 * root_distances[self._mrca_position(position1, position2)])
+
+    def path_edge_count(self, node1, node2):
+        """
+        Returns the number of edges between two node objects.
+        """
+        position1 = self._node_positions[node1]
+        position2 = self._node_positions[node2]
+        depths = self._depths
+        return (depths[position1]
+                + depths[position2]
+                - 2 * depths[self._mrca_position(position1, position2)])
+
+    def _get_seed_node(self):
+        if self._nodes:
+            return self._nodes[0]
+        return None
+    seed_node = property(_get_seed_node)
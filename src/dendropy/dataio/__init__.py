@@ -32,24 +32,29 @@ from dendropy.dataio import nexmlyielder
 from dendropy.dataio import phylipreader
 from dendropy.dataio import phylipwriter
 from dendropy.dataio import multiphylipreader
+from dendropy.dataio import dendropybinaryreader
+from dendropy.dataio import dendropybinarywriter
+from dendropy.dataio import dendropybinaryyielder
+from dendropy.dataio import treeindex
 from dendropy.utility import container
 
 _IOServices = collections.namedtuple(
         "_IOServices",
-        ["reader", "writer", "tree_yielder"]
+        ["reader", "writer", "tree_yielder", "char_sequence_yielder"]
         )
 
 _IO_SERVICE_REGISTRY = container.CaseInsensitiveDict()
-_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder)
-_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None)
-_IO_SERVICE_REGISTRY["multiphylip"] = _IOServices(multiphylipreader.MultiPhylipReader, None, None)
+_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder, nexmlyielder.NexmlCharacterDataSequenceYielder)
+_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None, None)
+_IO_SERVICE_REGISTRY["multiphylip"] = _IOServices(multiphylipreader.MultiPhylipReader, None, None, None)
+_IO_SERVICE_REGISTRY["dendropy-binary"] = _IOServices(dendropybinaryreader.DendroPyBinaryReader, dendropybinarywriter.DendroPyBinaryWriter, dendropybinaryyielder.DendroPyBinaryTreeDataYielder, None)
 
 def get_reader(schema, **kwargs):
     try:
@@ -79,6 +84,20 @@ def get_tree_yielder(
         taxon_namespace,
         tree_type,
         **kwargs):
+    if kwargs.pop("follow", False):
+        tree_offset = kwargs.pop("tree_offset", 0)
+        def yielder_factory(files, schema):
+            return get_tree_yielder(
+                    files=files,
+                    schema=schema,
+                    taxon_namespace=taxon_namespace,
+                    tree_type=tree_type,
+                    **kwargs)
+        return treeindex.FollowingTreeDataYielder(
+                files=files,
+                schema=schema,
+                yielder_factory=yielder_factory,
+                tree_offset=tree_offset)
     try:
         yielder_type =_IO_SERVICE_REGISTRY[schema].tree_yielder
         if yielder_type is None:
@@ -92,9 +111,26 @@ def get_tree_yielder(
     except KeyError:
         raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
 
-def register_service(schema, reader=None, writer=None, tree_yielder=None):
+def get_char_sequence_yielder(
+        files,
+        schema,
+        taxon_namespace,
+        **kwargs):
+    try:
+        yielder_type =_IO_SERVICE_REGISTRY[schema].char_sequence_yielder
+        if yielder_type is None:
+            raise KeyError
+        yielder = yielder_type(
+                files=files,
+                taxon_namespace=taxon_namespace,
+                **kwargs)
+        return yielder
+    except KeyError:
+        raise NotImplementedError("'{}' is not a supported character sequence yielding schema".format(schema))
+
+def register_service(schema, reader=None, writer=None, tree_yielder=None, char_sequence_yielder=None):
     global _IO_SERVICE_REGISTRY
-    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder)
+    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder, char_sequence_yielder)
 
 def register_reader(schema, reader):
     global _IO_SERVICE_REGISTRY
@@ -103,7 +139,8 @@ def register_reader(schema, reader):
         register_service(schema=schema,
                 reader=reader,
                 writer=current.writer,
-                tree_yielder=current.tree_yielder)
+                tree_yielder=current.tree_yielder,
+                char_sequence_yielder=current.char_sequence_yielder)
     except KeyError:
         register_service(schema=schema, reader=reader)
 
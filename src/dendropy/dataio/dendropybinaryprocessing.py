@@ -0,0 +1,353 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Encoding and decoding of the "dendropy-binary" format, a compact binary
+serialization of a collection of trees.
+
+The layout of a file is as follows (all numbers are little-endian)::
+
+    magic number        8 bytes: b"DPYBTREE"
+    format version      uint32
+    header size         uint32
+    header              UTF-8 encoded JSON object: taxon labels, label and
+                        annotations of the collection
+    number of trees     uint64
+    offset table        uint64 x (number of trees + 1): offset of the record
+                        of each tree, relative to the end of the offset
+                        table, followed by the offset of the end of the last
+                        record
+    tree records
+
+and that of the record of a tree with ``n`` nodes is::
+
+    number of nodes     uint32
+    rooting state       uint8 (0: unspecified, 1: unrooted, 2: rooted)
+    flags               uint8 (``HAS_EDGE_LENGTHS``, ``HAS_NODE_AGES``,
+                        ``HAS_METADATA``)
+    reserved            uint16
+    parent indexes      int32 x n: nodes are given in preorder, with -1 for
+                        the seed node
+    taxon indexes       int32 x n: index into the taxon labels of the header,
+                        or -1 if the node has no taxon
+    edge lengths        float64 x n, NaN if not set (if ``HAS_EDGE_LENGTHS``)
+    node ages           float64 x n, NaN if not set (if ``HAS_NODE_AGES``)
+    metadata size       uint32 (if ``HAS_METADATA``)
+    metadata            UTF-8 encoded JSON object: tree label and weight, node
+                        and edge labels and annotations (if ``HAS_METADATA``)
+
+Only simple name-value annotations are stored; values that cannot be
+represented in JSON are stored as strings.
+"""
+
+import io
+import json
+import math
+import struct
+from dendropy.datamodel import basemodel
+
+MAGIC_NUMBER = b"DPYBTREE"
+FORMAT_VERSION = 1
+
+HAS_EDGE_LENGTHS = 1
+HAS_NODE_AGES = 2
+HAS_METADATA = 4
+
+_PREAMBLE = struct.Struct("<8sII")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+_TREE_RECORD_HEADER = struct.Struct("<IBBH")
+
+_ROOTING_STATES = {None: 0, False: 1, True: 2}
+_ROOTING_VALUES = (None, False, True)
+
+NAN = float("nan")
+
+class DendroPyBinaryFormatError(Exception):
+    pass
+
+def get_binary_stream(stream):
+    """
+    Returns the binary stream underlying ``stream`` if it is a text stream
+    (e.g., a file opened in text mode), or ``stream`` itself otherwise.
+    """
+    stream = getattr(stream, "buffer", stream)
+    if isinstance(stream, io.TextIOBase):
+        raise TypeError("The 'dendropy-binary' format requires a binary stream, not a text stream")
+    return stream
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise DendroPyBinaryFormatError("Unexpected end of data: expecting {} bytes but only found {}".format(size, len(data)))
+    return data
+
+def _encode_json(obj):
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+def _decode_json(data):
+    return json.loads(data.decode("utf-8"))
+
+def _encode_annotations(annotated):
+    if not annotated.has_annotations:
+        return None
+    return [[a.name, a.value] for a in annotated.annotations if not a.is_attribute]
+
+def _create_annotations(annotations):
+    return [basemodel.Annotation(name=name, value=value) for name, value in annotations]
+
+def _decode_annotations(annotated, annotations):
+    # only built when first accessed
+    annotated.defer_annotations(_create_annotations, annotations)
+
+###############################################################################
+## Header
+
+def encode_header(taxon_namespace, tree_list, suppress_annotations=False):
+    """
+    Returns the header for the trees of ``tree_list``, referencing the taxa
+    of ``taxon_namespace``.
+    """
+    header = {
+        "taxon_namespace_label": taxon_namespace.label,
+        "taxon_labels": [taxon.label for taxon in taxon_namespace],
+        "label": tree_list.label,
+    }
+    if not suppress_annotations:
+        annotations = _encode_annotations(tree_list)
+        if annotations:
+            header["annotations"] = annotations
+    return header
+
+def decode_header_taxa(header, taxon_namespace):
+    """
+    Returns the list of |Taxon| objects in ``taxon_namespace`` corresponding
+    to the taxon labels of ``header``, creating them if necessary. Taxa with
+    the same label are matched by position: the n-th taxon of the header with
+    a particular label corresponds to the n-th taxon of ``taxon_namespace``
+    with that label, so that distinct taxa are not merged.
+    """
+    taxa = []
+    label_counts = {}
+    for label in header["taxon_labels"]:
+        if label is None:
+            taxa.append(taxon_namespace.new_taxon(label=None))
+            continue
+        if taxon_namespace.is_case_sensitive:
+            key = label
+        else:
+            key = label.lower()
+        count = label_counts.get(key, 0)
+        label_counts[key] = count + 1
+        matches = taxon_namespace.findall(label=label)
+        if count < len(matches):
+            taxa.append(matches[count])
+        else:
+            taxa.append(taxon_namespace.new_taxon(label=label))
+    return taxa
+
+def decode_header_annotations(header, annotated):
+    if "annotations" in header:
+        _decode_annotations(annotated, header["annotations"])
+
+def write_data(stream, header, tree_records):
+    """
+    Writes the preamble, header, and offset table followed by the encoded
+    ``tree_records`` to ``stream``.
+    """
+    header_data = _encode_json(header)
+    stream.write(_PREAMBLE.pack(MAGIC_NUMBER, FORMAT_VERSION, len(header_data)))
+    stream.write(header_data)
+    offsets = [0]
+    for record in tree_records:
+        offsets.append(offsets[-1] + len(record))
+    stream.write(_UINT64.pack(len(tree_records)))
+    stream.write(struct.pack("<{}Q".format(len(offsets)), *offsets))
+    for record in tree_records:
+        stream.write(record)
+
+def read_header(stream):
+    """
+    Reads the preamble, header, and offset table from ``stream``. Returns the
+    header, the offsets of the tree records, and the position of the start of
+    the tree records in ``stream`` (or |None| if ``stream`` is not
+    seekable).
+    """
+    magic_number, version, header_size = _PREAMBLE.unpack(_read_exactly(stream, _PREAMBLE.size))
+    if magic_number != MAGIC_NUMBER:
+        raise DendroPyBinaryFormatError("Not a 'dendropy-binary' data source")
+    if version > FORMAT_VERSION:
+        raise DendroPyBinaryFormatError("Unsupported 'dendropy-binary' format version: {}".format(version))
+    header = _decode_json(_read_exactly(stream, header_size))
+    num_trees, = _UINT64.unpack(_read_exactly(stream, _UINT64.size))
+    offsets = struct.unpack("<{}Q".format(num_trees + 1),
+            _read_exactly(stream, _UINT64.size * (num_trees + 1)))
+    try:
+        records_start = stream.tell() if stream.seekable() else None
+    except (AttributeError, IOError, OSError):
+        records_start = None
+    return header, offsets, records_start
+
+###############################################################################
+## Tree Records
+
+def iter_tree_records(stream, offsets, records_start, start=0, stop=None):
+    """
+    Yields the encoded records of the trees ``start`` (inclusive) to ``stop``
+    (exclusive) from ``stream``, positioned at the end of the offset table. If
+    ``records_start`` is not |None|, then the stream is positioned directly at
+    the first tree record requested; otherwise, the records of the preceding
+    trees are read and discarded.
+    """
+    num_trees = len(offsets) - 1
+    if stop is None or stop > num_trees:
+        stop = num_trees
+    if start >= stop:
+        return
+    if records_start is not None:
+        stream.seek(records_start + offsets[start])
+    else:
+        to_skip = offsets[start]
+        while to_skip > 0:
+            to_skip -= len(_read_exactly(stream, min(to_skip, 1 << 20)))
+    for idx in range(start, stop):
+        yield _read_exactly(stream, offsets[idx+1] - offsets[idx])
+
+def encode_tree(tree,
+        taxon_index_fn,
+        suppress_edge_lengths=False,
+        store_node_ages=False,
+        suppress_annotations=False):
+    """
+    Returns the record of ``tree``, where ``taxon_index_fn`` returns the index
+    of a |Taxon| object in the taxon labels of the header.
+    """
+    nodes = list(tree.preorder_node_iter())
+    node_index_map = {}
+    parent_indexes = []
+    taxon_indexes = []
+    for idx, nd in enumerate(nodes):
+        node_index_map[nd] = idx
+        parent = nd._parent_node
+        parent_indexes.append(-1 if parent is None else node_index_map[parent])
+        taxon_indexes.append(-1 if nd.taxon is None else taxon_index_fn(nd.taxon))
+    num_nodes = len(nodes)
+    flags = 0
+    parts = []
+    parts.append(struct.pack("<{}i".format(num_nodes), *parent_indexes))
+    parts.append(struct.pack("<{}i".format(num_nodes), *taxon_indexes))
+    if not suppress_edge_lengths:
+        edge_lengths = [nd.edge.length for nd in nodes]
+        if any(v is not None for v in edge_lengths):
+            flags |= HAS_EDGE_LENGTHS
+            parts.append(struct.pack("<{}d".format(num_nodes),
+                    *[NAN if v is None else v for v in edge_lengths]))
+    if store_node_ages:
+        node_ages = [getattr(nd, "age", None) for nd in nodes]
+        if any(v is not None for v in node_ages):
+            flags |= HAS_NODE_AGES
+            parts.append(struct.pack("<{}d".format(num_nodes),
+                    *[NAN if v is None else v for v in node_ages]))
+    metadata = {}
+    if tree.label is not None:
+        metadata["label"] = tree.label
+    if tree.weight is not None:
+        metadata["weight"] = tree.weight
+    for key, items in (("node_labels", ((nd, nd.label) for nd in nodes)),
+            ("edge_labels", ((nd, nd.edge.label) for nd in nodes))):
+        labels = dict((str(node_index_map[nd]), label) for nd, label in items if label is not None)
+        if labels:
+            metadata[key] = labels
+    if not suppress_annotations:
+        annotations = _encode_annotations(tree)
+        if annotations:
+            metadata["annotations"] = annotations
+        for key, items in (("node_annotations", ((nd, nd) for nd in nodes)),
+                ("edge_annotations", ((nd, nd.edge) for nd in nodes))):
+            item_annotations = {}
+            for nd, item in items:
+                annotations = _encode_annotations(item)
+                if annotations:
+                    item_annotations[str(node_index_map[nd])] = annotations
+            if item_annotations:
+                metadata[key] = item_annotations
+    if metadata:
+        flags |= HAS_METADATA
+        metadata_data = _encode_json(metadata)
+        parts.append(_UINT32.pack(len(metadata_data)))
+        parts.append(metadata_data)
+    parts.insert(0, _TREE_RECORD_HEADER.pack(num_nodes,
+            _ROOTING_STATES[tree.is_rooted],
+            flags,
+            0))
+    return b"".join(parts)
+
+def decode_tree(record, tree, taxa):
+    """
+    Builds the structure of ``tree``, a new, empty |Tree|, from ``record``,
+    where ``taxa`` is the list of |Taxon| objects corresponding to the taxon
+    labels of the header.
+    """
+    num_nodes, rooting_state, flags, _ = _TREE_RECORD_HEADER.unpack_from(record, 0)
+    pos = _TREE_RECORD_HEADER.size
+    int_array_format = "<{}i".format(num_nodes)
+    float_array_format = "<{}d".format(num_nodes)
+    parent_indexes = struct.unpack_from(int_array_format, record, pos)
+    pos += 4 * num_nodes
+    taxon_indexes = struct.unpack_from(int_array_format, record, pos)
+    pos += 4 * num_nodes
+    tree.is_rooted = _ROOTING_VALUES[rooting_state]
+    node_factory = tree.node_factory
+    nodes = [tree.seed_node]
+    for idx in range(1, num_nodes):
+        nd = node_factory()
+        nodes[parent_indexes[idx]].add_child(nd)
+        nodes.append(nd)
+    for nd, taxon_index in zip(nodes, taxon_indexes):
+        if taxon_index >= 0:
+            nd.taxon = taxa[taxon_index]
+    if flags & HAS_EDGE_LENGTHS:
+        edge_lengths = struct.unpack_from(float_array_format, record, pos)
+        pos += 8 * num_nodes
+        for nd, v in zip(nodes, edge_lengths):
+            if not math.isnan(v):
+                nd.edge.length = v
+    if flags & HAS_NODE_AGES:
+        node_ages = struct.unpack_from(float_array_format, record, pos)
+        pos += 8 * num_nodes
+        for nd, v in zip(nodes, node_ages):
+            if not math.isnan(v):
+                nd.age = v
+    if flags & HAS_METADATA:
+        metadata_size, = _UINT32.unpack_from(record, pos)
+        pos += _UINT32.size
+        metadata = _decode_json(record[pos:pos+metadata_size])
+        tree.label = metadata.get("label", None)
+        tree.weight = metadata.get("weight", None)
+        for idx, label in metadata.get("node_labels", {}).items():
+            nodes[int(idx)].label = label
+        for idx, label in metadata.get("edge_labels", {}).items():
+            nodes[int(idx)].edge.label = label
+        if "annotations" in metadata:
+            _decode_annotations(tree, metadata["annotations"])
+        for idx, annotations in metadata.get("node_annotations", {}).items():
+            _decode_annotations(nodes[int(idx)], annotations)
+        for idx, annotations in metadata.get("edge_annotations", {}).items():
+            _decode_annotations(nodes[int(idx)].edge, annotations)
+    return tree
@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "dendropy-binary"-schema data reader.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import dendropybinaryprocessing
+
+class DendroPyBinaryReader(ioservice.DataReader):
+    """
+    Parser for data in the "dendropy-binary" format (see
+    `dendropy.dataio.dendropybinaryprocessing`), a compact binary
+    serialization of a collection of trees.
+    """
+
+    def __init__(self, **kwargs):
+        ioservice.DataReader.__init__(self)
+        self.tree_offset = None
+        self.num_trees = None
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    def select_trees(self, tree_offset, num_trees=None):
+        """
+        Restricts the trees read to the ``num_trees`` trees (or all the
+        remaining trees, if |None|) starting at ``tree_offset``. As with list
+        indexes, negative offsets count from the end. If the data source is
+        seekable, then the records of the trees that are not read are skipped
+        over directly, as the position of each tree record is given in the
+        header of the data.
+        """
+        self.tree_offset = tree_offset
+        self.num_trees = num_trees
+
+    def _get_tree_range(self, total_num_trees):
+        tree_offset = self.tree_offset
+        if tree_offset is None:
+            tree_offset = 0
+        elif (tree_offset >= total_num_trees
+                or (self.num_trees is not None and tree_offset < -total_num_trees)):
+            raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, total_num_trees, total_num_trees-1))
+        elif tree_offset < 0:
+            tree_offset = max(0, tree_offset + total_num_trees)
+        if self.num_trees is None:
+            return tree_offset, total_num_trees
+        return tree_offset, min(total_num_trees, tree_offset + self.num_trees)
+
+    def _read(self,
+            stream,
+            taxon_namespace_factory=None,
+            tree_list_factory=None,
+            char_matrix_factory=None,
+            state_alphabet_factory=None,
+            global_annotations_target=None):
+        stream = dendropybinaryprocessing.get_binary_stream(stream)
+        header, offsets, records_start = dendropybinaryprocessing.read_header(stream)
+        if taxon_namespace_factory is None or tree_list_factory is None:
+            return self.Product(
+                    taxon_namespaces=None,
+                    tree_lists=None,
+                    char_matrices=None)
+        taxon_namespace = taxon_namespace_factory(label=header.get("taxon_namespace_label", None))
+        tree_list = tree_list_factory(label=header.get("label", None), taxon_namespace=taxon_namespace)
+        dendropybinaryprocessing.decode_header_annotations(header, tree_list)
+        taxa = dendropybinaryprocessing.decode_header_taxa(header, taxon_namespace)
+        start, stop = self._get_tree_range(len(offsets) - 1)
+        for record in dendropybinaryprocessing.iter_tree_records(
+                stream=stream,
+                offsets=offsets,
+                records_start=records_start,
+                start=start,
+                stop=stop):
+            dendropybinaryprocessing.decode_tree(record, tree_list.new_tree(), taxa)
+        product = self.Product(
+                taxon_namespaces=None,
+                tree_lists=[tree_list],
+                char_matrices=None)
+        return product
@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "dendropy-binary"-schema data writer.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import dendropybinaryprocessing
+
+class DendroPyBinaryWriter(ioservice.DataWriter):
+    """
+    Formatter for data in the "dendropy-binary" format (see
+    `dendropy.dataio.dendropybinaryprocessing`), a compact binary
+    serialization of a collection of trees. The taxon labels are stored
+    once, followed by the structure of each tree as arrays of parent and
+    taxon indexes, edge lengths and, optionally, node ages, and an offset
+    table allowing for any tree to be read directly.
+    """
+
+    def __init__(self, **kwargs):
+        """
+
+        Keyword Arguments
+        -----------------
+        suppress_edge_lengths : boolean, default: |False|
+            If |True|, edge lengths will not be written.
+        store_node_ages : boolean, default: |False|
+            If |True|, the ``age`` attribute of each node (if set, e.g., by
+            :meth:`Tree.calc_node_ages()`) will be written.
+        suppress_annotations : boolean, default: |False|
+            If |True|, metadata annotations will not be written. Otherwise,
+            simple name-value annotations of the tree collection, trees,
+            nodes and edges will be written.
+        """
+        ioservice.DataWriter.__init__(self)
+        self.suppress_edge_lengths = kwargs.pop("suppress_edge_lengths", False)
+        self.store_node_ages = kwargs.pop("store_node_ages", False)
+        self.suppress_annotations = kwargs.pop("suppress_annotations", False)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    def _write(self,
+            stream,
+            taxon_namespaces=None,
+            tree_lists=None,
+            char_matrices=None,
+            global_annotations_target=None):
+        if self.attached_taxon_namespace is not None:
+            tree_lists = [tl for tl in tree_lists if tl.taxon_namespace is self.attached_taxon_namespace]
+        if not tree_lists:
+            return
+        if len(tree_lists) > 1:
+            raise ValueError("'dendropy-binary' format supports only a single collection of trees, but {} were given".format(len(tree_lists)))
+        stream = dendropybinaryprocessing.get_binary_stream(stream)
+        self._write_tree_list(stream, tree_lists[0])
+        stream.flush()
+
+    def _write_tree_list(self, stream, tree_list):
+        taxon_namespace = tree_list.taxon_namespace
+        header = dendropybinaryprocessing.encode_header(
+                taxon_namespace=taxon_namespace,
+                tree_list=tree_list,
+                suppress_annotations=self.suppress_annotations)
+        taxon_labels = header["taxon_labels"]
+        taxon_index_map = dict((taxon, idx) for idx, taxon in enumerate(taxon_namespace))
+        def taxon_index_fn(taxon):
+            try:
+                return taxon_index_map[taxon]
+            except KeyError:
+                # taxon not in the namespace of the collection
+                taxon_index_map[taxon] = len(taxon_labels)
+                taxon_labels.append(taxon.label)
+                return taxon_index_map[taxon]
+        tree_records = []
+        for tree in tree_list:
+            tree_records.append(dendropybinaryprocessing.encode_tree(
+                    tree=tree,
+                    taxon_index_fn=taxon_index_fn,
+                    suppress_edge_lengths=self.suppress_edge_lengths,
+                    store_node_ages=self.store_node_ages,
+                    suppress_annotations=self.suppress_annotations))
+        dendropybinaryprocessing.write_data(stream, header, tree_records)
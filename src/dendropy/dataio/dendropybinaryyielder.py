@@ -0,0 +1,74 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "dendropy-binary"-schema tree iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import dendropybinaryprocessing
+
+class DendroPyBinaryTreeDataYielder(ioservice.TreeDataYielder):
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            tree_type=None,
+            **kwargs):
+        r"""
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string, then it is assumed to be a path to a file. Otherwise, the
+            source is assumed to be a file-like object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        tree_offset : integer
+            Number of trees at the start of each source to skip. The records
+            of these trees are not read at all if the source is seekable.
+        threaded_decompression : bool
+            If |True|, then sources given by path that are compressed (which
+            are recognized and decompressed automatically) are decompressed
+            in a background thread.
+        """
+        ioservice.TreeDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", 0),
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        stream = dendropybinaryprocessing.get_binary_stream(stream)
+        header, offsets, records_start = dendropybinaryprocessing.read_header(stream)
+        taxa = dendropybinaryprocessing.decode_header_taxa(header, self.attached_taxon_namespace)
+        for record in dendropybinaryprocessing.iter_tree_records(
+                stream=stream,
+                offsets=offsets,
+                records_start=records_start,
+                start=self.tree_offset):
+            yield dendropybinaryprocessing.decode_tree(record, self.tree_factory(), taxa)
@@ -73,13 +73,18 @@ class FastaReader(ioservice.DataReader):
                     label=None,
                     taxon_namespace=taxon_namespace)
         symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
+        packing_tables = self._build_symbol_packing_tables(symbol_state_map)
         curr_vec = None
         curr_taxon = None
+        curr_chunks = None
         for line_index, line in enumerate(stream):
             s = line.strip()
             if not s:
                 continue
             if s.startswith('>'):
+                if curr_chunks is not None:
+                    self._store_packed_sequence(curr_vec, curr_chunks, packing_tables)
+                    curr_chunks = None
                 name = s[1:].strip()
                 curr_taxon = taxon_namespace.require_taxon(label=name)
                 if curr_taxon in char_matrix:
@@ -87,8 +92,12 @@ class FastaReader(ioservice.DataReader):
                 if curr_vec is not None and len(curr_vec) == 0:
                     raise DataParseError(message="FASTA error: Expected sequence, but found another sequence name ('{}')".format(name), line_num=line_index + 1, stream=stream)
                 curr_vec = char_matrix[curr_taxon]
+                if packing_tables is not None:
+                    curr_chunks = []
             elif curr_vec is None:
                 raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
+            elif curr_chunks is not None:
+                curr_chunks.append(self._pack_line(s, packing_tables, line_index, stream))
             else:
                 states = []
                 for col_ind, c in enumerate(s):
@@ -101,12 +110,28 @@ class FastaReader(ioservice.DataReader):
                         raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
                     states.append(state)
                 curr_vec.extend(states)
+        if curr_chunks is not None:
+            self._store_packed_sequence(curr_vec, curr_chunks, packing_tables)
         product = self.Product(
                 taxon_namespaces=None,
                 tree_lists=None,
                 char_matrices=[char_matrix])
         return product
 
+    def _pack_line(self, s, packing_tables, line_index, stream):
+        packed = self._pack_symbols(s, packing_tables)
+        if packed is not None:
+            return packed
+        # locate the offending symbol in the original line
+        translation_table = packing_tables[1]
+        for col_ind, c in enumerate(s):
+            if c.strip() and (ord(c) > 255 or translation_table[ord(c)] == self.INVALID_SYMBOL_CODE):
+                break
+        raise DataParseError(message="Unrecognized sequence symbol '{}'".format(s[col_ind]), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
+
+    def _store_packed_sequence(self, vec, chunks, packing_tables):
+        vec._set_packed_values(bytearray().join(chunks), packing_tables[0])
+
 
 class DnaFastaReader(FastaReader):
 
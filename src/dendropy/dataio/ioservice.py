@@ -23,6 +23,8 @@ import warnings
 from dendropy.datamodel import taxonmodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.utility import error
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 
@@ -205,6 +207,63 @@ class DataReader(IOService):
         """
         raise NotImplementedError
 
+    ###########################################################################
+    ## Support for packed character data
+
+    INVALID_SYMBOL_CODE = 255
+
+    def _build_symbol_packing_tables(self, symbol_state_map, invalid_symbols=None):
+        """
+        Returns a tuple, ``(states, translation_table, delete_chars)``, for
+        packing strings of single-character symbols mapped by
+        ``symbol_state_map`` into byte strings of indexes of states in
+        ``states`` with a single call to ``bytearray.translate()`` (see
+        ``_pack_symbols()``), or |None| if the alphabet cannot be packed in
+        this way (in which case each symbol should be looked up
+        individually). Symbols in ``invalid_symbols`` are not packed, even if
+        they are mapped.
+        """
+        states = []
+        state_codes = {}
+        translation_table = bytearray([DataReader.INVALID_SYMBOL_CODE]) * 256
+        for symbol, state in symbol_state_map.items():
+            if symbol is None or len(symbol) != 1 or ord(symbol) > 255:
+                continue
+            if invalid_symbols is not None and symbol in invalid_symbols:
+                continue
+            try:
+                code = state_codes[state]
+            except KeyError:
+                code = len(states)
+                if code >= DataReader.INVALID_SYMBOL_CODE:
+                    return None
+                states.append(state)
+                state_codes[state] = code
+            translation_table[ord(symbol)] = code
+        # characters that are skipped over, as per ``str.strip()``
+        delete_chars = bytearray(i for i in range(256) if not chr(i).strip())
+        return states, bytes(translation_table), bytes(delete_chars)
+
+    def _pack_symbols(self, s, packing_tables):
+        """
+        Returns a ``bytearray`` of the indexes of the states of the symbols
+        in ``s`` (skipping whitespace), using tables returned by
+        ``_build_symbol_packing_tables()``, or |None| if ``s`` includes a
+        symbol that cannot be packed.
+        """
+        states, translation_table, delete_chars = packing_tables
+        try:
+            if isinstance(s, bytes):
+                packed = bytearray(s)
+            else:
+                packed = bytearray(s.encode("latin-1"))
+        except UnicodeEncodeError:
+            return None
+        packed = packed.translate(translation_table, delete_chars)
+        if DataReader.INVALID_SYMBOL_CODE in packed:
+            return None
+        return packed
+
     def read_dataset(self,
             stream,
             dataset,
@@ -495,14 +554,161 @@ class DataWriter(IOService):
                 char_matrices=[char_matrix],
                 global_annotations_target=None)
 
+    def _write_tree_stream_open(self, stream, tree_list):
+        """
+        Deriving classes that support incremental writing of trees (see
+        |TreeStreamWriter|) should implement this method to write everything
+        that precedes the first tree statement of ``tree_list`` (which will
+        not have any trees in it) to ``stream``.
+        """
+        raise NotImplementedError("Incremental writing of trees is not supported by '{}'".format(self.__class__.__name__))
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_idx):
+        """
+        Deriving classes that support incremental writing of trees should
+        implement this method to write ``tree``, the ``tree_idx``-th tree of
+        the stream, to ``stream``.
+        """
+        raise NotImplementedError("Incremental writing of trees is not supported by '{}'".format(self.__class__.__name__))
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        """
+        Deriving classes that support incremental writing of trees should
+        implement this method to write everything that follows the last tree
+        statement of ``tree_list`` to ``stream``.
+        """
+        raise NotImplementedError("Incremental writing of trees is not supported by '{}'".format(self.__class__.__name__))
+
+###############################################################################
+## TreeStreamWriter
+
+class TreeStreamWriter(object):
+    """
+    Writes trees to a stream one at a time, so that trees can be written as
+    they are produced (e.g., read from another source, or simulated) without
+    the whole collection having to be held in memory.
+
+    Trees are written using the ``writer`` |DataWriter|, which must support
+    incremental writing of trees. Everything preceding the first tree (e.g.,
+    the "TAXA" block and "TRANSLATE" statement in NEXUS) is written when the
+    stream is opened, and everything following the last tree (e.g., "END;")
+    is written when it is closed. All taxa referenced by the trees should
+    therefore be in ``taxon_namespace`` by the time the stream is opened.
+
+    Instances are usually obtained through |TreeList|.open_stream_writer(),
+    and can be used as context managers::
+
+        with dendropy.TreeList.open_stream_writer(
+                path="thinned.nex",
+                schema="nexus",
+                taxon_namespace=taxon_namespace,
+                translate_tree_taxa=True) as tree_writer:
+            for tree_idx, tree in enumerate(dendropy.Tree.yield_from_files(
+                    files=["posterior.nex"],
+                    schema="nexus",
+                    taxon_namespace=taxon_namespace)):
+                if tree_idx % 100 == 0:
+                    tree_writer.write_tree(tree)
+
+    """
+
+    def __init__(self, writer, stream, tree_list, close_stream=False):
+        """
+        Parameters
+        ----------
+        writer : |DataWriter|
+            The writer used to format the trees.
+        stream : file or file-like object
+            Destination for data.
+        tree_list : |TreeList|
+            An empty |TreeList| that provides the taxon namespace, label,
+            annotations, etc. of the collection of trees to be written.
+        close_stream : bool
+            If |True|, then ``stream`` will be closed when this writer is
+            closed.
+        """
+        self.writer = writer
+        self.stream = stream
+        self.tree_list = tree_list
+        self.close_stream = close_stream
+        self.num_trees_written = 0
+        self.is_open = False
+        self.is_closed = False
+
+    def _get_taxon_namespace(self):
+        return self.tree_list.taxon_namespace
+    taxon_namespace = property(_get_taxon_namespace)
+
+    def open(self):
+        """
+        Writes everything that precedes the first tree. Called automatically
+        when the first tree is written, if not called before.
+        """
+        if self.is_closed:
+            raise ValueError("I/O operation on closed tree stream")
+        if self.is_open:
+            return
+        self.writer._write_tree_stream_open(self.stream, self.tree_list)
+        self.is_open = True
+
+    def write_tree(self, tree):
+        """
+        Writes ``tree``, which must reference the same taxon namespace as this
+        stream.
+        """
+        if self.is_closed:
+            raise ValueError("I/O operation on closed tree stream")
+        if not self.is_open:
+            self.open()
+        if tree.taxon_namespace is not self.tree_list.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(self.tree_list, tree)
+        self.writer._write_tree_stream_tree(self.stream, self.tree_list, tree, self.num_trees_written)
+        self.num_trees_written += 1
+
+    def write_trees(self, trees):
+        """
+        Writes all trees in the iterable ``trees``, which may be a generator.
+        """
+        for tree in trees:
+            self.write_tree(tree)
+
+    def close(self):
+        """
+        Writes everything that follows the last tree and, if the stream is
+        owned by this writer, closes it.
+        """
+        if self.is_closed:
+            return
+        try:
+            if not self.is_open:
+                self.open()
+            self.writer._write_tree_stream_close(self.stream, self.tree_list)
+            self.stream.flush()
+        finally:
+            self.is_closed = True
+            if self.close_stream:
+                self.stream.close()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Also completed on errors, so that the trees written so far form
+        # a valid document.
+        self.close()
+
 ###############################################################################
 ## DataYielder
 
 class DataYielder(IOService):
 
-    def __init__(self, files=None):
+    def __init__(self, files=None, threaded_decompression=False):
         IOService.__init__(self)
         self.files = files
+        # if True, then compressed files given by path are decompressed in a
+        # background thread
+        self.threaded_decompression = threaded_decompression
         self._current_file_index = None
         self._current_file = None
         self._current_file_name = None
@@ -532,7 +738,8 @@ class DataYielder(IOService):
 
     def iterate_over_file(self, current_file):
         if textprocessing.is_str_type(current_file):
-            self._current_file = open(current_file, "r")
+            self._current_file = filesys.open_for_reading(current_file,
+                    threaded_decompression=self.threaded_decompression)
             self._current_file_name = current_file
         else:
             self._current_file = current_file
@@ -551,19 +758,30 @@ class DataYielder(IOService):
         self._current_file = None
 
 ###############################################################################
-## DataYielder
+## TreeDataYielder
 
 class TreeDataYielder(DataYielder):
 
     def __init__(self,
             files=None,
             taxon_namespace=None,
-            tree_type=None):
-        DataYielder.__init__(self, files=files)
+            tree_type=None,
+            tree_offset=0,
+            threaded_decompression=False):
+        DataYielder.__init__(self,
+                files=files,
+                threaded_decompression=threaded_decompression)
         self.taxon_namespace = taxon_namespace
         assert self.taxon_namespace is not None
         self.attached_taxon_namespace = self.taxon_namespace
         self.tree_type = tree_type
+        if tree_offset is None:
+            tree_offset = 0
+        if tree_offset < 0:
+            raise ValueError("Negative tree offsets are not supported when yielding trees: {}".format(tree_offset))
+        # number of trees at the start of each source that are to be skipped
+        # without being built
+        self.tree_offset = tree_offset
 
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
@@ -41,6 +41,12 @@ class NewickReader(ioservice.DataReader):
     _default_rooting_directive = None
     _default_tree_weight = 1.0
 
+    # Characters that cannot be handled by the simple tree statement parser:
+    # comments, quotes, and other NEXUS punctuation.
+    _simple_tree_statement_stop_chars = "[]'\"{}=\\"
+    _simple_tree_statement_token_pattern = re.compile(r"[(),:;]|[^(),:; \t\n\r]+")
+    _simple_tree_statement_delimiters = frozenset("(),:;")
+
     class NewickReaderError(error.DataParseError):
         def __init__(self, message,
                 line_num=None,
@@ -152,6 +158,17 @@ class NewickReader(ioservice.DataReader):
             value'). If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
+        comment_metadata_keys : iterable of strings, default: |None|
+            If given, then only the fields with these names will be extracted
+            from metadata comments when ``extract_comment_metadata`` is |True|:
+            all other fields are discarded. E.g., given
+            ``comment_metadata_keys=["rate", "height_95%_HPD"]``, only these
+            two annotations will be created for each node of a BEAST tree.
+        lazy_comment_metadata : boolean, default: |False|
+            If |True|, and ``extract_comment_metadata`` is |True|, then
+            metadata comments on trees, nodes and edges are stored unparsed
+            and only parsed into annotations when the ``annotations``
+            attribute of the object is first accessed.
         store_tree_weights : boolean, default: |False|
             If |True|, process the tree weight (e.g. "[&W 1/2]") comment
             associated with each tree, if any. Defaults to |False|.
@@ -252,6 +269,15 @@ class NewickReader(ioservice.DataReader):
         self.edge_length_type = kwargs.pop("edge_length_type", float)
         self.suppress_edge_lengths = kwargs.pop("suppress_edge_lengths", False)
         self.extract_comment_metadata = kwargs.pop('extract_comment_metadata', True)
+        self.comment_metadata_keys = kwargs.pop('comment_metadata_keys', None)
+        if self.comment_metadata_keys is not None:
+            self.comment_metadata_keys = frozenset(self.comment_metadata_keys)
+        self.lazy_comment_metadata = kwargs.pop('lazy_comment_metadata', False)
+        if self.lazy_comment_metadata:
+            self._deferred_comment_metadata_parser = nexusprocessing.CommentMetadataParser(
+                    field_names=self.comment_metadata_keys)
+        else:
+            self._deferred_comment_metadata_parser = None
         self.store_tree_weights = kwargs.pop("store_tree_weights", False)
         self.default_tree_weight = kwargs.pop("default_tree_weight", self.__class__._default_tree_weight)
         self.finish_node_fn = kwargs.pop("finish_node_fn", None)
@@ -307,6 +333,58 @@ class NewickReader(ioservice.DataReader):
                 # raise StopIteration
                 return
 
+    def built_tree_iter(self,
+            stream,
+            taxon_symbol_mapper,
+            tree_factory,
+            node_builder_factory):
+        """
+        Iterator that yields the trees in NEWICK-formatted source, with their
+        nodes created by node builders rather than as |Node| objects of the
+        trees whenever possible.
+
+        A new node builder, obtained by calling ``node_builder_factory``
+        without arguments, is used for each tree statement. It has to
+        provide the same methods as :class:`TreeNodeBuilder`, and is used
+        for all tree statements that the fast path of the parser handles
+        (i.e., those without comments, quoted labels, blank nodes or other
+        special syntax), in which case the tree returned by ``tree_factory``
+        only holds the information on the tree as a whole (e.g., its rooting
+        state). Any other tree statement is parsed into the tree itself, and
+        the node builder is not used.
+
+        Parameters
+        ----------
+        stream : file or file-like object
+            A file or file-like object opened for reading.
+        taxon_symbol_mapper : :class:`NexusTaxonSymbolMapper`
+            Mapper used to resolve labels to |Taxon| objects.
+        tree_factory : function object
+            A function that returns a new |Tree| object when called
+            without arguments.
+        node_builder_factory : function object
+            A function that returns a new node builder when called without
+            arguments.
+
+        Returns
+        -------
+        iter : :py`collections.Iterator` [(|Tree|, node builder)]
+            An iterator yielding the tree and node builder of each tree
+            statement in ``stream``.
+        """
+        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_unquoted_underscores)
+        while True:
+            node_builder = node_builder_factory()
+            tree = self._parse_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree_factory=tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol,
+                    node_builder=node_builder)
+            if tree is None:
+                return
+            yield tree, node_builder
+
     def _read(self,
             stream,
             taxon_namespace_factory=None,
@@ -348,7 +426,8 @@ class NewickReader(ioservice.DataReader):
     def _parse_tree_statement(self,
             nexus_tokenizer,
             tree_factory,
-            taxon_symbol_map_fn):
+            taxon_symbol_map_fn,
+            node_builder=None):
         """
         Parses a single tree statement from a token stream and constructs a
         corresponding Tree object. Expects that the first non-comment and
@@ -356,6 +435,10 @@ class NewickReader(ioservice.DataReader):
         the parenthesis that opens the tree statement. When complete, the
         current token will be the token immediately following the semi-colon,
         if any.
+
+        If ``node_builder`` is given, it is used to create the nodes of the
+        tree if the statement can be handled by the fast path of the parser
+        (see :meth:`built_tree_iter`).
         """
         current_token = nexus_tokenizer.current_token
         tree_comments = nexus_tokenizer.pull_captured_comments()
@@ -378,12 +461,18 @@ class NewickReader(ioservice.DataReader):
         self._process_tree_comments(tree, tree_comments, nexus_tokenizer)
         self._tree_statement_complete = False
         self._seen_taxa = set()
-        self._parse_tree_node_description(
-                nexus_tokenizer=nexus_tokenizer,
-                tree=tree,
-                current_node=tree.seed_node,
-                taxon_symbol_map_fn=taxon_symbol_map_fn,
-                is_internal_node=None)
+        if not (current_token == "("
+                and not nexus_tokenizer.is_token_quoted
+                and self._parse_simple_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    node_builder=node_builder or TreeNodeBuilder(tree, self),
+                    taxon_symbol_map_fn=taxon_symbol_map_fn)):
+            self._parse_tree_node_description(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree=tree,
+                    current_node=tree.seed_node,
+                    taxon_symbol_map_fn=taxon_symbol_map_fn,
+                    is_internal_node=None)
         current_token = nexus_tokenizer.current_token
         if not self._tree_statement_complete:
             raise NewickReader.NewickReaderIncompleteTreeStatementError(
@@ -399,6 +488,45 @@ class NewickReader(ioservice.DataReader):
             current_token = nexus_tokenizer.next_token()
         return tree
 
+    def _skip_tree_statement(self,
+            nexus_tokenizer,
+            tree_factory,
+            taxon_symbol_map_fn):
+        """
+        Skips over a single tree statement in a token stream, under the same
+        expectations as :meth:`_parse_tree_statement` and leaving the
+        tokenizer in the same state. Returns |False| if there are no more tree
+        statements.
+
+        The statement is skipped by scanning the raw text to its terminating
+        semi-colon (taking quoted labels and comments into account), without
+        building the tree or resolving taxa, unless the terminating
+        semi-colon is not required, in which case the statement is parsed
+        and the resulting tree discarded.
+        """
+        if not self.terminating_semicolon_required:
+            return self._parse_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree_factory=tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_map_fn) is not None
+        current_token = nexus_tokenizer.current_token
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+        nexus_tokenizer.clear_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return False
+        if not nexus_tokenizer.skip_raw_to(";"):
+            raise NewickReader.NewickReaderIncompleteTreeStatementError(
+                    message="Incomplete or improperly-terminated tree statement (end of stream reached instead of a semi-colon ';')",
+                    line_num=nexus_tokenizer.current_line_num,
+                    col_num=nexus_tokenizer.current_column_num,
+                    stream=nexus_tokenizer.src)
+        current_token = nexus_tokenizer.current_token
+        while current_token == ";" and not nexus_tokenizer.is_eof():
+            nexus_tokenizer.clear_captured_comments()
+            current_token = nexus_tokenizer.next_token()
+        return True
+
     def _process_tree_comments(self, tree, tree_comments, nexus_tokenizer):
         # NOTE: this also unconditionally sets the tree rootedness and
         # weighting if no comment indicating these are found; for this to work
@@ -447,15 +575,12 @@ class NewickReader(ioservice.DataReader):
                     exc.__context__ = None # Python 3.0, 3.1, 3.2
                     exc.__cause__ = None # Python 3.3, 3.4
                     raise exc
-            elif self.extract_comment_metadata and comment.startswith("&"):
-                annotations = nexusprocessing.parse_comment_metadata_to_annotations(
-                    comment=comment)
-                if annotations:
-                    tree.annotations.update(annotations)
-                else:
-                    tree.comments.append(comment)
             else:
-                tree.comments.append(comment)
+                nexusprocessing.process_comments_for_item(item=tree,
+                        item_comments=[comment],
+                        extract_comment_metadata=self.extract_comment_metadata,
+                        comment_metadata_keys=self.comment_metadata_keys,
+                        defer_comment_metadata=self._deferred_comment_metadata_parser)
         if not rooting_token_found:
             tree.is_rooted = self._parse_tree_rooting_state("")
         if self.store_tree_weights and not weighting_token_found:
@@ -483,6 +608,117 @@ class NewickReader(ioservice.DataReader):
         else:
             raise TypeError("Unrecognized rooting directive: '{}'".format(self._rooting))
 
+    def _parse_simple_tree_statement(self,
+            nexus_tokenizer,
+            node_builder,
+            taxon_symbol_map_fn):
+        """
+        Fast path for the (very common) case of tree statements consisting only
+        of parentheses, commas, unquoted labels and edge lengths, i.e., without
+        comments, quoted labels, blank nodes or other special syntax. Assuming
+        that the current token is the parenthesis that opens the tree
+        statement, the raw text of the statement is retrieved from the
+        tokenizer and the nodes are created from it in a single pass, using
+        ``node_builder`` (see :class:`TreeNodeBuilder`).
+
+        If the statement cannot be handled here, nothing will have been
+        consumed from the tokenizer, the seed node of ``node_builder`` will
+        not have been set, and |False| is returned, in which case the
+        statement should be processed by the full parser. Otherwise, |True|
+        is returned and the tokenizer is left in the same state as the full
+        parser would have left it.
+        """
+        if self.finish_node_fn is not None or not self.terminating_semicolon_required:
+            return False
+        stop_chars = self._simple_tree_statement_stop_chars + "".join(
+                ch for ch in nexus_tokenizer.captured_delimiters
+                if ch not in self._simple_tree_statement_delimiters)
+        statement = nexus_tokenizer.peek_raw(";", stop_chars)
+        if statement is None:
+            return False
+        tokens = self._simple_tree_statement_token_pattern.findall(statement)
+        new_node = node_builder.new_node
+        set_node_label = node_builder.set_node_label
+        set_node_taxon = node_builder.set_node_taxon
+        set_edge_length = node_builder.set_edge_length
+        preserve_underscores = nexus_tokenizer.preserve_unquoted_underscores
+        suppress_edge_lengths = self.suppress_edge_lengths
+        seen_taxa = set()
+        delimiters = self._simple_tree_statement_delimiters
+
+        # Each entry is a (node, children) pair for an open parenthesis; the
+        # first one is for the (already consumed) parenthesis that opens the
+        # statement, and its node only becomes the seed node once the whole
+        # statement has been parsed successfully.
+        node_stack = [(new_node(), [])]
+        idx = 0
+        while True:
+            token = tokens[idx]
+            if token == "(":
+                node_stack.append((new_node(), []))
+                idx += 1
+                continue
+            if token in delimiters and token != ":":
+                # blank node or unbalanced parentheses
+                return False
+            current_node = new_node()
+            is_internal_node = False
+            while True:
+                # label and edge length of ``current_node``
+                if token not in delimiters:
+                    if not preserve_underscores:
+                        token = token.replace("_", " ")
+                    if ( (is_internal_node and self.suppress_internal_node_taxa)
+                            or ((not is_internal_node) and self.suppress_leaf_node_taxa) ):
+                        set_node_label(current_node, token)
+                    else:
+                        node_taxon = taxon_symbol_map_fn(token)
+                        if node_taxon in seen_taxa:
+                            return False
+                        seen_taxa.add(node_taxon)
+                        set_node_taxon(current_node, node_taxon)
+                    idx += 1
+                    token = tokens[idx]
+                if token == ":":
+                    idx += 1
+                    token = tokens[idx]
+                    if token in delimiters:
+                        return False
+                    if not suppress_edge_lengths:
+                        if not preserve_underscores:
+                            token = token.replace("_", " ")
+                        try:
+                            set_edge_length(current_node, token)
+                        except ValueError:
+                            return False
+                    idx += 1
+                    token = tokens[idx]
+                if not node_stack:
+                    # root node: must be followed by the terminating
+                    # semi-colon, which is the last token
+                    if idx != len(tokens) - 1:
+                        return False
+                    break
+                node_stack[-1][1].append(current_node)
+                idx += 1
+                if token == ",":
+                    break
+                elif token != ")":
+                    return False
+                current_node, child_nodes = node_stack.pop()
+                node_builder.add_child_nodes(current_node, child_nodes)
+                is_internal_node = True
+                token = tokens[idx]
+            if not node_stack:
+                break
+        node_builder.set_seed_node(current_node)
+        nexus_tokenizer.skip_raw(len(statement))
+        nexus_tokenizer.current_token = ";"
+        self._parenthesis_nesting_level = 0
+        self._tree_statement_complete = True
+        nexus_tokenizer.next_token()
+        return True
+
     def _parse_tree_node_description(
             self,
             nexus_tokenizer,
@@ -494,75 +730,127 @@ class NewickReader(ioservice.DataReader):
         Assuming that the iterator is currently sitting on a parenthesis that
         opens a node with children or the label of a leaf node, this will
         populate the node ``node`` appropriately (label, edge length, comments,
-        metadata etc.) and recursively parse and add the node's
-        children. When complete, the token will be the token immediately
-        following the end of the node or tree statement if this is the root
-        node, i.e. the token *following* the closing parenthesis of the node or
-        the semi-colon terminating a tree statement.
+        metadata etc.) and parse and add the node's children (and their
+        children, and so on). When complete, the token will be the token
+        immediately following the end of the node or tree statement if this is
+        the root node, i.e. the token *following* the closing parenthesis of
+        the node or the semi-colon terminating a tree statement.
+
+        Nodes are processed using an explicit stack of the ancestors of the
+        current node rather than by recursion, so that the depth of the tree is
+        not limited by the recursion limit of the interpreter.
         """
+        # each entry: (node, is_internal_node, comments, node_created) of an
+        # ancestor of ``current_node`` whose children are being parsed
+        ancestors = []
         current_node_comments = nexus_tokenizer.pull_captured_comments()
         if nexus_tokenizer.current_token == "(":
             # self._parenthesis_nesting_level += 1 # handled by calling code
             nexus_tokenizer.require_next_token()
             node_created = False
-            while True:
-                if nexus_tokenizer.current_token == ",":
-                    if not node_created: #184
-                        # no node has been created yet: ',' designates a
-                        # preceding blank node
-                        new_node = tree.node_factory()
-                        nexusprocessing.process_comments_for_item(item=new_node,
-                                item_comments=nexus_tokenizer.pull_captured_comments(),
-                                extract_comment_metadata=self.extract_comment_metadata)
-                        self._finish_node(new_node)
-                        current_node.add_child(new_node)
-                        ## node_created = True # do not flag node as created to allow for an extra node to be created in the event of (..,)
-                    nexus_tokenizer.require_next_token()
-                    while nexus_tokenizer.current_token == ",": #192
-                        # another blank node
-                        new_node = tree.node_factory()
-                        nexusprocessing.process_comments_for_item(item=new_node,
-                                item_comments=nexus_tokenizer.pull_captured_comments(),
-                                extract_comment_metadata=self.extract_comment_metadata)
-                        self._finish_node(new_node)
-                        current_node.add_child(new_node)
-                        # node_created = True; # do not flag node as created: extra node needed in the event of (..,)
-                        nexus_tokenizer.require_next_token()
-                    if not node_created and nexus_tokenizer.current_token == ")": #200
-                        # end of node
-                        new_node = tree.node_factory();
-                        nexusprocessing.process_comments_for_item(item=new_node,
-                                item_comments=nexus_tokenizer.pull_captured_comments(),
-                                extract_comment_metadata=self.extract_comment_metadata)
-                        self._finish_node(new_node)
-                        current_node.add_child(new_node)
-                        node_created = True;
-                elif nexus_tokenizer.current_token == ")": #206
-                    # end of child nodes
-                    self._parenthesis_nesting_level -= 1
+            is_parsing_children = True
+        else:
+            is_parsing_children = False
+        while True:
+            if not is_parsing_children:
+                self._parse_tree_node_info(
+                        nexus_tokenizer=nexus_tokenizer,
+                        tree=tree,
+                        current_node=current_node,
+                        current_node_comments=current_node_comments,
+                        taxon_symbol_map_fn=taxon_symbol_map_fn,
+                        is_internal_node=is_internal_node)
+                if not ancestors:
+                    return current_node
+                child_node = current_node
+                current_node, is_internal_node, current_node_comments, node_created = ancestors.pop()
+                current_node.add_child(child_node)
+                node_created = True
+                is_parsing_children = True
+                continue
+            if nexus_tokenizer.current_token == ",":
+                if not node_created: #184
+                    # no node has been created yet: ',' designates a
+                    # preceding blank node
+                    new_node = tree.node_factory()
+                    nexusprocessing.process_comments_for_item(item=new_node,
+                            item_comments=nexus_tokenizer.pull_captured_comments(),
+                            extract_comment_metadata=self.extract_comment_metadata,
+                            comment_metadata_keys=self.comment_metadata_keys,
+                            defer_comment_metadata=self._deferred_comment_metadata_parser)
+                    self._finish_node(new_node)
+                    current_node.add_child(new_node)
+                    ## node_created = True # do not flag node as created to allow for an extra node to be created in the event of (..,)
+                nexus_tokenizer.require_next_token()
+                while nexus_tokenizer.current_token == ",": #192
+                    # another blank node
+                    new_node = tree.node_factory()
+                    nexusprocessing.process_comments_for_item(item=new_node,
+                            item_comments=nexus_tokenizer.pull_captured_comments(),
+                            extract_comment_metadata=self.extract_comment_metadata,
+                            comment_metadata_keys=self.comment_metadata_keys,
+                            defer_comment_metadata=self._deferred_comment_metadata_parser)
+                    self._finish_node(new_node)
+                    current_node.add_child(new_node)
+                    # node_created = True; # do not flag node as created: extra node needed in the event of (..,)
                     nexus_tokenizer.require_next_token()
-                    break
-                else: #210
-                    # assume child nodes: a leaf node (if a label) or
-                    # internal (if a parenthesis)
-                    if nexus_tokenizer.current_token == "(":
-                        self._parenthesis_nesting_level += 1
-                        is_new_internal_node = True
-                    else:
-                        is_new_internal_node = False
+                if not node_created and nexus_tokenizer.current_token == ")": #200
+                    # end of node
                     new_node = tree.node_factory();
                     nexusprocessing.process_comments_for_item(item=new_node,
                             item_comments=nexus_tokenizer.pull_captured_comments(),
-                            extract_comment_metadata=self.extract_comment_metadata)
-                    self._parse_tree_node_description(
-                            nexus_tokenizer=nexus_tokenizer,
-                            tree=tree,
-                            current_node=new_node,
-                            taxon_symbol_map_fn=taxon_symbol_map_fn,
-                            is_internal_node=is_new_internal_node,
-                            )
-                    current_node.add_child(new_node);
+                            extract_comment_metadata=self.extract_comment_metadata,
+                            comment_metadata_keys=self.comment_metadata_keys,
+                            defer_comment_metadata=self._deferred_comment_metadata_parser)
+                    self._finish_node(new_node)
+                    current_node.add_child(new_node)
                     node_created = True;
+            elif nexus_tokenizer.current_token == ")": #206
+                # end of child nodes
+                self._parenthesis_nesting_level -= 1
+                nexus_tokenizer.require_next_token()
+                is_parsing_children = False
+            else: #210
+                # assume child nodes: a leaf node (if a label) or
+                # internal (if a parenthesis)
+                if nexus_tokenizer.current_token == "(":
+                    self._parenthesis_nesting_level += 1
+                    is_new_internal_node = True
+                else:
+                    is_new_internal_node = False
+                new_node = tree.node_factory();
+                nexusprocessing.process_comments_for_item(item=new_node,
+                        item_comments=nexus_tokenizer.pull_captured_comments(),
+                        extract_comment_metadata=self.extract_comment_metadata,
+                        comment_metadata_keys=self.comment_metadata_keys,
+                        defer_comment_metadata=self._deferred_comment_metadata_parser)
+                # descend into the new node, to be added to the current node
+                # once it has been parsed
+                ancestors.append((current_node, is_internal_node, current_node_comments, node_created))
+                current_node = new_node
+                is_internal_node = is_new_internal_node
+                current_node_comments = nexus_tokenizer.pull_captured_comments()
+                if nexus_tokenizer.current_token == "(":
+                    nexus_tokenizer.require_next_token()
+                    node_created = False
+                else:
+                    is_parsing_children = False
+
+    def _parse_tree_node_info(
+            self,
+            nexus_tokenizer,
+            tree,
+            current_node,
+            current_node_comments,
+            taxon_symbol_map_fn,
+            is_internal_node):
+        """
+        Parses the label, edge length and other information of
+        ``current_node`` following its children (if any), and finishes the
+        node. The node description is terminated by the closing parenthesis
+        of its parent, a comma, or the end of the tree statement; whether the
+        node has a parent to return to is tracked by the calling code.
+        """
         label_parsed = False
         self._tree_statement_complete = False
         if is_internal_node is None:
@@ -610,9 +898,11 @@ class NewickReader(ioservice.DataReader):
                 # self._parenthesis_nesting_level -= 1 # handled by calling code
                 nexusprocessing.process_comments_for_item(item=current_node,
                         item_comments=current_node_comments,
-                        extract_comment_metadata=self.extract_comment_metadata)
+                        extract_comment_metadata=self.extract_comment_metadata,
+                        comment_metadata_keys=self.comment_metadata_keys,
+                        defer_comment_metadata=self._deferred_comment_metadata_parser)
                 self._finish_node(current_node)
-                return current_node
+                return
             elif nexus_tokenizer.current_token == ";": #256
                 # end of tree statement
                 self._tree_statement_complete = True
@@ -622,9 +912,11 @@ class NewickReader(ioservice.DataReader):
                 # end of this node
                 nexusprocessing.process_comments_for_item(item=current_node,
                             item_comments=current_node_comments,
-                            extract_comment_metadata=self.extract_comment_metadata)
+                            extract_comment_metadata=self.extract_comment_metadata,
+                            comment_metadata_keys=self.comment_metadata_keys,
+                            defer_comment_metadata=self._deferred_comment_metadata_parser)
                 self._finish_node(current_node)
-                return current_node
+                return
             elif nexus_tokenizer.current_token == "(": #263
                 # start of another node or tree without finishing this
                 # node
@@ -696,10 +988,55 @@ class NewickReader(ioservice.DataReader):
                     stream=nexus_tokenizer.src)
         nexusprocessing.process_comments_for_item(item=current_node,
                 item_comments=current_node_comments,
-                extract_comment_metadata=self.extract_comment_metadata)
+                extract_comment_metadata=self.extract_comment_metadata,
+                comment_metadata_keys=self.comment_metadata_keys,
+                defer_comment_metadata=self._deferred_comment_metadata_parser)
         self._finish_node(current_node)
-        return current_node
 
     def _finish_node(self, node):
         if self.finish_node_fn is not None:
             self.finish_node_fn(node)
+
+###############################################################################
+## TreeNodeBuilder
+
+class TreeNodeBuilder(object):
+    """
+    Creates the nodes of a tree parsed by the fast path of a |NewickReader|
+    as |Node| objects of a |Tree|.
+
+    Other node builders (see :meth:`NewickReader.built_tree_iter`) provide
+    the same methods, with nodes represented by any objects they choose:
+    ``new_node()`` returns a new node, which is given its label, taxon and
+    edge length (if any) and then its child nodes, and the node that opens
+    the tree statement is finally passed to ``set_seed_node()``.
+    """
+
+    def __init__(self, tree, newick_reader):
+        self.tree = tree
+        self.is_assign_internal_labels_to_edges = newick_reader.is_assign_internal_labels_to_edges
+        self.edge_length_type = newick_reader.edge_length_type
+        self.new_node = tree.node_factory
+
+    def set_node_label(self, node, label):
+        if self.is_assign_internal_labels_to_edges:
+            node.edge.label = label
+        else:
+            node.label = label
+
+    def set_node_taxon(self, node, taxon):
+        node.taxon = taxon
+
+    def set_edge_length(self, node, edge_length):
+        """
+        Sets the length of the edge subtending ``node`` from the string
+        ``edge_length``, raising ValueError if it is not valid.
+        """
+        node.edge.length = self.edge_length_type(edge_length)
+
+    def add_child_nodes(self, node, child_nodes):
+        for child_node in child_nodes:
+            node.add_child(child_node)
+
+    def set_seed_node(self, node):
+        self.tree.seed_node = node
@@ -167,6 +167,8 @@ class NewickWriter(ioservice.DataWriter):
             if kw in kwargs:
                 raise TypeError("'{}' is no longer supported: {}".format(kw, legacy[kw]))
         ioservice.DataWriter.__init__(self, **kwargs)
+        self._taxon_tags = {}
+        self._buffer = []
         self.suppress_leaf_taxon_labels = kwargs.pop("suppress_leaf_taxon_labels", False)
         self.suppress_leaf_node_labels = kwargs.pop("suppress_leaf_node_labels", True)
         self.suppress_internal_taxon_labels = kwargs.pop("suppress_internal_taxon_labels", False)
@@ -197,6 +199,13 @@ class NewickWriter(ioservice.DataWriter):
             self.edge_label_compose_fn = self._format_edge_length
         self.check_for_unused_keyword_arguments(kwargs)
 
+    def _get_taxon_token_map(self):
+        return self._taxon_token_map
+    def _set_taxon_token_map(self, m):
+        self._taxon_token_map = m
+        self._taxon_tags = {}
+    taxon_token_map = property(_get_taxon_token_map, _set_taxon_token_map)
+
     def _get_taxon_tree_token(self, taxon):
         if self.taxon_token_map is None:
             self.taxon_token_map = {}
@@ -207,6 +216,21 @@ class NewickWriter(ioservice.DataWriter):
             self.taxon_token_map[taxon] = t
             return t
 
+    def _get_taxon_tag(self, taxon):
+        """
+        Returns the escaped token representing ``taxon`` in tree statements.
+        Tokens are composed once per taxon and reused for all subsequent
+        trees written by this writer (until ``taxon_token_map`` is reset).
+        """
+        try:
+            return self._taxon_tags[taxon]
+        except KeyError:
+            tag = nexusprocessing.escape_nexus_token(self._get_taxon_tree_token(taxon),
+                    preserve_spaces=self.preserve_spaces,
+                    quote_underscores=not self.unquoted_underscores)
+            self._taxon_tags[taxon] = tag
+            return tag
+
     def _get_real_value_format_specifier(self):
         return self._real_value_format_specifier
     def _set_real_value_format_specifier(self, f):
@@ -242,6 +266,19 @@ class NewickWriter(ioservice.DataWriter):
         for tree in tree_list:
             self._write_tree(stream, tree)
             stream.write("\n")
+        self._write_tree_list_annotations_and_comments(stream, tree_list)
+
+    def _write_tree_stream_open(self, stream, tree_list):
+        pass
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_idx):
+        self._write_tree(stream, tree)
+        stream.write("\n")
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        self._write_tree_list_annotations_and_comments(stream, tree_list)
+
+    def _write_tree_list_annotations_and_comments(self, stream, tree_list):
         # In Newick format, no clear way to distinguish between
         # annotations/comments associated with tree collection and
         # annotations/comments associated with first tree. So we place them at
@@ -262,69 +299,73 @@ class NewickWriter(ioservice.DataWriter):
         """
         Composes and writes ``tree`` to ``stream``.
         """
+        parts = self._buffer
+        try:
+            self._compose_tree(tree, parts)
+            stream.write("".join(parts))
+        finally:
+            del parts[:]
+
+    def _compose_tree(self, tree, parts):
+        """
+        Composes the tree statement of ``tree``, appending the string
+        fragments to the list ``parts``. The tree is traversed iteratively,
+        so arbitrarily deep trees can be written.
+        """
         if tree.rooting_state_is_undefined or self.suppress_rooting:
-            rooting = ""
+            pass
         elif tree.is_rooted:
-            rooting = "[&R] "
+            parts.append("[&R] ")
         elif not tree.is_rooted:
-            rooting = "[&U] "
-        else:
-            rooting = ""
+            parts.append("[&U] ")
         if self.store_tree_weights and tree.weight is not None:
-            weight = "[&W {}] ".format(tree.weight)
-        else:
-            weight = ""
+            parts.append("[&W {}] ".format(tree.weight))
         if not self.suppress_annotations:
-            annotation_comments = nexusprocessing.format_item_annotations_as_comments(tree,
+            parts.append(nexusprocessing.format_item_annotations_as_comments(tree,
                     nhx=self.annotations_as_nhx,
                     real_value_format_specifier=self.real_value_format_specifier,
-                    )
-        else:
-            annotation_comments = ""
-        tree_comments = self._compose_comment_string(tree)
-        stream.write("{}{}{}{}".format(
-                rooting,
-                weight,
-                annotation_comments,
-                tree_comments,
-                ))
-        tree.apply(
-                before_fn=lambda x: self._write_node_open(x, stream),
-                after_fn=lambda x: self._write_node_close(x, stream),
-                leaf_fn=lambda x: self._write_leaf(x, stream),
-                )
-        stream.write(";")
-
-    def _write_node_open(self, node, out):
-        if node._parent_node is None or node._parent_node._child_nodes[0] is node:
-            out.write("(")
-        else:
-            out.write(",(")
-
-    def _write_leaf(self, node, out):
-        if not (node._parent_node is None or node._parent_node._child_nodes[0] is node):
-            out.write(",")
-        self._write_node_body(node, out)
-
-    def _write_node_close(self, node, out):
-        out.write(")")
-        self._write_node_body(node, out)
+                    ))
+        if not self.suppress_item_comments:
+            parts.append(self._compose_comment_string(tree))
+        # Stack entries are (node, is_first_child), with ``is_first_child``
+        # set to |None| for internal nodes whose subtrees have been written.
+        stack = [(tree.seed_node, True)]
+        while stack:
+            node, is_first_child = stack.pop()
+            if is_first_child is None:
+                parts.append(")")
+                self._compose_node_body(node, parts)
+                continue
+            if not is_first_child:
+                parts.append(",")
+            child_nodes = node._child_nodes
+            if child_nodes:
+                parts.append("(")
+                stack.append((node, None))
+                for child in child_nodes[:0:-1]:
+                    stack.append((child, False))
+                stack.append((child_nodes[0], True))
+            else:
+                self._compose_node_body(node, parts)
+        parts.append(";")
 
-    def _write_node_body(self, node, out):
-        out.write(self._render_node_tag(node))
-        if node.edge and node.edge.length != None and not self.suppress_edge_lengths:
-            out.write(":{}".format(self.edge_label_compose_fn(node.edge)))
+    def _compose_node_body(self, node, parts):
+        parts.append(self._render_node_tag(node))
+        edge = node.edge
+        if edge and edge.length != None and not self.suppress_edge_lengths:
+            parts.append(":{}".format(self.edge_label_compose_fn(edge)))
         if not self.suppress_annotations:
-            node_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(node_annotation_comments)
-            edge_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node.edge,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(edge_annotation_comments)
-        out.write(self._compose_comment_string(node))
-        out.write(self._compose_comment_string(node.edge))
+            if node.has_annotations:
+                parts.append(nexusprocessing.format_item_annotations_as_comments(node,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier))
+            if edge.has_annotations:
+                parts.append(nexusprocessing.format_item_annotations_as_comments(edge,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier))
+        if not self.suppress_item_comments:
+            parts.append(self._compose_comment_string(node))
+            parts.append(self._compose_comment_string(edge))
 
     def _compose_comment_string(self, item):
         if not self.suppress_item_comments and item.comments:
@@ -347,38 +388,23 @@ class NewickWriter(ioservice.DataWriter):
         if self.node_label_compose_fn:
             tag = self.node_label_compose_fn(node)
         else:
-            tag_parts = []
-            is_leaf = len(node.child_nodes()) == 0
-            if is_leaf:
-                if hasattr(node, 'taxon') \
-                        and node.taxon \
-                        and node.taxon.label is not None \
-                        and not self.suppress_leaf_taxon_labels:
-                    tag_parts.append(self._get_taxon_tree_token(node.taxon))
-                if hasattr(node, 'label') \
-                        and node.label \
-                        and node.label is not None \
-                        and not self.suppress_leaf_node_labels:
-                    tag_parts.append(str(node.label))
-                if len(tag_parts) > 0:
-                    tag = self.node_label_element_separator.join(tag_parts)
-                else:
-                    return "" # anonymous leaf
+            if node._child_nodes:
+                suppress_taxon_labels = self.suppress_internal_taxon_labels
+                suppress_node_labels = self.suppress_internal_node_labels
+            else:
+                suppress_taxon_labels = self.suppress_leaf_taxon_labels
+                suppress_node_labels = self.suppress_leaf_node_labels
+            taxon = node.taxon
+            if taxon is not None and taxon.label is not None and not suppress_taxon_labels:
+                if suppress_node_labels or not node.label:
+                    return self._get_taxon_tag(taxon)
+                tag = self.node_label_element_separator.join([
+                    self._get_taxon_tree_token(taxon),
+                    str(node.label)])
+            elif node.label and not suppress_node_labels:
+                tag = str(node.label)
             else:
-                if hasattr(node, 'taxon') \
-                        and node.taxon \
-                        and node.taxon.label is not None \
-                        and not self.suppress_internal_taxon_labels:
-                    tag_parts.append(self._get_taxon_tree_token(node.taxon))
-                if hasattr(node, 'label') \
-                        and node.label \
-                        and node.label is not None \
-                        and not self.suppress_internal_node_labels:
-                    tag_parts.append(str(node.label))
-                if len(tag_parts) > 0:
-                    tag = self.node_label_element_separator.join(tag_parts)
-                else:
-                    return ""
+                return ""
         if tag:
             tag = nexusprocessing.escape_nexus_token(tag,
                     preserve_spaces=self.preserve_spaces,
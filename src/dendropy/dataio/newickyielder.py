@@ -45,6 +45,14 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the start of each source to skip. The
+            statements of these trees are scanned over without the trees
+            being built (or their taxa being added to the taxon namespace).
+        threaded_decompression : bool
+            If |True|, then sources given by path that are compressed (which
+            are recognized and decompressed automatically) are decompressed
+            in a background thread.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `newickreader.NexusReader`
             class. See `newickreader.NexusReader` for details.
@@ -52,7 +60,9 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", 0),
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
         self.newick_reader = newickreader.NewickReader(**kwargs)
 
     ###########################################################################
@@ -65,6 +75,12 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
                 taxon_namespace=self.attached_taxon_namespace,
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.newick_reader.case_sensitive_taxon_labels)
+        for tree_idx in range(self.tree_offset):
+            if not self.newick_reader._skip_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree_factory=self.tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol):
+                return
         while True:
             tree = self.newick_reader._parse_tree_statement(
                     nexus_tokenizer=nexus_tokenizer,
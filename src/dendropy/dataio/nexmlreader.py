@@ -280,15 +280,22 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
             char_matrix_factory=None,
             state_alphabet_factory=None,
             global_annotations_target=None):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
         self._taxon_namespace_factory = taxon_namespace_factory
         self._tree_list_factory = tree_list_factory
         self._char_matrix_factory = char_matrix_factory
         self._state_alphabet_factory = state_alphabet_factory
         self._global_annotations_target = global_annotations_target
-        self._parse_document(xml_doc)
+        tree_parser = None
+        for item_type, element, context in self._iterparse_document(stream,
+                parse_char_matrices=self._char_matrix_factory is not None,
+                parse_tree_lists=self._tree_list_factory is not None):
+            if item_type == "tree":
+                if tree_parser is None:
+                    tree_parser = self._new_tree_parser()
+                tree_list, otus_id = context
+                tree_parser.build_tree(tree_list.new_tree(), element, otus_id)
+            else:
+                context.parse_char_row(element)
         self._product = self.Product(
                 taxon_namespaces=self._taxon_namespaces,
                 tree_lists=self._tree_lists,
@@ -335,67 +342,155 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
 
     ## Following methods are class-specific ###
 
-    def _parse_document(self, xml_doc):
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
-        if self._char_matrix_factory is not None:
-            self._parse_char_matrices(xml_root)
-        if self._tree_list_factory is not None:
-            self._parse_tree_lists(xml_root)
-        if self._global_annotations_target is not None:
-            top_annotations = [i for i in xml_root.findall_annotations()]
-            for annotation in top_annotations:
-                self._parse_annotations(self._global_annotations_target, annotation)
-
-    def _parse_taxon_namespaces(self, xml_root):
-        for nxtaxa in xml_root.iter_otus():
-            taxon_namespace_label = nxtaxa.get('label', None)
-            taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
-            taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
-            self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
-            annotations = [i for i in nxtaxa.findall_annotations()]
+    def _iterparse_document(self,
+            stream,
+            parse_char_matrices=True,
+            parse_tree_lists=True):
+        """
+        Parses the NeXML document in ``stream`` incrementally. Elements are
+        discarded as soon as they have been processed, so that memory use is
+        bounded by the size of the largest "otus", matrix "row" or "tree"
+        element, rather than by the size of the whole document.
+
+        Taxon namespaces, the definitions of character matrices and
+        tree lists, and annotations are processed here, while the following
+        items are yielded, to be processed by the caller before iteration
+        continues:
+
+            -   ``("char_row", nxrow, char_block_parser)`` for each row of a
+                character matrix, if ``parse_char_matrices`` is |True|.
+            -   ``("tree", nxtree, (tree_list, otus_id))`` for each tree, if
+                ``parse_tree_lists`` is |True|. ``tree_list`` is |None| if
+                ``self._tree_list_factory`` is |None|.
+        """
+        xml_doc = xmlprocessing.XmlDocument(
+                subelement_factory=self._subelement_factory)
+        self._namespace_registry = xml_doc.namespace_registry
+        otus_tag = self._compose_tag("otus")
+        characters_tag = self._compose_tag("characters")
+        format_tag = self._compose_tag("format")
+        matrix_tag = self._compose_tag("matrix")
+        row_tag = self._compose_tag("row")
+        trees_tag = self._compose_tag("trees")
+        tree_tag = self._compose_tag("tree")
+        meta_tag = self._compose_tag("meta")
+        char_block_parser = None
+        trees_context = None
+        for event, depth, element, parent in xml_doc.iterparse(stream, max_depth=3):
+            tag = element.tag
+            if event == "start":
+                if depth != 1 and not (depth == 2 and tag == matrix_tag):
+                    continue
+                if tag == characters_tag and parse_char_matrices:
+                    char_block_parser = self._new_char_block_parser()
+                    char_block_parser.begin_char_matrix(element)
+                elif tag == matrix_tag and char_block_parser is not None:
+                    char_block_parser.begin_char_matrix_rows()
+                elif tag == trees_tag and parse_tree_lists:
+                    trees_context = self._begin_tree_list(element, len(self._tree_lists))
+                continue
+            if depth == 1:
+                if tag == otus_tag:
+                    self._parse_taxon_namespace(element)
+                elif tag == meta_tag:
+                    if self._global_annotations_target is not None:
+                        self._parse_annotations(self._global_annotations_target, element)
+                elif tag == characters_tag:
+                    char_block_parser = None
+                elif tag == trees_tag:
+                    trees_context = None
+            elif depth == 2:
+                if parent.tag != characters_tag and parent.tag != trees_tag:
+                    # the taxa of "otus" elements etc. are processed with
+                    # their parent elements
+                    continue
+                if tag == tree_tag:
+                    if trees_context is not None:
+                        yield "tree", element, trees_context
+                elif tag == meta_tag:
+                    if char_block_parser is not None and parent.tag == characters_tag:
+                        char_block_parser._parse_annotations(char_block_parser._char_matrix, element)
+                    elif trees_context is not None and trees_context[0] is not None and parent.tag == trees_tag:
+                        self._parse_annotations(trees_context[0], element)
+                elif tag == format_tag:
+                    if char_block_parser is not None:
+                        char_block_parser.parse_characters_format(element,
+                                char_block_parser._data_type,
+                                char_block_parser._char_matrix)
+            elif depth == 3:
+                if parent.tag != matrix_tag:
+                    # the nodes and edges of trees etc. are processed with
+                    # their parent elements
+                    continue
+                if tag == row_tag:
+                    if char_block_parser is not None:
+                        yield "char_row", element, char_block_parser
+                elif tag == meta_tag:
+                    if char_block_parser is not None:
+                        char_block_parser._parse_annotations(char_block_parser._char_matrix.taxon_seq_map, element)
+            if parent is not None:
+                parent.remove(element)
+
+    def _compose_tag(self, tag):
+        if self.default_namespace:
+            return "{%s}%s" % (self.default_namespace, tag)
+        return tag
+
+    def _parse_taxon_namespace(self, nxtaxa):
+        taxon_namespace_label = nxtaxa.get('label', None)
+        taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
+        taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
+        self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
+        annotations = [i for i in nxtaxa.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(taxon_namespace, annotation)
+        if self.case_sensitive_taxon_labels:
+            label_taxon_map = {}
+        else:
+            label_taxon_map = container.OrderedCaselessDict()
+        if self.attached_taxon_namespace is not None:
+            for t in taxon_namespace:
+                label_taxon_map[t.label] = t
+        for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
+            taxon = None
+            taxon_label = nxtaxon.get('label', None)
+            taxon_oid = nxtaxon.get('id', id(nxtaxon))
+            if taxon_label is not None and self.attached_taxon_namespace is not None:
+                # taxon = label_taxon_map.get_taxon(
+                #         label=taxon_label,
+                #         case_sensitive=self.case_sensitive_taxon_labels)
+                try:
+                    taxon = label_taxon_map[taxon_label]
+                except KeyError:
+                    taxon = None
+            if taxon is None:
+                taxon = taxon_namespace.new_taxon(label=taxon_label)
+            annotations = [i for i in nxtaxon.findall_annotations()]
             for annotation in annotations:
-                self._parse_annotations(taxon_namespace, annotation)
-            if self.case_sensitive_taxon_labels:
-                label_taxon_map = {}
-            else:
-                label_taxon_map = container.OrderedCaselessDict()
-            if self.attached_taxon_namespace is not None:
-                for t in taxon_namespace:
-                    label_taxon_map[t.label] = t
-            for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
-                taxon = None
-                taxon_label = nxtaxon.get('label', None)
-                taxon_oid = nxtaxon.get('id', id(nxtaxon))
-                if taxon_label is not None and self.attached_taxon_namespace is not None:
-                    # taxon = label_taxon_map.get_taxon(
-                    #         label=taxon_label,
-                    #         case_sensitive=self.case_sensitive_taxon_labels)
-                    try:
-                        taxon = label_taxon_map[taxon_label]
-                    except KeyError:
-                        taxon = None
-                if taxon is None:
-                    taxon = taxon_namespace.new_taxon(label=taxon_label)
-                annotations = [i for i in nxtaxon.findall_annotations()]
-                for annotation in annotations:
-                    self._parse_annotations(taxon, annotation)
-                self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
-
-    def _parse_char_matrices(self, xml_root):
-        nxc = _NexmlCharBlockParser(self._namespace_registry,
+                self._parse_annotations(taxon, annotation)
+            self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
+
+    def _new_char_block_parser(self):
+        return _NexmlCharBlockParser(self._namespace_registry,
                 self._id_taxon_namespace_map,
                 self._id_taxon_map,
                 self._new_char_matrix,
                 self._state_alphabet_factory)
-        for char_matrix_element in xml_root.iter_characters():
-            nxc.parse_char_matrix(char_matrix_element)
 
-    def _parse_tree_lists(self, xml_root):
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            self._parse_tree_list(trees_element, trees_idx, True)
+    def _new_tree_parser(self):
+        return _NexmlTreeParser(
+                id_taxon_map=self._id_taxon_map,
+                annotations_processor_fn=self._parse_annotations,
+                )
 
-    def _parse_tree_list(self, nxtrees, trees_idx=None, add_to_tree_list=True):
+    def _begin_tree_list(self, nxtrees, trees_idx=None):
+        """
+        Given an XmlElement representing a nexml trees block, of which only
+        the attributes need to have been parsed, returns a tuple of the
+        |TreeList| to which trees are to be added (or |None| if
+        ``self._tree_list_factory`` is |None|) and the id of the taxa block
+        of the trees.
+        """
         trees_id = nxtrees.get('id', "Trees" + str(trees_idx))
         trees_label = nxtrees.get('label', None)
         otus_id = nxtrees.get('otus', None)
@@ -404,19 +499,12 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
         taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
         if not taxon_namespace:
             raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
+        if self._tree_list_factory is None:
+            return None, otus_id
         tree_list = self._new_tree_list(
                 label=trees_label,
                 taxon_namespace=taxon_namespace)
-        annotations = [i for i in nxtrees.findall_annotations()]
-        for annotation in annotations:
-            self._parse_annotations(tree_list, annotation)
-        tree_parser = _NexmlTreeParser(
-                id_taxon_map=self._id_taxon_map,
-                annotations_processor_fn=self._parse_annotations,
-                )
-        for tree_element in nxtrees.findall_tree():
-            tree_obj = tree_list.new_tree()
-            tree_parser.build_tree(tree_obj, tree_element, otus_id)
+        return tree_list, otus_id
 
 class _NexmlTreeParser(object):
 
@@ -599,6 +687,32 @@ class _NexmlCharBlockParser(_AnnotationParser):
         Given an XmlElement representing a nexml characters block, this
         instantiates and returns a corresponding DendroPy CharacterMatrix object.
         """
+        char_matrix = self.begin_char_matrix(nxchars)
+        annotations = [i for i in nxchars.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(char_matrix, annotation)
+        nxformat = nxchars.find_char_format()
+        if nxformat is not None:
+            self.parse_characters_format(nxformat, self._data_type, char_matrix)
+        nxmatrix = nxchars.find_char_matrix()
+        self.begin_char_matrix_rows()
+        annotations = [i for i in nxmatrix.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(char_matrix.taxon_seq_map, annotation)
+        for nxrow in nxmatrix.findall_char_row():
+            self.parse_char_row(nxrow)
+        # if fixed_state_alphabet:
+        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+        return char_matrix
+
+    def begin_char_matrix(self, nxchars):
+        """
+        Given an XmlElement representing a nexml characters block, of which
+        only the attributes need to have been parsed, this instantiates and
+        returns the corresponding DendroPy CharacterMatrix object, to be
+        populated by subsequent calls to ``parse_characters_format()`` and
+        ``parse_char_row()``.
+        """
 
         # clear
         self._id_state_alphabet_map = {}
@@ -606,6 +720,7 @@ class _NexmlCharBlockParser(_AnnotationParser):
         self._id_chartype_map = {}
         self._char_types = []
         self._chartype_id_to_pos_map = {}
+        self._is_format_parsed = False
 
         # initiaiize
         label = nxchars.get('label', None)
@@ -614,10 +729,10 @@ class _NexmlCharBlockParser(_AnnotationParser):
         # set up taxa
         otus_id = nxchars.get('otus', None)
         if otus_id is None:
-            raise Exception("Character Block %s (\"%s\"): Taxon namespace not specified" % (char_matrix_oid, char_matrix.label))
+            raise Exception("Character Block %s (\"%s\"): Taxon namespace not specified" % (char_matrix_oid, label))
         taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
         if not taxon_namespace:
-            raise Exception("Character Block %s (\"%s\"): Specified taxon namespace not found" % (char_matrix_oid, char_matrix.label))
+            raise Exception("Character Block %s (\"%s\"): Specified taxon namespace not found" % (char_matrix_oid, label))
 
         # character matrix instantiation
         nxchartype = nxchars.parse_type()
@@ -636,119 +751,125 @@ class _NexmlCharBlockParser(_AnnotationParser):
         elif nxchartype.startswith('Continuous'):
             data_type = "continuous"
         else:
-            raise Exception("Character Block %s (\"%s\"): Character type '%s' not supported" % (char_matrix_oid, char_matrix.label, nxchartype))
+            raise Exception("Character Block %s (\"%s\"): Character type '%s' not supported" % (char_matrix_oid, label, nxchartype))
         char_matrix = self._char_matrix_factory(
                 data_type,
                 taxon_namespace=taxon_namespace,
                 label=label,
                 **extra_kwargs)
+        self._char_matrix = char_matrix
+        self._char_matrix_oid = char_matrix_oid
+        self._otus_id = otus_id
+        self._nxchartype = nxchartype
+        self._data_type = data_type
+        return char_matrix
 
-        # annotation processing
-        annotations = [i for i in nxchars.findall_annotations()]
-        for annotation in annotations:
-            self._parse_annotations(char_matrix, annotation)
+    def begin_char_matrix_rows(self):
+        """
+        To be called once the format definition of the current characters
+        block (if any) has been parsed, before the rows are parsed.
+        """
+        if not self._is_format_parsed and self._data_type == "standard":
+            self.create_standard_character_alphabet(self._char_matrix)
 
-        # get state mappings
-        nxformat = nxchars.find_char_format()
-        if nxformat is not None:
-            self.parse_characters_format(nxformat, data_type, char_matrix)
-        elif data_type == "standard":
-            self.create_standard_character_alphabet(char_matrix)
+    def parse_char_row(self, nxrow):
+        """
+        Given an XmlElement representing a row of the matrix of the current
+        characters block, this adds the corresponding character sequence to
+        the character matrix, and returns the |Taxon| and the sequence.
+        """
+        char_matrix = self._char_matrix
+        char_matrix_oid = self._char_matrix_oid
+        otus_id = self._otus_id
+        nxchartype = self._nxchartype
+        data_type = self._data_type
+        row_id = nxrow.get('id', None)
+        label = nxrow.get('label', None)
+        taxon_id = nxrow.get('otu', None)
+        try:
+            taxon = self._id_taxon_map[(otus_id, taxon_id)]
+        except KeyError:
+            raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
 
-        nxmatrix = nxchars.find_char_matrix()
-        annotations = [i for i in nxmatrix.findall_annotations()]
+        character_vector = char_matrix.new_sequence(taxon=taxon)
+        annotations = [i for i in nxrow.findall_annotations()]
         for annotation in annotations:
-            self._parse_annotations(char_matrix.taxon_seq_map, annotation)
-        for nxrow in nxmatrix.findall_char_row():
-            row_id = nxrow.get('id', None)
-            label = nxrow.get('label', None)
-            taxon_id = nxrow.get('otu', None)
-            try:
-                taxon = self._id_taxon_map[(otus_id, taxon_id)]
-            except KeyError:
-                raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
-
-            character_vector = char_matrix.new_sequence(taxon=taxon)
-            annotations = [i for i in nxrow.findall_annotations()]
-            for annotation in annotations:
-                self._parse_annotations(character_vector, annotation)
-
-            if data_type == "continuous":
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
-                        col_idx = -1
-                        for char in seq.split(' '):
-                            char = char.strip()
-                            if char:
-                                col_idx += 1
-                                if len(self._char_types) <= col_idx:
-                                    raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                        + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
-                                character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        pos_idx = self._char_types.index(chartype)
-#                         column = id_chartype_map[chartype_id]
-#                         state = column.state_id_map[cell.get('state', None)]
-                        # annotations = [i for i in nxcell.findall_annotations]
-                        # for annotation in annotations:
-                        #     self._parse_annotations(cell, annotation)
-                        character_vector.append(character_value=float(nxcell.get('state')),
-                                character_type=chartype)
-            else:
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
-                        col_idx = -1
-                        for char in seq:
+            self._parse_annotations(character_vector, annotation)
+
+        if data_type == "continuous":
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
+                    col_idx = -1
+                    for char in seq.split(' '):
+                        char = char.strip()
+                        if char:
                             col_idx += 1
-                            state_alphabet = char_matrix.character_types[col_idx].state_alphabet
-                            try:
-                                state = state_alphabet[char]
-                            except KeyError:
-                                raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
-                                        % (row_id, col_idx, char, seq))
                             if len(self._char_types) <= col_idx:
                                 raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                    + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
-                            character_type = self._char_types[col_idx]
-                            character_vector.append(character_value=state,
-                                    character_type=character_type)
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
-                        pos_idx = self._chartype_id_to_pos_map[chartype_id]
-                        state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
-                        character_vector.set_at(pos_idx,
-                                character_value=state,
-                                character_type=chartype)
-                        # self._id_state_alphabet_map = {}
-                        # self._id_state_map = {}
-                        # self._id_chartype_map = {}
-
-            char_matrix[taxon] = character_vector
-
-        # if fixed_state_alphabet:
-        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+                                    + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
+                            character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    pos_idx = self._char_types.index(chartype)
+#                     column = id_chartype_map[chartype_id]
+#                     state = column.state_id_map[cell.get('state', None)]
+                    # annotations = [i for i in nxcell.findall_annotations]
+                    # for annotation in annotations:
+                    #     self._parse_annotations(cell, annotation)
+                    character_vector.append(character_value=float(nxcell.get('state')),
+                            character_type=chartype)
+        else:
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
+                    col_idx = -1
+                    for char in seq:
+                        col_idx += 1
+                        state_alphabet = char_matrix.character_types[col_idx].state_alphabet
+                        try:
+                            state = state_alphabet[char]
+                        except KeyError:
+                            raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
+                                    % (row_id, col_idx, char, seq))
+                        if len(self._char_types) <= col_idx:
+                            raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
+                                + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
+                        character_type = self._char_types[col_idx]
+                        character_vector.append(character_value=state,
+                                character_type=character_type)
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
+                    pos_idx = self._chartype_id_to_pos_map[chartype_id]
+                    state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
+                    character_vector.set_at(pos_idx,
+                            character_value=state,
+                            character_type=chartype)
+                    # self._id_state_alphabet_map = {}
+                    # self._id_state_map = {}
+                    # self._id_chartype_map = {}
+
+        char_matrix[taxon] = character_vector
+        return taxon, character_vector
 
     def parse_ambiguous_state(self, nxstate, state_alphabet):
         """
@@ -873,6 +994,7 @@ class _NexmlCharBlockParser(_AnnotationParser):
         else:
             for nxstates in nxformat.findall_char_states():
                 char_matrix.state_alphabets.append(self.parse_state_alphabet(nxstates))
+        self._is_format_parsed = True
         for nxchars in nxformat.findall_char():
             col = char_matrix.new_character_type()
             char_state_set_id = nxchars.get('states')
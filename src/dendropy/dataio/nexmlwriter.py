@@ -124,6 +124,7 @@ class NexmlWriter(ioservice.DataWriter):
         self._taxon_namespaces_to_write = []
         self._taxon_namespace_id_map = {}
         self._object_xml_id = {}
+        self._num_xml_ids = 0
         self._taxon_id_map = {}
         self._node_id_map = {}
         self._state_alphabet_id_map = {}
@@ -216,7 +217,56 @@ class NexmlWriter(ioservice.DataWriter):
         dest.write(self.indent * indent_level)
         dest.write('</otus>\n')
 
+    def _write_tree_stream_open(self, stream, tree_list):
+        self._taxon_namespaces_to_write = [tree_list.taxon_namespace]
+        self._taxon_namespace_id_map = {}
+        self._taxon_id_map = {}
+        self._node_id_map = {}
+        body = StringIO()
+        self._write_taxon_namespace(tree_list.taxon_namespace, body)
+        self._write_tree_list_open(tree_list, body)
+        # Trees are yet to come, so the namespace of annotations created by
+        # DendroPy (e.g., from NEXUS/Newick comment metadata) is declared
+        # up front
+        if not any(prefix == "dendropy" for prefix, uri in self._prefix_uri_tuples):
+            self._prefix_uri_tuples.add(("dendropy", "http://packages.python.org/DendroPy/"))
+        self._write_to_nexml_open(stream, indent_level=0)
+        stream.write(body.getvalue())
+        self._declared_prefix_uri_tuples = set(self._prefix_uri_tuples)
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_idx):
+        # Only the ids of the taxa, taxon namespace, and tree list need to
+        # persist across trees; discarding the rest keeps memory use constant.
+        object_xml_id = self._object_xml_id
+        self._object_xml_id = dict((o, object_xml_id[o]) for o in self._taxon_id_map)
+        self._object_xml_id[tree_list] = object_xml_id[tree_list]
+        self._object_xml_id[tree_list.taxon_namespace] = object_xml_id[tree_list.taxon_namespace]
+        self._node_id_map = {}
+        body = StringIO()
+        self._write_tree(tree=tree, dest=body, indent_level=2)
+        tree_xml = body.getvalue()
+        # Namespaces of annotations that were not known when the document
+        # element was written are declared on the tree element instead.
+        undeclared = self._prefix_uri_tuples - self._declared_prefix_uri_tuples
+        if undeclared:
+            self._prefix_uri_tuples = set(self._declared_prefix_uri_tuples)
+            xmlns = "".join(' xmlns{}="{}"'.format(":" + prefix if prefix else "", uri)
+                    for prefix, uri in sorted(undeclared))
+            tag_name_end = tree_xml.index("<tree") + len("<tree")
+            tree_xml = tree_xml[:tag_name_end] + xmlns + tree_xml[tag_name_end:]
+        stream.write(tree_xml)
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        self._write_tree_list_close(stream)
+        self._write_to_nexml_close(stream, indent_level=0)
+
     def _write_tree_list(self, tree_list, dest, indent_level=1):
+        self._write_tree_list_open(tree_list, dest, indent_level=indent_level)
+        for tree in tree_list:
+            self._write_tree(tree=tree, dest=dest, indent_level=2)
+        self._write_tree_list_close(dest, indent_level=indent_level)
+
+    def _write_tree_list_open(self, tree_list, dest, indent_level=1):
         dest.write(self.indent * indent_level)
         parts = []
         parts.append('trees')
@@ -228,8 +278,8 @@ class NexmlWriter(ioservice.DataWriter):
         if tree_list.has_annotations or (hasattr(tree_list, "comments") and tree_list.comments):
             self._write_annotations_and_comments(tree_list, dest,
                     indent_level=indent_level+1)
-        for tree in tree_list:
-            self._write_tree(tree=tree, dest=dest, indent_level=2)
+
+    def _write_tree_list_close(self, dest, indent_level=1):
         dest.write(self.indent * indent_level)
         dest.write('</trees>\n')
 
@@ -613,7 +663,8 @@ class NexmlWriter(ioservice.DataWriter):
         try:
             return self._object_xml_id[o]
         except KeyError:
-            oid = "d{}".format(len(self._object_xml_id))
+            oid = "d{}".format(self._num_xml_ids)
+            self._num_xml_ids += 1
             self._object_xml_id[o] = oid
             return oid
 
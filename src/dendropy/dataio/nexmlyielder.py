@@ -18,7 +18,7 @@
 ##############################################################################
 
 """
-Implementation of NEXML-schema tree iterator.
+Implementation of NEXML-schema tree and character sequence iterators.
 """
 
 import sys
@@ -26,7 +26,9 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 from dendropy.dataio import ioservice
 from dendropy.dataio import nexmlreader
-from dendropy.dataio import xmlprocessing
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import charmatrixmodel
+from dendropy.datamodel import charstatemodel
 
 class NexmlTreeDataYielder(
         ioservice.TreeDataYielder,
@@ -49,6 +51,13 @@ class NexmlTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the start of each source to skip. The elements
+            of these trees are passed over without the trees being built.
+        threaded_decompression : bool
+            If |True|, then sources given by path that are compressed (which
+            are recognized and decompressed automatically) are decompressed
+            in a background thread.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexmlreader.NexusReader`
             class. See `nexmlreader.NexusReader` for details.
@@ -56,7 +65,9 @@ class NexmlTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", 0),
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
         nexmlreader.NexmlReader.__init__(self,
                 **kwargs)
         self.attached_taxon_namespace = self.taxon_namespace
@@ -65,25 +76,87 @@ class NexmlTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
-        tree_parser = nexmlreader._NexmlTreeParser(
-                id_taxon_map=self._id_taxon_map,
-                annotations_processor_fn=self._parse_annotations,
-                )
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            trees_id = trees_element.get('id', "Trees" + str(trees_idx))
-            trees_label = trees_element.get('label', None)
-            otus_id = trees_element.get('otus', None)
-            if otus_id is None:
-                raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
-            taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
-            if not taxon_namespace:
-                raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-            for tree_element in trees_element.findall_tree():
-                tree_obj = self.tree_factory()
-                tree_parser.build_tree(tree_obj, tree_element, otus_id)
-                yield tree_obj
+        num_trees_to_skip = self.tree_offset
+        tree_parser = None
+        for item_type, element, context in self._iterparse_document(stream,
+                parse_char_matrices=False,
+                parse_tree_lists=True):
+            if num_trees_to_skip > 0:
+                num_trees_to_skip -= 1
+                continue
+            if tree_parser is None:
+                tree_parser = self._new_tree_parser()
+            tree_list, otus_id = context
+            tree_obj = self.tree_factory()
+            tree_parser.build_tree(tree_obj, element, otus_id)
+            yield tree_obj
+
+class NexmlCharacterDataSequenceYielder(
+        ioservice.DataYielder,
+        nexmlreader.NexmlReader):
+    """
+    Yields the rows of the character matrices of NEXML sources one at a time,
+    as tuples of the |Taxon| and the |CharacterDataSequence| of each row. The
+    character matrix to which the current row belongs (but which does not
+    retain any rows) is available as ``current_char_matrix``.
+    """
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string, then it is assumed to be a path to a file. Otherwise, the
+            source is assumed to be a file-like object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions. If not specified, a new one will be created.
+        threaded_decompression : bool
+            If |True|, then sources given by path that are compressed (which
+            are recognized and decompressed automatically) are decompressed
+            in a background thread.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base `nexmlreader.NexusReader`
+            class. See `nexmlreader.NexusReader` for details.
+        """
+        ioservice.DataYielder.__init__(self,
+                files=files,
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
+        nexmlreader.NexmlReader.__init__(self,
+                **kwargs)
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        self.taxon_namespace = taxon_namespace
+        self.attached_taxon_namespace = self.taxon_namespace
+        self._char_matrix_factory = charmatrixmodel.new_char_matrix
+        self._state_alphabet_factory = charstatemodel.StateAlphabet
+        self.current_char_matrix = None
+
+    ###########################################################################
+    ## Data Management
+
+    def _new_char_matrix(self, data_type, taxon_namespace, label=None, **kwargs):
+        # matrices are not accumulated
+        self.current_char_matrix = self._char_matrix_factory(
+                data_type,
+                taxon_namespace=taxon_namespace,
+                label=label,
+                **kwargs)
+        return self.current_char_matrix
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        for item_type, element, char_block_parser in self._iterparse_document(stream,
+                parse_char_matrices=True,
+                parse_tree_lists=False):
+            taxon, character_vector = char_block_parser.parse_char_row(element)
+            del char_block_parser._char_matrix[taxon]
+            yield taxon, character_vector
@@ -37,7 +37,8 @@ from dendropy.datamodel import basemodel
 class NexusTokenizer(Tokenizer):
 
     def __init__(self, src,
-            preserve_unquoted_underscores=False):
+            preserve_unquoted_underscores=False,
+            block_size=None):
         Tokenizer.__init__(self,
             src=src,
             uncaptured_delimiters=list(" \t\n\r"),
@@ -48,7 +49,8 @@ class NexusTokenizer(Tokenizer):
             comment_begin="[",
             comment_end="]",
             capture_comments=True,
-            preserve_unquoted_underscores=preserve_unquoted_underscores)
+            preserve_unquoted_underscores=preserve_unquoted_underscores,
+            block_size=block_size)
         # self.preserve_unquoted_underscores = preserve_unquoted_underscores
 
     # def __next__(self):
@@ -85,6 +87,7 @@ class NexusTokenizer(Tokenizer):
                 self.uncaptured_delimiters.append("\n")
             if "\r" not in self.uncaptured_delimiters:
                 self.uncaptured_delimiters.append("\r")
+        self.compile_scanners()
 
     def set_hyphens_as_captured_delimiters(self, hyphens_as_captured_delimiters):
         if hyphens_as_captured_delimiters:
@@ -95,6 +98,7 @@ class NexusTokenizer(Tokenizer):
                 self.captured_delimiters.remove("-")
             except ValueError:
                 pass
+        self.compile_scanners()
 
     def require_next_token_ucase(self):
         t = self.require_next_token()
@@ -119,10 +123,12 @@ class NexusTokenizer(Tokenizer):
 
     def process_and_clear_comments_for_item(self,
             item,
-            extract_comment_metadata):
+            extract_comment_metadata,
+            comment_metadata_keys=None):
         process_comments_for_item(item,
                 self.captured_comments,
-                extract_comment_metadata)
+                extract_comment_metadata,
+                comment_metadata_keys=comment_metadata_keys)
         del self.captured_comments[:]
 
     def skip_to_semicolon(self):
@@ -284,12 +290,36 @@ class NexusTaxonSymbolMapper(object):
 FIGTREE_COMMENT_FIELD_PATTERN = re.compile(r'(.+?)=({.+?,.+?}|.+?)(,|$)')
 NHX_COMMENT_FIELD_PATTERN = re.compile(r'(.+?)=({.+?,.+?}|.+?)(:|$)')
 
+def _get_comment_metadata_field_pattern(comment):
+    """
+    Returns the pattern to be used to extract fields from the metadata
+    comment, ``comment``, and the part of the comment to which it should be
+    applied, or ``(None, None)`` if the comment is not a metadata comment.
+    """
+    if comment.startswith("&&NHX:"):
+        return NHX_COMMENT_FIELD_PATTERN, comment[6:]
+    elif comment.startswith("&&"):
+        return NHX_COMMENT_FIELD_PATTERN, comment[2:]
+    elif comment.startswith("&"):
+        return FIGTREE_COMMENT_FIELD_PATTERN, comment[1:]
+    else:
+        return None, None
+
+def is_comment_metadata(comment):
+    """
+    Returns |True| if ``comment`` has at least one metadata field that can be
+    parsed into an |Annotation| by :func:`parse_comment_metadata_to_annotations`.
+    """
+    pattern, comment = _get_comment_metadata_field_pattern(comment)
+    return pattern is not None and pattern.search(comment) is not None
+
 def parse_comment_metadata_to_annotations(
         comment,
         annotations=None,
         field_name_map=None,
         field_value_types=None,
-        strip_leading_trailing_spaces=True):
+        strip_leading_trailing_spaces=True,
+        field_names=None):
     """
     Returns set of |Annotation| objects corresponding to metadata
     given in comments.
@@ -310,6 +340,9 @@ def parse_comment_metadata_to_annotations(
         string) to the value type (e.g. {"node-age" : float}.
     ``strip_leading_trailing_spaces`` : boolean
         Remove whitespace from comments.
+    ``field_names`` : iterable of strings
+        If given, then only fields with names (as given in the comment string)
+        in this collection will be parsed; all other fields are skipped.
 
     Returns
     -------
@@ -323,16 +356,8 @@ def parse_comment_metadata_to_annotations(
         field_name_map = {}
     if field_value_types is None:
         field_value_types = {}
-    if comment.startswith("&&NHX:"):
-        pattern = NHX_COMMENT_FIELD_PATTERN
-        comment = comment[6:]
-    elif comment.startswith("&&"):
-        pattern = NHX_COMMENT_FIELD_PATTERN
-        comment = comment[2:]
-    elif comment.startswith("&"):
-        pattern = FIGTREE_COMMENT_FIELD_PATTERN
-        comment = comment[1:]
-    else:
+    pattern, comment = _get_comment_metadata_field_pattern(comment)
+    if pattern is None:
         # unrecognized metadata pattern
         return annotations
     for match_group in pattern.findall(comment):
@@ -340,6 +365,8 @@ def parse_comment_metadata_to_annotations(
         if strip_leading_trailing_spaces:
             key = key.strip()
             val = val.strip()
+        if field_names is not None and key not in field_names:
+            continue
         if key in field_value_types:
             value_type = field_value_types[key]
         else:
@@ -374,18 +401,57 @@ def parse_comment_metadata_to_annotations(
         annotations.add(annote)
     return annotations
 
+class CommentMetadataParser(object):
+    """
+    Callable that parses a metadata comment into a set of |Annotation|
+    objects, restricted to the given field names if any. Instances of this
+    class are registered with |Annotable| objects (see
+    :meth:`Annotable.defer_annotations`) to defer parsing of metadata comments
+    until the annotations are actually accessed.
+    """
+
+    def __init__(self, field_names=None):
+        if field_names is not None:
+            field_names = frozenset(field_names)
+        self.field_names = field_names
+
+    def __call__(self, comment):
+        return parse_comment_metadata_to_annotations(
+                comment,
+                field_names=self.field_names)
+
 def process_comments_for_item(item,
         item_comments,
-        extract_comment_metadata):
+        extract_comment_metadata,
+        comment_metadata_keys=None,
+        defer_comment_metadata=None):
+    """
+    Stores the comments in ``item_comments`` with ``item``.
+
+    If ``extract_comment_metadata`` is |True|, metadata comments are parsed
+    and stored as annotations of ``item``, restricted to the field names in
+    ``comment_metadata_keys`` if this is not |None|. If
+    ``defer_comment_metadata`` is given, it should be a
+    :class:`CommentMetadataParser`: metadata comments are then stored
+    unparsed with ``item`` and only parsed when the annotations of ``item``
+    are first accessed.
+    """
     if not item_comments or item is None:
         return
     for comment in item_comments:
         if extract_comment_metadata and comment.startswith("&"):
-            annotations = parse_comment_metadata_to_annotations(comment)
-            if annotations:
-                item.annotations.update(annotations)
+            if defer_comment_metadata is not None:
+                if is_comment_metadata(comment):
+                    item.defer_annotations(defer_comment_metadata, comment)
+                else:
+                    item.comments.append(comment)
             else:
-                item.comments.append(comment)
+                annotations = parse_comment_metadata_to_annotations(comment,
+                        field_names=comment_metadata_keys)
+                if annotations:
+                    item.annotations.update(annotations)
+                elif comment_metadata_keys is None or not is_comment_metadata(comment):
+                    item.comments.append(comment)
         else:
             item.comments.append(comment)
 
@@ -228,6 +228,15 @@ class NexusReader(ioservice.DataReader):
             value'). If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
+        comment_metadata_keys : iterable of strings, default: |None|
+            If given, then only the fields with these names will be extracted
+            from metadata comments when ``extract_comment_metadata`` is |True|:
+            all other fields are discarded.
+        lazy_comment_metadata : boolean, default: |False|
+            If |True|, and ``extract_comment_metadata`` is |True|, then
+            metadata comments on trees, nodes and edges are stored unparsed
+            and only parsed into annotations when the ``annotations``
+            attribute of the object is first accessed.
         store_tree_weights : boolean, default: |False|
             If |True|, process the tree weight (e.g. "[&W 1/2]") comment
             associated with each tree, if any. Defaults to |False|.
@@ -310,6 +319,9 @@ class NexusReader(ioservice.DataReader):
         self.preserve_underscores = kwargs.get('preserve_underscores', False)
         self.case_sensitive_taxon_labels = kwargs.get('case_sensitive_taxon_labels', False)
         self.extract_comment_metadata = kwargs.get('extract_comment_metadata', True)
+        self.comment_metadata_keys = kwargs.get('comment_metadata_keys', None)
+        if self.comment_metadata_keys is not None:
+            self.comment_metadata_keys = frozenset(self.comment_metadata_keys)
 
         # As above, but the NEXUS format default is different from the NEWICK
         # default, so this rather convoluted approach
@@ -325,6 +337,7 @@ class NexusReader(ioservice.DataReader):
         self._gap_char = '-'
         self._missing_char = '?'
         self._match_char = frozenset('.')
+        self._symbol_packing_tables_cache = None
         self._file_specified_ntax = None
         self._file_specified_nchar = None
         self._nexus_tokenizer = None
@@ -558,7 +571,8 @@ class NexusReader(ioservice.DataReader):
                 token = self._nexus_tokenizer.next_token_ucase()
             self._nexus_tokenizer.process_and_clear_comments_for_item(
                     self._global_annotations_target,
-                    self.extract_comment_metadata)
+                    self.extract_comment_metadata,
+                    comment_metadata_keys=self.comment_metadata_keys)
             token = self._nexus_tokenizer.next_token_ucase()
             if token == 'TAXA':
                 self._parse_taxa_block()
@@ -616,7 +630,8 @@ class NexusReader(ioservice.DataReader):
                     taxon_namespace = self._new_taxon_namespace()
                 self._nexus_tokenizer.process_and_clear_comments_for_item(
                         self._global_annotations_target,
-                        self.extract_comment_metadata)
+                        self.extract_comment_metadata,
+                        comment_metadata_keys=self.comment_metadata_keys)
                 self._parse_taxlabels_statement(taxon_namespace)
         self._nexus_tokenizer.skip_to_semicolon() # move past END statement
         self._nexus_tokenizer.allow_eof = True
@@ -655,7 +670,8 @@ class NexusReader(ioservice.DataReader):
                 taxon = taxon_namespace.new_taxon(label=label)
             token = self._nexus_tokenizer.next_token()
             self._nexus_tokenizer.process_and_clear_comments_for_item(taxon,
-                    self.extract_comment_metadata)
+                    self.extract_comment_metadata,
+                    comment_metadata_keys=self.comment_metadata_keys)
 
     ###########################################################################
     ## LINK/TITLE PARSERS (How Mesquite handles multiple TAXA blocks)
@@ -995,8 +1011,12 @@ class NexusReader(ioservice.DataReader):
         self._nexus_tokenizer.next_token()
         tree = self._build_tree_from_newick_tree_string(tree_factory, taxon_symbol_mapper)
         tree.label = tree_name
-        nexusprocessing.process_comments_for_item(tree, pre_tree_comments, self.extract_comment_metadata)
-        nexusprocessing.process_comments_for_item(tree, tree_comments, self.extract_comment_metadata)
+        for comments in (pre_tree_comments, tree_comments):
+            nexusprocessing.process_comments_for_item(tree,
+                    comments,
+                    self.extract_comment_metadata,
+                    comment_metadata_keys=self.comment_metadata_keys,
+                    defer_comment_metadata=self.newick_reader._deferred_comment_metadata_parser)
         # if self.extract_comment_metadata:
         #     annotations = nexustokenizer.parse_comment_metadata(tree_comments)
         #     for annote in annotations:
@@ -1102,7 +1122,8 @@ class NexusReader(ioservice.DataReader):
                 nexusprocessing.process_comments_for_item(
                         trees_block,
                         pre_tree_comments,
-                        self.extract_comment_metadata)
+                        self.extract_comment_metadata,
+                        comment_metadata_keys=self.comment_metadata_keys)
                 tree_factory = trees_block.new_tree
                 while True:
                     ## After the following, the current token
@@ -1260,11 +1281,18 @@ class NexusReader(ioservice.DataReader):
         where `<.>` is a StateIdentity object with the characters within the
         brackets as symbol(s).
 
+        Tokens consisting only of single-character state symbols (i.e., no
+        multistate groups or MATCHCHAR symbols) are mapped in a single pass
+        and the resulting states stored in packed form.
+
         """
         if self._interleave:
             self._nexus_tokenizer.set_capture_eol(True)
+        packing_tables = self._get_symbol_packing_tables(state_alphabet)
+        # packed states, always preceding those in ``states_to_add``
+        packed_to_add = bytearray()
         states_to_add = []
-        while len(character_data_vector) + len(states_to_add) < self._file_specified_nchar:
+        while len(character_data_vector) + len(packed_to_add) + len(states_to_add) < self._file_specified_nchar:
             token = self._nexus_tokenizer.require_next_token()
             if token == "{" or token == "(":
                 if token == "{":
@@ -1283,7 +1311,7 @@ class NexusReader(ioservice.DataReader):
                     multistate_tokens.append(token)
                 c = "".join(multistate_tokens)
                 state = self._get_state_for_multistate_tokens(c, multistate_type, state_alphabet)
-                if len(character_data_vector) + len(states_to_add) == self._file_specified_nchar:
+                if len(character_data_vector) + len(packed_to_add) + len(states_to_add) == self._file_specified_nchar:
                     raise self._too_many_characters_error(c)
                 states_to_add.append(state)
             elif token == "\r" or token == "\n":
@@ -1292,10 +1320,16 @@ class NexusReader(ioservice.DataReader):
             elif token == ";":
                 raise NexusReader.BlockTerminatedException
             else:
+                if packing_tables is not None and not states_to_add:
+                    packed = self._pack_symbols(token, packing_tables)
+                    if (packed is not None
+                            and len(character_data_vector) + len(packed_to_add) + len(packed) <= self._file_specified_nchar):
+                        packed_to_add.extend(packed)
+                        continue
                 for c in token:
                     if c in self._match_char:
                         try:
-                            state = first_sequence_defined[len(character_data_vector) + len(states_to_add)]
+                            state = first_sequence_defined[len(character_data_vector) + len(packed_to_add) + len(states_to_add)]
                         except TypeError:
                             exc = self._nexus_error("Cannot dereference MATCHCHAR '{}' on first sequence".format(c), NexusReader.NexusReaderError)
                             exc.__context__ = None # Python 3.0, 3.1, 3.2
@@ -1303,7 +1337,7 @@ class NexusReader(ioservice.DataReader):
                             raise exc
                         except IndexError:
                             exc = self._nexus_error("Cannot dereference MATCHCHAR '{}': current position ({}) exceeds length of first sequence ({})".format(c,
-                                    len(character_data_vector) + len(states_to_add) + 1,
+                                    len(character_data_vector) + len(packed_to_add) + len(states_to_add) + 1,
                                     len(first_sequence_defined),
                                     NexusReader.NexusReaderError))
                             exc.__context__ = None # Python 3.0, 3.1, 3.2
@@ -1321,14 +1355,27 @@ class NexusReader(ioservice.DataReader):
                             exc.__context__ = None # Python 3.0, 3.1, 3.2
                             exc.__cause__ = None # Python 3.3, 3.4
                             raise exc
-                    if len(character_data_vector) + len(states_to_add) == self._file_specified_nchar:
+                    if len(character_data_vector) + len(packed_to_add) + len(states_to_add) == self._file_specified_nchar:
                         raise self._too_many_characters_error(c)
                     states_to_add.append(state)
         if self._interleave:
             self._nexus_tokenizer.set_capture_eol(False)
-        character_data_vector.extend(states_to_add)
+        if packed_to_add:
+            character_data_vector._extend_packed_values(packed_to_add, packing_tables[0])
+        if states_to_add:
+            character_data_vector.extend(states_to_add)
         return character_data_vector
 
+    def _get_symbol_packing_tables(self, state_alphabet):
+        symbol_state_map = state_alphabet.full_symbol_state_map
+        if (self._symbol_packing_tables_cache is None
+                or self._symbol_packing_tables_cache[0] is not symbol_state_map
+                or self._symbol_packing_tables_cache[1] != self._match_char):
+            packing_tables = self._build_symbol_packing_tables(symbol_state_map,
+                    invalid_symbols=self._match_char)
+            self._symbol_packing_tables_cache = (symbol_state_map, self._match_char, packing_tables)
+        return self._symbol_packing_tables_cache[2]
+
     def _read_continuous_character_values(self,
             character_data_vector,
             datatype=float,
@@ -230,22 +230,7 @@ class NexusWriter(ioservice.DataWriter):
             char_matrices=None,
             global_annotations_target=None):
 
-        # Header
-        stream.write('#NEXUS\n\n')
-
-        # File/Document-level annotations and comments
-        if self.file_comments:
-            self._write_comments(stream, self.file_comments)
-        if global_annotations_target is not None:
-            self._write_item_annotations(stream, global_annotations_target)
-            self._write_item_comments(stream, global_annotations_target)
-
-        # Other blocks
-        if self.preamble_blocks:
-            for block in self.preamble_blocks:
-                stream.write(block)
-                stream.write("\n")
-            stream.write("\n")
+        self._write_header(stream, global_annotations_target)
 
         # Taxon namespace discovery
         candidate_taxon_namespaces = collections.OrderedDict()
@@ -268,11 +253,7 @@ class NexusWriter(ioservice.DataWriter):
         self.taxon_namespaces_to_write = [tns for tns in candidate_taxon_namespaces if candidate_taxon_namespaces[tns]]
 
         #  Write out taxon namespaces
-        if not self.simple and not self.suppress_taxa_blocks:
-            if self.suppress_block_titles and len(taxon_namespace_to_write) > 1:
-                warnings.warn("Multiple taxon namespaces will be written, but block titles are suppressed: data file may not be interpretable")
-            for tns in self.taxon_namespaces_to_write:
-                self._write_taxa_block(stream, tns)
+        self._write_taxa_blocks(stream)
 
         # Write out character matrices
         if char_matrices is not None:
@@ -290,11 +271,52 @@ class NexusWriter(ioservice.DataWriter):
                             tree_list=tree_list)
 
         # Write out remaining
+        self._write_supplemental_blocks(stream)
+
+    def _write_header(self, stream, global_annotations_target):
+        # Header
+        stream.write('#NEXUS\n\n')
+
+        # File/Document-level annotations and comments
+        if self.file_comments:
+            self._write_comments(stream, self.file_comments)
+        if global_annotations_target is not None:
+            self._write_item_annotations(stream, global_annotations_target)
+            self._write_item_comments(stream, global_annotations_target)
+
+        # Other blocks
+        if self.preamble_blocks:
+            for block in self.preamble_blocks:
+                stream.write(block)
+                stream.write("\n")
+            stream.write("\n")
+
+    def _write_taxa_blocks(self, stream):
+        if not self.simple and not self.suppress_taxa_blocks:
+            if self.suppress_block_titles and len(self.taxon_namespaces_to_write) > 1:
+                warnings.warn("Multiple taxon namespaces will be written, but block titles are suppressed: data file may not be interpretable")
+            for tns in self.taxon_namespaces_to_write:
+                self._write_taxa_block(stream, tns)
+
+    def _write_supplemental_blocks(self, stream):
         if self.supplemental_blocks:
             for block in self.supplemental_blocks:
                 stream.write(block)
                 stream.write("\n")
 
+    def _write_tree_stream_open(self, stream, tree_list):
+        self._write_header(stream, None)
+        self.taxon_namespaces_to_write = [tree_list.taxon_namespace]
+        self._write_taxa_blocks(stream)
+        self._write_trees_block_open(stream, tree_list)
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_idx):
+        self._write_tree_statement(stream, tree, tree_idx)
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        self._write_trees_block_close(stream)
+        self._write_supplemental_blocks(stream)
+
     def _get_taxa_to_include(self, taxon_namespace):
         if not self.exclude_from_taxa_blocks:
             return list(taxon_namespace)
@@ -341,24 +363,33 @@ class NexusWriter(ioservice.DataWriter):
         stream.write("{}\n             ;\n".format(statement))
 
     def _write_trees_block(self, stream, tree_list):
+        self._write_trees_block_open(stream, tree_list)
+        for tree_idx, tree in enumerate(tree_list):
+            self._write_tree_statement(stream, tree, tree_idx)
+        self._write_trees_block_close(stream)
+
+    def _write_trees_block_open(self, stream, tree_list):
         stream.write("BEGIN TREES;\n")
         self._write_block_title(stream, tree_list)
         self._write_item_annotations(stream, tree_list)
         self._write_item_comments(stream, tree_list)
         self._write_link_to_taxa_block(stream, tree_list.taxon_namespace)
         self._set_and_write_translate_block(stream, tree_list.taxon_namespace)
-        for tree_idx, tree in enumerate(tree_list):
-            if tree.label:
-                tree_name = tree.label
-            else:
-                tree_name = str(tree_idx+1)
-            tree_name = nexusprocessing.escape_nexus_token(
-                    tree_name,
-                    preserve_spaces=self.preserve_spaces,
-                    quote_underscores=not self.unquoted_underscores)
-            stream.write("    TREE {} = ".format(tree_name))
-            self._newick_writer._write_tree(stream, tree)
-            stream.write("\n")
+
+    def _write_tree_statement(self, stream, tree, tree_idx):
+        if tree.label:
+            tree_name = tree.label
+        else:
+            tree_name = str(tree_idx+1)
+        tree_name = nexusprocessing.escape_nexus_token(
+                tree_name,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
+        stream.write("    TREE {} = ".format(tree_name))
+        self._newick_writer._write_tree(stream, tree)
+        stream.write("\n")
+
+    def _write_trees_block_close(self, stream):
         stream.write("END;\n\n")
 
     def _write_char_block(self, stream, char_matrix):
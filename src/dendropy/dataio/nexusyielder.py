@@ -51,6 +51,14 @@ class NexusTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the start of each source to skip. The
+            statements of these trees are scanned over without the trees
+            being built (or their taxa being added to the taxon namespace).
+        threaded_decompression : bool
+            If |True|, then sources given by path that are compressed (which
+            are recognized and decompressed automatically) are decompressed
+            in a background thread.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexusreader.NexusReader`
             class. See `nexusreader.NexusReader` for details.
@@ -58,7 +66,10 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", 0),
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
+        self._num_trees_to_skip = 0
         self.assume_newick_if_not_nexus = kwargs.pop("assume_newick_if_not_nexus", False)
         kwargs["attached_taxon_namespace"] = self.attached_taxon_namespace
         nexusreader.NexusReader.__init__(self, **kwargs)
@@ -74,6 +85,7 @@ class NexusTreeDataYielder(
                 preserve_unquoted_underscores=self.preserve_underscores)
         else:
             self._nexus_tokenizer.set_stream(stream)
+        self._num_trees_to_skip = self.tree_offset
         token = self._nexus_tokenizer.next_token()
         if token.upper() != "#NEXUS":
             if self.assume_newick_if_not_nexus:
@@ -81,6 +93,13 @@ class NexusTreeDataYielder(
                         taxon_namespace=self.attached_taxon_namespace,
                         enable_lookup_by_taxon_number=False,
                         )
+                while self._num_trees_to_skip > 0:
+                    self._num_trees_to_skip -= 1
+                    if not self.newick_reader._skip_tree_statement(
+                            nexus_tokenizer=self._nexus_tokenizer,
+                            tree_factory=self.tree_factory,
+                            taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol):
+                        return
                 while True:
                     tree = self._build_tree_from_newick_tree_string(
                             tree_factory=self.tree_factory,
@@ -97,7 +116,8 @@ class NexusTreeDataYielder(
                 token = self._nexus_tokenizer.next_token_ucase()
             self._nexus_tokenizer.process_and_clear_comments_for_item(
                     self._global_annotations_target,
-                    self.extract_comment_metadata)
+                    self.extract_comment_metadata,
+                    comment_metadata_keys=self.comment_metadata_keys)
             token = self._nexus_tokenizer.next_token_ucase()
             if token == 'TAXA':
                 self._parse_taxa_block()
@@ -160,10 +180,14 @@ class NexusTreeDataYielder(
                     ## statement. Typically, this will be
                     ## 'TREE' if there is another tree, or
                     ## 'END'/'ENDBLOCK'.
-                    tree = self._parse_tree_statement(
-                            tree_factory=tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
-                    yield tree
+                    if self._num_trees_to_skip > 0:
+                        self._num_trees_to_skip -= 1
+                        self._skip_tree_statement()
+                    else:
+                        tree = self._parse_tree_statement(
+                                tree_factory=tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
+                        yield tree
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
                     if self._nexus_tokenizer.cast_current_token_to_ucase() != "TREE":
@@ -175,6 +199,19 @@ class NexusTreeDataYielder(
         self._nexus_tokenizer.skip_to_semicolon() # move past END command
         return
 
+    def _skip_tree_statement(self):
+        """
+        Skips over a TREE command without building the tree. Assumes that the
+        file reader is positioned right after the "TREE" token in a TREE
+        command. When complete, the current token will be the token
+        immediately following the terminating semi-colon, as is the case
+        after parsing the command.
+        """
+        if not self._nexus_tokenizer.skip_raw_to(";"):
+            raise self._nexus_error("Unexpected end of stream in TREE command")
+        self._nexus_tokenizer.clear_captured_comments()
+        self._nexus_tokenizer.next_token()
+
 class NexusNewickTreeDataYielder(NexusTreeDataYielder):
 
     def __init__(self,
@@ -145,6 +145,7 @@ class PhylipReader(ioservice.DataReader):
         self.taxon_namespace = None
         self.stream = None
         self.taxa_processed = set()
+        self._symbol_packing_tables = None
 
     def _read(self,
             stream,
@@ -177,6 +178,9 @@ class PhylipReader(ioservice.DataReader):
                     gap_symbol="-",
                     case_sensitive=False)
                 self.char_matrix.state_alphabets.append(state_alphabet)
+        if self.data_type != "continuous":
+            self._symbol_packing_tables = self._build_symbol_packing_tables(
+                    self.char_matrix.default_state_alphabet.full_symbol_state_map)
         lines = filesys.get_lines(stream)
         if len(lines) == 0:
             raise error.DataParseError("No data in source", stream=self.stream)
@@ -248,6 +252,13 @@ class PhylipReader(ioservice.DataReader):
                 else:
                     self.char_matrix[current_taxon].append(state)
         else:
+            if self._symbol_packing_tables is not None:
+                # map all symbols in a single pass if they are all valid
+                packed = self._pack_symbols(line, self._symbol_packing_tables)
+                if packed is not None:
+                    self.char_matrix[current_taxon]._extend_packed_values(packed,
+                            self._symbol_packing_tables[0])
+                    return
             for c in line:
                 if c in [' ', '\t']:
                     continue
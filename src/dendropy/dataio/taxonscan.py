@@ -0,0 +1,187 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Lightweight scans of NEWICK and NEXUS tree sources for the taxa they
+reference, without building any trees.
+
+Only the statements that define taxa are tokenized: the "TAXLABELS" statement
+of a NEXUS "TAXA" block and the "TRANSLATE" statement of the first "TREES"
+block or, failing these, the labels of the tips of the first tree statement.
+Everything else up to that point is skipped over at raw text speed, and the
+rest of the source is not read at all.
+"""
+
+from dendropy.dataio import nexusprocessing
+from dendropy.utility import filesys
+from dendropy.utility import textprocessing
+
+def _scan_tree_statement_labels(nexus_tokenizer, labels):
+    """
+    Adds the labels of the tips of the tree statement starting at the current
+    token (i.e., tokens following an opening parenthesis or a comma, or a
+    lone label) to ``labels``, up to and including the terminating
+    semi-colon.
+    """
+    token = nexus_tokenizer.current_token
+    prev_token = None
+    while token is not None:
+        if not nexus_tokenizer.is_token_quoted:
+            if token == ";":
+                break
+            if token in "(),:":
+                prev_token = token
+                token = nexus_tokenizer.next_token()
+                continue
+        if prev_token is None or prev_token == "(" or prev_token == ",":
+            labels.append(token)
+        # (not compared with punctuation, as it may have been quoted)
+        prev_token = ""
+        token = nexus_tokenizer.next_token()
+    nexus_tokenizer.clear_captured_comments()
+
+def _scan_nexus(nexus_tokenizer, labels):
+    is_taxa_defined = False
+    token = nexus_tokenizer.next_token_ucase()
+    while token is not None:
+        if token != "BEGIN":
+            nexus_tokenizer.skip_raw_to(";")
+            token = nexus_tokenizer.next_token_ucase()
+            continue
+        block = nexus_tokenizer.require_next_token_ucase()
+        nexus_tokenizer.skip_raw_to(";")
+        while True:
+            token = nexus_tokenizer.next_token_ucase()
+            if token is None or token == "END" or token == "ENDBLOCK":
+                break
+            if block not in ("TAXA", "TREES"):
+                pass
+            elif token == "TAXLABELS" or token == "TRANSLATE":
+                is_taxa_defined = True
+                is_translate = token == "TRANSLATE"
+                token = nexus_tokenizer.next_token()
+                while token is not None and token != ";":
+                    if is_translate:
+                        # translation token: skip to its label
+                        token = nexus_tokenizer.next_token()
+                    labels.append(token)
+                    token = nexus_tokenizer.next_token()
+                    if is_translate and token == ",":
+                        token = nexus_tokenizer.next_token()
+                nexus_tokenizer.clear_captured_comments()
+                continue
+            elif token == "TREE" and block == "TREES":
+                if not is_taxa_defined:
+                    nexus_tokenizer.skip_raw_to("=")
+                    nexus_tokenizer.next_token()
+                    _scan_tree_statement_labels(nexus_tokenizer, labels)
+                return
+            nexus_tokenizer.skip_raw_to(";")
+        nexus_tokenizer.clear_captured_comments()
+        if block == "TREES" and is_taxa_defined:
+            return
+        nexus_tokenizer.skip_raw_to(";")
+        token = nexus_tokenizer.next_token_ucase()
+
+def scan_taxon_labels(src, schema, preserve_underscores=False):
+    """
+    Returns the labels of the taxa referenced by the tree source ``src``, a
+    file-like object, in the order in which they would be added to a
+    |TaxonNamespace| when reading the first tree of the source, without
+    reading any trees.
+
+    For "``nexus``" sources, these are the labels of the "TAXA" block and
+    the "TRANSLATE" statement of the first "TREES" block or, if there are
+    neither, of the tips of the first tree. For "``newick``" sources, these
+    are the labels of the tips of the first tree. Labels may be repeated if
+    they are, e.g., both in the "TAXA" block and the "TRANSLATE" statement.
+    The "``nexus/newick``" schema selects between the two based on the
+    "#NEXUS" header.
+    """
+    schema = schema.lower()
+    if schema not in ("newick", "nexus", "nexus/newick"):
+        raise ValueError("Scanning for taxa not supported for schema '{}'".format(schema))
+    nexus_tokenizer = nexusprocessing.NexusTokenizer(src,
+            preserve_unquoted_underscores=preserve_underscores)
+    labels = []
+    token = nexus_tokenizer.next_token()
+    if token is None:
+        return labels
+    if token.upper() == "#NEXUS":
+        if schema == "newick":
+            raise ValueError("Expecting NEWICK source but found NEXUS")
+        _scan_nexus(nexus_tokenizer, labels)
+    elif schema == "nexus":
+        raise ValueError("Expecting '#NEXUS' but found '{}'".format(token))
+    else:
+        while token == ";" and not nexus_tokenizer.is_token_quoted:
+            token = nexus_tokenizer.next_token()
+        nexus_tokenizer.clear_captured_comments()
+        _scan_tree_statement_labels(nexus_tokenizer, labels)
+    return labels
+
+def scan_taxon_namespace(files,
+        schema,
+        taxon_namespace=None,
+        preserve_underscores=False):
+    """
+    Returns a |TaxonNamespace| with the taxa referenced by all of the tree
+    sources in ``files``, and a dictionary mapping the label of each of these
+    taxa to its accession index in the namespace.
+
+    Each source is scanned as described for :func:`scan_taxon_labels`, and
+    the taxa are added to the namespace in the order in which their labels
+    are first encountered across the sources, so that the same sources always
+    result in the same namespace. Taxa already in ``taxon_namespace``, if
+    given, come first.
+
+    The label-to-index mapping, unlike the namespace, can be cheaply passed
+    to other processes, where a namespace with the same taxa at the same
+    accession indexes (and hence the same split bitmasks) can be recreated
+    (see :func:`dendropy.datamodel.taxonmodel.new_taxon_namespace_from_accessions`).
+
+    Parameters
+    ----------
+    files : iterable of file paths or file-like objects.
+        Tree sources to scan.
+    schema : str
+        "``newick``", "``nexus``", or "``nexus/newick``".
+    taxon_namespace : |TaxonNamespace|
+        Namespace to which the taxa will be added. A new one is created if
+        not given.
+    preserve_underscores : bool
+        If |True|, unquoted underscores in labels are not converted to spaces.
+
+    Returns
+    -------
+    taxon_namespace, label_index_map : |TaxonNamespace|, dict
+    """
+    if taxon_namespace is None:
+        from dendropy.datamodel import taxonmodel
+        taxon_namespace = taxonmodel.TaxonNamespace()
+    for src in files:
+        if textprocessing.is_str_type(src):
+            with filesys.open_for_reading(src) as stream:
+                labels = scan_taxon_labels(stream, schema, preserve_underscores=preserve_underscores)
+        else:
+            labels = scan_taxon_labels(src, schema, preserve_underscores=preserve_underscores)
+        for label in labels:
+            taxon_namespace.require_taxon(label=label)
+    label_index_map = dict((taxon.label, taxon_namespace.accession_index(taxon)) for taxon in taxon_namespace)
+    return taxon_namespace, label_index_map
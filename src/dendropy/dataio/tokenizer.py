@@ -18,6 +18,7 @@
 ##############################################################################
 
 import sys
+import re
 from dendropy.utility import error
 
 ##############################################################################
@@ -26,8 +27,15 @@ from dendropy.utility import error
 class Tokenizer(object):
     """
     Stream tokenizer.
+
+    The source is read in blocks of ``block_size`` characters, and runs of
+    characters that are not delimiters, quotes, or comment markers are
+    scanned in bulk. Line and column numbers are only calculated when
+    requested (e.g., when reporting an error).
     """
 
+    DEFAULT_BLOCK_SIZE = 65536
+
     class TokenizerError(error.DataParseError):
 
         def __init__(self,
@@ -78,6 +86,7 @@ class Tokenizer(object):
             comment_end,                # string indicating end of comment
             capture_comments,           # are comments to be stored?
             preserve_unquoted_underscores,       # are unquoted underscores to be preserved
+            block_size=None,            # number of characters to read from the source at a time
             ):
         # Tokenizer behavior customization
         self.uncaptured_delimiters = uncaptured_delimiters
@@ -89,19 +98,16 @@ class Tokenizer(object):
         self.comment_end = comment_end
         self.capture_comments = capture_comments
         self.preserve_unquoted_underscores = preserve_unquoted_underscores
+        if block_size is None:
+            block_size = Tokenizer.DEFAULT_BLOCK_SIZE
+        if block_size < 1:
+            raise ValueError("Invalid block size: {}".format(block_size))
+        self.block_size = block_size
+        self._raw_scanners = {}
+        self.compile_scanners()
 
         # State (internals)
-        self.src = src
-        self._cur_char = None
-        self.current_token = None
-        self.is_token_quoted = False
-
-        # Meta-information
-        self.captured_comments = []
-        self.current_line_num = 1
-        self.current_column_num = 0
-        self.token_line_num = 0
-        self.token_column_num = 0
+        self.set_stream(src)
 
     def reset(self):
         self.set_stream(src=None)
@@ -112,10 +118,72 @@ class Tokenizer(object):
         self.current_token = None
         self.is_token_quoted = False
         self.captured_comments = []
-        self.current_line_num = 1
-        self.current_column_num = 0
-        self.token_line_num = 0
-        self.token_column_num = 0
+
+        # Buffer: ``self._buffer[self._pos]`` is the current character
+        # (``self._cur_char``) once the first character has been read.
+        self._buffer = ""
+        self._pos = 0
+
+        # Meta-information: line and column numbers are not tracked per
+        # character, but calculated on demand from the buffer contents and
+        # the number of lines/columns in the text already discarded from the
+        # buffer.
+        self._buffer_offset = 0
+        self._discarded_line_count = 0
+        self._discarded_column_count = 0
+        self._token_offset = None
+        self._token_position = None
+
+    def compile_scanners(self):
+        """
+        (Re-)builds the patterns used to scan runs of characters in bulk. This
+        must be called if the delimiter, quote, or comment character
+        collections are modified after construction.
+        """
+        self._uncaptured_run = self._compile_run_pattern(self.uncaptured_delimiters, False)
+        self._unquoted_run = self._compile_run_pattern(
+                list(self.uncaptured_delimiters)
+                + list(self.captured_delimiters)
+                + list(self.comment_begin),
+                True)
+        self._comment_run = self._compile_run_pattern(
+                list(self.comment_begin) + list(self.comment_end),
+                True)
+
+    def _compile_run_pattern(self, chars, is_negated):
+        chars = "".join(re.escape(ch) for ch in sorted(set(chars)))
+        if not chars:
+            if is_negated:
+                return re.compile(".*", re.DOTALL)
+            else:
+                return re.compile("")
+        if is_negated:
+            return re.compile("[^{}]*".format(chars))
+        else:
+            return re.compile("[{}]*".format(chars))
+
+    def _get_current_line_num(self):
+        return self._position_at(self._current_index())[0]
+    current_line_num = property(_get_current_line_num)
+
+    def _get_current_column_num(self):
+        return self._position_at(self._current_index())[1]
+    current_column_num = property(_get_current_column_num)
+
+    def _get_token_position(self):
+        if self._token_offset is None:
+            return (0, 0)
+        if self._token_position is None:
+            self._token_position = self._position_at(self._token_offset - self._buffer_offset)
+        return self._token_position
+
+    def _get_token_line_num(self):
+        return self._get_token_position()[0]
+    token_line_num = property(_get_token_line_num)
+
+    def _get_token_column_num(self):
+        return self._get_token_position()[1]
+    token_column_num = property(_get_token_column_num)
 
     def is_eof(self):
         return self._cur_char == ""
@@ -169,126 +237,307 @@ class Tokenizer(object):
         del self.captured_comments[:]
         return c
 
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        self.is_token_quoted = False
+    def peek_raw(self, terminator, stop_chars=""):
+        """
+        Returns the raw, unprocessed text from the current character up to
+        and including the next occurrence of ``terminator``, reading ahead
+        from the source as needed but without consuming anything. Returns
+        |None| if any of the characters in ``stop_chars`` or the end of the
+        stream are encountered before ``terminator``.
+        """
         if self._cur_char is None:
             self._get_next_char()
-        self._skip_to_significant_char()
         if self._cur_char == "":
-            raise StopIteration
-        if self._cur_char in self.captured_delimiters:
-            self.current_token = self._cur_char
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
+            return None
+        try:
+            pattern = self._raw_scanners[(terminator, stop_chars)]
+        except KeyError:
+            pattern = re.compile("[{}]".format("".join(re.escape(ch) for ch in terminator + stop_chars)))
+            self._raw_scanners[(terminator, stop_chars)] = pattern
+        search_start = self._pos
+        while True:
+            m = pattern.search(self._buffer, search_start)
+            if m is not None:
+                if m.group(0) != terminator:
+                    return None
+                return self._buffer[self._pos:m.end()]
+            search_start = len(self._buffer) - self._pos
+            if not self._extend_buffer():
+                return None
+            # buffer has been rebased on the current character
+            search_start += self._pos
+
+    def skip_raw(self, count):
+        """
+        Consumes ``count`` characters, starting with the current one, without
+        tokenizing them. The character following them becomes the current
+        character.
+        """
+        if self._cur_char is None:
             self._get_next_char()
-            return self.current_token
-        elif self._cur_char in self.quote_chars:
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
-            dest = []
-            self.is_token_quoted = True
-            cur_quote_char = self._cur_char
+        if self._cur_char == "":
+            return
+        while self._pos + count > len(self._buffer):
+            count -= len(self._buffer) - self._pos
+            self._advance(len(self._buffer))
+            if self._cur_char == "":
+                return
+        self._advance(self._pos + count)
+
+    def skip_raw_to(self, terminator):
+        """
+        Consumes all characters up to and including the next occurrence of
+        ``terminator`` that is not part of a quoted literal or a comment,
+        without tokenizing them or capturing comments. The terminator then
+        becomes the current token, and the character following it the current
+        character. Returns |False| if the end of the stream is reached before
+        ``terminator`` is found.
+        """
+        if self._cur_char is None:
             self._get_next_char()
-            while True:
-                if self._cur_char == "":
-                    raise Tokenizer.UnterminatedQuoteError(
-                            quote_char=cur_quote_char,
-                            line_num=self.current_line_num,
-                            col_num=self.current_column_num,
-                            stream=src)
-                if self._cur_char == cur_quote_char:
-                    self._get_next_char()
-                    if self.escape_quote_by_doubling:
-                        if self._cur_char == cur_quote_char:
-                            # dest.write(cur_quote_char)
-                            dest.append(cur_quote_char)
-                            self._get_next_char()
-                        else:
-                            break
+        try:
+            pattern = self._raw_scanners[(terminator, None)]
+        except KeyError:
+            pattern = re.compile("[{}]".format("".join(re.escape(ch)
+                for ch in terminator + "".join(self.quote_chars) + "".join(self.comment_begin))))
+            self._raw_scanners[(terminator, None)] = pattern
+        while self._cur_char != "":
+            m = pattern.search(self._buffer, self._pos)
+            if m is None:
+                self._advance(len(self._buffer))
+                continue
+            ch = m.group(0)
+            self._advance(m.start())
+            if ch == terminator:
+                self._mark_token_start()
+                self.is_token_quoted = False
+                self.current_token = terminator
+                self._get_next_char()
+                return True
+            elif ch in self.quote_chars:
+                # a doubled quote character is skipped as two literals
+                self._get_next_char()
+                while self._cur_char != "":
+                    idx = self._buffer.find(ch, self._pos)
+                    if idx < 0:
+                        self._advance(len(self._buffer))
                     else:
-                        self._get_next_char()
+                        self._advance(idx + 1)
                         break
                 else:
-                    # dest.write(self._cur_char)
-                    dest.append(self._cur_char)
-                    self._get_next_char()
-            # self.current_token = dest.getvalue()
-            self.current_token = "".join(dest)
-            return self.current_token
-        else:
-            # unquoted
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
-            dest = []
-            self.is_token_quoted = False
-            while self._cur_char != "":
-                if self._cur_char in self.uncaptured_delimiters:
-                    self._get_next_char()
-                    break
-                elif self._cur_char in self.captured_delimiters:
-                    break
-                elif self._cur_char in self.comment_begin:
+                    raise Tokenizer.UnterminatedQuoteError(
+                            quote_char=ch,
+                            line_num=self.current_line_num,
+                            col_num=self.current_column_num,
+                            stream=self.src)
+            else:
+                capture_comments = self.capture_comments
+                self.capture_comments = False
+                try:
                     self._handle_comment()
-                    if self._cur_char == "":
-                        break
-                else:
-                    if self._cur_char == "_" and not self.preserve_unquoted_underscores:
-                        self._cur_char = " "
-                    dest.append(self._cur_char)
-                    self._get_next_char()
-            # self.current_token = dest.getvalue()
-            self.current_token = "".join(dest)
-            if self.current_token == "":
-                if self._cur_char != "":
-                    self.__next__()
-                else:
-                    raise StopIteration
-            return self.current_token
+                finally:
+                    self.capture_comments = capture_comments
+        self.current_token = None
+        return False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self.is_token_quoted = False
+        if self._cur_char is None:
+            self._get_next_char()
+        while True:
+            self._skip_to_significant_char()
+            if self._cur_char == "":
+                raise StopIteration
+            self._mark_token_start()
+            if self._cur_char in self.captured_delimiters:
+                self.current_token = self._cur_char
+                self._get_next_char()
+                return self.current_token
+            elif self._cur_char in self.quote_chars:
+                self.is_token_quoted = True
+                self.current_token = self._scan_quoted_token()
+                return self.current_token
+            else:
+                self.current_token = self._scan_unquoted_token()
+                if self.current_token == "":
+                    # only comments found: look for the next token
+                    if self._cur_char != "":
+                        continue
+                    else:
+                        raise StopIteration
+                return self.current_token
     next = __next__ # Python 2 legacy support
 
+    def _scan_quoted_token(self):
+        dest = []
+        cur_quote_char = self._cur_char
+        self._get_next_char()
+        while True:
+            if self._cur_char == "":
+                raise Tokenizer.UnterminatedQuoteError(
+                        quote_char=cur_quote_char,
+                        line_num=self.current_line_num,
+                        col_num=self.current_column_num,
+                        stream=self.src)
+            idx = self._buffer.find(cur_quote_char, self._pos)
+            if idx < 0:
+                dest.append(self._buffer[self._pos:])
+                self._advance(len(self._buffer))
+                continue
+            dest.append(self._buffer[self._pos:idx])
+            self._advance(idx + 1)
+            if self.escape_quote_by_doubling and self._cur_char == cur_quote_char:
+                dest.append(cur_quote_char)
+                self._get_next_char()
+            else:
+                break
+        return "".join(dest)
+
+    def _scan_unquoted_token(self):
+        dest = []
+        while self._cur_char != "":
+            end = self._unquoted_run.match(self._buffer, self._pos).end()
+            if end > self._pos:
+                dest.append(self._buffer[self._pos:end])
+                self._advance(end)
+            elif self._cur_char in self.uncaptured_delimiters:
+                self._get_next_char()
+                break
+            elif self._cur_char in self.captured_delimiters:
+                break
+            elif self._cur_char in self.comment_begin:
+                self._handle_comment()
+            else:
+                # only reached if the delimiters were changed without
+                # recompiling the scanners
+                dest.append(self._cur_char)
+                self._get_next_char()
+        token = "".join(dest)
+        if not self.preserve_unquoted_underscores:
+            token = token.replace("_", " ")
+        return token
+
     def _skip_to_significant_char(self):
         if self._cur_char == "":
             return
         if self._cur_char is None:
             self._get_next_char()
-        if self._cur_char not in self.uncaptured_delimiters:
-            return
         while self._cur_char != "" and self._cur_char in self.uncaptured_delimiters:
-            self._get_next_char()
+            end = self._uncaptured_run.match(self._buffer, self._pos).end()
+            self._advance(max(end, self._pos + 1))
         return
 
     def _get_next_char(self):
-        self._cur_char = self.src.read(1)
-        if self._cur_char != "":
-            if self._cur_char == "\n":
-                self.current_line_num += 1
-                self.current_column_num = 1
-            else:
-                # print("@@@ {}: {}".format(self.current_column_num, self._cur_char))
-                self.current_column_num += 1
+        if self._cur_char is None or self._cur_char == "":
+            # first read, or retrying at end of stream
+            self._advance(self._pos)
+        else:
+            self._advance(self._pos + 1)
         return self._cur_char
 
+    def _advance(self, idx):
+        """
+        Makes the character at index ``idx`` of the buffer the current
+        character, reading in the next block from the source if ``idx`` is past
+        the end of the buffer.
+        """
+        if idx < len(self._buffer):
+            self._pos = idx
+            self._cur_char = self._buffer[idx]
+            return
+        block = self.src.read(self.block_size) if self.src is not None else ""
+        if not block:
+            # end of stream: the buffer is retained so that positions can
+            # still be calculated relative to its last character
+            self._pos = len(self._buffer)
+            self._cur_char = ""
+            return
+        self._discard_buffer()
+        self._buffer = block
+        self._pos = 0
+        self._cur_char = block[0]
+
+    def _extend_buffer(self):
+        """
+        Appends the next block from the source to the buffer, discarding the
+        text before the current character. Returns |False| if the end of the
+        stream has been reached.
+        """
+        block = self.src.read(self.block_size) if self.src is not None else ""
+        if not block:
+            return False
+        self._discard_buffer(self._pos)
+        self._buffer += block
+        return True
+
+    def _discard_buffer(self, count=None):
+        if count is None:
+            count = len(self._buffer)
+        if not count:
+            return
+        if (self._token_offset is not None
+                and self._token_position is None
+                and self._token_offset < self._buffer_offset + count):
+            self._token_position = self._position_at(self._token_offset - self._buffer_offset)
+        line_count = self._buffer.count("\n", 0, count)
+        if line_count:
+            self._discarded_line_count += line_count
+            self._discarded_column_count = count - self._buffer.rindex("\n", 0, count)
+        else:
+            self._discarded_column_count += count
+        self._buffer_offset += count
+        self._buffer = self._buffer[count:]
+        self._pos -= count
+
+    def _mark_token_start(self):
+        self._token_offset = self._buffer_offset + self._pos
+        self._token_position = None
+
+    def _current_index(self):
+        if self._cur_char is None:
+            return -1
+        elif self._cur_char == "":
+            return self._pos - 1
+        else:
+            return self._pos
+
+    def _position_at(self, idx):
+        """
+        Returns the line and column numbers of the character at index ``idx``
+        of the buffer (or of the last character read before the first one in
+        the buffer if ``idx`` is -1). A newline character is counted as the
+        first column of the line it begins.
+        """
+        end = idx + 1
+        line_count = self._buffer.count("\n", 0, end)
+        if line_count:
+            col_num = end - self._buffer.rindex("\n", 0, end)
+        else:
+            col_num = self._discarded_column_count + end
+        return (1 + self._discarded_line_count + line_count, col_num)
+
     def _handle_comment(self):
         dest = []
         nesting = 0
-        comment_complete = False
         while self._cur_char != "":
+            end = self._comment_run.match(self._buffer, self._pos).end()
+            if end > self._pos:
+                if self.capture_comments:
+                    dest.append(self._buffer[self._pos:end])
+                self._advance(end)
+                continue
             if self._cur_char in self.comment_end:
                 nesting -= 1
                 if nesting <= 0:
-                    comment_complete = True
                     self._get_next_char()
                     break
             elif self._cur_char in self.comment_begin:
                 nesting += 1
             elif self.capture_comments:
-                # dest.write(self._cur_char)
                 dest.append(self._cur_char)
             self._get_next_char()
         if self.capture_comments:
-            # self.captured_comments.append(dest.getvalue())
             self.captured_comments.append("".join(dest))
-
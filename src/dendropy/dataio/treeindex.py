@@ -0,0 +1,640 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Byte-offset index of the tree statements in NEWICK and NEXUS files, allowing
+for particular trees or ranges of trees to be read without parsing the trees
+preceding them.
+"""
+
+import os
+import re
+import json
+import mmap
+import codecs
+import locale
+from dendropy.utility import filesys
+from dendropy.utility import textprocessing
+
+_STATEMENT_BOUNDARY_PATTERN = re.compile(b"[;\\['\"\\]]")
+_COMMENT_BOUNDARY_PATTERN = re.compile(b"[\\[\\]]")
+_WHITESPACE_PATTERN = re.compile(b"\\s*")
+_WORD_PATTERN = re.compile(b"[^\\s;\\[\\](),:='\"{}\\\\]+")
+
+def _skip_comment(buf, idx):
+    """
+    Returns the index following the end of the (possibly nested) comment
+    opened at index ``idx`` of ``buf``, or the length of ``buf`` if the comment
+    is not closed.
+    """
+    nesting = 0
+    pos = idx
+    while True:
+        m = _COMMENT_BOUNDARY_PATTERN.search(buf, pos)
+        if m is None:
+            return len(buf)
+        if m.group() == b"[":
+            nesting += 1
+        else:
+            nesting -= 1
+            if nesting <= 0:
+                return m.end()
+        pos = m.end()
+
+def _skip_whitespace_and_comments(buf, pos, end):
+    while pos < end:
+        pos = _WHITESPACE_PATTERN.match(buf, pos, end).end()
+        if buf[pos:pos+1] == b"[":
+            pos = _skip_comment(buf, pos)
+        else:
+            break
+    return min(pos, end)
+
+def _iter_statements(buf, start=0, complete_only=False):
+    """
+    Iterates over the statements in ``buf`` from offset ``start``, i.e., the
+    text up to and including each semi-colon that is not part of a comment or
+    a quoted token, yielding (start, end) offsets for each. Text following the
+    last semi-colon is yielded as a final statement if it is not blank,
+    unless ``complete_only`` is |True|.
+    """
+    size = len(buf)
+    pos = start
+    while True:
+        m = _STATEMENT_BOUNDARY_PATTERN.search(buf, pos)
+        if m is None:
+            break
+        ch = m.group()
+        if ch == b";":
+            yield start, m.end()
+            start = m.end()
+            pos = start
+        elif ch == b"'" or ch == b'"':
+            # a doubled quote (escaped quote) simply closes and re-opens
+            # the quoted token
+            idx = buf.find(ch, m.end())
+            if idx < 0:
+                break
+            pos = idx + 1
+        elif ch == b"[":
+            pos = _skip_comment(buf, m.start())
+        else:
+            pos = m.end()
+    if not complete_only and _skip_whitespace_and_comments(buf, start, size) < size:
+        yield start, size
+
+class TreeFileIndexError(Exception):
+    pass
+
+class TreeFileIndex(object):
+    """
+    Index of the byte offsets of the tree statements in a NEWICK or NEXUS
+    file.
+
+    The file is scanned once, at raw text speed, for statement boundaries
+    (respecting comments and quoted tokens); no trees are built. Trees are
+    grouped into collections as the readers would group them (i.e., a single
+    collection for NEWICK files and one per non-empty TREES block for NEXUS
+    files). For each collection, the offsets of the statements that need to be
+    processed before any of its trees (i.e., TAXA blocks and the statements of
+    the TREES block, such as TRANSLATE, preceding its trees) are stored as
+    well, so that a minimal but complete source of any subset of trees can be
+    assembled with :meth:`open_trees`. Other blocks (e.g., CHARACTERS or DATA
+    blocks) are not included in these sources.
+
+    The offsets are of bytes, and the sources are decoded using
+    ``encoding`` (or the preferred encoding of the locale, as when opening
+    files for reading, if |None|).
+
+    The index can be saved to and loaded from a sidecar file, which is only
+    used if the size and modification time of the indexed file are unchanged.
+    """
+
+    sidecar_extension = ".dpidx"
+    format_version = 2
+
+    @classmethod
+    def get(cls, path, schema, use_sidecar=True, encoding=None):
+        """
+        Returns the index of the file at ``path``. If ``use_sidecar`` is
+        |True|, then the index is loaded from the sidecar file if it exists and
+        is up to date, and otherwise the file is scanned and the index saved
+        to the sidecar file (if possible).
+        """
+        if not use_sidecar:
+            return cls.build(path=path, schema=schema, encoding=encoding)
+        sidecar_path = cls.get_sidecar_path(path)
+        try:
+            index = cls.load(path=path,
+                    schema=schema,
+                    sidecar_path=sidecar_path,
+                    encoding=encoding)
+        except (IOError, OSError, ValueError, KeyError, TreeFileIndexError):
+            index = None
+        if index is None:
+            index = cls.build(path=path, schema=schema, encoding=encoding)
+            try:
+                index.save(sidecar_path)
+            except (IOError, OSError):
+                pass
+        return index
+
+    @classmethod
+    def get_sidecar_path(cls, path):
+        return path + cls.sidecar_extension
+
+    @classmethod
+    def build(cls, path, schema, encoding=None):
+        """
+        Scans the file at ``path`` and returns its index.
+        """
+        schema = schema.lower()
+        if schema not in ("newick", "nexus", "nexus/newick"):
+            raise TreeFileIndexError("Indexing not supported for schema '{}'".format(schema))
+        if filesys.get_compression_format(path) is not None:
+            raise TreeFileIndexError("Indexing not supported for compressed files: '{}'".format(path))
+        index = cls(path=path, schema=schema, encoding=encoding)
+        index._set_source_signature()
+        with open(path, "rb") as src:
+            if os.fstat(src.fileno()).st_size == 0:
+                if schema == "nexus/newick":
+                    index.schema = "newick"
+                return index
+            buf = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if schema == "nexus/newick":
+                    schema = index._detect_schema(buf)
+                    index.schema = schema
+                if schema == "newick":
+                    index._scan_newick(buf)
+                else:
+                    index._scan_nexus(buf)
+            finally:
+                buf.close()
+        return index
+
+    @classmethod
+    def load(cls, path, schema, sidecar_path=None, encoding=None):
+        """
+        Loads the index of the file at ``path`` from ``sidecar_path``. Returns
+        |None| if the sidecar file was not created for the current version of
+        the file at ``path`` using ``schema``.
+        """
+        if sidecar_path is None:
+            sidecar_path = cls.get_sidecar_path(path)
+        with open(sidecar_path, "r") as src:
+            data = json.load(src)
+        index = cls(path=path, schema=schema.lower(), encoding=encoding)
+        index._set_source_signature()
+        if index.schema == "nexus/newick" and data["schema"] in ("nexus", "newick"):
+            index.schema = data["schema"]
+        if (data["version"] != cls.format_version
+                or data["schema"] != index.schema
+                or data["source_size"] != index.source_size
+                or data["source_mtime"] != index.source_mtime):
+            return None
+        for entry in data["collections"]:
+            offsets = entry["trees"]
+            index.collections.append((
+                [tuple(span) for span in entry["header"]],
+                list(zip(offsets[0::2], offsets[1::2])),
+                ))
+        return index
+
+    def __init__(self, path, schema, encoding=None):
+        self.path = path
+        self.schema = schema
+        self.encoding = encoding
+        self.source_size = None
+        self.source_mtime = None
+        # list of (header statement spans, tree statement spans) tuples
+        self.collections = []
+        # state of the scan, so that it can be resumed by ``update()``
+        self._scanned_size = 0
+        self._preamble = []
+        self._preamble_block_name = None
+        self._block = None
+
+    def save(self, sidecar_path=None):
+        if sidecar_path is None:
+            sidecar_path = self.get_sidecar_path(self.path)
+        collections = []
+        for header, trees in self.collections:
+            offsets = []
+            for span in trees:
+                offsets.extend(span)
+            collections.append({"header": header, "trees": offsets})
+        data = {
+            "version": self.format_version,
+            "schema": self.schema,
+            "source_size": self.source_size,
+            "source_mtime": self.source_mtime,
+            "collections": collections,
+            }
+        with open(sidecar_path, "w") as dest:
+            json.dump(data, dest)
+
+    def _set_source_signature(self):
+        st = os.stat(self.path)
+        self.source_size = st.st_size
+        self.source_mtime = st.st_mtime
+
+    def _get_num_collections(self):
+        return len(self.collections)
+    num_collections = property(_get_num_collections)
+
+    def num_trees(self, collection_offset=0):
+        """
+        Returns the number of trees in the collection given by
+        ``collection_offset``.
+        """
+        return len(self.collections[collection_offset][1])
+
+    def __len__(self):
+        return sum(len(trees) for header, trees in self.collections)
+
+    def tree_spans(self, collection_offset=0):
+        """
+        Returns the list of (start, end) byte offsets of the tree statements in
+        the collection given by ``collection_offset``.
+        """
+        return self.collections[collection_offset][1]
+
+    def open_trees(self, collection_offset=0, start=None, stop=None, step=None):
+        """
+        Returns a file-like object that provides a complete, minimal source
+        (in the same schema as the indexed file) of the trees given by the
+        slice ``start:stop:step`` of the collection given by
+        ``collection_offset``. Only the selected tree statements are read from
+        the indexed file, together with statements required to interpret them
+        (e.g., NEXUS TAXA blocks and TRANSLATE statements).
+        """
+        return open_source_parts(self.path, self.source_parts(
+            collection_offset=collection_offset,
+            start=start,
+            stop=stop,
+            step=step),
+            encoding=self.encoding)
+
+    def source_parts(self, collection_offset=0, start=None, stop=None, step=None):
+        """
+        Returns the description of the source provided by :meth:`open_trees`
+        as a list of strings and (start, end) byte spans of the indexed file.
+        Passing this list to :func:`open_source_parts` (e.g., in another
+        process) opens the source without the index.
+        """
+        header, trees = self.collections[collection_offset]
+        spans = []
+        for span in trees[start:stop:step]:
+            if spans and spans[-1][1] == span[0]:
+                spans[-1] = (spans[-1][0], span[1])
+            else:
+                spans.append(span)
+        if self.schema == "nexus":
+            parts = ["#NEXUS\n"]
+            parts.extend(header)
+            parts.extend(spans)
+            parts.append("\nEND;\n")
+        else:
+            parts = spans
+        return parts
+
+    def partition(self, num_chunks, collection_offset=0, start=0):
+        """
+        Splits the trees of the collection given by ``collection_offset``,
+        starting with the tree at offset ``start``, into (at most)
+        ``num_chunks`` contiguous ranges of approximately equal size (in
+        bytes), returned as a list of (start, stop) tree offsets.
+        """
+        trees = self.collections[collection_offset][1]
+        if start < 0:
+            start = max(0, start + len(trees))
+        if start >= len(trees):
+            return []
+        num_chunks = max(1, min(num_chunks, len(trees) - start))
+        base = trees[start][0]
+        size = trees[-1][1] - base
+        ranges = []
+        chunk_start = start
+        for chunk_idx in range(1, num_chunks):
+            boundary = base + (size * chunk_idx) // num_chunks
+            chunk_stop = chunk_start + 1
+            while chunk_stop < len(trees) and trees[chunk_stop][0] < boundary:
+                chunk_stop += 1
+            if chunk_stop >= len(trees):
+                break
+            ranges.append((chunk_start, chunk_stop))
+            chunk_start = chunk_stop
+        ranges.append((chunk_start, len(trees)))
+        return ranges
+
+    def update(self):
+        """
+        Scans the statements that have been appended to the file since it was
+        last scanned by this method, adding the trees found to the index.
+        Only complete statements (i.e., those terminated by a semi-colon) are
+        scanned, so that a statement that is still being written is scanned
+        in full by a later call instead. Returns |True| if any trees were
+        added.
+        """
+        if not os.path.isfile(self.path):
+            return False
+        if self._scanned_size == 0 and filesys.get_compression_format(self.path) is not None:
+            raise TreeFileIndexError("Indexing not supported for compressed files: '{}'".format(self.path))
+        num_trees = len(self)
+        with open(self.path, "rb") as src:
+            size = os.fstat(src.fileno()).st_size
+            if size <= self._scanned_size:
+                return False
+            buf = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if self.schema == "nexus/newick":
+                    self.schema = self._detect_schema(buf)
+                if self.schema == "newick":
+                    self._scan_newick(buf, self._scanned_size, complete_only=True)
+                else:
+                    self._scan_nexus(buf, self._scanned_size, complete_only=True)
+            finally:
+                buf.close()
+        self._set_source_signature()
+        return len(self) > num_trees
+
+    def _detect_schema(self, buf):
+        # as for the "nexus/newick" tree yielder, NEWICK unless the first
+        # token is "#NEXUS"
+        pos = _skip_whitespace_and_comments(buf, 0, len(buf))
+        m = _WORD_PATTERN.match(buf, pos)
+        if m is not None and m.group().upper() == b"#NEXUS":
+            return "nexus"
+        else:
+            return "newick"
+
+    def _scan_newick(self, buf, scan_start=0, complete_only=False):
+        if self.collections:
+            trees = self.collections[0][1]
+        else:
+            trees = []
+        for start, end in _iter_statements(buf, scan_start, complete_only):
+            pos = _skip_whitespace_and_comments(buf, start, end)
+            if pos < end and buf[pos:pos+1] != b";":
+                trees.append((start, end))
+            self._scanned_size = end
+        if trees and not self.collections:
+            self.collections.append(([], trees))
+
+    def _scan_nexus(self, buf, scan_start=0, complete_only=False):
+        # a trees block is added to the collections once its first tree is
+        # found; of the statements preceding it, only those of TAXA blocks
+        # are kept
+        preamble = self._preamble
+        if self._block is None:
+            block_header = None
+            block_trees = None
+        else:
+            block_header, block_trees = self._block
+        for start, end in _iter_statements(buf, scan_start, complete_only):
+            self._scanned_size = end
+            pos = _skip_whitespace_and_comments(buf, start, end)
+            m = _WORD_PATTERN.match(buf, pos, end)
+            keyword = m.group().upper() if m is not None else b""
+            if keyword == b"#NEXUS":
+                start = m.end()
+                pos = _skip_whitespace_and_comments(buf, start, end)
+                m = _WORD_PATTERN.match(buf, pos, end)
+                keyword = m.group().upper() if m is not None else b""
+            if block_trees is None:
+                if keyword == b"BEGIN":
+                    pos = _skip_whitespace_and_comments(buf, m.end(), end)
+                    m = _WORD_PATTERN.match(buf, pos, end)
+                    block_name = m.group().upper() if m is not None else b""
+                    if block_name == b"TREES":
+                        block_header = preamble + [(start, end)]
+                        block_trees = []
+                        self._block = (block_header, block_trees)
+                        continue
+                    self._preamble_block_name = block_name
+                if self._preamble_block_name == b"TAXA":
+                    preamble.append((start, end))
+                if keyword == b"END" or keyword == b"ENDBLOCK":
+                    self._preamble_block_name = None
+            elif keyword == b"TREE":
+                if not block_trees:
+                    self.collections.append(self._block)
+                block_trees.append((start, end))
+            elif keyword == b"END" or keyword == b"ENDBLOCK":
+                block_header = None
+                block_trees = None
+                self._block = None
+            else:
+                block_header.append((start, end))
+
+class TreeFileFollower(object):
+    """
+    Follows a NEWICK or NEXUS file that may still be being written (e.g., by
+    a running MCMC sampler), providing the trees that have been completely
+    written to it since it was last polled. Only the newly-written part of the
+    file is scanned on each poll, and a partially-written final statement is
+    left for a later poll. The file need not exist yet.
+    """
+
+    def __init__(self, path, schema, tree_offset=0, encoding=None):
+        if not textprocessing.is_str_type(path):
+            raise TypeError("Only files given by path can be followed: {}".format(path))
+        schema = schema.lower()
+        if schema not in ("newick", "nexus", "nexus/newick"):
+            raise TreeFileIndexError("Following not supported for schema '{}'".format(schema))
+        self.index = TreeFileIndex(path=path, schema=schema, encoding=encoding)
+        # number of trees at the start of the file to skip
+        self.tree_offset = tree_offset
+        # number of trees of each collection that have already been provided
+        # (or skipped)
+        self._num_trees_polled = []
+
+    def poll(self):
+        """
+        Returns a list of file-like objects, one for each collection with
+        trees that have been completely written since the last poll,
+        providing a complete, minimal source (in the schema of the file) of
+        these trees.
+        """
+        self.index.update()
+        sources = []
+        num_preceding_trees = 0
+        for collection_offset in range(self.index.num_collections):
+            num_trees = self.index.num_trees(collection_offset)
+            if collection_offset == len(self._num_trees_polled):
+                self._num_trees_polled.append(0)
+            start = max(self._num_trees_polled[collection_offset],
+                    self.tree_offset - num_preceding_trees)
+            num_preceding_trees += num_trees
+            self._num_trees_polled[collection_offset] = num_trees
+            if start < num_trees:
+                sources.append(self.index.open_trees(
+                    collection_offset=collection_offset,
+                    start=start))
+        return sources
+
+class FollowingTreeDataYielder(object):
+    """
+    Yields trees from NEWICK or NEXUS files that may still be being written.
+    Each iteration yields the trees that have been completely written to the
+    files since the previous iteration and then ends, rather than waiting for
+    more trees to be written, so the files are polled by iterating repeatedly.
+    """
+
+    def __init__(self, files, schema, yielder_factory, tree_offset=0):
+        """
+        Parameters
+        ----------
+        files : iterable of file paths
+            Paths of the files to follow.
+        schema : string
+            The name of the data format: "newick", "nexus", or
+            "nexus/newick".
+        yielder_factory : function object
+            A function that takes two named arguments, ``files`` and
+            ``schema``, and returns an iterable over the trees of the sources
+            in ``files``.
+        tree_offset : integer
+            Number of trees at the start of each file to skip.
+        """
+        self.followers = [TreeFileFollower(path=f, schema=schema, tree_offset=tree_offset) for f in files]
+        self.yielder_factory = yielder_factory
+
+    def __iter__(self):
+        for follower in self.followers:
+            for source in follower.poll():
+                for tree in self.yielder_factory(files=[source], schema=follower.index.schema):
+                    yield tree
+
+class _SpanStream(object):
+    """
+    Read-only text stream over a sequence of parts, each of which is either a
+    string or a (start, end) span of bytes in the file at ``path``, decoded
+    using ``encoding``.
+    """
+
+    def __init__(self, path, parts, encoding=None):
+        self.name = path
+        self._parts = list(parts)
+        self._part_index = 0
+        self._src = None
+        self._remaining = 0
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+    def read(self, size=-1):
+        chunks = []
+        count = 0
+        while size < 0 or count < size:
+            chunk = self._read_part(size - count if size >= 0 else -1)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            count += len(chunk)
+        return "".join(chunks)
+
+    def _read_part(self, size):
+        while True:
+            if self._remaining > 0:
+                n = self._remaining if size < 0 else min(size, self._remaining)
+                data = self._src.read(n)
+                if not data:
+                    self._remaining = 0
+                    continue
+                self._remaining -= len(data)
+                final = self._remaining == 0
+                return self._decoder.decode(data, final)
+            if self._part_index >= len(self._parts):
+                self.close()
+                return None
+            part = self._parts[self._part_index]
+            self._part_index += 1
+            if isinstance(part, str):
+                return part
+            if self._src is None:
+                self._src = open(self.name, "rb")
+            self._src.seek(part[0])
+            self._remaining = part[1] - part[0]
+
+    def close(self):
+        if self._src is not None:
+            self._src.close()
+            self._src = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def open_source_parts(path, parts, encoding=None):
+    """
+    Returns a file-like object providing the text given by ``parts``, a list
+    of strings and (start, end) byte spans of the file at ``path``, as
+    returned by :meth:`TreeFileIndex.source_parts`, decoded using
+    ``encoding`` (or the preferred encoding of the locale, if |None|).
+    """
+    return _SpanStream(path, parts, encoding=encoding)
+
+def is_indexable_source(source, schema):
+    """
+    Returns |True| if ``source`` is the path of an (uncompressed) file on disk
+    that can be indexed as ``schema``.
+    """
+    return (textprocessing.is_str_type(source)
+            and schema.lower() in ("newick", "nexus", "nexus/newick")
+            and os.path.isfile(source)
+            and filesys.get_compression_format(source) is None)
+
+def open_indexed_trees(stream,
+        schema,
+        collection_offset=0,
+        tree_offset=0,
+        num_trees=None,
+        use_sidecar=True):
+    """
+    Returns a file-like object providing the ``num_trees`` trees (or all
+    remaining trees, if ``num_trees`` is |None|) starting at ``tree_offset``
+    of the collection given by ``collection_offset`` of the file underlying
+    ``stream``, as given by the index of the file (see :meth:`TreeFileIndex.get`),
+    decoded as ``stream`` is. Returns |None| if ``stream`` is not a NEWICK or
+    NEXUS file on disk.
+    """
+    path = getattr(stream, "name", None)
+    if not is_indexable_source(path, schema):
+        return None
+    index = TreeFileIndex.get(path=path,
+            schema=schema,
+            use_sidecar=use_sidecar,
+            encoding=getattr(stream, "encoding", None))
+    num_collections = index.num_collections
+    if collection_offset >= num_collections or collection_offset < -num_collections:
+        raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, num_collections, num_collections-1))
+    num_source_trees = index.num_trees(collection_offset)
+    if tree_offset >= num_source_trees or (num_trees is not None and tree_offset < -num_source_trees):
+        raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_source_trees, num_source_trees-1))
+    if tree_offset < 0:
+        tree_offset = max(0, tree_offset + num_source_trees)
+    if num_trees is None:
+        stop = None
+    else:
+        stop = tree_offset + num_trees
+    return index.open_trees(collection_offset=collection_offset, start=tree_offset, stop=stop)
@@ -64,6 +64,16 @@ class XmlObject(object):
     def get(self, attrib_name, default=None):
         return self._element.get(attrib_name, default)
 
+    def remove(self, subelement):
+        self._element.remove(subelement._element)
+
+    def clear(self):
+        self._element.clear()
+
+    def _get_tag(self):
+        return self._element.tag
+    tag = property(_get_tag)
+
     def _get_attrib(self):
         return self._element.attrib
     attrib = property(_get_attrib)
@@ -174,3 +184,46 @@ class XmlDocument(XmlObject):
         for prefix, namespace in ns_map:
             self.namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
 
+    def iterparse(self, source, max_depth=None):
+        """
+        Incrementally parses an XML document from ``source``, which can either
+        be a filepath string or a file object, yielding a tuple,
+        ``(event, depth, element, parent)``, at the start (``event`` =
+        "start") and end (``event`` = "end") of each element. The root
+        element is at depth 0, and ``parent`` is |None| for it. Elements
+        deeper than ``max_depth`` are not reported, but are available as
+        subelements of their ancestors.
+
+        At the "start" event, only the attributes of the element are
+        available; at the "end" event, the element is complete. Elements are
+        not discarded once parsed: to keep memory use bounded by the size of
+        the largest element of interest rather than the document, call
+        ``parent.remove(element)`` once it has been processed at its "end"
+        event.
+        """
+        stack = []
+        num_unreported_open = 0
+        for event, elem in ElementTree.iterparse(source, ("start", "end", "start-ns")):
+            if event == "start-ns":
+                self.namespace_registry.add_namespace(prefix=elem[0], namespace=elem[1])
+            elif event == "start":
+                if num_unreported_open or (max_depth is not None and len(stack) > max_depth):
+                    num_unreported_open += 1
+                    continue
+                element = self.subelement_factory(elem)
+                if stack:
+                    parent = stack[-1]
+                else:
+                    parent = None
+                    self.root = element
+                stack.append(element)
+                yield event, len(stack) - 1, element, parent
+            elif num_unreported_open:
+                num_unreported_open -= 1
+            else:
+                element = stack.pop()
+                if stack:
+                    parent = stack[-1]
+                else:
+                    parent = None
+                yield event, len(stack), element, parent
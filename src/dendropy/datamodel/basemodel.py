@@ -23,6 +23,8 @@ Infrastructure for phylogenetic data objects.
 
 import os
 import copy
+import gc
+import platform
 import sys
 import collections
 from dendropy.utility.textprocessing import StringIO
@@ -34,6 +36,7 @@ from dendropy.utility import textprocessing
 from dendropy.utility import urlio
 from dendropy.utility import error
 from dendropy.utility import deprecate
+from dendropy.utility import filesys
 
 ##############################################################################
 ## Keyword Processor
@@ -54,6 +57,121 @@ def _extract_serialization_target_keyword(kwargs, target_type):
     schema = kwargs.pop("schema")
     return found_kw[0], target, schema
 
+##############################################################################
+## Instance Attributes
+
+# Names of the slots of classes, across the class hierarchy
+_class_slot_names = {}
+
+def _get_slot_names(cls):
+    try:
+        return _class_slot_names[cls]
+    except KeyError:
+        pass
+    names = []
+    for c in reversed(cls.__mro__):
+        slots = c.__dict__.get("__slots__", ())
+        if textprocessing.is_str_type(slots):
+            slots = (slots,)
+        for name in slots:
+            if name != "__dict__" and name != "__weakref__" and name not in names:
+                names.append(name)
+    names = frozenset(names)
+    _class_slot_names[cls] = names
+    return names
+
+_is_cpython = platform.python_implementation() == "CPython"
+
+def has_instance_dict_attributes(obj, num_slot_values):
+    """
+    Returns |False| if ``obj``, with ``num_slot_values`` of its slots set,
+    has no attributes stored in its instance dictionary, or |True| if it has
+    or may have. Unlike accessing the ``__dict__`` attribute of a slotted
+    object, this does not create its instance dictionary if it has none.
+    """
+    if not _is_cpython:
+        return True
+    # the garbage collector visits the class of the object, the values of
+    # its slots, and its instance dictionary or the values in it
+    return len(gc.get_referents(obj)) != num_slot_values + 1
+
+def iter_instance_attributes(obj):
+    """
+    Iterates over the names and values of the attributes set on ``obj``,
+    whether stored in slots or in the instance dictionary.
+    """
+    num_slot_values = 0
+    for name in _get_slot_names(obj.__class__):
+        try:
+            value = getattr(obj, name)
+        except AttributeError:
+            # slot not set
+            continue
+        num_slot_values += 1
+        yield name, value
+    if has_instance_dict_attributes(obj, num_slot_values):
+        instance_dict = getattr(obj, "__dict__", None)
+        if instance_dict:
+            for item in instance_dict.items():
+                yield item
+
+def has_instance_attribute(obj, name):
+    """
+    Returns |True| if the attribute ``name`` is set on ``obj``, whether
+    stored in a slot or in the instance dictionary.
+    """
+    if name in _get_slot_names(obj.__class__):
+        return hasattr(obj, name)
+    return name in getattr(obj, "__dict__", ())
+
+def set_instance_attribute(obj, name, value):
+    """
+    Sets the attribute ``name`` of ``obj`` directly, i.e., in its slot or
+    instance dictionary, bypassing any property of the same name.
+    """
+    if name in _get_slot_names(obj.__class__):
+        setattr(obj, name, value)
+    else:
+        obj.__dict__[name] = value
+
+class Slotted(object):
+    """
+    Mixin class for objects of which there may be very many instances, such
+    as the nodes, edges and bipartitions of trees or the taxa of namespaces.
+
+    Derived classes store their attributes in slots, to reduce the memory
+    footprint of each instance, and include the "``__dict__``" slot in their
+    ``__slots__`` to still allow for arbitrary other attributes (the
+    dictionary is only created when first needed). Instances are pickled
+    with the attributes stored in both.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return dict(iter_instance_attributes(self))
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            set_instance_attribute(self, k, v)
+
+class Commentable(object):
+    """
+    Mixin class for objects with a list of comments, which is only created
+    when first needed. Derived classes that use slots need to provide the
+    ``_comments`` slot, and set it to |None| on initialization.
+    """
+
+    __slots__ = ()
+
+    def _get_comments(self):
+        if self._comments is None:
+            self._comments = []
+        return self._comments
+    def _set_comments(self, comments):
+        self._comments = comments
+    comments = property(_get_comments, _set_comments)
+
 ##############################################################################
 ## DataObject
 
@@ -63,6 +181,10 @@ class DataObject(object):
     Base class for all phylogenetic data objects.
     """
 
+    # Derived classes may store their attributes, including ``_label``, in
+    # slots (see `Slotted`).
+    __slots__ = ()
+
     def __init__(self, label=None):
         self._label = None
         if label is not None:
@@ -194,6 +316,8 @@ class Deserializable(object):
         """
         Factory method to return new object of this class from file
         specified by string ``src``.
+        Files compressed in gzip, bz2, or xz format are recognized by their
+        leading bytes and decompressed on the fly as they are read.
 
         Parameters
         ----------
@@ -205,7 +329,9 @@ class Deserializable(object):
             Arguments to customize parsing, instantiation, processing, and
             accession of objects read from the data source, including schema-
             or format-specific handling. These will be passed to the underlying
-            schema-specific reader for handling.
+            schema-specific reader for handling, except for
+            ``threaded_decompression``: if |True|, then compressed files are
+            decompressed in a background thread.
 
         Returns
         -------
@@ -213,7 +339,9 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        with open(src, "r", newline=None) as fsrc:
+        fsrc = filesys.open_for_reading(src,
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
+        with fsrc:
             return cls._parse_and_create_from_stream(stream=fsrc,
                     schema=schema,
                     **kwargs)
@@ -386,6 +514,8 @@ class MultiReadable(object):
     def read_from_path(self, src, schema, **kwargs):
         """
         Reads data from file specified by ``filepath``.
+        Files compressed in gzip, bz2, or xz format are recognized by their
+        leading bytes and decompressed on the fly as they are read.
 
         Parameters
         ----------
@@ -397,7 +527,9 @@ class MultiReadable(object):
             Arguments to customize parsing, instantiation, processing, and
             accession of objects read from the data source, including schema-
             or format-specific handling. These will be passed to the underlying
-            schema-specific reader for handling.
+            schema-specific reader for handling, except for
+            ``threaded_decompression``: if |True|, then compressed files are
+            decompressed in a background thread.
 
         Returns
         -------
@@ -410,7 +542,9 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        with open(src, "r", newline=None) as fsrc:
+        fsrc = filesys.open_for_reading(src,
+                threaded_decompression=kwargs.pop("threaded_decompression", False))
+        with fsrc:
             return self._parse_and_add_from_stream(stream=fsrc, schema=schema, **kwargs)
 
     def read_from_string(self, src, schema, **kwargs):
@@ -630,11 +764,18 @@ class Annotable(object):
     """
     Mixin class which all classes that need to persist object attributes
     or other information as metadata should subclass.
+
+    Derived classes that use slots need to provide the ``_annotations`` and
+    ``_deferred_annotations`` slots.
     """
 
+    __slots__ = ()
+
     def _get_annotations(self):
         if not hasattr(self, "_annotations"):
             self._annotations = AnnotationSet(self)
+        if hasattr(self, "_deferred_annotations"):
+            self._resolve_deferred_annotations()
         return self._annotations
     def _set_annotations(self, annotations):
         if hasattr(self, "_annotations") \
@@ -652,9 +793,43 @@ class Annotable(object):
     annotations = property(_get_annotations, _set_annotations)
 
     def _has_annotations(self):
+        if hasattr(self, "_deferred_annotations"):
+            self._resolve_deferred_annotations()
         return hasattr(self, "_annotations") and len(self._annotations) > 0
     has_annotations = property(_has_annotations)
 
+    def defer_annotations(self, annotations_fn, source):
+        """
+        Registers a source of annotations that will only be parsed when the
+        annotations of this object are first accessed.
+
+        Parameters
+        ----------
+
+        ``annotations_fn`` : function object
+            A function that takes ``source`` as its only argument and returns
+            a collection of |Annotation| objects.
+
+        ``source`` : object
+            The raw (unparsed) representation of the annotations, e.g. the
+            text of a metadata comment.
+
+        """
+        try:
+            self._deferred_annotations.append( (annotations_fn, source) )
+        except AttributeError:
+            self._deferred_annotations = [ (annotations_fn, source) ]
+
+    def _resolve_deferred_annotations(self):
+        if not hasattr(self, "_deferred_annotations"):
+            return
+        deferred_annotations = self._deferred_annotations
+        del self._deferred_annotations
+        if not hasattr(self, "_annotations"):
+            self._annotations = AnnotationSet(self)
+        for annotations_fn, source in deferred_annotations:
+            self._annotations.update(annotations_fn(source))
+
     def copy_annotations_from(self,
             other,
             attribute_object_mapper=None):
@@ -703,6 +878,7 @@ class Annotable(object):
             instead.
 
         """
+        other._resolve_deferred_annotations()
         if hasattr(other, "_annotations"):
             if attribute_object_mapper is None:
                 attribute_object_mapper = {id(object):self}
@@ -720,6 +896,7 @@ class Annotable(object):
         (i.e., a reference to a particular entity may be absolute regardless of
         context).
         """
+        other._resolve_deferred_annotations()
         if hasattr(other, "_annotations"):
             # if not isinstance(self, other.__class__) or not isinstance(other, self.__class__):
             if type(self) is not type(other):
@@ -754,19 +931,22 @@ class Annotable(object):
         """
         if memo is None:
             memo = {}
+        self._resolve_deferred_annotations()
         other = self.__class__()
         memo[id(self)] = other
-        for k in self.__dict__:
+        for k, v in list(iter_instance_attributes(self)):
             if k == "_annotations":
                 continue
-            other.__dict__[k] = copy.copy(self.__dict__[k])
-            memo[id(self.__dict__[k])] = other.__dict__[k]
+            c = copy.copy(v)
+            set_instance_attribute(other, k, c)
+            memo[id(v)] = c
         self.deep_copy_annotations_from(other, memo=memo)
 
     def __deepcopy__(self, memo=None):
         # ensure clone map
         if memo is None:
             memo = {}
+        self._resolve_deferred_annotations()
         # get or create clone of self
         try:
             other = memo[id(self)]
@@ -777,14 +957,15 @@ class Annotable(object):
             # store
             memo[id(self)] = other
         # copy other attributes first, skipping annotations
-        for k in self.__dict__:
+        for k, v in list(iter_instance_attributes(self)):
             if k == "_annotations":
                 continue
-            if k in other.__dict__:
+            if has_instance_attribute(other, k):
                 continue
-            other.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
-            memo[id(self.__dict__[k])] = other.__dict__[k]
-            # assert id(self.__dict__[k]) in memo
+            c = copy.deepcopy(v, memo)
+            set_instance_attribute(other, k, c)
+            memo[id(v)] = c
+            # assert id(v) in memo
         # create annotations
         other.deep_copy_annotations_from(self, memo)
         # return
@@ -891,6 +1072,7 @@ class Annotation(Annotable):
         o = self.__class__.__new__(self.__class__)
         if attribute_object_mapper is None:
             attribute_object_mapper = {id(self):o}
+        self._resolve_deferred_annotations()
         if hasattr(self, "_annotations"):
             o.copy_annotations_from(self)
         for k in self.__dict__:
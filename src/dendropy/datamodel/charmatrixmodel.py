@@ -130,6 +130,12 @@ class CharacterDataSequence(
     iterating over ``<character-value, character-type,
     character-annotation-set>`` triplets.
 
+    Readers may store the values of a sequence in a compact, packed form (see
+    ``CharacterDataSequence._set_packed_values``), in which each value is
+    represented by a single byte indexing a table of state identities. Reading
+    values through the list interface works directly on the packed form, while
+    any other access expands it into the standard representation.
+
     """
 
     ###############################################################################
@@ -145,6 +151,8 @@ class CharacterDataSequence(
         character_values : iterable of values
             A set of values for this sequence.
         """
+        self._packed_values = None
+        self._packed_states = None
         self._character_values = []
         self._character_types = []
         self._character_annotations = []
@@ -154,6 +162,60 @@ class CharacterDataSequence(
                     character_types=character_types,
                     character_annotations=character_annotations)
 
+    ###############################################################################
+    ## Packed Storage
+
+    def _set_packed_values(self, packed_values, packed_states):
+        """
+        Replaces the contents of this sequence with values given in packed
+        form.
+
+        Parameters
+        ----------
+        packed_values : bytearray
+            Each byte is the index of the value of the corresponding
+            character in ``packed_states``.
+        packed_states : list
+            List of (typically) |StateIdentity| instances indexed by the
+            bytes of ``packed_values``. This list is not copied, and may be
+            shared by multiple sequences: it must not be modified.
+        """
+        for attr_name in ("_character_values", "_character_types", "_character_annotations"):
+            self.__dict__.pop(attr_name, None)
+        self._packed_values = packed_values
+        self._packed_states = packed_states
+
+    def _extend_packed_values(self, packed_values, packed_states):
+        """
+        Extends this sequence with values given in packed form (see
+        ``_set_packed_values()``). The sequence remains packed if it is empty
+        or already packed with the same states table.
+        """
+        if self._packed_values is not None and self._packed_states is packed_states:
+            self._packed_values.extend(packed_values)
+        elif self._packed_values is None and not self._character_values:
+            self._set_packed_values(bytearray(packed_values), packed_states)
+        else:
+            self.extend([packed_states[c] for c in packed_values])
+
+    def _unpack_values(self):
+        states = self._packed_states
+        self._character_values = [states[c] for c in self._packed_values]
+        self._character_types = [None] * len(self._character_values)
+        self._character_annotations = [None] * len(self._character_values)
+        self._packed_values = None
+        self._packed_states = None
+
+    def __getattr__(self, name):
+        # only called if normal attribute lookup fails, i.e., for the lists of
+        # values, types and annotations, only if they have not been expanded
+        # from the packed form yet
+        if (name in ("_character_values", "_character_types", "_character_annotations")
+                and self.__dict__.get("_packed_values", None) is not None):
+            self._unpack_values()
+            return self.__dict__[name]
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
     ###############################################################################
     ## Life-cycle
 
@@ -180,7 +242,7 @@ class CharacterDataSequence(
         v : list
             List of string representation of values making up this vector.
         """
-        return list(str(cs) for cs in self._character_values)
+        return list(str(cs) for cs in self)
 
     def symbols_as_string(self, sep=""):
         """
@@ -192,6 +254,9 @@ class CharacterDataSequence(
         s : string
             String representation of values making up this vector.
         """
+        if self._packed_values is not None:
+            symbols = [str(cs) for cs in self._packed_states]
+            return sep.join([symbols[c] for c in self._packed_values])
         return sep.join(str(cs) for cs in self._character_values)
 
     def __str__(self):
@@ -240,9 +305,16 @@ class CharacterDataSequence(
             self._character_annotations.extend(character_annotations)
 
     def __len__(self):
+        if self._packed_values is not None:
+            return len(self._packed_values)
         return len(self._character_values)
 
     def __getitem__(self, idx):
+        if self._packed_values is not None:
+            states = self._packed_states
+            if isinstance(idx, slice):
+                return [states[c] for c in self._packed_values[idx]]
+            return states[self._packed_values[idx]]
         return self._character_values[idx]
 
     def __setitem__(self, idx, value):
@@ -252,6 +324,11 @@ class CharacterDataSequence(
         return self.__next__()
 
     def __next__(self):
+        if self._packed_values is not None:
+            states = self._packed_states
+            for c in self._packed_values:
+                yield states[c]
+            return
         for v in self._character_values:
             yield v
 
@@ -328,7 +405,7 @@ class CharacterDataSequence(
         c : object
             Value of character at index ``idx``.
         """
-        return self._character_values[idx]
+        return self[idx]
 
     def character_type_at(self, idx):
         """
@@ -605,6 +682,64 @@ class CharacterMatrix(
         """
         return cls._get_from(**kwargs)
 
+    @classmethod
+    def yield_sequences_from_files(cls,
+            files,
+            schema,
+            taxon_namespace=None,
+            **kwargs):
+        """
+        Iterates over the rows of the character matrices of files, returning
+        them one-by-one instead of instantiating the matrices in memory. Only
+        the "nexml" schema is currently supported.
+
+        Parameters
+        ----------
+        files : iterable of file paths or file-like objects.
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        schema : string
+            The name of the data format (e.g., "nexml").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the schema-parser implementation.
+
+        Yields
+        ------
+        t : ``tuple`` (|Taxon|, |CharacterDataSequence|)
+            The taxon and the sequence of each row, for the rows of all the
+            character matrices of the files, whatever their data types.
+
+        Examples
+        --------
+
+        ::
+
+            taxon_namespace = dendropy.TaxonNamespace()
+            sequence_yielder = dendropy.CharacterMatrix.yield_sequences_from_files(
+                    files=["path/to/data1.xml", "path/to/data2.xml"],
+                    schema="nexml",
+                    taxon_namespace=taxon_namespace)
+            lengths = {}
+            for taxon, sequence in sequence_yielder:
+                lengths[taxon] = len(sequence)
+
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
+            if taxon_namespace is None:
+                taxon_namespace = taxonmodel.TaxonNamespace()
+        return dataio.get_char_sequence_yielder(
+                files=files,
+                schema=schema,
+                taxon_namespace=taxon_namespace,
+                **kwargs)
+
     def concatenate(cls, char_matrices):
         """
         Creates and returns a single character matrix from multiple
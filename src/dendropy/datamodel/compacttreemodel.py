@@ -0,0 +1,812 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+This module provides an array-backed, read-only representation of the
+topology and edge lengths of a tree, for workloads (e.g., distance
+calculations, statistics, or split extraction over posterior samples of
+trees) that do not need the full |Node| and |Edge| object graph of a |Tree|.
+"""
+
+import array
+from dendropy.utility import error
+from dendropy.utility import bitprocessing
+from dendropy.utility import constants
+from dendropy.utility import filesys
+from dendropy.utility import textprocessing
+from dendropy.datamodel import basemodel
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import treemodel
+from dendropy.dataio import nexusprocessing
+from dendropy.dataio import newickreader
+
+##############################################################################
+## CompactTree
+
+class CompactTree(basemodel.Deserializable):
+    """
+    An immutable, array-backed representation of the topology, edge lengths
+    and taxa of a tree.
+
+    The nodes of the tree are identified by their index, from 0 to
+    ``num_nodes - 1``, and their data is held in parallel arrays:
+
+        - ``parent_indexes``: the index of the parent of each node, or -1
+          for the seed node.
+        - ``child_offsets`` and ``child_indexes``: the indexes of the children
+          of node ``i`` are ``child_indexes[child_offsets[i]:child_offsets[i+1]]``.
+        - ``edge_lengths``: the length of the edge subtending each node
+          (``array('d')``), with undefined lengths stored as NaN.
+        - ``taxon_indexes``: the accession index of the taxon associated with
+          each node in ``taxon_namespace``, or -1 if there is none. The
+          bitmask of this taxon is thus ``1 << taxon_indexes[i]``.
+        - ``preorder_indexes`` and ``postorder_indexes``: the indexes of the
+          nodes in pre-order and post-order, respectively.
+
+    Node labels, if any, are held in the list ``node_labels``, which is
+    |None| if no node has a label.
+
+    None of these arrays should be modified: the bipartitions of the tree are
+    cached when first calculated. Use :meth:`to_tree()` to obtain a |Tree|
+    that can be modified.
+
+    A |CompactTree| is created from a |Tree| using :meth:`from_tree()`, or
+    from NEWICK sources using :meth:`get()` or :meth:`yield_from_files()`,
+    which parse the (very common) tree statements that consist only of
+    parentheses, commas, unquoted labels and edge lengths directly into
+    arrays, without building the nodes of a |Tree|.
+    """
+
+    def _parse_and_create_from_stream(cls,
+            stream,
+            schema,
+            taxon_namespace=None,
+            tree_offset=None,
+            **kwargs):
+        """
+        Constructs a new |CompactTree| object from the tree at offset
+        ``tree_offset`` (the first tree by default) of file-like object
+        ``stream``. Returns |None| if there is no such tree.
+        """
+        if tree_offset is None:
+            tree_offset = 0
+        for tree_idx, tree in enumerate(cls._compact_tree_iter(
+                stream=stream,
+                schema=schema,
+                taxon_namespace=taxon_namespace,
+                **kwargs)):
+            if tree_idx == tree_offset:
+                return tree
+        return None
+    _parse_and_create_from_stream = classmethod(_parse_and_create_from_stream)
+
+    @classmethod
+    def get(cls, **kwargs):
+        """
+        Instantiate and return a *new* |CompactTree| object from a data
+        source.
+
+        **Mandatory Source-Specification Keyword Argument (Exactly One of the Following Required):**
+
+            - **file** (*file*) -- File or file-like object of data opened for reading.
+            - **path** (*str*) -- Path to file of data.
+            - **url** (*str*) -- URL of data.
+            - **data** (*str*) -- Data given directly.
+
+        **Mandatory Schema-Specification Keyword Argument:**
+
+            - **schema** (*str*) -- Identifier of format of data given by the
+              "``file``", "``path``", "``data``", or "``url``" argument
+              specified above: currently only ":doc:`newick </schemas/newick>`"
+              is supported.
+
+        **Optional General Keyword Arguments:**
+
+            - **taxon_namespace** (|TaxonNamespace|) -- The |TaxonNamespace|
+              instance to use to :doc:`manage the taxon names </primer/taxa>`.
+              If not specified, a new one will be created.
+            - **tree_offset** (*int*) -- 0-based index of the tree in the
+              source to be returned.
+
+        **Optional Schema-Specific Keyword Arguments:**
+
+            These are passed to the
+            :class:`~dendropy.dataio.newickreader.NewickReader`: see
+            :meth:`yield_from_files()`.
+
+        Examples
+        --------
+
+        ::
+
+            tree = dendropy.CompactTree.get(
+                    path="mammals.tre",
+                    schema="newick",
+                    tree_offset=2)
+            tree = dendropy.CompactTree.get(
+                    data="((A:1,B:1):1,C:2);",
+                    schema="newick")
+
+        """
+        return cls._get_from(**kwargs)
+
+    def yield_from_files(cls,
+            files,
+            schema,
+            taxon_namespace=None,
+            **kwargs):
+        """
+        Iterates over the trees in files as |CompactTree| objects, parsing
+        them directly into arrays where possible.
+
+        Parameters
+        ----------
+        files : iterable of file paths or file-like objects.
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading.
+        schema : string
+            The name of the data format: currently only "newick" is supported.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions. If not specified, a new one will be created
+            and shared by all of the trees.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the
+            :class:`~dendropy.dataio.newickreader.NewickReader`: e.g.,
+            ``rooting``, ``preserve_underscores``,
+            ``suppress_internal_node_taxa``, ``suppress_leaf_node_taxa``,
+            ``suppress_edge_lengths``, ``case_sensitive_taxon_labels`` and
+            ``terminating_semicolon_required``. Comments and metadata (other
+            than rooting tokens) are not stored.
+
+        Yields
+        ------
+        t : |CompactTree|
+            Trees as read from the files.
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        for src in files:
+            if textprocessing.is_str_type(src):
+                with filesys.open_for_reading(src) as stream:
+                    for tree in cls._compact_tree_iter(stream=stream,
+                            schema=schema,
+                            taxon_namespace=taxon_namespace,
+                            **kwargs):
+                        yield tree
+            else:
+                for tree in cls._compact_tree_iter(stream=src,
+                        schema=schema,
+                        taxon_namespace=taxon_namespace,
+                        **kwargs):
+                    yield tree
+    yield_from_files = classmethod(yield_from_files)
+
+    def _compact_tree_iter(cls, stream, schema, taxon_namespace=None, **kwargs):
+        if schema.lower() != "newick":
+            raise error.UnsupportedSchemaError("Compact trees can only be read from NEWICK sources, not '{}'".format(schema))
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        reader = newickreader.NewickReader(**kwargs)
+        taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
+                taxon_namespace=taxon_namespace,
+                enable_lookup_by_taxon_number=False,
+                case_sensitive=reader.case_sensitive_taxon_labels)
+        def tree_factory():
+            return treemodel.Tree(taxon_namespace=taxon_namespace)
+        def node_builder_factory():
+            return CompactTreeNodeBuilder(taxon_namespace)
+        try:
+            for tree, node_builder in reader.built_tree_iter(
+                    stream=stream,
+                    taxon_symbol_mapper=taxon_symbol_mapper,
+                    tree_factory=tree_factory,
+                    node_builder_factory=node_builder_factory):
+                if node_builder.seed_node_index is None:
+                    # not handled by the fast path of the reader, so the
+                    # nodes were built in ``tree`` itself
+                    yield cls.from_tree(tree)
+                else:
+                    yield node_builder.compact_tree(cls, tree)
+        finally:
+            taxon_symbol_mapper.restore_taxon_namespace_mutability()
+    _compact_tree_iter = classmethod(_compact_tree_iter)
+
+    def from_tree(cls, tree):
+        """
+        Returns a new |CompactTree| with the topology, edge lengths, node
+        labels and taxa of ``tree``, which share its |TaxonNamespace|.
+
+        Nodes are indexed in the pre-order of ``tree``.
+        """
+        taxon_namespace = tree.taxon_namespace
+        node_index_map = {}
+        parent_indexes = array.array("l")
+        edge_lengths = array.array("d")
+        taxon_indexes = array.array("l")
+        node_labels = []
+        has_node_labels = False
+        undefined_edge_length = float("nan")
+        for node_idx, node in enumerate(tree.preorder_node_iter()):
+            node_index_map[node] = node_idx
+            parent_node = node._parent_node
+            if parent_node is None:
+                parent_indexes.append(-1)
+            else:
+                parent_indexes.append(node_index_map[parent_node])
+            edge_length = node.edge.length
+            if edge_length is None:
+                edge_lengths.append(undefined_edge_length)
+            else:
+                edge_lengths.append(edge_length)
+            if node.taxon is None:
+                taxon_indexes.append(-1)
+            else:
+                taxon_indexes.append(taxon_namespace.accession_index(node.taxon))
+            node_labels.append(node.label)
+            if node.label is not None:
+                has_node_labels = True
+        if not has_node_labels:
+            node_labels = None
+        return cls(parent_indexes=parent_indexes,
+                edge_lengths=edge_lengths,
+                taxon_indexes=taxon_indexes,
+                node_labels=node_labels,
+                taxon_namespace=taxon_namespace,
+                is_rooted=tree.is_rooted,
+                label=tree.label)
+    from_tree = classmethod(from_tree)
+
+    def __init__(self,
+            parent_indexes,
+            edge_lengths=None,
+            taxon_indexes=None,
+            node_labels=None,
+            taxon_namespace=None,
+            is_rooted=None,
+            label=None):
+        """
+        Parameters
+        ----------
+        parent_indexes : iterable of integers
+            The index of the parent of each node, with -1 for the seed node.
+            Nodes may be given in any order: the children of each node are
+            ordered by their index.
+        edge_lengths : iterable of numbers
+            The length of the edge subtending each node, with NaN for
+            undefined lengths. If not given, all edge lengths are undefined.
+        taxon_indexes : iterable of integers
+            The accession index in ``taxon_namespace`` of the taxon associated
+            with each node, or -1. If not given, no node has a taxon.
+        node_labels : list
+            The label of each node, or |None| if no node has a label.
+        taxon_namespace : |TaxonNamespace|
+            The namespace of the taxa of the tree. If not given, a new one
+            is created.
+        is_rooted : bool
+            Whether or not the tree is rooted.
+        label : str
+            The label of the tree.
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        self.taxon_namespace = taxon_namespace
+        self.is_rooted = is_rooted
+        self.label = label
+        self._parent_indexes = array.array("l", parent_indexes)
+        num_nodes = len(self._parent_indexes)
+        if edge_lengths is None:
+            self._edge_lengths = array.array("d", [float("nan")]) * num_nodes
+        else:
+            self._edge_lengths = array.array("d", edge_lengths)
+        if taxon_indexes is None:
+            self._taxon_indexes = array.array("l", [-1]) * num_nodes
+        else:
+            self._taxon_indexes = array.array("l", taxon_indexes)
+        self._node_labels = node_labels
+        if (len(self._edge_lengths) != num_nodes
+                or len(self._taxon_indexes) != num_nodes
+                or (node_labels is not None and len(node_labels) != num_nodes)):
+            raise ValueError("Node arrays must all be of the same length")
+        self._build_node_index_arrays()
+        self._leafset_bitmasks = None
+        self._split_bitmasks = None
+
+    def _build_node_index_arrays(self):
+        parent_indexes = self._parent_indexes
+        num_nodes = len(parent_indexes)
+        # children, grouped by parent in a single array
+        child_offsets = array.array("l", [0]) * (num_nodes + 1)
+        num_seed_nodes = 0
+        for parent_idx in parent_indexes:
+            if parent_idx < 0:
+                num_seed_nodes += 1
+            elif parent_idx >= num_nodes:
+                raise ValueError("Invalid parent index: {}".format(parent_idx))
+            else:
+                child_offsets[parent_idx + 1] += 1
+        if num_nodes and num_seed_nodes != 1:
+            raise ValueError("Expecting exactly one node without a parent, but found {}".format(num_seed_nodes))
+        for node_idx in range(num_nodes):
+            child_offsets[node_idx + 1] += child_offsets[node_idx]
+        child_indexes = array.array("l", [0]) * (num_nodes - 1 if num_nodes else 0)
+        next_child_positions = array.array("l", child_offsets)
+        seed_node_index = -1
+        for node_idx, parent_idx in enumerate(parent_indexes):
+            if parent_idx < 0:
+                seed_node_index = node_idx
+            else:
+                child_indexes[next_child_positions[parent_idx]] = node_idx
+                next_child_positions[parent_idx] += 1
+        self._child_offsets = child_offsets
+        self._child_indexes = child_indexes
+        self._seed_node_index = seed_node_index
+        # pre-order; the reverse of a pre-order traversal that visits
+        # children in reverse order is a post-order traversal
+        preorder_indexes = array.array("l")
+        reversed_postorder_indexes = array.array("l")
+        if num_nodes:
+            stack = [seed_node_index]
+            while stack:
+                node_idx = stack.pop()
+                preorder_indexes.append(node_idx)
+                stack.extend(reversed(child_indexes[child_offsets[node_idx]:child_offsets[node_idx+1]]))
+            stack = [seed_node_index]
+            while stack:
+                node_idx = stack.pop()
+                reversed_postorder_indexes.append(node_idx)
+                stack.extend(child_indexes[child_offsets[node_idx]:child_offsets[node_idx+1]])
+        if len(preorder_indexes) != num_nodes:
+            raise ValueError("Not all nodes are descended from the seed node")
+        reversed_postorder_indexes.reverse()
+        self._preorder_indexes = preorder_indexes
+        self._postorder_indexes = reversed_postorder_indexes
+
+    def to_tree(self, tree_factory=None):
+        """
+        Returns a new |Tree| with the topology, edge lengths, node labels and
+        taxa of this tree, sharing its |TaxonNamespace|.
+
+        Parameters
+        ----------
+        tree_factory : function object
+            A function that returns a new |Tree| object when called with the
+            keyword argument ``taxon_namespace``. Defaults to |Tree|.
+        """
+        if tree_factory is None:
+            tree_factory = treemodel.Tree
+        tree = tree_factory(taxon_namespace=self.taxon_namespace)
+        tree.is_rooted = self.is_rooted
+        tree.label = self.label
+        num_nodes = len(self._parent_indexes)
+        if not num_nodes:
+            return tree
+        accession_index_taxon_map = self.taxon_namespace._accession_index_taxon_map
+        nodes = [None] * num_nodes
+        seed_node_index = self._seed_node_index
+        for node_idx in self._preorder_indexes:
+            if node_idx == seed_node_index:
+                node = tree.seed_node
+            else:
+                node = tree.node_factory()
+                nodes[self._parent_indexes[node_idx]].add_child(node)
+            nodes[node_idx] = node
+            edge_length = self._edge_lengths[node_idx]
+            if edge_length == edge_length:
+                node.edge.length = edge_length
+            taxon_idx = self._taxon_indexes[node_idx]
+            if taxon_idx >= 0:
+                node.taxon = accession_index_taxon_map[taxon_idx]
+            if self._node_labels is not None:
+                node.label = self._node_labels[node_idx]
+        return tree
+
+    ###########################################################################
+    ### Arrays
+
+    def _get_parent_indexes(self):
+        return self._parent_indexes
+    parent_indexes = property(_get_parent_indexes)
+
+    def _get_child_offsets(self):
+        return self._child_offsets
+    child_offsets = property(_get_child_offsets)
+
+    def _get_child_indexes(self):
+        return self._child_indexes
+    child_indexes = property(_get_child_indexes)
+
+    def _get_edge_lengths(self):
+        return self._edge_lengths
+    edge_lengths = property(_get_edge_lengths)
+
+    def _get_taxon_indexes(self):
+        return self._taxon_indexes
+    taxon_indexes = property(_get_taxon_indexes)
+
+    def _get_node_labels(self):
+        return self._node_labels
+    node_labels = property(_get_node_labels)
+
+    def _get_preorder_indexes(self):
+        return self._preorder_indexes
+    preorder_indexes = property(_get_preorder_indexes)
+
+    def _get_postorder_indexes(self):
+        return self._postorder_indexes
+    postorder_indexes = property(_get_postorder_indexes)
+
+    def _get_seed_node_index(self):
+        return self._seed_node_index
+    seed_node_index = property(_get_seed_node_index)
+
+    def _get_num_nodes(self):
+        return len(self._parent_indexes)
+    num_nodes = property(_get_num_nodes)
+
+    ###########################################################################
+    ### Node Access
+
+    def parent_index(self, node_idx):
+        """
+        Returns the index of the parent of node ``node_idx``, or -1 if it is
+        the seed node.
+        """
+        return self._parent_indexes[node_idx]
+
+    def child_node_indexes(self, node_idx):
+        """
+        Returns the indexes of the children of node ``node_idx``.
+        """
+        return self._child_indexes[self._child_offsets[node_idx]:self._child_offsets[node_idx+1]]
+
+    def num_child_nodes(self, node_idx):
+        """
+        Returns the number of children of node ``node_idx``.
+        """
+        return self._child_offsets[node_idx+1] - self._child_offsets[node_idx]
+
+    def is_leaf(self, node_idx):
+        """
+        Returns |True| if node ``node_idx`` has no children.
+        """
+        return self._child_offsets[node_idx+1] == self._child_offsets[node_idx]
+
+    def edge_length(self, node_idx):
+        """
+        Returns the length of the edge subtending node ``node_idx``, or |None|
+        if it is undefined.
+        """
+        edge_length = self._edge_lengths[node_idx]
+        if edge_length != edge_length:
+            return None
+        return edge_length
+
+    def node_taxon(self, node_idx):
+        """
+        Returns the |Taxon| associated with node ``node_idx``, or |None|.
+        """
+        taxon_idx = self._taxon_indexes[node_idx]
+        if taxon_idx < 0:
+            return None
+        return self.taxon_namespace._accession_index_taxon_map[taxon_idx]
+
+    def node_label(self, node_idx):
+        """
+        Returns the label of node ``node_idx``, or |None|.
+        """
+        if self._node_labels is None:
+            return None
+        return self._node_labels[node_idx]
+
+    ###########################################################################
+    ### Traversals
+
+    def __iter__(self):
+        """
+        Iterates over the indexes of the nodes in pre-order.
+        """
+        return iter(self._preorder_indexes)
+
+    def preorder_index_iter(self, filter_fn=None):
+        """
+        Iterates over the indexes of the nodes in pre-order, optionally only
+        those for which ``filter_fn(node_idx)`` is |True|.
+        """
+        if filter_fn is None:
+            return iter(self._preorder_indexes)
+        return (node_idx for node_idx in self._preorder_indexes if filter_fn(node_idx))
+
+    def postorder_index_iter(self, filter_fn=None):
+        """
+        Iterates over the indexes of the nodes in post-order, optionally only
+        those for which ``filter_fn(node_idx)`` is |True|.
+        """
+        if filter_fn is None:
+            return iter(self._postorder_indexes)
+        return (node_idx for node_idx in self._postorder_indexes if filter_fn(node_idx))
+
+    def leaf_index_iter(self):
+        """
+        Iterates over the indexes of the leaves, in pre-order.
+        """
+        child_offsets = self._child_offsets
+        for node_idx in self._preorder_indexes:
+            if child_offsets[node_idx+1] == child_offsets[node_idx]:
+                yield node_idx
+
+    def internal_node_index_iter(self):
+        """
+        Iterates over the indexes of the internal nodes, in pre-order.
+        """
+        child_offsets = self._child_offsets
+        for node_idx in self._preorder_indexes:
+            if child_offsets[node_idx+1] != child_offsets[node_idx]:
+                yield node_idx
+
+    ###########################################################################
+    ### Calculations
+
+    def encode_bipartitions(self):
+        """
+        Calculates the leafset and split bitmasks of the edges of this tree,
+        and returns the split bitmasks as a list indexed by node.
+
+        The bitmasks are as for the |Bipartition| objects created by
+        :meth:`Tree.encode_bipartitions()`, with split bitmasks normalized
+        for unrooted trees. As the tree cannot be modified, nodes with a
+        single child are not suppressed, and the basal bifurcation of an
+        unrooted tree is not collapsed (the split bitmasks of its two
+        edges are identical). The bitmasks are cached: subsequent calls
+        return the same list.
+
+        Returns
+        -------
+        s : list[integer]
+            The split bitmask of the edge subtending each node.
+        """
+        if self._split_bitmasks is not None:
+            return self._split_bitmasks
+        num_nodes = len(self._parent_indexes)
+        leafset_bitmasks = [0] * num_nodes
+        parent_indexes = self._parent_indexes
+        taxon_indexes = self._taxon_indexes
+        child_offsets = self._child_offsets
+        for node_idx in self._postorder_indexes:
+            if child_offsets[node_idx+1] == child_offsets[node_idx]:
+                taxon_idx = taxon_indexes[node_idx]
+                if taxon_idx >= 0:
+                    leafset_bitmasks[node_idx] |= 1 << taxon_idx
+            parent_idx = parent_indexes[node_idx]
+            if parent_idx >= 0:
+                leafset_bitmasks[parent_idx] |= leafset_bitmasks[node_idx]
+        if self.is_rooted or not num_nodes:
+            split_bitmasks = leafset_bitmasks
+        else:
+            tree_leafset_bitmask = leafset_bitmasks[self._seed_node_index]
+            lowest_relevant_bit = bitprocessing.least_significant_set_bit(tree_leafset_bitmask)
+            normalize_bitmask = treemodel.Bipartition.normalize_bitmask
+            split_bitmasks = [normalize_bitmask(
+                    bitmask=b,
+                    fill_bitmask=tree_leafset_bitmask,
+                    lowest_relevant_bit=lowest_relevant_bit) for b in leafset_bitmasks]
+        self._leafset_bitmasks = leafset_bitmasks
+        self._split_bitmasks = split_bitmasks
+        return split_bitmasks
+
+    def _get_leafset_bitmasks(self):
+        if self._leafset_bitmasks is None:
+            self.encode_bipartitions()
+        return self._leafset_bitmasks
+    leafset_bitmasks = property(_get_leafset_bitmasks)
+
+    def _get_split_bitmasks(self):
+        return self.encode_bipartitions()
+    split_bitmasks = property(_get_split_bitmasks)
+
+    def calc_node_ages(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False):
+        """
+        Returns the age of each node, i.e., the sum of edge lengths from the
+        node to the tips, as an array indexed by node. Undefined edge lengths
+        are taken to be 0.
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            If the lengths of different paths to the node differ by more than
+            ``ultrametricity_precision``, then a
+            :class:`~dendropy.utility.error.UltrametricityError` exception will
+            be raised. If ``ultrametricity_precision`` is negative or False,
+            then this check will be skipped.
+        is_force_max_age: bool
+            If |True|, then each node will be set to the oldest age given its
+            children and their edge lengths, and the ultrametricity check is
+            skipped.
+        is_force_min_age: bool
+            If |True|, then each node will be set to the youngest age given
+            its children and their edge lengths, and the ultrametricity check
+            is skipped.
+
+        Returns
+        -------
+        a : ``array('d')``
+            The age of each node.
+        """
+        if is_force_max_age and is_force_min_age:
+            raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
+        is_check_ultrametricity = not (is_force_max_age
+                or is_force_min_age
+                or ultrametricity_precision is None
+                or ultrametricity_precision is False
+                or ultrametricity_precision < 0)
+        num_nodes = len(self._parent_indexes)
+        ages = array.array("d", [0.0]) * num_nodes
+        edge_lengths = self._edge_lengths
+        child_offsets = self._child_offsets
+        child_indexes = self._child_indexes
+        for node_idx in self._postorder_indexes:
+            start = child_offsets[node_idx]
+            stop = child_offsets[node_idx+1]
+            if start == stop:
+                continue
+            child_ages = []
+            for child_idx in child_indexes[start:stop]:
+                edge_length = edge_lengths[child_idx]
+                if edge_length != edge_length:
+                    edge_length = 0.0
+                child_ages.append(ages[child_idx] + edge_length)
+            if is_force_max_age:
+                age = max(child_ages)
+            elif is_force_min_age:
+                age = min(child_ages)
+            else:
+                age = child_ages[0]
+                if is_check_ultrametricity:
+                    for child_age in child_ages[1:]:
+                        if abs(age - child_age) > ultrametricity_precision:
+                            raise error.UltrametricityError("Tree is not ultrametric within threshold of {threshold}: node {node} has child node ages (plus edge lengths) of {ages}".format(
+                                threshold=ultrametricity_precision,
+                                node=node_idx,
+                                ages=", ".join(str(a) for a in child_ages)))
+            ages[node_idx] = age
+        return ages
+
+    def length(self):
+        """
+        Returns sum of edge lengths of the tree. Undefined edge lengths are
+        taken to be 0.
+        """
+        total = 0.0
+        for edge_length in self._edge_lengths:
+            if edge_length == edge_length:
+                total += edge_length
+        return total
+
+    def mrca(self, **kwargs):
+        """
+        Returns the index of the most-recent common ancestor node of a set of
+        taxa on the tree, i.e., the node nearest the tips that has all of the
+        taxa specified by exactly one of the following keyword arguments:
+
+            ``leafset_bitmask`` : integer
+                The leafset bitmask of the taxa.
+            ``taxa`` : collections.Iterable [|Taxon|]
+                The |Taxon| objects.
+            ``taxon_labels`` : collections.Iterable [string]
+                The labels of the taxa.
+
+        Returns -1 if the tree does not have all of the taxa.
+        """
+        if "leafset_bitmask" in kwargs:
+            leafset_bitmask = kwargs["leafset_bitmask"]
+        else:
+            taxa = kwargs.get("taxa", None)
+            if taxa is None:
+                if "taxon_labels" in kwargs:
+                    taxa = self.taxon_namespace.get_taxa(labels=kwargs["taxon_labels"])
+                    if len(taxa) != len(kwargs["taxon_labels"]):
+                        raise KeyError("Not all labels matched to taxa")
+                else:
+                    raise TypeError("Must specify one of: 'leafset_bitmask', 'taxa' or 'taxon_labels'")
+            leafset_bitmask = self.taxon_namespace.taxa_bitmask(taxa=taxa)
+        if not leafset_bitmask:
+            raise ValueError("Null leafset bitmask (0)")
+        if not len(self._parent_indexes):
+            return -1
+        leafset_bitmasks = self.leafset_bitmasks
+        node_idx = self._seed_node_index
+        if (leafset_bitmasks[node_idx] & leafset_bitmask) != leafset_bitmask:
+            return -1
+        child_offsets = self._child_offsets
+        child_indexes = self._child_indexes
+        while True:
+            for child_idx in child_indexes[child_offsets[node_idx]:child_offsets[node_idx+1]]:
+                if (leafset_bitmasks[child_idx] & leafset_bitmask) == leafset_bitmask:
+                    node_idx = child_idx
+                    break
+            else:
+                return node_idx
+
+##############################################################################
+## CompactTreeNodeBuilder
+
+class CompactTreeNodeBuilder(object):
+    """
+    Creates the nodes of a tree parsed by the fast path of a
+    :class:`~dendropy.dataio.newickreader.NewickReader` as the indexes of the
+    node arrays of a |CompactTree|, in the same way as
+    :class:`~dendropy.dataio.newickreader.TreeNodeBuilder` creates |Node|
+    objects.
+
+    Nodes are indexed in the order in which they are opened in the tree
+    statement, i.e., in pre-order.
+    """
+
+    undefined_edge_length = float("nan")
+
+    def __init__(self, taxon_namespace):
+        self.taxon_namespace = taxon_namespace
+        self.parent_indexes = array.array("l")
+        self.edge_lengths = array.array("d")
+        self.taxon_indexes = array.array("l")
+        self.node_labels = []
+        self.has_node_labels = False
+        self.seed_node_index = None
+
+    def new_node(self):
+        node_idx = len(self.parent_indexes)
+        self.parent_indexes.append(-1)
+        self.edge_lengths.append(self.undefined_edge_length)
+        self.taxon_indexes.append(-1)
+        self.node_labels.append(None)
+        return node_idx
+
+    def set_node_label(self, node_idx, label):
+        self.node_labels[node_idx] = label
+        self.has_node_labels = True
+
+    def set_node_taxon(self, node_idx, taxon):
+        self.taxon_indexes[node_idx] = self.taxon_namespace.accession_index(taxon)
+
+    def set_edge_length(self, node_idx, edge_length):
+        self.edge_lengths[node_idx] = float(edge_length)
+
+    def add_child_nodes(self, node_idx, child_node_idxs):
+        parent_indexes = self.parent_indexes
+        for child_node_idx in child_node_idxs:
+            parent_indexes[child_node_idx] = node_idx
+
+    def set_seed_node(self, node_idx):
+        self.seed_node_index = node_idx
+
+    def compact_tree(self, compact_tree_type, tree):
+        """
+        Returns a new instance of ``compact_tree_type`` with the nodes
+        created, and the rooting state and label of ``tree``.
+        """
+        return compact_tree_type(parent_indexes=self.parent_indexes,
+                edge_lengths=self.edge_lengths,
+                taxon_indexes=self.taxon_indexes,
+                node_labels=self.node_labels if self.has_node_labels else None,
+                taxon_namespace=self.taxon_namespace,
+                is_rooted=tree.is_rooted,
+                label=tree.label)
@@ -76,9 +76,11 @@ be related through correct interpretation of their taxon labels.
 """
 
 
+import os
 import warnings
 import collections
 import copy
+import weakref
 from dendropy.utility.textprocessing import StringIO
 from dendropy.datamodel import basemodel
 from dendropy.utility import bitprocessing
@@ -545,6 +547,7 @@ class TaxonNamespace(
         self._taxon_bitmask_map = {}
         # self._split_bitmask_taxon_map = {}
         self._current_accession_count = 0
+        self._invalidate_label_indexes()
         if len(args) > 1:
             raise TypeError("TaxonNamespace() takes at most 1 non-keyword argument ({} given)".format(len(args)))
         elif len(args) == 1:
@@ -561,7 +564,7 @@ class TaxonNamespace(
                 for t1, t2 in zip(self._taxa, other._taxa):
                     memo[id(t2)] = t1
                 for k in other.__dict__:
-                    if k == "_annotations" or k == "_taxa":
+                    if k == "_annotations" or k == "_taxa" or k in TaxonNamespace._label_index_attrs:
                         continue
                     self.__dict__[k] = copy.deepcopy(other.__dict__[k], memo)
                 self.deep_copy_annotations_from(other, memo=memo)
@@ -591,9 +594,10 @@ class TaxonNamespace(
         for t in self._taxa:
             o._taxa.append(copy.deepcopy(t, memo))
         for k in self.__dict__:
-            if k == "_annotations" or k == "_taxa":
+            if k == "_annotations" or k == "_taxa" or k in TaxonNamespace._label_index_attrs:
                 continue
             o.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
+        o._invalidate_label_indexes()
         o.deep_copy_annotations_from(self, memo=memo)
         # o.copy_annotations_from(self, attribute_object_mapper=memo)
         return o
@@ -605,6 +609,28 @@ class TaxonNamespace(
                 memo[id(taxon)] = taxon
         return memo
 
+    ### Pickling
+
+    def __reduce_ex__(self, protocol):
+        # shared namespaces are pickled by reference (see
+        # `share_taxon_namespace()`)
+        key = _shared_taxon_namespace_keys.get(id(self), None)
+        if key is not None:
+            return (get_shared_taxon_namespace, (key,))
+        return object.__reduce_ex__(self, protocol)
+
+    def __getstate__(self):
+        # the label indexes are rebuilt on demand rather than pickled, as
+        # the taxa refer to the namespaces that index them by weak references
+        state = dict(self.__dict__)
+        for k in TaxonNamespace._label_index_attrs:
+            state.pop(k, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._invalidate_label_indexes()
+
     ### Identity and Comparison
 
     def __str__(self):
@@ -709,28 +735,101 @@ class TaxonNamespace(
             `first_match_only==False`, a list of one or more |Taxon|
             instances with a ``label`` attribute matching the ``label`` argument.
         """
-        taxa = []
+        if not self._is_label_indexed:
+            self._build_label_indexes()
         if is_case_sensitive is True or (is_case_sensitive is None and self.is_case_sensitive):
-            for taxon in self._taxa:
-                if label == taxon.label:
-                    if first_match_only:
-                        return taxon
-                    else:
-                        taxa.append(taxon)
+            taxa = self._label_taxa_map.get(label, None)
         else:
             label = str(label).lower()
-            for taxon in self._taxa:
-                if label == taxon.lower_cased_label:
-                    if first_match_only:
-                        return taxon
-                    else:
-                        taxa.append(taxon)
-        if len(taxa) == 0:
+            taxa = self._lower_cased_label_taxa_map.get(label, None)
+        if not taxa:
             if error_if_not_found:
                 raise LookupError(label)
             else:
                 return None
-        return taxa
+        if first_match_only:
+            return taxa[0]
+        return list(taxa)
+
+    ### Label Indexes
+
+    # Dictionaries mapping labels and lower-cased labels to lists of the
+    # |Taxon| objects in ``self`` with those labels, in the order of the
+    # collection. They are built on demand, updated as taxa are added,
+    # removed and relabeled, and rebuilt if the collection is reordered.
+    # Indexed |Taxon| objects keep weak references to the namespaces
+    # indexing them, so that changes to their labels are passed on to these
+    # (see `TaxonNamespace._reindex_taxon_label()`).
+    _label_index_attrs = frozenset([
+        "_label_taxa_map",
+        "_lower_cased_label_taxa_map",
+        "_is_label_indexed",
+        ])
+
+    def _invalidate_label_indexes(self):
+        self._label_taxa_map = {}
+        self._lower_cased_label_taxa_map = {}
+        self._is_label_indexed = False
+
+    def _build_label_indexes(self):
+        self._label_taxa_map = {}
+        self._lower_cased_label_taxa_map = {}
+        for taxon in self._taxa:
+            self._index_taxon_label(taxon)
+        self._is_label_indexed = True
+
+    def _index_taxon_label(self, taxon):
+        namespace_refs = taxon._label_indexing_namespace_refs
+        if namespace_refs is None:
+            taxon._label_indexing_namespace_refs = [weakref.ref(self)]
+        elif not any(ref() is self for ref in namespace_refs):
+            namespace_refs.append(weakref.ref(self))
+        try:
+            self._label_taxa_map[taxon.label].append(taxon)
+        except KeyError:
+            self._label_taxa_map[taxon.label] = [taxon]
+        lower_cased_label = taxon.lower_cased_label
+        if lower_cased_label is not None:
+            try:
+                self._lower_cased_label_taxa_map[lower_cased_label].append(taxon)
+            except KeyError:
+                self._lower_cased_label_taxa_map[lower_cased_label] = [taxon]
+
+    def _unindex_taxon_label(self, taxon):
+        self._unindex_taxon_label_keys(taxon, taxon.label, taxon.lower_cased_label)
+
+    def _unindex_taxon_label_keys(self, taxon, label, lower_cased_label):
+        for index, key in (
+                (self._label_taxa_map, label),
+                (self._lower_cased_label_taxa_map, lower_cased_label)):
+            taxa = index.get(key, None)
+            if taxa is None:
+                continue
+            while taxon in taxa:
+                taxa.remove(taxon)
+            if not taxa:
+                del index[key]
+
+    def _reindex_taxon_label(self, taxon, old_label, old_lower_cased_label):
+        """
+        Moves ``taxon`` from the entries of the label indexes for its previous
+        label, ``old_label``, and lower-cased label,
+        ``old_lower_cased_label``, to those for its current ones. Returns
+        |False| if ``taxon`` is not indexed by ``self``.
+        """
+        if not self._is_label_indexed or taxon not in self._taxon_accession_index_map:
+            return False
+        self._unindex_taxon_label_keys(taxon, old_label, old_lower_cased_label)
+        lower_cased_label = taxon.lower_cased_label
+        if (self._label_taxa_map.get(taxon.label, None)
+                or (lower_cased_label is not None
+                    and self._lower_cased_label_taxa_map.get(lower_cased_label, None))):
+            # the position of ``taxon`` among other taxa with the same label
+            # is that in the collection: rebuilt on demand
+            self._invalidate_label_indexes()
+            return False
+        self._index_taxon_label(taxon)
+        return True
 
     ### Adding Taxa
 
@@ -772,6 +871,8 @@ class TaxonNamespace(
         self._accession_index_taxon_map[self._current_accession_count] = taxon
         self._taxon_accession_index_map[taxon] = self._current_accession_count
         self._current_accession_count += 1
+        if self._is_label_indexed:
+            self._index_taxon_label(taxon)
 
     def append(self, taxon):
         """
@@ -878,6 +979,8 @@ class TaxonNamespace(
         # assert taxon not in self._taxa
         while taxon in self._taxa:
             self._taxa.remove(taxon)
+        if self._is_label_indexed:
+            self._unindex_taxon_label(taxon)
         idx = self._taxon_accession_index_map.pop(taxon, None)
         if idx is not None:
             self._accession_index_taxon_map.pop(idx, None)
@@ -995,6 +1098,7 @@ class TaxonNamespace(
         self._taxon_accession_index_map.clear()
         self._taxon_bitmask_map.clear()
         # self._split_bitmask_taxon_map.clear()
+        self._invalidate_label_indexes()
 
     ### Look-up and Retrieval of Taxa
 
@@ -1256,12 +1360,14 @@ class TaxonNamespace(
         if key is None:
             key = lambda x: x.label
         self._taxa.sort(key=key, reverse=reverse)
+        self._invalidate_label_indexes()
 
     def reverse(self):
         """
         Reverses order of |Taxon| objects in collection.
         """
         self._taxa.reverse()
+        self._invalidate_label_indexes()
 
     ### Summarization of Collection
 
@@ -1628,6 +1734,133 @@ class TaxonNamespace(
                 stream=stream,
                 taxon_namespaces=[self],)
 
+##############################################################################
+## Shared TaxonNamespace Registry
+
+# |TaxonNamespace| objects registered by `share_taxon_namespace()`, by key,
+# and the keys by the id's of the |TaxonNamespace| objects.
+_shared_taxon_namespaces = {}
+_shared_taxon_namespace_keys = {}
+
+def share_taxon_namespace(taxon_namespace, key=None):
+    """
+    Registers ``taxon_namespace`` under ``key`` as being shared with other
+    processes.
+
+    When pickled (e.g., to be passed to or from a ``multiprocessing`` worker),
+    a shared |TaxonNamespace| is represented by just its key, and each of its
+    |Taxon| objects by just its key and accession index, instead of by their
+    contents. When unpickled, these are resolved to the |TaxonNamespace|
+    registered under the same key in the unpickling process and its |Taxon|
+    objects. Trees, etc., referencing shared taxa can thus be passed between
+    processes without each copy bringing a duplicate of the namespace along.
+
+    The unpickling process must have registered a |TaxonNamespace| with the
+    same taxa, at the same accession indexes, under the same key. This is
+    the case for child processes of the registering process that have been
+    created by forking, or if the child process recreates the namespace with
+    `new_taxon_namespace_from_accessions()` and registers it.
+
+    Parameters
+    ----------
+    taxon_namespace : |TaxonNamespace|
+        The namespace to share.
+    key : str
+        Key under which to register ``taxon_namespace``, replacing any
+        namespace already registered under it. If not given, a key unique to
+        the registering process and namespace is generated.
+
+    Returns
+    -------
+    key : str
+        The key under which ``taxon_namespace`` has been registered.
+    """
+    if key is None:
+        key = "{}-{}".format(os.getpid(), id(taxon_namespace))
+    current = _shared_taxon_namespaces.get(key, None)
+    if current is not None:
+        unshare_taxon_namespace(current)
+    unshare_taxon_namespace(taxon_namespace)
+    _shared_taxon_namespaces[key] = taxon_namespace
+    _shared_taxon_namespace_keys[id(taxon_namespace)] = key
+    return key
+
+def unshare_taxon_namespace(taxon_namespace):
+    """
+    Removes ``taxon_namespace`` from the registry of shared namespaces, if
+    it has been registered.
+    """
+    key = _shared_taxon_namespace_keys.pop(id(taxon_namespace), None)
+    if key is not None:
+        del _shared_taxon_namespaces[key]
+
+def get_shared_taxon_namespace(key):
+    """
+    Returns the |TaxonNamespace| registered under ``key`` by
+    `share_taxon_namespace()`.
+    """
+    try:
+        return _shared_taxon_namespaces[key]
+    except KeyError:
+        raise KeyError("No TaxonNamespace has been shared under key '{}' in this process".format(key))
+
+def _get_shared_taxon(key, accession_index):
+    return get_shared_taxon_namespace(key)._accession_index_taxon_map[accession_index]
+
+def get_taxon_accessions(taxon_namespace):
+    """
+    Returns the accession indexes and labels of the taxa in
+    ``taxon_namespace``, and the number of accession indexes assigned by it
+    (including those of taxa since removed).
+
+    Unlike the namespace, these can be cheaply passed to other processes,
+    where `new_taxon_namespace_from_accessions()` recreates a namespace with
+    taxa of the same labels at the same accession indexes, and hence with
+    the same bitmasks.
+
+    Parameters
+    ----------
+    taxon_namespace : |TaxonNamespace|
+        The namespace to describe.
+
+    Returns
+    -------
+    taxon_accessions, num_accessions : list of (int, str) tuples, int
+    """
+    taxon_accessions = [(taxon_namespace._taxon_accession_index_map[taxon], taxon.label)
+            for taxon in taxon_namespace._taxa]
+    return taxon_accessions, taxon_namespace._current_accession_count
+
+def new_taxon_namespace_from_accessions(taxon_accessions, num_accessions, **kwargs):
+    """
+    Returns a new |TaxonNamespace| with taxa of the labels and at the
+    accession indexes given by ``taxon_accessions``, as returned by
+    `get_taxon_accessions()`.
+
+    Parameters
+    ----------
+    taxon_accessions : iterable of (int, str) tuples
+        The accession index and label of each taxon, in the order in which
+        the taxa are to be listed in the namespace.
+    num_accessions : int
+        The number of accession indexes assigned by the namespace.
+    \*\*kwargs : keyword arguments
+        Passed directly to the constructor of |TaxonNamespace|.
+
+    Returns
+    -------
+    taxon_namespace : |TaxonNamespace|
+    """
+    taxon_namespace = TaxonNamespace(**kwargs)
+    for accession_index, label in taxon_accessions:
+        taxon = Taxon(label=label)
+        taxon_namespace._taxa.append(taxon)
+        taxon_namespace._accession_index_taxon_map[accession_index] = taxon
+        taxon_namespace._taxon_accession_index_map[taxon] = accession_index
+    taxon_namespace._current_accession_count = num_accessions
+    taxon_namespace._invalidate_label_indexes()
+    return taxon_namespace
+
 ##############################################################################
 ## TaxonSet
 
@@ -1650,11 +1883,23 @@ class TaxonSet(TaxonNamespace):
 
 class Taxon(
         basemodel.DataObject,
-        basemodel.Annotable):
+        basemodel.Annotable,
+        basemodel.Commentable,
+        basemodel.Slotted):
     """
     A taxon associated with a sequence or a node on a tree.
     """
 
+    __slots__ = (
+        "_label",
+        "_annotations",
+        "_deferred_annotations",
+        "_lower_cased_label",
+        "_comments",
+        "_label_indexing_namespace_refs",
+        "__dict__",
+        )
+
     def __init__(self, label=None):
         """
         Parameters
@@ -1666,25 +1911,43 @@ class Taxon(
             set to the same value as the ``label`` attribute the other
             |Taxon| object and all annotations/metadata are copied.
         """
+        self._label_indexing_namespace_refs = None
         if isinstance(label, Taxon):
             other_taxon = label
             label = other_taxon.label
             memo={id(other_taxon):self}
-            for k in other_taxon.__dict__:
-                if k != "_annotations":
-                    self.__dict__[k] = copy.deepcopy(other_taxon.__dict__[k], memo=memo)
+            for k, v in list(basemodel.iter_instance_attributes(other_taxon)):
+                if k != "_annotations" and k != "_label_indexing_namespace_refs":
+                    basemodel.set_instance_attribute(self, k, copy.deepcopy(v, memo=memo))
             self.deep_copy_annotations_from(other_taxon, memo=memo)
             # self.copy_annotations_from(other_taxon, attribute_object_mapper=memo)
         else:
-            basemodel.DataObject.__init__(self, label=label)
+            # label is set directly, as it is not a change to the label of a
+            # taxon that could be in a namespace
+            basemodel.DataObject.__init__(self)
+            self._label = label
             self._lower_cased_label = None
-        self.comments = []
+        self._comments = None
 
     def _get_label(self):
         return self._label
     def _set_label(self, v):
+        namespace_refs = self._label_indexing_namespace_refs
+        if namespace_refs:
+            old_label = self._label
+            old_lower_cased_label = self.lower_cased_label
         self._label = v
         self._lower_cased_label = None
+        if namespace_refs:
+            # update the label indexes of the namespaces indexing ``self``,
+            # forgetting those that no longer do
+            current_refs = []
+            for ref in namespace_refs:
+                taxon_namespace = ref()
+                if (taxon_namespace is not None
+                        and taxon_namespace._reindex_taxon_label(self, old_label, old_lower_cased_label)):
+                    current_refs.append(ref)
+            self._label_indexing_namespace_refs = current_refs or None
     label = property(_get_label, _set_label)
 
     def _get_lower_cased_label(self):
@@ -1704,6 +1967,24 @@ class Taxon(
             memo[id(self)] = self
         return self
 
+    def __reduce_ex__(self, protocol):
+        # taxa of shared namespaces are pickled by reference (see
+        # `share_taxon_namespace()`)
+        for key, taxon_namespace in _shared_taxon_namespaces.items():
+            accession_index = taxon_namespace._taxon_accession_index_map.get(self, None)
+            if accession_index is not None:
+                return (_get_shared_taxon, (key, accession_index))
+        return object.__reduce_ex__(self, protocol)
+
+    def __getstate__(self):
+        state = basemodel.Slotted.__getstate__(self)
+        state.pop("_label_indexing_namespace_refs", None)
+        return state
+
+    def __setstate__(self, state):
+        self._label_indexing_namespace_refs = None
+        basemodel.Slotted.__setstate__(self, state)
+
     def __deepcopy__(self, memo=None):
         if memo is None:
             memo = {}
@@ -1713,9 +1994,10 @@ class Taxon(
             # o = type(self).__new__(self.__class__)
             o = self.__class__.__new__(self.__class__)
             memo[id(self)] = o
-        for k in self.__dict__:
-            if k != "_annotations":
-                o.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
+        o._label_indexing_namespace_refs = None
+        for k, v in list(basemodel.iter_instance_attributes(self)):
+            if k != "_annotations" and k != "_label_indexing_namespace_refs":
+                basemodel.set_instance_attribute(o, k, copy.deepcopy(v, memo))
         o.deep_copy_annotations_from(self, memo)
         # o.copy_annotations_from(self, attribute_object_mapper=memo)
         return o
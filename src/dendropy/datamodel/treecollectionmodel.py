@@ -22,20 +22,57 @@ This module handles the core definition of classes that model collections of
 trees.
 """
 
+import os
 import collections
 import math
 import copy
 import sys
+import multiprocessing
 from dendropy.utility import container
 from dendropy.utility import error
 from dendropy.utility import bitprocessing
 from dendropy.utility import deprecate
 from dendropy.utility import constants
+from dendropy.utility import textprocessing
 from dendropy.calculate import statistics
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
 from dendropy import dataio
+from dendropy.dataio import ioservice
+from dendropy.dataio import treeindex
+
+##############################################################################
+### Support
+
+def _read_tree_array_from_source_parts(task):
+    """
+    Worker function for `TreeArray._read_from_file_in_parallel`: returns a new
+    |TreeArray| populated from the source given by ``task``.
+    """
+    (path,
+            parts,
+            encoding,
+            schema,
+            taxon_accessions,
+            num_taxon_accessions,
+            is_case_sensitive,
+            tree_array_kwargs,
+            reader_kwargs) = task
+    # the taxa are recreated at the same accession indexes as in the main
+    # process, so that split bitmasks are the same in all processes
+    taxon_namespace = taxonmodel.new_taxon_namespace_from_accessions(
+            taxon_accessions,
+            num_taxon_accessions,
+            is_case_sensitive=is_case_sensitive)
+    taxon_namespace.is_mutable = False
+    tree_array = TreeArray(taxon_namespace=taxon_namespace, **tree_array_kwargs)
+    tree_array._read_from_files_serially(
+            files=[treeindex.open_source_parts(path, parts, encoding=encoding)],
+            schema=schema,
+            tree_offset=0,
+            **reader_kwargs)
+    return tree_array
 
 ##############################################################################
 ### TreeList
@@ -143,6 +180,15 @@ class TreeList(
         subsets of trees from the same data source, it would be much more
         efficient to read the entire data source, and extract trees as needed.
 
+        There are two exceptions, in which the trees to be skipped are not
+        parsed at all: "dendropy-binary" data, whose header gives the
+        position of each tree, and NEWICK or NEXUS data read from a file with
+        ``use_tree_index=True``, whose trees are located using a byte-offset
+        index of the file (see `dendropy.dataio.treeindex.TreeFileIndex`)
+        saved alongside it. In the latter case, only the operational taxonomic
+        units defined in TAXA blocks or TRANSLATE statements or referenced by
+        the trees read are included in the |TaxonNamespace|.
+
         Returns
         -------
         A |TreeList| object.
@@ -153,6 +199,7 @@ class TreeList(
         tree_list = kwargs.pop("tree_list", None)
         taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
         label = kwargs.pop("label", None)
+        use_tree_index = kwargs.pop("use_tree_index", False)
 
         # get the reader
         reader = dataio.get_reader(schema, **kwargs)
@@ -163,6 +210,21 @@ class TreeList(
 
         if collection_offset is None and tree_offset is not None:
             collection_offset = 0
+        if tree_offset is not None and hasattr(reader, "select_trees"):
+            # readers of formats that index their trees (e.g.,
+            # "dendropy-binary") locate the requested trees directly
+            reader.select_trees(tree_offset=tree_offset)
+            tree_offset = None
+        elif use_tree_index and tree_offset is not None:
+            indexed_stream = treeindex.open_indexed_trees(
+                    stream=stream,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset)
+            if indexed_stream is not None:
+                stream = indexed_stream
+                collection_offset = 0
+                tree_offset = None
         if collection_offset is None:
             # if tree_offset is not None:
             #     raise TypeError("Cannot specify ``tree_offset`` without specifying ``collection_offset``")
@@ -245,6 +307,11 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **use_tree_index** (*bool*) -- If |True|, and the source is a
+              NEWICK or NEXUS file given by ``path`` or ``file``, then the trees
+              before ``tree_offset`` are skipped without being parsed, using a
+              byte-offset index of the file that is saved alongside it (with
+              a ".dpidx" extension) for reuse. Default is |False|.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -642,6 +709,11 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **use_tree_index** (*bool*) -- If |True|, and the source is a
+              NEWICK or NEXUS file given by ``path`` or ``file``, then the trees
+              before ``tree_offset`` are skipped without being parsed, using a
+              byte-offset index of the file that is saved alongside it (with
+              a ".dpidx" extension) for reuse. Default is |False|.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -702,6 +774,96 @@ class TreeList(
         writer = dataio.get_writer(schema, **kwargs)
         writer.write_tree_list(self, stream)
 
+    @classmethod
+    def open_stream_writer(cls, taxon_namespace, label=None, **kwargs):
+        """
+        Returns a |TreeStreamWriter| that writes trees to a destination one at
+        a time, as a single collection of trees labeled ``label``.
+
+        Unlike writing out a |TreeList|, the trees do not all have to be in
+        memory at the same time. This allows for trees to be written as they
+        are generated or read in from another source (e.g., when thinning or
+        converting a large posterior sample), with constant memory use
+        regardless of the number of trees. The "``newick``", "``nexus``",
+        and "``nexml``" schemas are supported.
+
+        Everything preceding the first tree (e.g., the "TAXA" block and
+        "TRANSLATE" statement in NEXUS) is written when the writer is opened
+        or the first tree is written, and everything following the last tree
+        is written when the writer is closed. All taxa referenced by the trees
+        should thus already be in ``taxon_namespace`` when writing begins.
+
+        **Mandatory Destination-Specification Keyword Argument (Exactly One of the Following Required):**
+
+            - **file** (*file*) -- File or file-like object opened for writing.
+            - **path** (*str*) -- Path to file to which to write. The file
+              will be closed when the writer is closed.
+
+        **Mandatory Schema-Specification Keyword Argument:**
+
+            - **schema** (*str*) -- Identifier of format of data. See
+              "|Schemas|" for more details.
+
+        **Optional Schema-Specific Keyword Arguments:**
+
+            These provide control over how the data is formatted, and
+            supported argument names and values depend on the schema as
+            specified by the value passed as the "``schema``" argument, as
+            when writing a |TreeList|.
+
+        Parameters
+        ----------
+        taxon_namespace : |TaxonNamespace|
+            The taxon namespace referenced by all trees to be written.
+        label : str
+            Label of the collection of trees.
+
+        Returns
+        -------
+        w : |TreeStreamWriter|
+            Writer with ``write_tree(tree)``, ``write_trees(trees)`` and
+            ``close()`` methods, that can also be used as a context manager.
+
+        Examples
+        --------
+
+        ::
+
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees = dendropy.Tree.yield_from_files(
+                    files=["posterior.nex"],
+                    schema="nexus",
+                    taxon_namespace=taxon_namespace,
+                    tree_offset=1000)
+            tree = next(trees)
+            with dendropy.TreeList.open_stream_writer(
+                    path="thinned.nex",
+                    schema="nexus",
+                    taxon_namespace=taxon_namespace,
+                    translate_tree_taxa=True) as tree_writer:
+                tree_writer.write_tree(tree)
+                for tree_idx, tree in enumerate(trees):
+                    if tree_idx % 100 == 99:
+                        tree_writer.write_tree(tree)
+
+        """
+        dest_type, dest, schema = basemodel._extract_serialization_target_keyword(kwargs, "Destination")
+        if dest_type not in ("file", "path"):
+            raise ValueError("Unsupported destination type: {}".format(dest_type))
+        tree_list = cls(taxon_namespace=taxon_namespace, label=label)
+        writer = dataio.get_writer(schema, **kwargs)
+        if dest_type == "path":
+            stream = open(os.path.expandvars(os.path.expanduser(dest)), "w")
+            close_stream = True
+        else:
+            stream = dest
+            close_stream = False
+        return ioservice.TreeStreamWriter(
+                writer=writer,
+                stream=stream,
+                tree_list=tree_list,
+                close_stream=close_stream)
+
     ###########################################################################
     ### List Interface
 
@@ -1049,6 +1211,8 @@ class TreeList(
                 taxon_label_age_map=kwargs_dict.pop("taxon_label_age_map", None),
                 is_bipartitions_updated=kwargs_dict.pop("is_bipartitions_updated", False)
                 )
+        for tree in self:
+            tree.clear_traversal_cache()
         return ta
 
     def split_distribution(self,
@@ -1068,6 +1232,7 @@ class TreeList(
                     tree=tree,
                     is_bipartitions_updated=is_bipartitions_updated,
                     default_edge_length_value=default_edge_length_value)
+            tree.clear_traversal_cache()
         return sd
 
     def as_tree_array(self, **kwargs):
@@ -1079,6 +1244,8 @@ class TreeList(
         ta = TreeArray.from_tree_list(
                 trees=self,
                 **kwargs)
+        for tree in self:
+            tree.clear_traversal_cache()
         return ta
 
     def consensus(self,
@@ -2216,6 +2383,9 @@ class TreeArray(
                 taxon_label_age_map=self.taxon_label_age_map,
                 )
 
+        # Files followed by ``read_from_files(follow=True)``
+        self._tree_file_followers = {}
+
     ##############################################################################
     ## Book-Keeping
 
@@ -2383,28 +2553,158 @@ class TreeArray(
             The data format of the source. E.g., "nexus", "newick", "nexml".
         \*\*kwargs : keyword arguments
             These will be passed directly to the underlying schema-specific
-            reader implementation.
+            reader implementation, except for the following:
+
+                * ``tree_offset`` : the number of trees to skip at the start
+                  of each file (e.g., a burn-in). These trees are passed over
+                  without being built.
+                * ``num_processes`` : if greater than 1, then NEWICK and NEXUS
+                  files given by path are each split into ranges of trees
+                  at statement boundaries (see
+                  `dendropy.dataio.treeindex.TreeFileIndex`), which are parsed
+                  in up to this many worker processes. The partial results
+                  are merged in order, so the result is the same as that of
+                  reading the files serially. All the trees in a file must
+                  reference only taxa that are defined by the TAXA block or
+                  TRANSLATE statement of the file or that are in the first
+                  tree read from it.
+                * ``use_tree_index`` : if |True| (and ``num_processes`` is
+                  greater than 1), then the byte-offset indexes of the files
+                  are saved alongside them for reuse.
+                * ``follow`` : if |True|, then the files, which must be given
+                  by path, are followed as they are being written (e.g., by
+                  a running MCMC sampler): only the trees that have been
+                  completely written since the previous call with the same
+                  path are added, so that calling this method repeatedly
+                  updates the split distribution incrementally.
         """
         if "taxon_namespace" in kwargs:
             if kwargs["taxon_namespace"] is not self.taxon_namespace:
                 raise ValueError("TaxonNamespace object passed as keyword argument is not the same as self's TaxonNamespace reference")
             kwargs.pop("taxon_namespace")
         target_tree_offset = kwargs.pop("tree_offset", 0)
+        num_processes = kwargs.pop("num_processes", None)
+        use_tree_index = kwargs.pop("use_tree_index", False)
+        if kwargs.pop("follow", False):
+            for f in files:
+                try:
+                    follower = self._tree_file_followers[f]
+                except KeyError:
+                    follower = treeindex.TreeFileFollower(
+                            path=f,
+                            schema=schema,
+                            tree_offset=max(0, target_tree_offset))
+                    self._tree_file_followers[f] = follower
+                for source in follower.poll():
+                    self._read_from_files_serially(
+                            files=[source],
+                            schema=follower.index.schema,
+                            tree_offset=0,
+                            **kwargs)
+            return
+        if num_processes is None or num_processes <= 1:
+            self._read_from_files_serially(
+                    files=files,
+                    schema=schema,
+                    tree_offset=target_tree_offset,
+                    **kwargs)
+            return
+        for f in files:
+            if treeindex.is_indexable_source(f, schema):
+                self._read_from_file_in_parallel(
+                        path=f,
+                        schema=schema,
+                        tree_offset=target_tree_offset,
+                        num_processes=num_processes,
+                        use_tree_index=use_tree_index,
+                        **kwargs)
+            else:
+                self._read_from_files_serially(
+                        files=[f],
+                        schema=schema,
+                        tree_offset=target_tree_offset,
+                        **kwargs)
+
+    def _read_from_files_serially(self,
+            files,
+            schema,
+            tree_offset,
+            **kwargs):
+        # burn-in trees are skipped by the yielder without being built
         tree_yielder = self.tree_type.yield_from_files(
                 files=files,
                 schema=schema,
                 taxon_namespace=self.taxon_namespace,
+                tree_offset=max(0, tree_offset),
                 **kwargs)
-        current_source_index = None
-        current_tree_offset = None
-        for tree_idx, tree in enumerate(tree_yielder):
-            current_yielder_index = tree_yielder.current_file_index
-            if current_source_index != current_yielder_index:
-                current_source_index = current_yielder_index
-                current_tree_offset = 0
-            if current_tree_offset >= target_tree_offset:
-                self.add_tree(tree=tree, is_bipartitions_updated=False)
-            current_tree_offset += 1
+        for tree in tree_yielder:
+            self.add_tree(tree=tree, is_bipartitions_updated=False)
+
+    def _read_from_file_in_parallel(self,
+            path,
+            schema,
+            tree_offset,
+            num_processes,
+            use_tree_index,
+            **kwargs):
+        if use_tree_index:
+            index = treeindex.TreeFileIndex.get(path=path, schema=schema)
+        else:
+            index = treeindex.TreeFileIndex.build(path=path, schema=schema)
+        # as when reading serially, ``tree_offset`` trees are skipped at the
+        # start of the file, rather than of each collection
+        trees_before = 0
+        for collection_offset in range(index.num_collections):
+            num_trees = index.num_trees(collection_offset)
+            start = max(0, tree_offset - trees_before)
+            trees_before += num_trees
+            if start >= num_trees:
+                continue
+            # The first tree is read here, so that the taxon namespace and
+            # rooting state are established before the workers are started.
+            self._read_from_files_serially(
+                    files=[index.open_trees(collection_offset=collection_offset, start=start, stop=start+1)],
+                    schema=schema,
+                    tree_offset=0,
+                    **kwargs)
+            tree_array_kwargs = {
+                    "is_rooted_trees": self._is_rooted_trees,
+                    "ignore_edge_lengths": self.ignore_edge_lengths,
+                    "ignore_node_ages": self.ignore_node_ages,
+                    "use_tree_weights": self.use_tree_weights,
+                    "ultrametricity_precision": self._split_distribution.ultrametricity_precision,
+                    "is_force_max_age": self._split_distribution.is_force_max_age,
+                    "taxon_label_age_map": self.taxon_label_age_map,
+                    }
+            taxon_accessions, num_taxon_accessions = taxonmodel.get_taxon_accessions(self.taxon_namespace)
+            tasks = []
+            for chunk_start, chunk_stop in index.partition(
+                    num_chunks=num_processes * 4,
+                    collection_offset=collection_offset,
+                    start=start+1):
+                tasks.append((
+                    path,
+                    index.source_parts(collection_offset=collection_offset, start=chunk_start, stop=chunk_stop),
+                    index.encoding,
+                    schema,
+                    taxon_accessions,
+                    num_taxon_accessions,
+                    self.taxon_namespace.is_case_sensitive,
+                    tree_array_kwargs,
+                    kwargs,
+                    ))
+            if not tasks:
+                continue
+            pool = multiprocessing.Pool(processes=min(num_processes, len(tasks)))
+            try:
+                for tree_array in pool.imap(_read_tree_array_from_source_parts, tasks):
+                    self.update(tree_array)
+                pool.close()
+            except:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
 
     def _parse_and_add_from_stream(self,
             stream,
@@ -38,11 +38,12 @@ from dendropy.utility import textprocessing
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy import dataio
+from dendropy.dataio import treeindex
 
 ##############################################################################
 ### Bipartition
 
-class Bipartition(object):
+class Bipartition(basemodel.Slotted):
     """
     A bipartition on a tree.
 
@@ -142,6 +143,16 @@ class Bipartition(object):
 
     """
 
+    __slots__ = (
+        "_split_bitmask",
+        "_leafset_bitmask",
+        "_tree_leafset_bitmask",
+        "_lowest_relevant_bit",
+        "_is_rooted",
+        "is_mutable",
+        "__dict__",
+        )
+
     def normalize_bitmask(bitmask, fill_bitmask, lowest_relevant_bit=1):
         if bitmask & lowest_relevant_bit:
             return (~bitmask) & fill_bitmask             # force least-significant bit to 0
@@ -721,11 +732,25 @@ class Bipartition(object):
 
 class Edge(
         basemodel.DataObject,
-        basemodel.Annotable):
+        basemodel.Annotable,
+        basemodel.Commentable,
+        basemodel.Slotted):
     """
     An :term:``edge`` on a :term:``tree``.
     """
 
+    __slots__ = (
+        "_label",
+        "_annotations",
+        "_deferred_annotations",
+        "_head_node",
+        "rootedge",
+        "length",
+        "_bipartition",
+        "_comments",
+        "__dict__",
+        )
+
     ###########################################################################
     ### Life-cycle and Identity
 
@@ -754,7 +779,7 @@ class Edge(
             raise TypeError("Unsupported keyword arguments: {}".format(kwargs))
 
         self._bipartition = None
-        self.comments = []
+        self._comments = None
 
     def __copy__(self, memo=None):
         raise TypeError("Cannot directly copy Edge")
@@ -975,11 +1000,27 @@ class Edge(
 
 class Node(
         basemodel.DataObject,
-        basemodel.Annotable):
+        basemodel.Annotable,
+        basemodel.Commentable,
+        basemodel.Slotted):
     """
     A :term:|Node| on a :term:|Tree|.
     """
 
+    __slots__ = (
+        "_label",
+        "_annotations",
+        "_deferred_annotations",
+        "taxon",
+        "age",
+        "_edge",
+        "_child_nodes",
+        "_parent_node",
+        "_comments",
+        "_structure_version",
+        "__dict__",
+        )
+
     def edge_factory(cls, **kwargs):
         """
         Creates and returns a |Edge| object.
@@ -1024,11 +1065,12 @@ class Node(
         self._edge = None
         self._child_nodes = []
         self._parent_node = None
+        self._structure_version = None
         self.edge = self.edge_factory(head_node=self,
                 length=kwargs.pop("edge_length", None))
         if kwargs:
             raise TypeError("Unsupported keyword arguments: {}".format(kwargs))
-        self.comments = []
+        self._comments = None
 
     def __copy__(self, memo=None):
         raise TypeError("Cannot directly copy Edge")
@@ -1036,6 +1078,23 @@ class Node(
     def taxon_namespace_scoped_copy(self, memo=None):
         raise TypeError("Cannot directly copy Node")
 
+    def __getstate__(self):
+        # The parent node is not stored, but restored from the child nodes of
+        # the parent node when it is unpickled. Pickling a node thus only
+        # recurses into those of its child nodes that have not already been
+        # pickled (see `Tree.__getstate__()`).
+        state = basemodel.Slotted.__getstate__(self)
+        del state["_parent_node"]
+        return state
+
+    def __setstate__(self, state):
+        basemodel.Slotted.__setstate__(self, state)
+        # may already have been set, if the parent node was unpickled first
+        if not hasattr(self, "_parent_node"):
+            self._parent_node = None
+        for ch in self._child_nodes:
+            ch._parent_node = self
+
     def __deepcopy__(self, memo=None):
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
         # if memo is None:
@@ -1641,6 +1700,7 @@ class Node(
         node._parent_node = self
         if node not in self._child_nodes:
             self._child_nodes.append(node)
+        self._note_structure_change(node)
         return node
 
     def insert_child(self, index, node):
@@ -1674,6 +1734,7 @@ class Node(
                 return
             self._child_nodes.remove(node)
         self._child_nodes.insert(index, node)
+        self._note_structure_change(node)
         return node
 
     def new_child(self, **kwargs):
@@ -1785,6 +1846,7 @@ class Node(
                         for c in tr_children:
                             self.insert_child(pos, c)
                         to_remove._child_nodes = []
+            self._note_structure_change(node)
         else:
             raise ValueError("Tried to remove a node that is not listed as a child")
         return node
@@ -1794,6 +1856,7 @@ class Node(
         Removes all child nodes.
         """
         del self._child_nodes[:] # list.clear() is not in Python 2.7
+        self._note_structure_change()
 
     def reversible_remove_child(self, node, suppress_unifurcations=False):
         """
@@ -1859,7 +1922,7 @@ class Node(
                         self.insert_child(pos, c)
                     t = (to_remove, self, pos, tr_children, e)
                     removed.append(t)
-
+        self._note_structure_change(node)
         return removed
 
     def reinsert_nodes(self, nd_connection_list):
@@ -1948,6 +2011,8 @@ class Node(
                 self._parent_node._child_nodes.remove(self)
             except ValueError:
                 pass
+        if self._edge is not None or self._parent_node is not None:
+            self._note_structure_change()
 
         ## Minimal management
         self._edge = new_edge
@@ -2013,17 +2078,39 @@ class Node(
         return self._parent_node
     def _set_parent_node(self, parent):
         """Sets the parent node of this node."""
-        if self._parent_node is not None:
+        old_parent = self._parent_node
+        if old_parent is not None:
             try:
-                self._parent_node._child_nodes.remove(self)
+                old_parent._child_nodes.remove(self)
             except ValueError:
                 pass
         self._parent_node = parent
         if self._parent_node is not None:
             if self not in self._parent_node._child_nodes:
                 self._parent_node._child_nodes.append(self)
+        if old_parent is not None:
+            old_parent._note_structure_change(self)
+        if parent is not None:
+            parent._note_structure_change(self)
     parent_node = property(_get_parent_node, _set_parent_node)
 
+    def _note_structure_change(self, node=None):
+        # Counts a change to the child nodes of ``self`` (and, if given, to
+        # the parent node of ``node``) in the structure version of ``self``
+        # and that of ``node`` (see `Tree._get_structure_version()`). Nodes
+        # that are linked share the same structure version from then on.
+        version = self._structure_version
+        if node is not None and node._structure_version is not version:
+            if version is None:
+                version = node._structure_version
+                self._structure_version = version
+            else:
+                if node._structure_version is not None:
+                    node._structure_version[0] += 1
+                node._structure_version = version
+        if version is not None:
+            version[0] += 1
+
     ###########################################################################
     ### General Structural Access and Information
 
@@ -2445,16 +2532,26 @@ class Node(
         """
         edge_lengths = not kwargs.get('suppress_edge_lengths', False)
         edge_lengths = kwargs.get('edge_lengths', edge_lengths)
-        child_nodes = self.child_nodes()
-        if child_nodes:
-            out.write('(')
-            f_child = child_nodes[0]
-            for child in child_nodes:
-                if child is not f_child:
+        # each entry: (node, is_closing, is_first_child); an explicit stack is
+        # used instead of recursion so that tree depth is not limited
+        node_stack = [(self, False, True)]
+        while node_stack:
+            node, is_closing, is_first_child = node_stack.pop()
+            if not is_closing:
+                if not is_first_child:
                     out.write(',')
-                child._write_newick(out, **kwargs)
-            out.write(')')
+                child_nodes = node.child_nodes()
+                if child_nodes:
+                    out.write('(')
+                    node_stack.append((node, True, is_first_child))
+                    for child_idx in range(len(child_nodes)-1, -1, -1):
+                        node_stack.append((child_nodes[child_idx], False, child_idx == 0))
+                    continue
+            else:
+                out.write(')')
+            node._write_newick_node_info(out, edge_lengths, **kwargs)
 
+    def _write_newick_node_info(self, out, edge_lengths, **kwargs):
         out.write(self._get_node_token(**kwargs))
         if edge_lengths:
             e = self.edge
@@ -2649,6 +2746,7 @@ class Tree(
 
         tree_list_factory = lambda label, taxon_namespace: TreeList(label=label, taxon_namespace=taxon_namespace, tree_type=cls)
         label = kwargs.pop("label", None)
+        use_tree_index = kwargs.pop("use_tree_index", False)
         reader = dataio.get_reader(schema, **kwargs)
         # if collection_offset is None and tree_offset is not None:
         #     raise TypeError("Cannot specify ``tree_offset`` without specifying ``collection_offset``")
@@ -2656,6 +2754,22 @@ class Tree(
             collection_offset = 0
         if tree_offset is None:
             tree_offset = 0
+        if hasattr(reader, "select_trees"):
+            # readers of formats that index their trees (e.g.,
+            # "dendropy-binary") locate the requested tree directly
+            reader.select_trees(tree_offset=tree_offset, num_trees=1)
+            tree_offset = 0
+        elif use_tree_index:
+            indexed_stream = treeindex.open_indexed_trees(
+                    stream=stream,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset,
+                    num_trees=1)
+            if indexed_stream is not None:
+                stream = indexed_stream
+                collection_offset = 0
+                tree_offset = 0
         tree_lists = reader.read_tree_lists(
                     stream=stream,
                     taxon_namespace_factory=tns_factory,
@@ -2705,6 +2819,11 @@ class Tree(
             - **tree_offset** (*int*) -- 0-based index of tree within the
               collection specified by ``collection_offset`` to be parsed. If
               not specified, then the first tree (offset = 0) is assumed.
+            - **use_tree_index** (*bool*) -- If |True|, and the source is a
+              NEWICK or NEXUS file given by ``path`` or ``file``, then the trees
+              before ``tree_offset`` are skipped without being parsed, using a
+              byte-offset index of the file that is saved alongside it (with
+              a ".dpidx" extension) for reuse. Default is |False|.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -2775,6 +2894,9 @@ class Tree(
         the OS starts page faulting, performance starts taking some serious
         hits.
 
+        Sources given by path that are compressed in gzip, bz2, or xz format
+        are recognized by their leading bytes and decompressed on the fly.
+
         Parameters
         ----------
         files : iterable of file paths or file-like objects.
@@ -2790,6 +2912,25 @@ class Tree(
             taxon definitions.
         \*\*kwargs : keyword arguments
             These will be passed directly to the schema-parser implementation.
+            In addition, the following keyword arguments are supported:
+
+            - ``tree_offset`` (integer): the number of trees at the start of
+              each source to skip (e.g., as a "burn-in"). These trees are
+              passed over without being built, which is much faster than
+              discarding them on the client side. Note that taxa that are
+              only referenced in skipped trees are therefore not added to the
+              taxon namespace.
+            - ``threaded_decompression`` (boolean): if |True|, then sources
+              given by path that are compressed are decompressed in a
+              background thread.
+            - ``follow`` (boolean): if |True|, then the sources, which must
+              be paths of (uncompressed) NEWICK or NEXUS files, are followed
+              as they are being written (e.g., by a running MCMC sampler).
+              The object returned can then be iterated over repeatedly: each
+              iteration yields only the trees that have been completely
+              written since the previous one, resuming from the end of the
+              last complete tree statement (a partially-written final
+              statement is read by a later iteration).
 
         Yields
         ------
@@ -2830,8 +2971,6 @@ class Tree(
                 taxon_namespace = taxonmodel.TaxonNamespace()
         else:
             assert "taxon_set" not in kwargs
-        if "tree_offset" in kwargs:
-            raise TypeError("'tree_offset' is not supported: trees should be skipped/discarded on the client code side")
         tree_yielder = dataio.get_tree_yielder(
                 files,
                 schema,
@@ -3261,8 +3400,157 @@ class Tree(
         self.taxon_namespace.populate_memo_for_taxon_namespace_scoped_copy(memo)
         return self.__deepcopy__(memo=memo)
 
+    def __getstate__(self):
+        # Trees of plain nodes and edges (see `Tree._get_flat_node_state()`)
+        # are pickled as arrays of the values of their attributes, the nodes
+        # and edges being rebuilt from these when the tree is unpickled.
+        # Otherwise, the nodes are pickled ahead of everything else, in
+        # postorder, so that the child nodes of each node have already been
+        # pickled by the time that it is. Pickling a tree thus does not
+        # recurse from node to node, and is neither limited by the depth of
+        # the tree nor slowed down by deep recursion (see
+        # `Node.__getstate__()`).
+        state = dict(self.__dict__)
+        state.pop("_node_orders", None)
+        state.pop("_bipartition_encoding_state", None)
+        seed_node = state.pop("_seed_node")
+        if seed_node is None:
+            return ([], state)
+        if seed_node._parent_node is None:
+            flat_node_state = self._get_flat_node_state(seed_node)
+            if flat_node_state is not None:
+                # rebuilt on demand
+                state["_split_bitmask_edge_map"] = None
+                state["_bipartition_edge_map"] = None
+                return (flat_node_state, state)
+        nodes = list(seed_node.postorder_iter())
+        # not restored from the child nodes of any pickled node
+        state["_seed_node_parent"] = seed_node._parent_node
+        return (nodes, state)
+
+    def __setstate__(self, state):
+        nodes, state = state
+        self.__dict__.update(state)
+        if isinstance(nodes, tuple):
+            self._seed_node = self._build_nodes_from_flat_state(nodes)
+        elif nodes:
+            self._seed_node = nodes[-1]
+            self._seed_node._parent_node = self.__dict__.pop("_seed_node_parent")
+        else:
+            self._seed_node = None
+
+    @staticmethod
+    def _get_flat_node_state(seed_node):
+        # Returns the positions of the parent nodes (-1 for the seed node),
+        # the labels, taxa and ages of the nodes of the tree in pre-order
+        # sequence, and the labels, lengths, root edge flags and
+        # bipartitions of their edges, or |None| if any of the nodes or
+        # edges is not plain: of a class other than |Node| or |Edge|, or
+        # with annotations, comments or any other attributes, which may be
+        # bound to or refer to other objects.
+        parent_positions = []
+        labels = []
+        taxa = []
+        ages = []
+        edge_labels = []
+        edge_lengths = []
+        rootedges = []
+        bipartitions = []
+        positions = {}
+        # the slots of nodes and edges other than those of annotations are
+        # all set on initialization
+        num_node_slots = len(basemodel._get_slot_names(Node)) - 2
+        num_edge_slots = len(basemodel._get_slot_names(Edge)) - 2
+        for nd in seed_node.preorder_iter():
+            edge = nd._edge
+            if (type(nd) is not Node
+                    or type(edge) is not Edge
+                    or edge._head_node is not nd
+                    or nd._comments
+                    or edge._comments
+                    or hasattr(nd, "_deferred_annotations")
+                    or hasattr(edge, "_deferred_annotations")):
+                return None
+            num_node_slot_values = num_node_slots
+            if hasattr(nd, "_annotations"):
+                if nd._annotations:
+                    return None
+                num_node_slot_values += 1
+            num_edge_slot_values = num_edge_slots
+            if hasattr(edge, "_annotations"):
+                if edge._annotations:
+                    return None
+                num_edge_slot_values += 1
+            if (basemodel.has_instance_dict_attributes(nd, num_node_slot_values)
+                    or basemodel.has_instance_dict_attributes(edge, num_edge_slot_values)):
+                return None
+            positions[nd] = len(parent_positions)
+            parent = nd._parent_node
+            parent_positions.append(-1 if parent is None else positions[parent])
+            labels.append(nd._label)
+            taxa.append(nd.taxon)
+            ages.append(nd.age)
+            edge_labels.append(edge._label)
+            edge_lengths.append(edge.length)
+            rootedges.append(edge.rootedge)
+            bipartitions.append(edge._bipartition)
+        return (parent_positions,
+                labels,
+                taxa,
+                ages,
+                edge_labels,
+                edge_lengths,
+                rootedges,
+                bipartitions)
+
+    @staticmethod
+    def _build_nodes_from_flat_state(flat_node_state):
+        # Rebuilds the nodes of a tree pickled by `Tree._get_flat_node_state()`
+        # and returns the seed node.
+        (parent_positions,
+                labels,
+                taxa,
+                ages,
+                edge_labels,
+                edge_lengths,
+                rootedges,
+                bipartitions) = flat_node_state
+        nodes = []
+        for idx, parent_position in enumerate(parent_positions):
+            nd = Node.__new__(Node)
+            edge = Edge.__new__(Edge)
+            nd._label = labels[idx]
+            nd.taxon = taxa[idx]
+            nd.age = ages[idx]
+            nd._edge = edge
+            nd._child_nodes = []
+            nd._comments = None
+            nd._structure_version = None
+            if parent_position < 0:
+                nd._parent_node = None
+            else:
+                parent = nodes[parent_position]
+                nd._parent_node = parent
+                parent._child_nodes.append(nd)
+            edge._label = edge_labels[idx]
+            edge._head_node = nd
+            edge.rootedge = rootedges[idx]
+            edge.length = edge_lengths[idx]
+            edge._bipartition = bipartitions[idx]
+            edge._comments = None
+            nodes.append(nd)
+        return nodes[0]
+
     def __deepcopy__(self, memo=None):
         # ensure clone map
+        if memo is None:
+            memo = {}
+        if id(self) not in memo:
+            other = self.__class__.__new__(self.__class__)
+            # not copied, but rebuilt on demand
+            other._node_orders = None
+            other._bipartition_encoding_state = None
+            memo[id(self)] = other
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
         # if memo is None:
         #     memo = {}
@@ -3965,11 +4253,15 @@ class Tree(
               keyword argument ``taxon_labels``
 
         Returns |None| if no appropriate node is found. Assumes that
-        bipartitions have been encoded on the tree. It is possible that the
-        leafset bitmask is not compatible with the subtree that is returned!
-        (compatibility tests are not fully performed).  This function is used
-        to find the "insertion point" for a new bipartition via a root to tip
-        search.
+        bipartitions have been encoded on the tree (they are encoded if not,
+        or re-encoded if the tree has been restructured since). It is
+        possible that the leafset bitmask is not compatible with the subtree
+        that is returned! (compatibility tests are not fully performed). This
+        function is used to find the "insertion point" for a new bipartition
+        via a root to tip search.
+
+        For many queries on the same tree, a |MrcaIndex| (see
+        :meth:`Tree.mrca_index()`) answers each in constant time.
 
         Parameters
         ----------
@@ -4020,7 +4312,10 @@ class Tree(
         if leafset_bitmask is None or leafset_bitmask == 0:
             raise ValueError("Null leafset bitmask (0)")
 
-        if start_node.edge.bipartition.leafset_bitmask == 0 or not kwargs.get("is_bipartitions_updated", True):
+        if (start_node.edge.bipartition.leafset_bitmask == 0
+                or not kwargs.get("is_bipartitions_updated", True)
+                or (self._bipartition_encoding_state is not None
+                    and not self._is_bipartition_encoding_current())):
             self.encode_bipartitions(suppress_unifurcations=False)
 
         if (start_node.edge.bipartition.leafset_bitmask & leafset_bitmask) != leafset_bitmask:
@@ -4053,6 +4348,178 @@ class Tree(
             #   leaves that have not been encoded with leafset_bitmasks.
             return last_match
 
+    ###########################################################################
+    ### Structure Version
+
+    def _get_structure_version(self):
+        """
+        Returns the structure version of the tree: a list of a single count
+        of the changes to the structure of the tree, shared by its nodes.
+
+        Each change to the child nodes of a |Node| object increases the
+        count in the structure version of the node, which is also taken on
+        by the nodes linked to it (see `Node._note_structure_change()`). The
+        structure version of a tree is that of its seed node, and is
+        assigned to all of its nodes whenever its traversal orders are
+        built or its bipartitions encoded: while both the structure version of the tree and its count
+        are unchanged since, so is the structure of the tree, whatever the
+        changes to other trees.
+        """
+        seed_node = self._seed_node
+        if seed_node is None:
+            return [0]
+        version = seed_node._structure_version
+        if version is None:
+            version = [0]
+            seed_node._structure_version = version
+        return version
+
+    ###########################################################################
+    ### Cached Traversal Orders
+
+    # The nodes of the tree in pre-order and post-order sequence, built by
+    # the node and edge iterators on a repeated traversal of the tree (a
+    # first traversal follows the child nodes of each node, noting only the
+    # seed node and the structure version of the tree), and rebuilt if the
+    # seed node has been reassigned or the structure version of the tree
+    # has changed since they were built. Each order is a tuple of the list
+    # of nodes, the list of the positions in this list of the parents of the
+    # nodes (-1 for the seed node), and the list of the positions of the
+    # leaves.
+    _node_orders = None
+
+    def clear_traversal_cache(self):
+        """
+        Discards the sequences of nodes cached by repeated traversals of the
+        tree.
+
+        The sequences are rebuilt when the tree is next traversed twice
+        without changes to its structure in-between. Discarding them frees
+        the memory they take up in trees that will not be traversed again.
+        """
+        self._node_orders = None
+
+    def _get_node_order(self, postorder):
+        # Returns |None| on a first traversal of the current structure of
+        # the tree.
+        seed_node = self.seed_node
+        version = self._get_structure_version()
+        node_orders = self._node_orders
+        if (node_orders is None
+                or node_orders[0] is not seed_node
+                or node_orders[1] is not version
+                or node_orders[2] != version[0]):
+            self._node_orders = [seed_node, version, version[0], None, None]
+            return None
+        idx = 4 if postorder else 3
+        if node_orders[idx] is None:
+            node_orders[idx] = self._build_node_order(seed_node, version, postorder)
+        return node_orders[idx]
+
+    @staticmethod
+    def _build_node_order(seed_node, version, postorder):
+        nodes = []
+        parent_positions = []
+        leaf_positions = []
+        stack = [(seed_node, -1)]
+        while stack:
+            node, parent_position = stack.pop()
+            node._structure_version = version
+            position = len(nodes)
+            nodes.append(node)
+            parent_positions.append(parent_position)
+            if not node._child_nodes:
+                leaf_positions.append(position)
+            elif postorder:
+                # visiting the children right to left gives the post-order
+                # sequence reversed
+                stack.extend((ch, position) for ch in node._child_nodes)
+            else:
+                stack.extend((ch, position) for ch in reversed(node._child_nodes))
+        if postorder:
+            last = len(nodes) - 1
+            nodes.reverse()
+            parent_positions = [(last - p if p >= 0 else p) for p in reversed(parent_positions)]
+            leaf_positions = [last - p for p in reversed(leaf_positions)]
+        return nodes, parent_positions, leaf_positions
+
+    def _node_order_iter(self, postorder, filter_fn=None, leaves_only=False):
+        # Leaves are visited as if in a post-order traversal.
+        node_order = self._get_node_order(postorder)
+        if node_order is None:
+            if leaves_only:
+                return self.seed_node.leaf_iter(filter_fn=filter_fn)
+            elif postorder:
+                return self.seed_node.postorder_iter(filter_fn=filter_fn)
+            else:
+                return self.seed_node.preorder_iter(filter_fn=filter_fn)
+        return self._iter_node_order(node_order, self._get_structure_version(), postorder, filter_fn, leaves_only)
+
+    @staticmethod
+    def _iter_node_order(node_order, version, postorder, filter_fn, leaves_only):
+        nodes, parent_positions, leaf_positions = node_order
+        count = version[0]
+        num_visited = 0
+        for position in (leaf_positions if leaves_only else range(len(nodes))):
+            if version[0] != count:
+                break
+            node = nodes[position]
+            if filter_fn is None or filter_fn(node):
+                yield node
+            num_visited = position + 1
+        else:
+            if version[0] == count:
+                return
+        # The tree has been modified while being iterated over: the rest of
+        # the tree is traversed as it would have been without the cached
+        # order, i.e., by following the current child nodes of each node
+        # from the point where the traversal would have been interrupted.
+        if leaves_only:
+            if filter_fn:
+                ff = lambda x: x.is_leaf() and filter_fn(x) or None
+            else:
+                ff = lambda x: x.is_leaf() and x or None
+        else:
+            ff = filter_fn
+        if num_visited == 0:
+            if postorder:
+                stack = [(nodes[0], False)]
+            else:
+                stack = [nodes[0]]
+        else:
+            path_positions = set()
+            position = parent_positions[num_visited - 1]
+            while position >= 0:
+                path_positions.add(position)
+                position = parent_positions[position]
+            if postorder:
+                # unvisited ancestors and unexpanded siblings of these
+                stack = [(nodes[p], p in path_positions)
+                        for p in range(len(nodes) - 1, num_visited - 1, -1)
+                        if p in path_positions or parent_positions[p] in path_positions]
+            else:
+                # unvisited siblings of the ancestors of the last node visited
+                # and the current child nodes of this node
+                stack = [nodes[p]
+                        for p in range(len(nodes) - 1, num_visited - 1, -1)
+                        if parent_positions[p] in path_positions]
+                stack.extend(reversed(nodes[num_visited - 1]._child_nodes))
+        if postorder:
+            while stack:
+                node, state = stack.pop()
+                if state:
+                    if ff is None or ff(node):
+                        yield node
+                else:
+                    stack.append((node, True))
+                    stack.extend([(n, False) for n in reversed(node._child_nodes)])
+        else:
+            while stack:
+                node = stack.pop()
+                if ff is None or ff(node):
+                    yield node
+                stack.extend(n for n in reversed(node._child_nodes))
+
     ###########################################################################
     ### Node iterators
 
@@ -4097,7 +4564,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        return self.seed_node.preorder_iter(filter_fn=filter_fn)
+        return self._node_order_iter(False, filter_fn=filter_fn)
 
     def preorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4126,8 +4593,15 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the internal nodes of ``self``.
         """
-        return self.seed_node.preorder_internal_node_iter(filter_fn=filter_fn,
-                exclude_seed_node=exclude_seed_node)
+        if exclude_seed_node:
+            froot = lambda x: x._parent_node is not None
+        else:
+            froot = lambda x: True
+        if filter_fn:
+            f = lambda x: (froot(x) and x._child_nodes and filter_fn(x)) or None
+        else:
+            f = lambda x: (x and froot(x) and x._child_nodes) or None
+        return self._node_order_iter(False, filter_fn=f)
 
     def postorder_node_iter(self, filter_fn=None):
         """
@@ -4151,7 +4625,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the nodes in ``self`` in post-order sequence.
         """
-        return self.seed_node.postorder_iter(filter_fn=filter_fn)
+        return self._node_order_iter(True, filter_fn=filter_fn)
 
     def postorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4181,8 +4655,15 @@ class Tree(
             An iterator yielding the internal nodes of ``self`` in post-order
             sequence.
         """
-        return self.seed_node.postorder_internal_node_iter(filter_fn=filter_fn,
-                exclude_seed_node=exclude_seed_node)
+        if exclude_seed_node:
+            froot = lambda x: x._parent_node is not None
+        else:
+            froot = lambda x: True
+        if filter_fn:
+            f = lambda x: (froot(x) and x._child_nodes and filter_fn(x)) or None
+        else:
+            f = lambda x: (x and froot(x) and x._child_nodes) or None
+        return self._node_order_iter(True, filter_fn=f)
 
     def levelorder_node_iter(self, filter_fn=None):
         """
@@ -4262,7 +4743,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding leaf nodes in ``self``.
         """
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        return self._node_order_iter(True, filter_fn=filter_fn, leaves_only=True)
 
     def leaf_iter(self, filter_fn=None):
         """
@@ -4271,7 +4752,7 @@ class Tree(
         deprecate.dendropy_deprecation_warning(
                 message="Deprecated since DendroPy 4: 'leaf_iter()' will no longer be supported in future releases; use 'leaf_node_iter()' instead",
                 stacklevel=3)
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        return self.leaf_node_iter(filter_fn=filter_fn)
 
     def ageorder_node_iter(self, include_leaves=True, filter_fn=None, descending=False):
         """
@@ -4418,14 +4899,12 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        # NOTE: from-scratch implementation here instead of wrapping
-        # `preorder_node_iter()`for efficiency
-        stack = [self.seed_node._edge]
-        while stack:
-            edge = stack.pop()
-            if filter_fn is None or filter_fn(edge):
-                yield edge
-            stack.extend(n._edge for n in reversed(edge._head_node._child_nodes))
+        if filter_fn is not None:
+            f = lambda x : filter_fn(x._edge)
+        else:
+            f = None
+        for nd in self._node_order_iter(False, filter_fn=f):
+            yield nd._edge
 
     def preorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4490,33 +4969,12 @@ class Tree(
             An iterator yielding the edges in ``self`` in post-order sequence.
 
         """
-        # NOTE: custom implementation here instead of wrapping
-        # `postorder_node_iter()`for efficiency
-
-        # stack = [(self.seed_node._edge, False)]
-        # while stack:
-        #     edge, state = stack.pop(0)
-        #     if state:
-        #         if filter_fn is None or filter_fn(edge):
-        #             yield edge
-        #     else:
-        #         stack.insert(0, (edge, True))
-        #         child_edges = [(n._edge, False) for n in edge._head_node._child_nodes]
-        #         child_edges.extend(stack)
-        #         stack = child_edges
-
-        ## Prefer `pop()` to `pop(0)`.
-        ## Thanks to Mark T. Holder
-        ## From peyotl commits: d1ffef2 + 19fdea1
-        stack = [(self.seed_node._edge, False)]
-        while stack:
-            edge, state = stack.pop()
-            if state:
-                if filter_fn is None or filter_fn(edge):
-                    yield edge
-            else:
-                stack.append((edge, True))
-                stack.extend([(n._edge, False) for n in reversed(edge._head_node._child_nodes)])
+        if filter_fn is not None:
+            f = lambda x : filter_fn(x._edge)
+        else:
+            f = None
+        for nd in self._node_order_iter(True, filter_fn=f):
+            yield nd._edge
 
     def postorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4650,8 +5108,8 @@ class Tree(
             f = lambda x : filter_fn(x.edge)
         else:
             f = None
-        for nd in self.seed_node.leaf_iter(filter_fn=f):
-            yield nd.edge
+        for nd in self._node_order_iter(True, filter_fn=f, leaves_only=True):
+            yield nd._edge
 
     ###########################################################################
     ### Taxa Management
@@ -4807,8 +5265,16 @@ class Tree(
         self._is_rooted = not val
     is_unrooted = property(_get_is_unrooted, _set_is_unrooted)
 
-    def collapse_basal_bifurcation(self, set_as_unrooted_tree=True):
-        "Converts a degree-2 node at the root to a degree-3 node."
+    def collapse_basal_bifurcation(self, set_as_unrooted_tree=True, update_bipartitions=False):
+        """
+        Converts a degree-2 node at the root to a degree-3 node.
+
+        If ``update_bipartitions`` is |True|, then the bipartitions will be
+        updated: if these are current, only the bipartition of the collapsed
+        edge is dropped (the others being recompiled, without traversing the
+        tree, if the tree is set as unrooted).
+        """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         seed_node = self.seed_node
         if not seed_node:
             return
@@ -4831,6 +5297,12 @@ class Tree(
         to_del_edge.collapse(adjust_collapsed_head_children_edge_lengths=False)
         if set_as_unrooted_tree:
             self.is_rooted = False
+        if is_bipartitions_current:
+            self._update_bipartitions_incrementally(
+                    changed_nodes=[seed_node],
+                    removed_nodes=[to_del])
+        elif update_bipartitions:
+            self.update_bipartitions()
         return self.seed_node
 
     def _get_seed_node(self):
@@ -4841,8 +5313,9 @@ class Tree(
             self._seed_node.parent_node = None
     seed_node = property(_get_seed_node, _set_seed_node)
 
-    def deroot(self):
-        self.collapse_basal_bifurcation(set_as_unrooted_tree=True)
+    def deroot(self, update_bipartitions=False):
+        self.collapse_basal_bifurcation(set_as_unrooted_tree=True,
+                update_bipartitions=update_bipartitions)
 
     def reseed_at(self,
             new_seed_node,
@@ -4859,7 +5332,9 @@ class Tree(
         'new_seed_node', but it does not actually change the tree's rooting
         state.  If ``update_bipartitions`` is True, then the edges'
         ``bipartition_bitmask`` and the tree's ``bipartition_edge_map`` attributes
-        will be updated. If the *old* root of the tree had an outdegree of 2,
+        will be updated: if the bipartitions are current, then only those of
+        the edges on the path between the old and the new seed nodes are
+        recalculated. If the *old* root of the tree had an outdegree of 2,
         then after this operation, it will have an outdegree of one. In this
         case, unless ``suppress_unifurcations`` is False, then it will be removed
         from the tree.
@@ -4890,6 +5365,9 @@ class Tree(
         #     debug_children = ", ".join(debug_children)
         #     print("    Children (Node Parent, Edge Tail Node Parent): {}".format(debug_children))
 
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
+        changed_nodes = []
+        removed_nodes = []
         if self.seed_node is new_seed_node:
             # do not just return: allow for updating of bipartitions,
             # collapsing of unifurcations, collapsing of unrooted basal
@@ -4909,6 +5387,7 @@ class Tree(
             edges_to_invert = []
             current_node = new_seed_node
             while current_node:
+                changed_nodes.append(current_node)
                 if current_node._parent_node is not None:
                     edges_to_invert.append(current_node.edge)
                 current_node = current_node._parent_node
@@ -4925,9 +5404,16 @@ class Tree(
                     new_seed_node.remove_child(nsn_ch)
                     for ch in nsn_ch._child_nodes:
                         new_seed_node.add_child(ch)
+                    removed_nodes.append(nsn_ch)
             self.seed_node = new_seed_node
 
-        if update_bipartitions:
+        if is_bipartitions_current:
+            self._update_bipartitions_incrementally(
+                    changed_nodes=changed_nodes,
+                    removed_nodes=removed_nodes,
+                    suppress_unifurcations=suppress_unifurcations,
+                    collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
+        elif update_bipartitions:
             self.encode_bipartitions(
                     suppress_unifurcations=suppress_unifurcations,
                     collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
@@ -4956,10 +5442,14 @@ class Tree(
         p = outgroup_node._parent_node
         assert p is not None
         self.reseed_at(p, update_bipartitions=update_bipartitions, suppress_unifurcations=suppress_unifurcations)
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         p.remove_child(outgroup_node)
         _ognlen = outgroup_node.edge.length
         p.insert_child(0, outgroup_node)
         assert outgroup_node.edge.length == _ognlen
+        if is_bipartitions_current:
+            # reordering child nodes does not change any bipartitions
+            self._stamp_bipartition_encoding()
         return self.seed_node
 
     def reroot_at_node(self, new_root_node, update_bipartitions=False, suppress_unifurcations=True, collapse_unrooted_basal_bifurcation=True):
@@ -4976,13 +5466,27 @@ class Tree(
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
+        if is_bipartitions_current:
+            # rooted first, so that the bipartitions are updated as rooted
+            # ones on reseeding (which does not otherwise depend on the
+            # rooting state, as basal bifurcations are not collapsed)
+            self.is_rooted = True
         self.reseed_at(new_seed_node=new_root_node,
-                update_bipartitions=False,
+                update_bipartitions=is_bipartitions_current,
                 suppress_unifurcations=suppress_unifurcations,
                 collapse_unrooted_basal_bifurcation=False,
                 )
         self.is_rooted = True
-        if update_bipartitions:
+        if is_bipartitions_current and self._is_bipartition_encoding_current():
+            # recompiles the bipartitions as rooted ones if these were not
+            # updated on reseeding
+            self._update_bipartitions_incrementally(
+                    changed_nodes=(),
+                    removed_nodes=(),
+                    suppress_unifurcations=suppress_unifurcations,
+                    collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
+        elif update_bipartitions:
             self.update_bipartitions(suppress_unifurcations=suppress_unifurcations, collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
         return self.seed_node
 
@@ -5005,6 +5509,7 @@ class Tree(
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         old_tail = edge.tail_node
         old_head = edge.head_node
         new_seed_node = old_tail.new_child(edge_length=length1)
@@ -5012,6 +5517,10 @@ class Tree(
         # new_seed_node.add_child(old_head, edge_length=length2)
         new_seed_node.add_child(old_head)
         old_head.edge.length = length2
+        if is_bipartitions_current:
+            # the nodes changed are on the path from the new seed node to the
+            # old one, along which the bipartitions are updated on rerooting
+            self._stamp_bipartition_encoding()
         self.reroot_at_node(new_seed_node,
                 update_bipartitions=update_bipartitions,
                 suppress_unifurcations=suppress_unifurcations)
@@ -5077,8 +5586,9 @@ class Tree(
 
         assert break_on_node is not None or target_edge is not None
 
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         if break_on_node:
-            self.reseed_at(break_on_node, update_bipartitions=False, suppress_unifurcations=suppress_unifurcations)
+            self.reseed_at(break_on_node, update_bipartitions=is_bipartitions_current, suppress_unifurcations=suppress_unifurcations)
             new_seed_node = break_on_node
         else:
             tail_node_edge_len = target_edge.length - head_node_edge_len
@@ -5092,13 +5602,26 @@ class Tree(
             # old_tail_node.add_child(new_seed_node, edge_length=tail_node_edge_len)
             old_tail_node.add_child(new_seed_node)
             new_seed_node.edge.length = tail_node_edge_len
+            if is_bipartitions_current:
+                # the nodes changed are on the path from the new seed node to
+                # the old one, along which the bipartitions are updated on
+                # reseeding
+                self._stamp_bipartition_encoding()
             self.reseed_at(
-                    new_seed_node, update_bipartitions=False,
+                    new_seed_node, update_bipartitions=is_bipartitions_current,
                     suppress_unifurcations=suppress_unifurcations,
                     collapse_unrooted_basal_bifurcation=False,
                     )
         self.is_rooted = True
-        if update_bipartitions:
+        if is_bipartitions_current and self._is_bipartition_encoding_current():
+            # only to recompile the bipartitions as rooted ones, if need be
+            self._update_bipartitions_incrementally(
+                    changed_nodes=(),
+                    removed_nodes=(),
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation,
+                    )
+        elif update_bipartitions:
             self.update_bipartitions(
                     suppress_unifurcations=False,
                     collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation,
@@ -5238,11 +5761,37 @@ class Tree(
             raise ValueError("Tried to remove an non-existing or null node")
         if node._parent_node is None:
             raise TypeError('Node has no parent and is implicit root: cannot be pruned')
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
+        pruned_parent_nodes = [node._parent_node]
         node._parent_node.remove_child(node)
-        if suppress_unifurcations:
-            self.suppress_unifurcations()
-        if update_bipartitions:
-            self.update_bipartitions()
+        self._update_pruned_tree(
+                nodes_removed=[node],
+                pruned_parent_nodes=pruned_parent_nodes,
+                is_bipartitions_current=is_bipartitions_current,
+                update_bipartitions=update_bipartitions,
+                suppress_unifurcations=suppress_unifurcations)
+
+    def _update_pruned_tree(self,
+            nodes_removed,
+            pruned_parent_nodes,
+            is_bipartitions_current,
+            update_bipartitions,
+            suppress_unifurcations):
+        # Suppresses unifurcations and updates bipartitions after
+        # ``nodes_removed`` have been removed from ``pruned_parent_nodes``: only
+        # along the paths from these to the seed node if the bipartitions were
+        # current before.
+        if is_bipartitions_current:
+            # (unifurcations are always suppressed when updating bipartitions)
+            self._update_bipartitions_incrementally(
+                    changed_nodes=pruned_parent_nodes,
+                    removed_nodes=nodes_removed,
+                    is_collapse_after_suppression=suppress_unifurcations)
+        else:
+            if suppress_unifurcations:
+                self.suppress_unifurcations()
+            if update_bipartitions:
+                self.update_bipartitions()
 
     def filter_leaf_nodes(
             self,
@@ -5279,23 +5828,28 @@ class Tree(
         nds : list[|Node|]
             List of nodes removed.
         """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         nodes_removed = []
+        pruned_parent_nodes = []
         while True:
             is_nodes_deleted = False
             nodes_to_remove = [nd for nd in self.leaf_node_iter() if not filter_fn(nd)]
             for nd in nodes_to_remove:
                 if nd.edge.tail_node is None:
                     raise error.SeedNodeDeletionException("Attempting to remove seed node or node without parent")
+                pruned_parent_nodes.append(nd.edge.tail_node)
                 nd.edge.tail_node.remove_child(nd)
             if nodes_to_remove:
                 nodes_removed += nodes_to_remove
                 is_nodes_deleted = True
             if not is_nodes_deleted or not recursive:
                 break
-        if suppress_unifurcations:
-            self.suppress_unifurcations()
-        if update_bipartitions:
-            self.update_bipartitions()
+        self._update_pruned_tree(
+                nodes_removed=nodes_removed,
+                pruned_parent_nodes=pruned_parent_nodes,
+                is_bipartitions_current=is_bipartitions_current,
+                update_bipartitions=update_bipartitions,
+                suppress_unifurcations=suppress_unifurcations)
         return nodes_removed
 
     def prune_leaves_without_taxa(self,
@@ -5306,30 +5860,54 @@ class Tree(
         Removes all terminal nodes that have their ``taxon`` attribute set to
         |None|.
         """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         nodes_removed = []
+        pruned_parent_nodes = []
+        self._prune_leaves_without_taxa(
+                recursive=recursive,
+                nodes_removed=nodes_removed,
+                pruned_parent_nodes=pruned_parent_nodes)
+        self._update_pruned_tree(
+                nodes_removed=nodes_removed,
+                pruned_parent_nodes=pruned_parent_nodes,
+                is_bipartitions_current=is_bipartitions_current,
+                update_bipartitions=update_bipartitions,
+                suppress_unifurcations=suppress_unifurcations)
+        return nodes_removed
+
+    def _prune_leaves_without_taxa(self, recursive, nodes_removed, pruned_parent_nodes):
         while True:
             nodes_to_remove = []
             for nd in self.leaf_node_iter():
                 if nd.taxon is None:
                     nodes_to_remove.append(nd)
             for nd in nodes_to_remove:
+                pruned_parent_nodes.append(nd.edge.tail_node)
                 nd.edge.tail_node.remove_child(nd)
             nodes_removed += nodes_to_remove
             if not nodes_to_remove or not recursive:
                 break
-        if suppress_unifurcations:
-            self.suppress_unifurcations()
-        if update_bipartitions:
-            self.update_bipartitions()
-        return nodes_removed
 
     def prune_nodes(self, nodes, prune_leaves_without_taxa=False, update_bipartitions=False, suppress_unifurcations=True):
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
+        nodes_removed = []
+        pruned_parent_nodes = []
         for nd in nodes:
             if nd.edge.tail_node is None:
                 raise Exception("Attempting to remove root node or node without parent")
+            pruned_parent_nodes.append(nd.edge.tail_node)
             nd.edge.tail_node.remove_child(nd)
+            nodes_removed.append(nd)
         if prune_leaves_without_taxa:
-            self.prune_leaves_without_taxa(update_bipartitions=update_bipartitions,
+            self._prune_leaves_without_taxa(
+                    recursive=True,
+                    nodes_removed=nodes_removed,
+                    pruned_parent_nodes=pruned_parent_nodes)
+            self._update_pruned_tree(
+                    nodes_removed=nodes_removed,
+                    pruned_parent_nodes=pruned_parent_nodes,
+                    is_bipartitions_current=is_bipartitions_current,
+                    update_bipartitions=update_bipartitions,
                     suppress_unifurcations=suppress_unifurcations)
 
     def prune_taxa(self,
@@ -5342,16 +5920,28 @@ class Tree(
         Removes terminal nodes associated with Taxon objects given by the container
         ``taxa`` (which can be any iterable, including a TaxonNamespace object) from ``self``.
         """
+        is_bipartitions_current = update_bipartitions and self._is_bipartition_encoding_current()
         taxa = set(taxa)
-        nodes_to_remove = []
+        nodes_removed = []
+        pruned_parent_nodes = []
         for nd in self.postorder_node_iter():
             if (
                 ((is_apply_filter_to_internal_nodes and nd._child_nodes)
                 or (is_apply_filter_to_leaf_nodes and not nd._child_nodes))
                 and (nd.taxon and nd.taxon in taxa)
                 ):
+                    pruned_parent_nodes.append(nd.edge.tail_node)
                     nd.edge.tail_node.remove_child(nd)
-        self.prune_leaves_without_taxa(update_bipartitions=update_bipartitions,
+                    nodes_removed.append(nd)
+        self._prune_leaves_without_taxa(
+                recursive=True,
+                nodes_removed=nodes_removed,
+                pruned_parent_nodes=pruned_parent_nodes)
+        self._update_pruned_tree(
+                nodes_removed=nodes_removed,
+                pruned_parent_nodes=pruned_parent_nodes,
+                is_bipartitions_current=is_bipartitions_current,
+                update_bipartitions=update_bipartitions,
                 suppress_unifurcations=suppress_unifurcations)
 
     def prune_taxa_with_labels(self,
@@ -5472,6 +6062,8 @@ class Tree(
                 total += len(nd._child_nodes)
                 node_desc_counts[nd] = total
                 nd._child_nodes.sort(key=lambda n: node_desc_counts[n], reverse=not ascending)
+        # (only the child nodes of nodes already visited have been reordered)
+        self._get_structure_version()[0] += 1
 
     def truncate_from_root(self, distance_from_root):
         self.calc_node_root_distances()
@@ -5553,6 +6145,21 @@ class Tree(
         from dendropy.calculate.phylogeneticdistance import NodeDistanceMatrix
         return NodeDistanceMatrix.from_tree(tree=self)
 
+    def mrca_index(self):
+        """
+        Returns a |MrcaIndex| instance based on the tree (in its current
+        state), for constant-time queries of the most-recent common ancestors
+        of nodes or taxa, and of the distances between nodes.
+
+        Returns
+        -------
+        mrca_index : a |MrcaIndex| instance
+            A |MrcaIndex| instance corresponding to the tree in its current
+            state.
+        """
+        from dendropy.calculate.phylogeneticdistance import MrcaIndex
+        return MrcaIndex.from_tree(tree=self)
+
     def calc_node_ages(self,
             ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
             is_force_max_age=False,
@@ -5794,6 +6401,261 @@ class Tree(
     ###########################################################################
     ### Bipartition Management
 
+    # The bipartition encoding, the taxon namespace, the seed node and the
+    # structure version of the tree and its count (see
+    # `Tree._get_structure_version()`) when the (immutable) bipartitions of a
+    # tree without nodes of outdegree one were last encoded. While these are
+    # unchanged, the bipartitions are current, and rerooting and pruning
+    # operations update them along the paths affected instead of re-encoding
+    # them over the whole tree. Note that reassigning the taxa of nodes is
+    # not tracked.
+    _bipartition_encoding_state = None
+
+    def _stamp_bipartition_encoding(self):
+        version = self._get_structure_version()
+        self._bipartition_encoding_state = (
+                self.bipartition_encoding,
+                self._taxon_namespace,
+                self._seed_node,
+                version,
+                version[0])
+
+    def _is_bipartition_encoding_current(self):
+        state = self._bipartition_encoding_state
+        return (state is not None
+                and state[0] is self.bipartition_encoding
+                and state[1] is self._taxon_namespace
+                and state[2] is self._seed_node
+                and state[3] is self._get_structure_version()
+                and state[4] == state[3][0]
+                and bool(self.bipartition_encoding))
+
+    def _update_bipartitions_incrementally(self,
+            changed_nodes,
+            removed_nodes,
+            suppress_unifurcations=True,
+            collapse_unrooted_basal_bifurcation=True,
+            is_collapse_after_suppression=False):
+        """
+        Updates current bipartitions after the child nodes of
+        ``changed_nodes`` have been changed (or these nodes added to the tree)
+        and ``removed_nodes`` have been removed from the tree, with the same
+        results as `Tree.encode_bipartitions()`.
+
+        Only the bipartitions of the edges subtending ``changed_nodes`` and
+        their ancestors are recalculated (in place), and those of the edges
+        subtending ``removed_nodes`` and their descendents dropped, along with
+        their entries in ``bipartition_edge_map`` and
+        ``split_bitmask_edge_map`` (if these have been built). The rest of the
+        bipartitions are only recompiled if the leafset or the rootedness of
+        the tree have changed, without traversing the tree. Nodes of
+        outdegree one can only result from the changes, and so are only
+        looked for among ``changed_nodes`` and their ancestors. These are
+        suppressed after collapsing a basal bifurcation, as on encoding, unless
+        ``is_collapse_after_suppression`` is |True|.
+        """
+        bipartition_encoding = self.bipartition_encoding
+        old_tree_leafset_bitmask = bipartition_encoding[0]._tree_leafset_bitmask
+        old_is_rooted = bipartition_encoding[0]._is_rooted
+        changed_nodes = list(changed_nodes)
+        removed_nodes = list(removed_nodes)
+        def _collapse_basal_bifurcation():
+            seed_node = self._seed_node
+            if (not collapse_unrooted_basal_bifurcation
+                    or self._is_rooted
+                    or len(seed_node._child_nodes) != 2):
+                return []
+            child_nodes = list(seed_node._child_nodes)
+            self.collapse_basal_bifurcation()
+            return [nd for nd in child_nodes if nd._parent_node is not seed_node]
+        if not is_collapse_after_suppression:
+            collapsed_nodes = _collapse_basal_bifurcation()
+            if collapsed_nodes:
+                changed_nodes.append(self._seed_node)
+                removed_nodes.extend(collapsed_nodes)
+        seed_node = self._seed_node
+
+        # the nodes (still in the tree) to update, parents before children
+        nodes_to_update = []
+        dirty_nodes = set()
+        for nd in changed_nodes:
+            path = []
+            while nd not in dirty_nodes:
+                path.append(nd)
+                if nd._parent_node is None:
+                    if nd is not seed_node:
+                        path = []
+                    break
+                nd = nd._parent_node
+            dirty_nodes.update(path)
+            path.reverse()
+            nodes_to_update.extend(path)
+        nodes_to_update.reverse()
+
+        if suppress_unifurcations:
+            for nd in nodes_to_update:
+                child_nodes = nd._child_nodes
+                if len(child_nodes) != 1:
+                    continue
+                if nd.edge.length is not None:
+                    if child_nodes[0].edge.length is None:
+                        child_nodes[0].edge.length = nd.edge.length
+                    else:
+                        child_nodes[0].edge.length += nd.edge.length
+                if nd._parent_node is not None:
+                    parent = nd._parent_node
+                    pos = parent._child_nodes.index(nd)
+                    parent.remove_child(nd)
+                    parent.insert_child(index=pos, node=child_nodes[0])
+                    nd._parent_node = None
+                else:
+                    self.seed_node = child_nodes[0]
+                    self.seed_node._parent_node = None
+                dirty_nodes.discard(nd)
+                removed_nodes.append(nd)
+            nodes_to_update = [nd for nd in nodes_to_update if nd in dirty_nodes]
+        seed_node = self._seed_node
+        if is_collapse_after_suppression:
+            collapsed_nodes = _collapse_basal_bifurcation()
+            if collapsed_nodes:
+                removed_nodes.extend(collapsed_nodes)
+                dirty_nodes.difference_update(collapsed_nodes)
+                nodes_to_update = [nd for nd in nodes_to_update if nd in dirty_nodes]
+                if seed_node not in dirty_nodes:
+                    dirty_nodes.add(seed_node)
+                    nodes_to_update.append(seed_node)
+
+        # edges no longer in the tree (skipping child nodes since moved)
+        dropped_edges = []
+        to_drop = list(removed_nodes)
+        while to_drop:
+            nd = to_drop.pop()
+            dropped_edges.append(nd.edge)
+            to_drop.extend(ch for ch in nd._child_nodes if ch._parent_node is nd)
+
+        taxon_namespace = self._taxon_namespace
+        leafset_bitmasks = {}
+        for nd in nodes_to_update:
+            if nd._child_nodes:
+                leafset_bitmask = 0
+                for ch in nd._child_nodes:
+                    if ch in leafset_bitmasks:
+                        leafset_bitmask |= leafset_bitmasks[ch]
+                    else:
+                        leafset_bitmask |= ch.edge.bipartition._leafset_bitmask
+            elif nd.taxon:
+                leafset_bitmask = taxon_namespace.taxon_bitmask(nd.taxon)
+            else:
+                leafset_bitmask = 0
+            leafset_bitmasks[nd] = leafset_bitmask
+        if seed_node in leafset_bitmasks:
+            tree_leafset_bitmask = leafset_bitmasks[seed_node]
+        else:
+            tree_leafset_bitmask = seed_node.edge.bipartition._leafset_bitmask
+        if not tree_leafset_bitmask:
+            # nothing to normalize splits against
+            return self.encode_bipartitions(
+                    suppress_unifurcations=suppress_unifurcations,
+                    collapse_unrooted_basal_bifurcation=False)
+
+        # The edge maps are only kept up to date if there is one entry per
+        # edge, before and after: edges with the same splits (e.g., both
+        # edges of the basal bifurcation of an unrooted tree) share entries,
+        # and the entries of edges not updated may then be dropped with those
+        # of edges that are.
+        split_bitmask_edge_map = self._split_bitmask_edge_map
+        bipartition_edge_map = self._bipartition_edge_map
+        if (not split_bitmask_edge_map
+                or not bipartition_edge_map
+                or len(split_bitmask_edge_map) != len(bipartition_encoding)
+                or len(bipartition_edge_map) != len(bipartition_encoding)):
+            # rebuilt on demand
+            split_bitmask_edge_map = None
+            bipartition_edge_map = None
+            self._split_bitmask_edge_map = None
+            self._bipartition_edge_map = None
+        edges_to_map = []
+        def _unmap(bipartition, edge):
+            if split_bitmask_edge_map.get(bipartition._split_bitmask) is edge:
+                del split_bitmask_edge_map[bipartition._split_bitmask]
+            if bipartition_edge_map.get(bipartition) is edge:
+                del bipartition_edge_map[bipartition]
+
+        dropped_bipartition_ids = set()
+        for edge in dropped_edges:
+            if edge._bipartition is not None:
+                dropped_bipartition_ids.add(id(edge._bipartition))
+                if split_bitmask_edge_map is not None:
+                    _unmap(edge._bipartition, edge)
+        updated_bipartition_ids = set()
+        new_bipartitions = []
+        for nd in nodes_to_update:
+            edge = nd.edge
+            if edge._bipartition is None:
+                edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
+                new_bipartitions.append(edge.bipartition)
+            else:
+                updated_bipartition_ids.add(id(edge._bipartition))
+                if split_bitmask_edge_map is not None:
+                    _unmap(edge._bipartition, edge)
+            edges_to_map.append(edge)
+
+        is_rooted = self._is_rooted
+        if tree_leafset_bitmask != old_tree_leafset_bitmask or is_rooted != old_is_rooted:
+            # recompile the splits of all other edges
+            lowest_relevant_bit = bitprocessing.least_significant_set_bit(tree_leafset_bitmask)
+            split_bitmasks_to_set = []
+            for bipartition in bipartition_encoding:
+                if (id(bipartition) in updated_bipartition_ids
+                        or id(bipartition) in dropped_bipartition_ids):
+                    continue
+                if is_rooted:
+                    split_bitmask = bipartition._leafset_bitmask
+                else:
+                    split_bitmask = Bipartition.normalize_bitmask(
+                            bitmask=bipartition._leafset_bitmask,
+                            fill_bitmask=tree_leafset_bitmask,
+                            lowest_relevant_bit=lowest_relevant_bit)
+                if split_bitmask != bipartition._split_bitmask:
+                    if split_bitmask_edge_map is not None:
+                        edge = bipartition_edge_map.get(bipartition)
+                        if edge is not None and edge._bipartition is bipartition:
+                            _unmap(bipartition, edge)
+                            edges_to_map.append(edge)
+                    split_bitmasks_to_set.append((bipartition, split_bitmask))
+                bipartition._tree_leafset_bitmask = tree_leafset_bitmask
+                bipartition._lowest_relevant_bit = lowest_relevant_bit
+                bipartition._is_rooted = is_rooted
+            for bipartition, split_bitmask in split_bitmasks_to_set:
+                bipartition._split_bitmask = split_bitmask
+
+        for nd in nodes_to_update:
+            bipartition = nd.edge._bipartition
+            bipartition.is_mutable = True
+            bipartition._leafset_bitmask = leafset_bitmasks[nd]
+            bipartition._is_rooted = is_rooted
+        for nd in nodes_to_update:
+            self._compile_immutable_bipartition_for_edge(nd.edge)
+        if split_bitmask_edge_map is not None:
+            for edge in edges_to_map:
+                bipartition_edge_map[edge._bipartition] = edge
+                split_bitmask_edge_map[edge._bipartition._split_bitmask] = edge
+
+        if dropped_bipartition_ids:
+            bipartition_encoding = [b for b in bipartition_encoding if id(b) not in dropped_bipartition_ids]
+        bipartition_encoding.extend(new_bipartitions)
+        self.bipartition_encoding = bipartition_encoding
+        if split_bitmask_edge_map is not None and (
+                len(split_bitmask_edge_map) != len(bipartition_encoding)
+                or len(bipartition_edge_map) != len(bipartition_encoding)):
+            self._split_bitmask_edge_map = None
+            self._bipartition_edge_map = None
+        if any(len(nd._child_nodes) == 1 for nd in nodes_to_update):
+            self._bipartition_encoding_state = None
+        else:
+            self._stamp_bipartition_encoding()
+        return self.bipartition_encoding
+
     def _compile_mutable_bipartition_for_edge(self, edge):
         edge.bipartition.compile_split_bitmask(
                 tree_leafset_bitmask=self.seed_node.edge.bipartition._leafset_bitmask,
@@ -5843,6 +6705,7 @@ class Tree(
         """
         self._split_bitmask_edge_map = None
         self._bipartition_edge_map = None
+        self._bipartition_encoding_state = None
         taxon_namespace = self._taxon_namespace
         seed_node = self.seed_node
         if not seed_node:
@@ -5863,6 +6726,7 @@ class Tree(
             # two nodes).
             self.collapse_basal_bifurcation()
         tree_edges = []
+        is_unifurcations_encoded = False
         for edge in self.postorder_edge_iter():
             leafset_bitmask = 0
             head_node = edge._head_node
@@ -5892,6 +6756,8 @@ class Tree(
                         leafset_bitmask = taxon_namespace.taxon_bitmask(taxon)
                 else:
                     tree_edges.append(edge)
+                    if num_children == 1:
+                        is_unifurcations_encoded = True
                     for child in child_nodes:
                         leafset_bitmask |= child.edge.bipartition._leafset_bitmask
                 edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
@@ -5912,6 +6778,13 @@ class Tree(
         else:
             # self.bipartition_encoding = dict(zip(map(self._compile_bipartition_for_edge, tree_edges), tree_edges))
             self.bipartition_encoding = list(map(_compile_bipartition, tree_edges))
+            if not is_unifurcations_encoded and not is_bipartitions_mutable:
+                # changes to the nodes are to be counted in the structure
+                # version of the tree while the bipartitions are current
+                version = self._get_structure_version()
+                for edge in tree_edges:
+                    edge._head_node._structure_version = version
+                self._stamp_bipartition_encoding()
         return self.bipartition_encoding
 
     def update_bipartitions(self, *args, **kwargs):
@@ -5963,6 +6836,9 @@ class Tree(
         """
         Returns number of tips on tree (could be less than number of taxa in namespace).
         """
+        node_order = self._get_node_order(True)
+        if node_order is not None:
+            return len(node_order[2])
         count = 0
         for nd in self.seed_node.leaf_iter():
             count += 1
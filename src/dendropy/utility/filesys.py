@@ -26,7 +26,18 @@ import time
 import os
 import sys
 import re
+import io
+import gzip
+import bz2
 from threading import Event, Thread, Lock
+try:
+    from Queue import Queue, Full  # python 2.x
+except ImportError:
+    from queue import Queue, Full  # python 3.x
+try:
+    import lzma
+except ImportError:
+    lzma = None
 
 from dendropy.utility import messaging
 _LOG = messaging.get_logger(__name__)
@@ -60,6 +71,134 @@ def pre_py34_open(file,
             mode=mode,
             buffering=buffering)
 
+###############################################################################
+## Compressed Files
+
+# Leading bytes identifying each supported compression format
+COMPRESSION_FORMAT_MAGIC_NUMBERS = (
+    ("gzip", b"\x1f\x8b"),
+    ("bz2", b"BZh"),
+    ("xz", b"\xfd7zXZ\x00"),
+)
+
+def get_compression_format(path):
+    """
+    Returns the compression format ("gzip", "bz2", or "xz") of the file at
+    ``path``, as identified by its leading bytes, or |None| if the file is not
+    compressed in any of these formats.
+    """
+    if not os.path.isfile(path):
+        # do not consume data from pipes, devices, etc.
+        return None
+    with open(path, "rb") as src:
+        head = src.read(max(len(magic) for _, magic in COMPRESSION_FORMAT_MAGIC_NUMBERS))
+    for compression_format, magic in COMPRESSION_FORMAT_MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return compression_format
+    return None
+
+def open_decompressed(path, compression_format):
+    """
+    Opens the file at ``path``, compressed in ``compression_format``, and
+    returns a binary file-like object from which the decompressed data can be
+    read (decompression is carried out incrementally, as the data is read).
+    """
+    if compression_format == "gzip":
+        return gzip.GzipFile(path, "rb")
+    elif compression_format == "bz2":
+        return bz2.BZ2File(path, "rb")
+    elif compression_format == "xz":
+        if lzma is None:
+            raise NotImplementedError("'lzma' module is required to read xz-compressed data: '{}'".format(path))
+        return lzma.LZMAFile(path, "rb")
+    else:
+        raise ValueError("Unsupported compression format: '{}'".format(compression_format))
+
+class BackgroundReader(io.RawIOBase):
+    """
+    Read-only binary file-like object that reads the data of another binary
+    file-like object, ``src``, in a background thread, buffering up to
+    ``max_chunks`` chunks of ``chunk_size`` bytes ahead of the reader. Used to
+    overlap the decompression of compressed data with its parsing.
+    """
+
+    def __init__(self, src, chunk_size=1 << 20, max_chunks=4):
+        io.RawIOBase.__init__(self)
+        self.name = getattr(src, "name", None)
+        self._src = src
+        self._chunk_size = chunk_size
+        self._chunks = Queue(maxsize=max_chunks)
+        self._stop_event = Event()
+        self._chunk = b""
+        self._chunk_pos = 0
+        self._is_eof = False
+        self._thread = Thread(target=self._read_chunks)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _read_chunks(self):
+        try:
+            while not self._stop_event.is_set():
+                chunk = self._src.read(self._chunk_size)
+                self._put_chunk(chunk)
+                if not chunk:
+                    break
+        except Exception as e:
+            self._put_chunk(e)
+
+    def _put_chunk(self, chunk):
+        while not self._stop_event.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return
+            except Full:
+                pass
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._chunk_pos >= len(self._chunk):
+            if self._is_eof:
+                return 0
+            chunk = self._chunks.get()
+            if isinstance(chunk, Exception):
+                self._is_eof = True
+                raise chunk
+            if not chunk:
+                self._is_eof = True
+                return 0
+            self._chunk = chunk
+            self._chunk_pos = 0
+        end = min(len(self._chunk), self._chunk_pos + len(b))
+        n = end - self._chunk_pos
+        memoryview(b)[:n] = self._chunk[self._chunk_pos:end]
+        self._chunk_pos = end
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop_event.set()
+            self._thread.join()
+            self._src.close()
+        io.RawIOBase.close(self)
+
+def open_for_reading(path, threaded_decompression=False):
+    """
+    Opens the file at ``path`` for reading as text (with universal newlines).
+    If the file is compressed (in gzip, bz2, or xz format, as identified by
+    its leading bytes), then it is decompressed on the fly as it is read, in
+    a background thread if ``threaded_decompression`` is |True|.
+    """
+    compression_format = get_compression_format(path)
+    if compression_format is not None:
+        src = open_decompressed(path, compression_format)
+        if threaded_decompression:
+            src = io.BufferedReader(BackgroundReader(src))
+        return io.TextIOWrapper(src, newline=None)
+    else:
+        return open(path, "r", newline=None)
+
 ###############################################################################
 ## LineReadingThread
 
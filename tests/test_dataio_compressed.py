@@ -0,0 +1,166 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading compressed data files.
+"""
+
+import os
+import sys
+import io
+import gzip
+import bz2
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import filesys
+from dendropy.dataio import treeindex
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+class CompressedFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def compress_source(self, src_path, compression_format):
+        with open(src_path, "rb") as src:
+            data = src.read()
+        path = os.path.join(self.temp_dir, os.path.basename(src_path) + "." + compression_format)
+        if compression_format == "gzip":
+            dest = gzip.GzipFile(path, "wb")
+        elif compression_format == "bz2":
+            dest = bz2.BZ2File(path, "wb")
+        else:
+            dest = lzma.LZMAFile(path, "wb")
+        with dest:
+            dest.write(data)
+        return path
+
+    def iter_compression_formats(self):
+        for compression_format in ("gzip", "bz2", "xz"):
+            if compression_format == "xz" and lzma is None:
+                continue
+            yield compression_format
+
+class CompressionFormatTest(CompressedFileTestCase):
+
+    def test_get_compression_format(self):
+        src_path = pathmap.tree_source_path("pythonidae.reference-trees.newick")
+        self.assertIs(filesys.get_compression_format(src_path), None)
+        for compression_format in self.iter_compression_formats():
+            path = self.compress_source(src_path, compression_format)
+            self.assertEqual(filesys.get_compression_format(path), compression_format)
+
+    def test_background_reader(self):
+        data = b"".join(str(i).encode("ascii") for i in range(10000))
+        src = filesys.BackgroundReader(io.BytesIO(data), chunk_size=100, max_chunks=2)
+        with io.BufferedReader(src) as f:
+            self.assertEqual(f.read(), data)
+        src = filesys.BackgroundReader(io.BytesIO(data), chunk_size=100, max_chunks=2)
+        with io.BufferedReader(src, buffer_size=10) as f:
+            self.assertEqual(f.read(5), data[:5])
+        self.assertTrue(src.closed)
+
+class CompressedReadingTest(CompressedFileTestCase):
+
+    def check_trees(self, trees1, trees2):
+        self.assertEqual(len(trees1), len(trees2))
+        for t1, t2 in zip(trees1, trees2):
+            self.assertEqual(t1.label, t2.label)
+            self.assertEqual(t1.as_string("newick"), t2.as_string("newick"))
+
+    def test_tree_list_get(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.reference-trees.newick", "newick"),
+                ):
+            src_path = pathmap.tree_source_path(filename)
+            expected = dendropy.TreeList.get(path=src_path, schema=schema)
+            for compression_format in self.iter_compression_formats():
+                path = self.compress_source(src_path, compression_format)
+                for threaded_decompression in (False, True):
+                    trees = dendropy.TreeList.get(path=path,
+                            schema=schema,
+                            threaded_decompression=threaded_decompression)
+                    self.check_trees(trees, expected)
+                trees = dendropy.TreeList.get(path=path,
+                        schema=schema,
+                        tree_offset=3,
+                        use_tree_index=True)
+                self.check_trees(trees, expected[3:])
+
+    def test_yield_from_files(self):
+        src_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        taxon_namespace = dendropy.TaxonNamespace()
+        expected = list(dendropy.Tree.yield_from_files(
+                files=[src_path],
+                schema="nexus",
+                taxon_namespace=taxon_namespace))
+        for compression_format in self.iter_compression_formats():
+            path = self.compress_source(src_path, compression_format)
+            for threaded_decompression in (False, True):
+                trees = list(dendropy.Tree.yield_from_files(
+                        files=[path],
+                        schema="nexus",
+                        taxon_namespace=taxon_namespace,
+                        threaded_decompression=threaded_decompression))
+                self.check_trees(trees, expected)
+
+    def test_tree_array_read_from_files(self):
+        src_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        path = self.compress_source(src_path, "gzip")
+        self.assertFalse(treeindex.is_indexable_source(path, "nexus"))
+        with self.assertRaises(treeindex.TreeFileIndexError):
+            treeindex.TreeFileIndex.build(path=path, schema="nexus")
+        expected = dendropy.TreeArray()
+        expected.read_from_files(files=[src_path], schema="nexus", tree_offset=2)
+        tree_array = dendropy.TreeArray()
+        tree_array.read_from_files(files=[path], schema="nexus", tree_offset=2,
+                num_processes=2)
+        self.assertEqual(len(tree_array), len(expected))
+        self.assertEqual(tree_array.split_distribution.split_counts,
+                expected.split_distribution.split_counts)
+
+    def test_char_matrix_get(self):
+        for filename, schema in (
+                ("pythonidae.chars.fasta", "fasta"),
+                ("pythonidae.chars.nexus", "nexus"),
+                ):
+            src_path = pathmap.char_source_path(filename)
+            expected = dendropy.DnaCharacterMatrix.get(path=src_path, schema=schema)
+            for compression_format in self.iter_compression_formats():
+                path = self.compress_source(src_path, compression_format)
+                m = dendropy.DnaCharacterMatrix.get(path=path, schema=schema)
+                self.assertEqual(
+                        [t.label for t in m.taxon_namespace],
+                        [t.label for t in expected.taxon_namespace])
+                for t1, t2 in zip(m, expected):
+                    self.assertEqual(str(m[t1]), str(expected[t2]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading and writing the binary tree serialization format.
+"""
+
+import os
+import sys
+import gzip
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.dataio import dendropybinaryprocessing
+from dendropy.utility.textprocessing import StringIO
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class DendroPyBinaryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.src_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        self.trees = dendropy.TreeList.get(path=self.src_path, schema="nexus")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_binary(self, trees, filename="trees.dpyb", **kwargs):
+        path = os.path.join(self.temp_dir, filename)
+        trees.write(path=path, schema="dendropy-binary", **kwargs)
+        return path
+
+    def assert_same_trees(self, trees1, trees2):
+        self.assertEqual(len(trees1), len(trees2))
+        self.assertEqual(
+                [t.label for t in trees1.taxon_namespace],
+                [t.label for t in trees2.taxon_namespace])
+        for t1, t2 in zip(trees1, trees2):
+            self.assertEqual(t1.label, t2.label)
+            self.assertEqual(t1.is_rooted, t2.is_rooted)
+            self.assertEqual(t1.weight, t2.weight)
+            self.assertEqual(
+                    t1.as_string("newick", suppress_annotations=True),
+                    t2.as_string("newick", suppress_annotations=True))
+
+class DendroPyBinaryRoundTripTest(DendroPyBinaryTestCase):
+
+    def test_round_trip(self):
+        path = self.write_binary(self.trees)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary")
+        self.assert_same_trees(self.trees, trees2)
+
+    def test_round_trip_stream(self):
+        path = self.write_binary(self.trees)
+        with open(path, "rb") as src:
+            trees2 = dendropy.TreeList.get(file=src, schema="dendropy-binary")
+        self.assert_same_trees(self.trees, trees2)
+
+    def test_suppress_edge_lengths(self):
+        path = self.write_binary(self.trees, suppress_edge_lengths=True)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary")
+        for tree in trees2:
+            for edge in tree.postorder_edge_iter():
+                self.assertIs(edge.length, None)
+
+    def test_labels_and_rooting(self):
+        tree = dendropy.Tree.get(
+                data="[&R] ((A,B)ab:1,(C,D)cd:2)root;",
+                schema="newick")
+        tree.label = "t1"
+        tree.weight = 0.5
+        for edge in tree.postorder_edge_iter():
+            edge.label = "e"
+        trees = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        trees.label = "collection"
+        path = self.write_binary(trees)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary")
+        self.assertEqual(trees2.label, "collection")
+        self.assert_same_trees(trees, trees2)
+        self.assertEqual(
+                [nd.label for nd in trees2[0].preorder_node_iter()],
+                [nd.label for nd in tree.preorder_node_iter()])
+        self.assertEqual(
+                [e.label for e in trees2[0].preorder_edge_iter()],
+                [e.label for e in tree.preorder_edge_iter()])
+
+    def test_duplicate_taxon_labels(self):
+        tree = dendropy.Tree.get(data="((A,B),(C,D));", schema="newick")
+        for taxon in tree.taxon_namespace[2:]:
+            taxon.label = "A"
+        trees = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        path = self.write_binary(trees)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary")
+        self.assertEqual(len(trees2.taxon_namespace), 4)
+        self.assert_same_trees(trees, trees2)
+        taxon_indexes = dict((taxon, idx) for idx, taxon in enumerate(trees2.taxon_namespace))
+        self.assertEqual(
+                [taxon_indexes[leaf.taxon] for leaf in trees2[0].leaf_node_iter()],
+                [list(tree.taxon_namespace).index(leaf.taxon) for leaf in tree.leaf_node_iter()])
+        # read again into the same namespace: the taxa are matched
+        trees3 = dendropy.TreeList.get(path=path,
+                schema="dendropy-binary",
+                taxon_namespace=trees2.taxon_namespace)
+        self.assertEqual(len(trees2.taxon_namespace), 4)
+        self.assertEqual(
+                [leaf.taxon for leaf in trees3[0].leaf_node_iter()],
+                [leaf.taxon for leaf in trees2[0].leaf_node_iter()])
+
+    def test_annotations(self):
+        tree = dendropy.Tree.get(
+                data="[&R] ((A[&x=1],B)[&support=0.95,note=abc],(C,D)[&support=0.5]);",
+                schema="newick",
+                extract_comment_metadata=True)
+        tree.annotations.add_new("source", "test")
+        trees = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        path = self.write_binary(trees)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary")
+        tree2 = trees2[0]
+        self.assertEqual(tree2.annotations.get_value("source"), "test")
+        for nd1, nd2 in zip(tree.preorder_node_iter(), tree2.preorder_node_iter()):
+            self.assertEqual(
+                    dict((a.name, a.value) for a in nd1.annotations),
+                    dict((a.name, a.value) for a in nd2.annotations))
+        trees3 = dendropy.TreeList.get(path=self.write_binary(trees, "t2.dpyb", suppress_annotations=True),
+                schema="dendropy-binary")
+        for nd in trees3[0].preorder_node_iter():
+            self.assertFalse(nd.has_annotations)
+
+    def test_deferred_annotations_copy(self):
+        tree = dendropy.Tree.get(
+                data="((A,B)[&support=0.95],(C,D));",
+                schema="newick",
+                extract_comment_metadata=True)
+        trees = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        path = self.write_binary(trees)
+        tree2 = dendropy.Tree.get(path=path, schema="dendropy-binary")
+        tree3 = tree2.clone(depth=2)
+        values = [nd.annotations.get_value("support") for nd in tree3.preorder_node_iter() if nd.has_annotations]
+        self.assertEqual(values, ["0.95"])
+
+    def test_node_ages(self):
+        tree = dendropy.Tree.get(
+                data="[&R] ((A:1,B:1):2,(C:2,D:2):1);",
+                schema="newick")
+        tree.calc_node_ages()
+        trees = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        path = self.write_binary(trees, store_node_ages=True)
+        tree2 = dendropy.Tree.get(path=path, schema="dendropy-binary")
+        self.assertEqual(
+                [nd.age for nd in tree2.preorder_node_iter()],
+                [nd.age for nd in tree.preorder_node_iter()])
+
+    def test_compressed(self):
+        path = self.write_binary(self.trees)
+        with open(path, "rb") as src:
+            data = src.read()
+        gz_path = path + ".gz"
+        with gzip.GzipFile(gz_path, "wb") as dest:
+            dest.write(data)
+        trees2 = dendropy.TreeList.get(path=gz_path, schema="dendropy-binary")
+        self.assert_same_trees(self.trees, trees2)
+
+class DendroPyBinaryRandomAccessTest(DendroPyBinaryTestCase):
+
+    def test_tree_get_offset(self):
+        path = self.write_binary(self.trees)
+        for tree_offset in (0, 3, len(self.trees) - 1, -1):
+            tree = dendropy.Tree.get(path=path, schema="dendropy-binary", tree_offset=tree_offset)
+            self.assertEqual(
+                    tree.as_string("newick", suppress_annotations=True),
+                    self.trees[tree_offset].as_string("newick", suppress_annotations=True))
+
+    def test_tree_list_get_offset(self):
+        path = self.write_binary(self.trees)
+        trees2 = dendropy.TreeList.get(path=path, schema="dendropy-binary", tree_offset=2)
+        self.assertEqual(len(trees2), len(self.trees) - 2)
+        self.assertEqual(trees2[0].label, self.trees[2].label)
+        trees3 = dendropy.TreeList.get(path=path, schema="dendropy-binary", tree_offset=-3)
+        self.assertEqual([t.label for t in trees3], [t.label for t in self.trees[-3:]])
+
+    def test_offset_out_of_range(self):
+        path = self.write_binary(self.trees)
+        with self.assertRaises(IndexError):
+            dendropy.Tree.get(path=path, schema="dendropy-binary", tree_offset=len(self.trees))
+
+    def test_yield_from_files(self):
+        path = self.write_binary(self.trees)
+        labels = [t.label for t in dendropy.Tree.yield_from_files(
+                files=[path, path],
+                schema="dendropy-binary",
+                tree_offset=len(self.trees) - 2)]
+        self.assertEqual(labels, [t.label for t in self.trees[-2:]] * 2)
+
+    def test_tree_array(self):
+        path = self.write_binary(self.trees)
+        tree_array = dendropy.TreeArray(taxon_namespace=self.trees.taxon_namespace)
+        tree_array.read_from_files(files=[path], schema="dendropy-binary", tree_offset=1)
+        self.assertEqual(len(tree_array), len(self.trees) - 1)
+
+class DendroPyBinaryErrorTest(DendroPyBinaryTestCase):
+
+    def test_text_stream(self):
+        with self.assertRaises(TypeError):
+            dendropy.TreeList.get(file=StringIO("(A,B);"), schema="dendropy-binary")
+
+    def test_invalid_data(self):
+        with self.assertRaises(dendropybinaryprocessing.DendroPyBinaryFormatError):
+            dendropy.TreeList.get(path=self.src_path, schema="dendropy-binary")
+
+if __name__ == "__main__":
+    unittest.main()
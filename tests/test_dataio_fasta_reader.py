@@ -92,5 +92,53 @@ class FastaProteinReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+class FastaPackedSequenceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.src = ">a\nACGT\nN-?R\n\n>b\nTTG C\nAAAA\n"
+
+    def test_packed_values(self):
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=self.src, schema="fasta")
+        seq = char_matrix["a"]
+        self.assertIsNotNone(seq._packed_values)
+        self.assertEqual(len(seq), 8)
+        self.assertEqual(seq.symbols_as_string(), "ACGTN-?R")
+        self.assertEqual(char_matrix["b"].symbols_as_string(), "TTGCAAAA")
+        alphabet = dendropy.DNA_STATE_ALPHABET
+        self.assertIs(seq[0], alphabet["A"])
+        self.assertIs(seq[-1], alphabet["R"])
+        self.assertEqual(seq[1:3], [alphabet["C"], alphabet["G"]])
+        self.assertEqual([str(s) for s in seq], list("ACGTN-?R"))
+        self.assertIsNotNone(seq._packed_values)
+
+    def test_unpack_on_modification(self):
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=self.src, schema="fasta")
+        seq = char_matrix["a"]
+        seq.append(dendropy.DNA_STATE_ALPHABET["T"])
+        self.assertIsNone(seq._packed_values)
+        self.assertEqual(seq.symbols_as_string(), "ACGTN-?RT")
+        self.assertIsNone(seq.character_type_at(8))
+        self.assertFalse(seq.has_annotations_at(0))
+        self.assertEqual(char_matrix["b"].values()[:2],
+                [dendropy.DNA_STATE_ALPHABET["T"]] * 2)
+
+    def test_copy(self):
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=self.src, schema="fasta")
+        char_matrix2 = char_matrix.taxon_namespace_scoped_copy()
+        self.assertEqual(char_matrix2[0].symbols_as_string(), "ACGTN-?R")
+        char_matrix2[0][0] = dendropy.DNA_STATE_ALPHABET["G"]
+        self.assertEqual(char_matrix2[0].symbols_as_string(), "GCGTN-?R")
+        self.assertEqual(char_matrix[0].symbols_as_string(), "ACGTN-?R")
+
+    def test_unrecognized_symbol(self):
+        for src, col_num in (
+                (">a\nACGT\nAC J\n", 4),
+                (">a\nACGT\nAC\u00e9T\n", 3),
+                ):
+            with self.assertRaises(dendropy.utility.error.DataParseError) as cm:
+                dendropy.DnaCharacterMatrix.get(data=src, schema="fasta")
+            self.assertEqual(cm.exception.line_num, 3)
+            self.assertEqual(cm.exception.col_num, col_num)
+
 if __name__ == "__main__":
     unittest.main()
@@ -603,6 +603,49 @@ class CommentMetaDataTests(dendropytest.ExtendedTestCase):
         for idx, nd in enumerate(tree.postorder_node_iter()):
             self.assertEqual(nd.annotations.values_as_dict(), expected[idx])
 
+    def test_lazy_metadata(self):
+        for s in (self.figtree_metadata_str, self.nhx_metadata_str):
+            tree = dendropy.Tree.get_from_string(
+                    s,
+                    "newick",
+                    suppress_internal_node_taxa=True,
+                    suppress_leaf_node_taxa=True,
+                    extract_comment_metadata=True,
+                    lazy_comment_metadata=True)
+            for nd in tree.postorder_node_iter():
+                self.assertFalse(hasattr(nd, "_annotations"))
+                self.assertNotIn("&", "".join(nd.comments))
+            self.check_results(tree)
+
+    def test_lazy_metadata_copy(self):
+        tree1 = dendropy.Tree.get_from_string(
+                self.figtree_metadata_str,
+                "newick",
+                suppress_internal_node_taxa=True,
+                suppress_leaf_node_taxa=True,
+                lazy_comment_metadata=True)
+        tree2 = tree1.clone(depth=2)
+        self.check_results(tree2)
+        self.check_results(tree1)
+
+    def test_metadata_keys(self):
+        s = """[&color=blue](A[&region=Asia,id=00012][cryptic],(B[&region=Africa],C[&region=Madagascar,id=19391][two of three]));"""
+        for lazy_comment_metadata in (False, True):
+            tree = dendropy.Tree.get_from_string(
+                    s,
+                    "newick",
+                    suppress_internal_node_taxa=True,
+                    suppress_leaf_node_taxa=True,
+                    comment_metadata_keys=["id"],
+                    lazy_comment_metadata=lazy_comment_metadata)
+            self.assertEqual(tree.annotations.values_as_dict(), {})
+            self.assertEqual(tree.comments, [])
+            expected = [ {'id': '00012'}, {}, {'id': '19391'}, {}, {},]
+            expected_comments = [["cryptic"], [], ["two of three"], [], []]
+            for idx, nd in enumerate(tree.postorder_node_iter()):
+                self.assertEqual(nd.annotations.values_as_dict(), expected[idx])
+                self.assertEqual(nd.comments, expected_comments[idx])
+
 # class NewickTreeTaxonNamespaceTest(dendropytest.ExtendedTestCase):
 
 #     def test_namespace_passing(self):
@@ -999,5 +1042,104 @@ class NewickInternalLabelAssociationTest(unittest.TestCase):
                         self.assertEqual(nd.label, expected_label)
                         self.assertIs(nd.edge.label, None)
 
+class NewickSimpleTreeStatementParsingTest(dendropytest.ExtendedTestCase):
+
+    def _get_trees(self, s, **kwargs):
+        # supplying ``finish_node_fn`` disables the simple tree statement
+        # parser, so the full parser is used for the reference tree
+        tree1 = dendropy.Tree.get(data=s, schema="newick", **kwargs)
+        kwargs["taxon_namespace"] = tree1.taxon_namespace
+        tree2 = dendropy.Tree.get(data=s, schema="newick",
+                finish_node_fn=lambda nd: None,
+                **kwargs)
+        return tree1, tree2
+
+    def _get_node_descriptions(self, tree):
+        descs = []
+        for nd in tree.preorder_node_iter():
+            descs.append((
+                nd.taxon,
+                nd.label,
+                nd.edge.length,
+                nd.edge.label,
+                len(nd._child_nodes),
+                nd.comments))
+        return descs
+
+    def test_same_as_full_parser(self):
+        tree_strings = (
+            "((A:1.3,B:4.0):0.034,(C:1.1,(D:1.2,E:1.6):0.026):0.0126,F:1.5);",
+            "((C:1.3,D:4.0)34:0.034,(A:1.1,(B:1.2,X:1.6)26:0.026)12:0.0126,E:1.5)seed:0.5;",
+            "(a_1,(b_2,(c_3,d_4)),e_5);",
+            "((A:1e-05,B:1.0E2):3,(C:-1,D:0)) ;",
+            "((A,B) [&comment] ,(C,D));",
+            "((A,'B b'),(C,D));",
+            "((A,,B),(C,D));",
+            "(A);",
+            )
+        for s in tree_strings:
+            for kwargs in (
+                    {},
+                    {"suppress_internal_node_taxa": False},
+                    {"suppress_leaf_node_taxa": True},
+                    {"suppress_edge_lengths": True},
+                    {"preserve_underscores": True},
+                    {"is_assign_internal_labels_to_edges": True},
+                    ):
+                tree1, tree2 = self._get_trees(s, **kwargs)
+                self.assertEqual(self._get_node_descriptions(tree1),
+                        self._get_node_descriptions(tree2))
+
+    def test_tree_list_with_mixed_statements(self):
+        s = """\
+            [&R] ((A:1,B:2):1,(C:3,D:4):1);
+            [&U] ((A:1,B:2)[&x=1]:1,(C:3,D:4):1);
+            ((A:1,B:2):1,(C:3,D:4):1)
+            ;
+            """
+        trees = dendropy.TreeList.get(data=s, schema="newick")
+        self.assertEqual(len(trees), 3)
+        self.assertEqual([t.is_rooted for t in trees], [True, False, None])
+        for tree in trees:
+            self.assertEqual([nd.taxon.label for nd in tree.leaf_node_iter()],
+                    ["A", "B", "C", "D"])
+            self.assertEqual([nd.edge.length for nd in tree.leaf_node_iter()],
+                    [1.0, 2.0, 3.0, 4.0])
+
+    def test_errors_reported_as_by_full_parser(self):
+        for s, error_type in (
+                ("((A,B),(C,A));", newickreader.NewickReader.NewickReaderDuplicateTaxonError),
+                ("((A,B):x,(C,D));", newickreader.NewickReader.NewickReaderMalformedStatementError),
+                ("((A:1_0,B),(C,D));", newickreader.NewickReader.NewickReaderMalformedStatementError),
+                ("((A B,C),(D,E));", newickreader.NewickReader.NewickReaderMalformedStatementError),
+                ):
+            with self.assertRaises(error_type):
+                dendropy.Tree.get(data=s, schema="newick")
+
+class NewickDeepTreeTest(unittest.TestCase):
+
+    def test_deep_tree(self):
+        # comments ensure that the full parser is used
+        num_tips = sys.getrecursionlimit() * 3
+        s = "t0[&x=0]"
+        for idx in range(1, num_tips):
+            s = "({}[&x={}]:{},t{}:1)".format(s, idx, idx, idx)
+        s = "[&R] " + s + ";"
+        tree = dendropy.Tree.get(data=s, schema="newick")
+        self.assertIs(tree.is_rooted, True)
+        leaves = tree.leaf_nodes()
+        self.assertEqual(len(leaves), num_tips)
+        self.assertEqual(leaves[0].taxon.label, "t0")
+        self.assertEqual(leaves[0].edge.length, 1)
+        node = leaves[0].parent_node
+        self.assertEqual(node.annotations.get_value("x"), "2")
+        self.assertEqual(node.edge.length, 2)
+        self.assertEqual([ch.taxon.label for ch in node.child_node_iter()], ["t0", "t1"])
+        node = tree.seed_node.child_nodes()[0]
+        self.assertEqual(node.annotations.get_value("x"), str(num_tips - 1))
+        self.assertEqual(node.edge.length, num_tips - 1)
+        s2 = tree._as_newick_string()
+        self.assertTrue(s2.startswith("(" * (num_tips - 1) + "t0:1.0,t1:1.0):2.0,t2:1.0):3.0,"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -444,5 +444,40 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+    def test_deep_tree(self):
+        tree1 = dendropy.Tree()
+        node = tree1.seed_node
+        num_levels = sys.getrecursionlimit() * 2
+        for idx in range(num_levels):
+            node.new_child(taxon=tree1.taxon_namespace.require_taxon("t{}".format(idx)), edge_length=1)
+            node = node.new_child(edge_length=1)
+        node.taxon = tree1.taxon_namespace.require_taxon("last")
+        kwargs = {"suppress_rooting": True}
+        s = self.write_out_validate_equal_and_return(
+                tree1, "newick", kwargs)
+        expected = "{}last:1{});".format(
+                "".join("(t{}:1,".format(idx) for idx in range(num_levels)),
+                "):1" * (num_levels - 1))
+        self.assertEqual(s.strip(), expected)
+
+    def test_taxon_tokens_across_trees(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        trees = dendropy.TreeList(taxon_namespace=taxon_namespace)
+        for newick in ("((a,b),(c,d));", "((a,c),(b,d));"):
+            trees.read(data=newick, schema="newick", rooting="force-rooted")
+        taxon_namespace.get_taxon("a").label = "x y"
+        taxon_namespace.get_taxon("b").label = "x_y"
+        s = trees.as_string("newick", suppress_rooting=True)
+        self.assertEqual(s.split("\n")[:2], [
+            "((x_y,'x_y'),(c,d));",
+            "((x_y,c),('x_y',d));"])
+        s = trees.as_string("newick", suppress_rooting=True, preserve_spaces=True, unquoted_underscores=True)
+        self.assertEqual(s.split("\n")[:2], [
+            "(('x y',x_y),(c,d));",
+            "(('x y',c),(x_y,d));"])
+        taxon_namespace.get_taxon("c").label = "e"
+        s = trees.as_string("newick", suppress_rooting=True)
+        self.assertEqual(s.split("\n")[0], "((x_y,'x_y'),(e,d));")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for incremental parsing of NEXML sources.
+"""
+
+import os
+import sys
+import unittest
+import dendropy
+from dendropy.dataio import nexmlreader
+from dendropy.dataio import nexmlyielder
+from dendropy.dataio import xmlprocessing
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class XmlIterparseTest(unittest.TestCase):
+
+    def test_elements_released(self):
+        src_path = pathmap.char_source_path("standard-test-chars-dna.as_cells.nexml")
+        xml_doc = xmlprocessing.XmlDocument(
+                subelement_factory=lambda e: nexmlreader.NexmlElement(e))
+        depths = set()
+        for event, depth, element, parent in xml_doc.iterparse(src_path, max_depth=2):
+            depths.add(depth)
+            if event == "end" and parent is not None:
+                parent.remove(element)
+        self.assertEqual(depths, set([0, 1, 2]))
+        self.assertEqual(len(list(xml_doc.root._element)), 0)
+
+class NexmlTreeDataYielderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.src_path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.nexml")
+        self.expected_trees = dendropy.TreeList.get(
+                path=self.src_path,
+                schema="nexml")
+
+    def test_yield_trees(self):
+        for tree_offset in (0, 3, 20):
+            taxon_namespace = dendropy.TaxonNamespace()
+            tree_yielder = nexmlyielder.NexmlTreeDataYielder(
+                    files=[self.src_path, self.src_path],
+                    taxon_namespace=taxon_namespace,
+                    tree_type=dendropy.Tree,
+                    tree_offset=tree_offset)
+            trees = list(tree_yielder)
+            expected = list(self.expected_trees[tree_offset:]) * 2
+            self.assertEqual(len(trees), len(expected))
+            for tree, expected_tree in zip(trees, expected):
+                self.assertIs(tree.taxon_namespace, taxon_namespace)
+                self.assertEqual(
+                        tree.as_string("newick", suppress_rooting=True),
+                        expected_tree.as_string("newick", suppress_rooting=True))
+
+class NexmlCharacterDataSequenceYielderTest(unittest.TestCase):
+
+    def test_yield_sequences(self):
+        for src_filename in (
+                "standard-test-chars-dna.as_cells.nexml",
+                "standard-test-chars-dna.as_seqs.nexml",
+                "standard-test-chars-generic.as_cells.nexml",
+                "standard-test-chars-continuous.as_seqs.nexml",
+                ):
+            src_path = pathmap.char_source_path(src_filename)
+            expected = dendropy.DataSet.get(path=src_path, schema="nexml").char_matrices[0]
+            taxon_namespace = dendropy.TaxonNamespace()
+            sequence_yielder = nexmlyielder.NexmlCharacterDataSequenceYielder(
+                    files=[src_path],
+                    taxon_namespace=taxon_namespace)
+            num_sequences = 0
+            for taxon, sequence in sequence_yielder:
+                self.assertIn(taxon, taxon_namespace)
+                self.assertEqual(len(sequence_yielder.current_char_matrix), 0)
+                self.assertEqual(
+                        sequence.symbols_as_list(),
+                        expected[taxon.label].symbols_as_list())
+                num_sequences += 1
+            self.assertEqual(num_sequences, len(expected))
+
+    def test_yield_sequences_from_files(self):
+        src_path = pathmap.char_source_path("standard-test-chars-dna.as_seqs.nexml")
+        expected = dendropy.DnaCharacterMatrix.get(path=src_path, schema="nexml")
+        taxon_namespace = dendropy.TaxonNamespace()
+        rows = list(dendropy.CharacterMatrix.yield_sequences_from_files(
+                files=[src_path, src_path],
+                schema="nexml",
+                taxon_namespace=taxon_namespace))
+        self.assertEqual(len(rows), 2 * len(expected))
+        self.assertEqual(len(taxon_namespace), len(expected.taxon_namespace))
+        for taxon, sequence in rows:
+            self.assertIn(taxon, taxon_namespace)
+            self.assertEqual(
+                    sequence.symbols_as_list(),
+                    expected[taxon.label].symbols_as_list())
+        with self.assertRaises(NotImplementedError):
+            dendropy.CharacterMatrix.yield_sequences_from_files(
+                    files=[src_path],
+                    schema="fasta")
+
+if __name__ == "__main__":
+    unittest.main()
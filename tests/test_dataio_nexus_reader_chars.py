@@ -287,5 +287,58 @@ class NexusCharsSubsetsTest(
                 }
         self.verify_subsets('interleaved-charsets-all.nex', expected_sets)
 
+class NexusPackedCharactersTestCase(unittest.TestCase):
+
+    def get_matrix(self, rows, interleave=False, nchar=10):
+        s = """\
+#NEXUS
+BEGIN DATA;
+    DIMENSIONS NTAX=3 NCHAR={nchar};
+    FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.{interleave};
+    MATRIX
+{rows}
+    ;
+END;
+""".format(nchar=nchar, interleave=" INTERLEAVE" if interleave else "", rows=rows)
+        return dendropy.DnaCharacterMatrix.get(data=s, schema="nexus")
+
+    def test_sequential(self):
+        char_matrix = self.get_matrix("""\
+t1 ACGTA CGTAC
+t2 ACG{AG}A-??AC
+t3 AC.TA{CT}GT..
+""")
+        self.assertIsNotNone(char_matrix["t1"]._packed_values)
+        self.assertEqual(char_matrix["t1"].symbols_as_string(), "ACGTACGTAC")
+        self.assertEqual(char_matrix["t2"].symbols_as_list(),
+                list("ACG") + ["R"] + list("A-??AC"))
+        self.assertEqual(char_matrix["t3"].symbols_as_list()[:5], list("ACGTA"))
+        self.assertEqual(char_matrix["t3"][5].symbol, "Y")
+        self.assertEqual(char_matrix["t3"].symbols_as_list()[6:], list("GTAC"))
+
+    def test_interleaved(self):
+        char_matrix = self.get_matrix("""\
+t1 ACGTA
+t2 ACGTT
+t3 ACG{AG}A
+
+t1 CGTAC
+t2 CG-AC
+t3 CGTAC
+""", interleave=True)
+        self.assertIsNotNone(char_matrix["t1"]._packed_values)
+        self.assertEqual(char_matrix["t1"].symbols_as_string(), "ACGTACGTAC")
+        self.assertEqual(char_matrix["t2"].symbols_as_string(), "ACGTTCG-AC")
+        self.assertEqual(char_matrix["t3"].symbols_as_list(),
+                list("ACG") + ["R"] + list("ACGTAC"))
+
+    def test_too_many_characters(self):
+        self.assertRaises(nexusreader.NexusReader.TooManyCharactersError,
+                self.get_matrix, "t1 ACGTACGTACG\nt2 ACGTACGTAC\nt3 ACGTACGTAC\n")
+
+    def test_invalid_symbol(self):
+        self.assertRaises(nexusreader.NexusReader.InvalidCharacterStateSymbolError,
+                self.get_matrix, "t1 ACGTACGTAJ\nt2 ACGTACGTAC\nt3 ACGTACGTAC\n")
+
 if __name__ == "__main__":
     unittest.main()
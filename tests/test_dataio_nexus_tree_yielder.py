@@ -29,6 +29,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 from support import dendropytest
 from support import standard_file_test_trees
 from support import pathmap
+from dendropy.utility.textprocessing import StringIO
 
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
@@ -83,6 +84,90 @@ class NexusTreeYielderDefaultTestCase(
             self.assertIs(tree.taxon_namespace, tns)
             self.compare_to_reference_tree(tree, ref_tree)
 
+class TreeYielderTreeOffsetTestCase(unittest.TestCase):
+
+    def yield_tree_strings(self, sources, schema, tree_offset, **kwargs):
+        # sources are given as file paths, or as data strings if 'is_data'
+        if kwargs.pop("is_data", False):
+            files = [StringIO(src) for src in sources]
+        else:
+            files = list(sources)
+        tree_yielder = dendropy.Tree.yield_from_files(
+                files=files,
+                schema=schema,
+                tree_offset=tree_offset,
+                **kwargs)
+        return [(tree_yielder.current_file_index, t.label, t.as_string("newick"))
+                for t in tree_yielder]
+
+    def check_yielded_trees(self, sources, schema, tree_offset, **kwargs):
+        all_trees = self.yield_tree_strings(sources, schema, 0, **kwargs)
+        expected = []
+        for file_idx in range(len(sources)):
+            trees = [t for t in all_trees if t[0] == file_idx]
+            expected.extend(trees[tree_offset:])
+        observed = self.yield_tree_strings(sources, schema, tree_offset, **kwargs)
+        self.assertEqual(observed, expected)
+
+    def test_files(self):
+        for filenames, schema in (
+                (("pythonidae.reference-trees.nexus", "pythonidae.mle.nex"), "nexus"),
+                (("pythonidae.reference-trees.newick", "pythonidae.mle.newick"), "newick"),
+                (("pythonidae.reference-trees.nexus", "pythonidae.reference-trees.newick"), "nexus/newick"),
+                (("pythonidae.annotated.nexml",), "nexml"),
+                ):
+            files = [pathmap.tree_source_path(f) for f in filenames]
+            for tree_offset in (0, 1, 4, 1000):
+                self.check_yielded_trees(files, schema, tree_offset)
+
+    def test_skipped_statement_boundaries(self):
+        newick_str = """\
+            [comment; with semi-colon] ((A,B),(C,D));
+            ;;
+            (('A;1',B)[&x=';'],('it''s;',D));
+            [&R] ((A,B)[c[nested;]],(C,D));
+            ((A,C),(B,D));
+            """
+        nexus_str = """\
+            #NEXUS
+            BEGIN TREES;
+                TREE 'one;' = [&U] ((A,B),(C,D));
+                TREE two = (('A;1',B)[&x=';'],('it''s;',D));
+            END;
+            BEGIN TREES;
+                TREE three = [&R] ((A,B),(C,D));
+                TREE four = ((A,C),(B,D));
+            END;
+            """
+        for tree_offset in range(5):
+            self.check_yielded_trees([newick_str, newick_str], "newick", tree_offset, is_data=True)
+            self.check_yielded_trees([newick_str], "nexus/newick", tree_offset, is_data=True)
+            self.check_yielded_trees([nexus_str, nexus_str], "nexus", tree_offset, is_data=True)
+
+    def test_skipped_trees_not_built(self):
+        tns = dendropy.TaxonNamespace()
+        trees = list(dendropy.Tree.yield_from_files(
+                files=[StringIO("((A,B),(C,D));((E,F),(G,H));")],
+                schema="newick",
+                taxon_namespace=tns,
+                tree_offset=1))
+        self.assertEqual(len(trees), 1)
+        self.assertEqual(tns.labels(), ["E", "F", "G", "H"])
+
+    def test_unterminated_skipped_statement(self):
+        with self.assertRaises(dendropy.dataio.newickreader.NewickReader.NewickReaderIncompleteTreeStatementError):
+            list(dendropy.Tree.yield_from_files(
+                    files=[StringIO("((A,B),(C,D))")],
+                    schema="newick",
+                    tree_offset=1))
+
+    def test_negative_offset(self):
+        with self.assertRaises(ValueError):
+            dendropy.Tree.yield_from_files(
+                    files=[StringIO("((A,B),(C,D));")],
+                    schema="newick",
+                    tree_offset=-1)
+
 ## TODO:
 # - test multiple trees blocks
 # - mix of newick/nexus
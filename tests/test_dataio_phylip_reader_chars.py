@@ -309,5 +309,28 @@ Gorilla   -762.4904 808.3665  522.5775  250.6523
             self.assertEqual(taxon.label, expected_taxon)
             self.assertEqual(char_matrix[taxon].values(), self.expected_seqs[expected_taxon])
 
+class PhylipPackedCharactersTestCase(unittest.TestCase):
+
+    def test_interleaved(self):
+        s = """\
+3 10
+t1 ACGTA
+t2 ACG-?
+t3 ACNTJ
+
+CGTAC
+CGTAC
+CGTAC
+"""
+        char_matrix = dendropy.DnaCharacterMatrix.get(
+                data=s,
+                schema="phylip",
+                interleaved=True,
+                ignore_invalid_chars=True)
+        self.assertIsNotNone(char_matrix["t1"]._packed_values)
+        self.assertEqual(char_matrix["t1"].symbols_as_string(), "ACGTACGTAC")
+        self.assertEqual(char_matrix["t2"].symbols_as_string(), "ACG-?CGTAC")
+        self.assertEqual(char_matrix["t3"].symbols_as_string(), "ACNTCGTAC")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,126 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for scanning tree sources for taxa without reading trees.
+"""
+
+import os
+import sys
+import unittest
+import dendropy
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import taxonscan
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class ScanTaxonLabelsTest(unittest.TestCase):
+
+    def check_against_first_tree(self, src_path, schema):
+        tree = dendropy.Tree.get(path=src_path, schema=schema)
+        taxon_namespace, label_index_map = taxonscan.scan_taxon_namespace(
+                files=[src_path],
+                schema="nexus/newick")
+        self.assertEqual(
+                [taxon.label for taxon in taxon_namespace],
+                [taxon.label for taxon in tree.taxon_namespace])
+        for idx, taxon in enumerate(taxon_namespace):
+            self.assertEqual(label_index_map[taxon.label], idx)
+
+    def test_tree_files(self):
+        for src_filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.reference-trees.no-taxa-block.nexus", "nexus"),
+                ("pythonidae.mb.run1.t", "nexus"),
+                ("pythonidae.reference-trees.newick", "newick"),
+                ):
+            self.check_against_first_tree(pathmap.tree_source_path(src_filename), schema)
+
+    def test_newick_labels(self):
+        src = StringIO("""\
+                [&R] ;
+                ([comment, with comma]A_1:1,('B,1'[&x=1]:2,(C:3,'D ''1''')E:1)F:[&y]2,G)H;
+                (Z, Y);
+                """)
+        self.assertEqual(
+                taxonscan.scan_taxon_labels(src, "newick"),
+                ["A 1", "B,1", "C", "D '1'", "G"])
+        src.seek(0)
+        self.assertEqual(
+                taxonscan.scan_taxon_labels(src, "newick", preserve_underscores=True),
+                ["A_1", "B,1", "C", "D '1'", "G"])
+
+    def test_nexus_translate(self):
+        src = StringIO("""\
+                #NEXUS
+                BEGIN CHARACTERS;
+                    DIMENSIONS NCHAR=2;
+                    FORMAT DATATYPE=DNA;
+                    MATRIX
+                        BEGIN AC
+                        TREE GT
+                    ;
+                END;
+                BEGIN TREES;
+                    TRANSLATE
+                        1 'A;1',
+                        2 B_2,
+                        3 C
+                    ;
+                    TREE 1 = (1,(2,3));
+                    TREE 2 = (1,(2,Z));
+                END;
+                """)
+        self.assertEqual(
+                taxonscan.scan_taxon_labels(src, "nexus"),
+                ["A;1", "B 2", "C"])
+
+    def test_schema_mismatch(self):
+        self.assertRaises(ValueError,
+                taxonscan.scan_taxon_labels,
+                StringIO("#NEXUS\n"),
+                "newick")
+        self.assertRaises(ValueError,
+                taxonscan.scan_taxon_labels,
+                StringIO("(A,B);"),
+                "nexus")
+
+    def test_multiple_sources(self):
+        taxon_namespace, label_index_map = taxonscan.scan_taxon_namespace(
+                files=[StringIO("((A,B),C);"), StringIO("#NEXUS\nBEGIN TREES; TREE 1 = ((d,C),E); END;")],
+                schema="nexus/newick")
+        self.assertEqual(
+                [taxon.label for taxon in taxon_namespace],
+                ["A", "B", "C", "d", "E"])
+        self.assertEqual(label_index_map, {"A": 0, "B": 1, "C": 2, "d": 3, "E": 4})
+
+    def test_accession_indexes(self):
+        taxon_namespace = dendropy.TaxonNamespace(["x", "C"])
+        taxon_namespace.remove_taxon_label("x")
+        taxon_namespace, label_index_map = taxonscan.scan_taxon_namespace(
+                files=[StringIO("((A,B),C);")],
+                schema="newick",
+                taxon_namespace=taxon_namespace)
+        self.assertEqual(
+                [taxon.label for taxon in taxon_namespace],
+                ["C", "A", "B"])
+        self.assertEqual(label_index_map, {"C": 1, "A": 2, "B": 3})
+
+if __name__ == "__main__":
+    unittest.main()
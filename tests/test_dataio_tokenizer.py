@@ -157,5 +157,48 @@ class NexusTokenizerTestCase(unittest.TestCase):
         self.assertEqual(expected_comments, {})
         self.assertEqual(observed_tokens, expected_tokens)
 
+    def test_block_boundaries(self):
+        input_str = "[&R] ('the quick'[a]:1.0e-1,('brown''s fox':2, jumps_over[b [nested] c]:3)lazy:4)[d]dog;\n"
+        expected = []
+        tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+        for token in tk:
+            expected.append((token, tk.is_token_quoted, tk.pull_captured_comments()))
+        self.assertEqual(expected[0], ("(", False, ["&R"]))
+        self.assertIn(("brown's fox", True, None), expected)
+        self.assertIn(("jumps over", False, ["b nested c"]), expected)
+        for block_size in (1, 2, 3, 5, 7, 11, 64):
+            observed = []
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str), block_size=block_size)
+            for token in tk:
+                observed.append((token, tk.is_token_quoted, tk.pull_captured_comments()))
+            self.assertEqual(observed, expected)
+
+    def test_line_and_column_numbers(self):
+        input_str = "abc def\n  ghi\n\n'jk l' m"
+        expected = [
+                ("abc", 1, 1),
+                ("def", 1, 5),
+                ("ghi", 2, 4),
+                ("jk l", 4, 2),
+                ("m", 4, 9),
+                ]
+        for block_size in (1, 2, 3, 64):
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str), block_size=block_size)
+            observed = []
+            for token in tk:
+                observed.append((token, tk.token_line_num, tk.token_column_num))
+            self.assertEqual(observed, expected)
+            self.assertTrue(tk.is_eof())
+            self.assertEqual(tk.current_line_num, 4)
+            self.assertEqual(tk.current_column_num, 9)
+
+    def test_unterminated_quote(self):
+        tk = nexusprocessing.NexusTokenizer(src=StringIO("a\n'bc"), block_size=2)
+        self.assertEqual(tk.next_token(), "a")
+        with self.assertRaises(nexusprocessing.NexusTokenizer.UnterminatedQuoteError) as cm:
+            tk.next_token()
+        self.assertEqual(cm.exception.line_num, 2)
+        self.assertEqual(cm.exception.col_num, 4)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,273 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for the byte-offset index of tree files.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.dataio import treeindex
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class TreeFileIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def copy_source(self, filename):
+        path = os.path.join(self.temp_dir, filename)
+        shutil.copy(pathmap.tree_source_path(filename), path)
+        return path
+
+    def write_source(self, filename, text):
+        path = os.path.join(self.temp_dir, filename)
+        with open(path, "w") as dest:
+            dest.write(text)
+        return path
+
+    def check_trees(self, trees1, trees2):
+        self.assertEqual(len(trees1), len(trees2))
+        for t1, t2 in zip(trees1, trees2):
+            self.assertEqual(t1.label, t2.label)
+            self.assertEqual(t1.is_rooted, t2.is_rooted)
+            self.assertEqual(
+                    t1.as_string("newick", suppress_rooting=True),
+                    t2.as_string("newick", suppress_rooting=True))
+
+class TreeFileIndexBuildTest(TreeFileIndexTestCase):
+
+    def test_newick(self):
+        path = self.write_source("trees.newick", """\
+                [comment; with semi-colon] ((A,B),(C,D));
+                ;;
+                (('A;1',B)[&x=';'],(C,D));
+                ((A,B),(C,D))
+                """)
+        index = treeindex.TreeFileIndex.build(path=path, schema="newick")
+        self.assertEqual(index.num_collections, 1)
+        self.assertEqual(index.num_trees(0), 3)
+        with open(path, "rb") as src:
+            data = src.read()
+        statements = [data[start:end].strip() for start, end in index.tree_spans(0)]
+        self.assertEqual(statements, [
+            b"[comment; with semi-colon] ((A,B),(C,D));",
+            b"(('A;1',B)[&x=';'],(C,D));",
+            b"((A,B),(C,D))",
+            ])
+
+    def test_double_quoted_tokens(self):
+        path = self.write_source("trees.nex", """\
+                #NEXUS
+                BEGIN CHARACTERS;
+                    FORMAT DATATYPE=STANDARD SYMBOLS="0 1 ; [";
+                END;
+                BEGIN TREES;
+                    TREE t1 = ((A,B),(C,D));
+                END;
+                """)
+        index = treeindex.TreeFileIndex.build(path=path, schema="nexus")
+        self.assertEqual(index.num_collections, 1)
+        self.assertEqual(index.num_trees(0), 1)
+
+    def test_nexus(self):
+        path = self.copy_source("pythonidae.reference-trees.nexus")
+        index = treeindex.TreeFileIndex.build(path=path, schema="nexus")
+        trees = dendropy.TreeList.get(path=path, schema="nexus")
+        self.assertEqual(index.num_collections, 1)
+        self.assertEqual(index.num_trees(0), len(trees))
+
+    def test_nexus_multiple_tree_blocks(self):
+        path = self.write_source("trees.nex", """\
+                #NEXUS
+                BEGIN TAXA;
+                    DIMENSIONS NTAX=4;
+                    TAXLABELS A B C D;
+                END;
+                BEGIN CHARACTERS;
+                    DIMENSIONS NCHAR=2;
+                    FORMAT DATATYPE=DNA;
+                    MATRIX A AC B AG C CT D GT;
+                END;
+                BEGIN TREES;
+                    TRANSLATE 1 A, 2 B, 3 C, 4 D;
+                    TREE t1 = ((1,2),(3,4));
+                    TREE t2 = ((1,3),(2,4));
+                END;
+                BEGIN TREES;
+                END;
+                BEGIN TREES;
+                    TREE u1 = [&R] ((A,B),(C,D));
+                END;
+                """)
+        index = treeindex.TreeFileIndex.build(path=path, schema="nexus")
+        self.assertEqual(index.num_collections, 2)
+        self.assertEqual(index.num_trees(0), 2)
+        self.assertEqual(index.num_trees(1), 1)
+        # only the TAXA block is needed to read the trees
+        for collection_offset in range(2):
+            with index.open_trees(collection_offset=collection_offset) as src:
+                text = src.read()
+            self.assertIn("TAXLABELS", text)
+            self.assertNotIn("MATRIX", text)
+        trees = dendropy.TreeList.get(
+                file=index.open_trees(collection_offset=0, start=1),
+                schema="nexus")
+        self.assertEqual([t.label for t in trees], ["t2"])
+        self.assertEqual([t.label for t in trees.taxon_namespace], ["A", "B", "C", "D"])
+        trees = dendropy.TreeList.get(
+                file=index.open_trees(collection_offset=1),
+                schema="nexus")
+        self.assertEqual([t.label for t in trees], ["u1"])
+        self.assertTrue(trees[0].is_rooted)
+
+class TreeFileIndexSidecarTest(TreeFileIndexTestCase):
+
+    def test_sidecar_reuse_and_invalidation(self):
+        path = self.write_source("trees.newick", "((A,B),(C,D));((A,C),(B,D));")
+        index1 = treeindex.TreeFileIndex.get(path=path, schema="newick")
+        sidecar_path = treeindex.TreeFileIndex.get_sidecar_path(path)
+        self.assertTrue(os.path.exists(sidecar_path))
+        index2 = treeindex.TreeFileIndex.load(path=path, schema="newick")
+        self.assertEqual(index1.collections, index2.collections)
+        with open(path, "a") as dest:
+            dest.write("((A,D),(B,C));")
+        self.assertIs(treeindex.TreeFileIndex.load(path=path, schema="newick"), None)
+        index3 = treeindex.TreeFileIndex.get(path=path, schema="newick")
+        self.assertEqual(index3.num_trees(0), 3)
+
+class TreeFileIndexReadingTest(TreeFileIndexTestCase):
+
+    def test_tree_list_offsets(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.reference-trees.newick", "newick"),
+                ):
+            path = self.copy_source(filename)
+            full_trees = dendropy.TreeList.get(path=path, schema=schema)
+            for tree_offset in (0, 1, 5, len(full_trees)-1, -3):
+                trees = dendropy.TreeList.get(path=path,
+                        schema=schema,
+                        tree_offset=tree_offset,
+                        use_tree_index=True)
+                self.check_trees(trees, full_trees[tree_offset:])
+                tree1 = dendropy.Tree.get(path=path,
+                        schema=schema,
+                        tree_offset=tree_offset,
+                        use_tree_index=True)
+                tree2 = dendropy.Tree.get(path=path,
+                        schema=schema,
+                        tree_offset=tree_offset)
+                self.check_trees([tree1], [tree2])
+
+    def test_encoding(self):
+        path = os.path.join(self.temp_dir, "trees.newick")
+        with open(path, "w", encoding="latin-1") as dest:
+            dest.write("(('\u00c1',B),(C,D));(('\u00c1',C),(B,D));")
+        with open(path, "r", encoding="latin-1") as src:
+            trees = dendropy.TreeList.get(file=src,
+                    schema="newick",
+                    tree_offset=1,
+                    use_tree_index=True)
+        self.assertEqual(len(trees), 1)
+        self.assertIn("\u00c1", [t.label for t in trees.taxon_namespace])
+
+    def test_out_of_range_offsets(self):
+        path = self.copy_source("pythonidae.reference-trees.nexus")
+        num_trees = len(treeindex.TreeFileIndex.get(path=path, schema="nexus"))
+        with self.assertRaises(IndexError):
+            dendropy.TreeList.get(path=path, schema="nexus",
+                    tree_offset=num_trees, use_tree_index=True)
+        with self.assertRaises(IndexError):
+            dendropy.TreeList.get(path=path, schema="nexus",
+                    collection_offset=1, tree_offset=0, use_tree_index=True)
+
+    def test_non_file_source_ignores_index(self):
+        s = "((A,B),(C,D));((A,C),(B,D));"
+        trees = dendropy.TreeList.get(data=s, schema="newick",
+                tree_offset=1, use_tree_index=True)
+        self.assertEqual(len(trees), 1)
+
+class TreeFileFollowerTest(TreeFileIndexTestCase):
+
+    def setUp(self):
+        TreeFileIndexTestCase.setUp(self)
+        self.expected_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        self.nexus_text = self.expected_trees.as_string("nexus", translate_tree_taxa=True)
+        first_tree_start = self.nexus_text.index("TREE ", self.nexus_text.index("Translate"))
+        second_tree_start = self.nexus_text.index("TREE ", first_tree_start + 5)
+        # cut in the middle of the second tree statement
+        self.partial_text = self.nexus_text[:second_tree_start + 40]
+
+    def test_follow_yielder(self):
+        path = os.path.join(self.temp_dir, "run.t")
+        taxon_namespace = dendropy.TaxonNamespace()
+        tree_yielder = dendropy.Tree.yield_from_files(
+                [path],
+                schema="nexus",
+                taxon_namespace=taxon_namespace,
+                follow=True)
+        self.assertEqual(len(list(tree_yielder)), 0)
+        self.write_source("run.t", self.partial_text)
+        trees = list(tree_yielder)
+        self.assertEqual(len(trees), 1)
+        self.write_source("run.t", self.nexus_text)
+        trees.extend(tree_yielder)
+        self.assertEqual(len(list(tree_yielder)), 0)
+        for tree in trees:
+            self.assertIs(tree.taxon_namespace, taxon_namespace)
+        self.check_trees(trees, self.expected_trees)
+
+    def test_follow_newick(self):
+        newick_text = self.expected_trees.as_string("newick")
+        cut = newick_text.index(";") + 10
+        path = self.write_source("run.newick", newick_text[:cut])
+        follower = treeindex.TreeFileFollower(path=path, schema="newick", tree_offset=2)
+        self.assertEqual(follower.poll(), [])
+        self.write_source("run.newick", newick_text)
+        trees = dendropy.TreeList()
+        for source in follower.poll():
+            trees.read(file=source, schema="newick")
+        self.assertEqual(follower.poll(), [])
+        expected_trees = dendropy.TreeList.get(data=newick_text, schema="newick")
+        self.check_trees(trees, expected_trees[2:])
+
+    def test_follow_tree_array(self):
+        path = self.write_source("run.t", self.partial_text)
+        tree_array = dendropy.TreeArray(taxon_namespace=self.expected_trees.taxon_namespace)
+        tree_array.read_from_files([path], "nexus", follow=True, tree_offset=3)
+        self.assertEqual(len(tree_array), 0)
+        self.write_source("run.t", self.nexus_text)
+        tree_array.read_from_files([path], "nexus", follow=True, tree_offset=3)
+        self.assertEqual(len(tree_array), len(self.expected_trees) - 3)
+        tree_array.read_from_files([path], "nexus", follow=True, tree_offset=3)
+        self.assertEqual(len(tree_array), len(self.expected_trees) - 3)
+
+if __name__ == "__main__":
+    unittest.main()
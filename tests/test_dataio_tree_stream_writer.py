@@ -0,0 +1,154 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for incremental writing of trees.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility.textprocessing import StringIO
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class TreeStreamWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.taxon_namespace = dendropy.TaxonNamespace()
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus",
+                taxon_namespace=self.taxon_namespace)
+
+    def stream_trees(self, schema, **kwargs):
+        dest = StringIO()
+        with dendropy.TreeList.open_stream_writer(
+                file=dest,
+                schema=schema,
+                taxon_namespace=self.taxon_namespace,
+                **kwargs) as tree_writer:
+            tree_writer.write_trees(tree for tree in self.trees)
+        self.assertEqual(tree_writer.num_trees_written, len(self.trees))
+        return dest.getvalue()
+
+    def test_nexus(self):
+        for kwargs in (
+                {},
+                {"translate_tree_taxa": True},
+                {"supplemental_blocks": ["BEGIN PAUP;\nEND;"], "file_comments": ["test"]},
+                ):
+            s = self.stream_trees("nexus", **kwargs)
+            self.assertEqual(s, self.trees.as_string("nexus", **kwargs))
+
+    def test_newick(self):
+        s = self.stream_trees("newick", suppress_rooting=True)
+        self.assertEqual(s, self.trees.as_string("newick", suppress_rooting=True))
+
+    def test_nexml(self):
+        s = self.stream_trees("nexml")
+        trees2 = dendropy.TreeList.get(data=s, schema="nexml")
+        self.assertEqual(len(trees2), len(self.trees))
+        self.assertEqual(
+                [t.label for t in trees2.taxon_namespace],
+                [t.label for t in self.taxon_namespace])
+        expected = dendropy.TreeList.get(data=self.trees.as_string("nexml"), schema="nexml")
+        for t1, t2 in zip(expected, trees2):
+            self.assertEqual(t1.label, t2.label)
+            self.assertEqual(t1.annotations.get_value("lnP"), t2.annotations.get_value("lnP"))
+            self.assertEqual(t1.as_string("newick"), t2.as_string("newick"))
+
+    def test_nexml_undeclared_annotation_namespace(self):
+        self.trees[1].annotations.add_new(
+                name="color",
+                value="red",
+                name_prefix="test",
+                namespace="http://example.org/test/")
+        s = self.stream_trees("nexml")
+        self.assertIn('<tree xmlns:test="http://example.org/test/"', s)
+        trees2 = dendropy.TreeList.get(data=s, schema="nexml")
+        self.assertEqual(trees2[1].annotations.get_value("color"), "red")
+
+    def test_nexml_constant_book_keeping(self):
+        dest = StringIO()
+        tree_writer = dendropy.TreeList.open_stream_writer(
+                file=dest,
+                schema="nexml",
+                taxon_namespace=self.taxon_namespace)
+        tree_writer.write_tree(self.trees[0])
+        num_ids = len(tree_writer.writer._object_xml_id)
+        for tree in self.trees:
+            tree_writer.write_tree(tree)
+        self.assertTrue(len(tree_writer.writer._object_xml_id) <= num_ids + 500)
+        tree_writer.close()
+        trees2 = dendropy.TreeList.get(data=dest.getvalue(), schema="nexml")
+        self.assertEqual(len(trees2), len(self.trees) + 1)
+
+    def test_path(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "trees.nex")
+            tree_writer = dendropy.TreeList.open_stream_writer(
+                    path=path,
+                    schema="nexus",
+                    taxon_namespace=self.taxon_namespace)
+            for tree in self.trees:
+                tree_writer.write_tree(tree)
+            tree_writer.close()
+            self.assertTrue(tree_writer.stream.closed)
+            trees2 = dendropy.TreeList.get(path=path, schema="nexus")
+            self.assertEqual(len(trees2), len(self.trees))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_no_trees(self):
+        dest = StringIO()
+        tree_writer = dendropy.TreeList.open_stream_writer(
+                file=dest,
+                schema="nexus",
+                taxon_namespace=self.taxon_namespace)
+        tree_writer.close()
+        self.assertEqual(dest.getvalue(),
+                dendropy.TreeList(taxon_namespace=self.taxon_namespace).as_string("nexus"))
+        self.assertFalse(dest.closed)
+        with self.assertRaises(ValueError):
+            tree_writer.write_tree(self.trees[0])
+
+    def test_taxon_namespace_mismatch(self):
+        tree = dendropy.Tree.get(data="((a,b),c);", schema="newick")
+        with dendropy.TreeList.open_stream_writer(
+                file=StringIO(),
+                schema="newick",
+                taxon_namespace=self.taxon_namespace) as tree_writer:
+            with self.assertRaises(dendropy.TaxonNamespaceIdentityError):
+                tree_writer.write_tree(tree)
+
+    def test_unsupported_schema(self):
+        tree_writer = dendropy.TreeList.open_stream_writer(
+                file=StringIO(),
+                schema="phylip",
+                taxon_namespace=self.taxon_namespace)
+        with self.assertRaises(NotImplementedError):
+            tree_writer.write_tree(self.trees[0])
+
+if __name__ == "__main__":
+    unittest.main()
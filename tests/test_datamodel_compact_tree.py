@@ -0,0 +1,194 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for the array-backed CompactTree.
+"""
+
+import os
+import sys
+import unittest
+import dendropy
+from dendropy.utility import error
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import newickreader
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class CompactTreeConversionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.src_paths = [pathmap.tree_source_path(f) for f in (
+                "dendropy-test-trees-multifurcating-rooted.newick",
+                "dendropy-test-trees-multifurcating-unrooted.newick",
+                "dendropy-test-trees-n33-unrooted-x10a.newick",
+                "dendropy-test-trees-n33-unrooted-annotated-x10a.newick",
+                )]
+
+    def test_from_and_to_tree(self):
+        for src_path in self.src_paths:
+            trees = dendropy.TreeList.get(path=src_path, schema="newick")
+            for tree in trees:
+                compact_tree = dendropy.CompactTree.from_tree(tree)
+                self.assertIs(compact_tree.taxon_namespace, tree.taxon_namespace)
+                self.assertEqual(compact_tree.num_nodes, len(tree.nodes()))
+                self.assertEqual(list(compact_tree.preorder_indexes), list(range(compact_tree.num_nodes)))
+                tree2 = compact_tree.to_tree()
+                self.assertIs(tree2.taxon_namespace, tree.taxon_namespace)
+                self.assertEqual(tree2.is_rooted, tree.is_rooted)
+                self.assertEqual(tree2.as_string("newick"), tree.as_string("newick"))
+
+    def test_parse(self):
+        for src_path in self.src_paths:
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees = dendropy.TreeList.get(path=src_path,
+                    schema="newick",
+                    taxon_namespace=taxon_namespace)
+            compact_trees = list(dendropy.CompactTree.yield_from_files(
+                    files=[src_path],
+                    schema="newick",
+                    taxon_namespace=taxon_namespace))
+            self.assertEqual(len(compact_trees), len(trees))
+            for tree, compact_tree in zip(trees, compact_trees):
+                self.assertIs(compact_tree.taxon_namespace, taxon_namespace)
+                self.assertEqual(compact_tree.is_rooted, tree.is_rooted)
+                self.assertEqual(
+                        compact_tree.to_tree().as_string("newick"),
+                        tree.as_string("newick"))
+
+    def test_parse_special_statements(self):
+        s = "[&R] (A:1,'B b':2,(C,D)[comment]:3)'E':0.5;\n((A,B),,(C,D)x);\n;;\nA;"
+        for kwargs in ({}, {"suppress_internal_node_taxa": False}):
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees = dendropy.TreeList.get(data=s,
+                    schema="newick",
+                    taxon_namespace=taxon_namespace,
+                    **kwargs)
+            compact_trees = list(dendropy.CompactTree.yield_from_files(
+                    files=[StringIO(s)],
+                    schema="newick",
+                    taxon_namespace=taxon_namespace,
+                    **kwargs))
+            self.assertEqual(len(compact_trees), 3)
+            self.assertEqual([t.is_rooted for t in compact_trees], [True, None, None])
+            for tree, compact_tree in zip(trees, compact_trees):
+                self.assertEqual(
+                        compact_tree.to_tree().as_string("newick", suppress_annotations=True),
+                        tree.as_string("newick", suppress_annotations=True))
+
+    def test_parse_with_and_without_fast_path(self):
+        # the quoted label takes the second statement off the fast path
+        s = "((A:1,B:2)x:3,C:4);\n((A:1,'B':2)x:3,C:4);"
+        compact_trees = list(dendropy.CompactTree.yield_from_files(
+                files=[StringIO(s)],
+                schema="newick"))
+        self.assertEqual(len(compact_trees), 2)
+        for compact_tree in compact_trees:
+            self.assertEqual(list(compact_tree.preorder_indexes), list(range(5)))
+            self.assertEqual(list(compact_tree.parent_indexes), [-1, 0, 1, 1, 0])
+            self.assertEqual(list(compact_tree.edge_lengths)[1:], [3.0, 1.0, 2.0, 4.0])
+            self.assertEqual(compact_tree.node_labels, [None, "x", None, None, None])
+        self.assertEqual(list(compact_trees[0].taxon_indexes), list(compact_trees[1].taxon_indexes))
+
+    def test_get(self):
+        s = "((A:1,B:1):1,C:2);\n(A:1,(B:1,C:1):1);"
+        tree = dendropy.CompactTree.get(data=s, schema="newick", tree_offset=1)
+        self.assertEqual(tree.to_tree().as_string("newick").strip(), "(A:1.0,(B:1.0,C:1.0):1.0);")
+        self.assertIs(dendropy.CompactTree.get(data=s, schema="newick", tree_offset=2), None)
+        with self.assertRaises(error.UnsupportedSchemaError):
+            dendropy.CompactTree.get(data=s, schema="nexus")
+
+    def test_malformed(self):
+        for s in ("((A,B);", "(A,B));", "(A,B)(C,D);", "(A B,C);", "(A,B),C;", "(A:x,B);", "(A,A);"):
+            with self.assertRaises(newickreader.NewickReader.NewickReaderError):
+                dendropy.CompactTree.get(data=s, schema="newick")
+
+    def test_construction(self):
+        # nodes out of order: children ordered by index
+        compact_tree = dendropy.CompactTree(
+                parent_indexes=[4, 4, 3, -1, 3],
+                edge_lengths=[1, 2, 3, float("nan"), 4])
+        self.assertEqual(compact_tree.seed_node_index, 3)
+        self.assertEqual(list(compact_tree.child_node_indexes(3)), [2, 4])
+        self.assertEqual(list(compact_tree.preorder_indexes), [3, 2, 4, 0, 1])
+        self.assertEqual(list(compact_tree.postorder_indexes), [2, 0, 1, 4, 3])
+        self.assertEqual(list(compact_tree.leaf_index_iter()), [2, 0, 1])
+        self.assertEqual(list(compact_tree.internal_node_index_iter()), [3, 4])
+        self.assertIs(compact_tree.edge_length(3), None)
+        self.assertEqual(compact_tree.length(), 10)
+        for parent_indexes in ([-1, -1], [1, 0, -1], [-1, 5]):
+            with self.assertRaises(ValueError):
+                dendropy.CompactTree(parent_indexes=parent_indexes)
+
+class CompactTreeCalculationsTest(unittest.TestCase):
+
+    def test_encode_bipartitions(self):
+        for src_filename in (
+                "dendropy-test-trees-multifurcating-rooted.newick",
+                "dendropy-test-trees-multifurcating-unrooted.newick",
+                "dendropy-test-trees-n33-unrooted-x10a.newick",
+                ):
+            trees = dendropy.TreeList.get(
+                    path=pathmap.tree_source_path(src_filename),
+                    schema="newick")
+            for tree in trees:
+                compact_tree = dendropy.CompactTree.from_tree(tree)
+                tree.encode_bipartitions(
+                        suppress_unifurcations=False,
+                        collapse_unrooted_basal_bifurcation=False)
+                split_bitmasks = compact_tree.encode_bipartitions()
+                self.assertIs(compact_tree.encode_bipartitions(), split_bitmasks)
+                for node_idx, node in zip(compact_tree.preorder_indexes, tree.preorder_node_iter()):
+                    self.assertEqual(split_bitmasks[node_idx], node.edge.bipartition.split_bitmask)
+                    self.assertEqual(compact_tree.leafset_bitmasks[node_idx], node.edge.bipartition.leafset_bitmask)
+
+    def test_calc_node_ages(self):
+        tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        compact_tree = dendropy.CompactTree.from_tree(tree)
+        tree.calc_node_ages()
+        ages = compact_tree.calc_node_ages()
+        for node_idx, node in zip(compact_tree.preorder_indexes, tree.preorder_node_iter()):
+            self.assertAlmostEqual(ages[node_idx], node.age)
+        self.assertAlmostEqual(compact_tree.length(), tree.length())
+        compact_tree = dendropy.CompactTree.get(data="((A:1,B:2):1,C:2);", schema="newick")
+        with self.assertRaises(error.UltrametricityError):
+            compact_tree.calc_node_ages()
+        self.assertEqual(list(compact_tree.calc_node_ages(is_force_max_age=True)), [3, 2, 0, 0, 0])
+        self.assertEqual(list(compact_tree.calc_node_ages(is_force_min_age=True)), [2, 1, 0, 0, 0])
+
+    def test_mrca(self):
+        tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        compact_tree = dendropy.CompactTree.from_tree(tree)
+        nodes = list(tree.preorder_node_iter())
+        taxa = list(tree.taxon_namespace)
+        for idx1 in range(0, len(taxa), 3):
+            for idx2 in range(idx1 + 1, len(taxa), 5):
+                expected = tree.mrca(taxa=[taxa[idx1], taxa[idx2]])
+                node_idx = compact_tree.mrca(taxa=[taxa[idx1], taxa[idx2]])
+                self.assertIs(nodes[node_idx], expected)
+        node_idx = compact_tree.mrca(taxon_labels=[taxa[0].label])
+        self.assertIs(compact_tree.node_taxon(node_idx), taxa[0])
+        self.assertEqual(compact_tree.mrca(leafset_bitmask=1 << len(taxa)), -1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,7 @@ import collections
 import unittest
 import copy
 from dendropy import Taxon, TaxonNamespace
+from dendropy.datamodel import taxonmodel
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -694,6 +695,109 @@ class TaxonNamespaceTaxonManagement(unittest.TestCase):
             x.append(t)
         self.assertEqual(len(x), 0)
 
+class TaxonNamespaceLabelLookup(unittest.TestCase):
+
+    def setUp(self):
+        self.str_labels = ["a", "A", "b", "c", "c", "d"]
+
+    def check_lookups(self, tns):
+        # compare against a linear search over the collection
+        labels = set(t.label for t in tns) | set(["x", "C", "none"])
+        for label in labels:
+            expected = [t for t in tns if t.label == label]
+            self.assertEqual(tns.findall(label, is_case_sensitive=True), expected)
+            self.assertIs(tns.get_taxon(label, is_case_sensitive=True), expected[0] if expected else None)
+            if label is None:
+                continue
+            expected = [t for t in tns if t.label is not None and t.label.lower() == label.lower()]
+            self.assertEqual(tns.findall(label, is_case_sensitive=False), expected)
+            self.assertIs(tns.get_taxon(label, is_case_sensitive=False), expected[0] if expected else None)
+
+    def test_duplicate_labels(self):
+        tns = TaxonNamespace(self.str_labels)
+        self.check_lookups(tns)
+        self.assertEqual(len(tns.findall("a")), 2)
+        self.assertIs(tns.get_taxa(["c"], first_match_only=True)[0], tns[3])
+        self.assertEqual(tns.get_taxa(["c"]), [tns[3], tns[4]])
+
+    def test_add_and_remove(self):
+        tns = TaxonNamespace(self.str_labels)
+        self.check_lookups(tns)
+        t = tns.new_taxon("c")
+        self.assertEqual(tns.findall("c")[-1], t)
+        self.check_lookups(tns)
+        tns.remove_taxon(tns[3])
+        self.check_lookups(tns)
+        tns.remove_taxon_label("a")
+        self.assertIs(tns.get_taxon("a"), None)
+        self.check_lookups(tns)
+        t = Taxon(None)
+        tns.add_taxon(t)
+        self.check_lookups(tns)
+        self.assertIs(tns.get_taxon(None, is_case_sensitive=True), t)
+
+    def test_relabel(self):
+        tns = TaxonNamespace(self.str_labels)
+        other_tns = TaxonNamespace([tns[2]])
+        self.check_lookups(tns)
+        self.check_lookups(other_tns)
+        tns[2].label = "X"
+        self.assertIs(tns.get_taxon("b"), None)
+        self.assertIs(tns.get_taxon("x"), tns[2])
+        self.assertIs(other_tns.get_taxon("x"), tns[2])
+        self.check_lookups(tns)
+        t = tns.new_taxon(None)
+        t.label = "c"
+        self.assertEqual(tns.findall("c")[-1], t)
+        self.check_lookups(tns)
+
+    def test_relabel_updates_indexes_in_place(self):
+        tns1 = TaxonNamespace(self.str_labels)
+        tns2 = TaxonNamespace(["p", "q"])
+        self.check_lookups(tns1)
+        self.check_lookups(tns2)
+        # only the indexes of the namespace of the taxon are changed, and
+        # these are not rebuilt
+        label_taxa_map = tns1._label_taxa_map
+        tns1[5].label = "e"
+        self.assertTrue(tns1._is_label_indexed)
+        self.assertIs(tns1._label_taxa_map, label_taxa_map)
+        self.assertTrue(tns2._is_label_indexed)
+        self.assertIs(tns1.get_taxon("e"), tns1[5])
+        self.check_lookups(tns1)
+        # a taxon removed from a namespace no longer changes its indexes
+        t = tns1[5]
+        tns1.remove_taxon(t)
+        t.label = "a"
+        self.assertEqual(len(tns1.findall("a")), 2)
+        self.check_lookups(tns1)
+        # nor does a copy of a taxon
+        t = copy.deepcopy(tns2[0])
+        t.label = "q"
+        self.assertEqual(tns2.findall("q"), [tns2[1]])
+        self.check_lookups(tns2)
+
+    def test_reorder_and_clear(self):
+        tns = TaxonNamespace(self.str_labels)
+        self.check_lookups(tns)
+        tns.reverse()
+        self.assertIs(tns.get_taxon("c"), tns[1])
+        self.check_lookups(tns)
+        tns.sort(key=lambda t: t.label.lower())
+        self.check_lookups(tns)
+        tns.clear()
+        self.assertIs(tns.get_taxon("a"), None)
+        tns.new_taxon("a")
+        self.check_lookups(tns)
+
+    def test_copies(self):
+        tns1 = TaxonNamespace(self.str_labels)
+        self.check_lookups(tns1)
+        for tns2 in (copy.deepcopy(tns1), TaxonNamespace(tns1)):
+            self.check_lookups(tns2)
+            for t in tns2:
+                self.assertIn(tns2.get_taxon(t.label, is_case_sensitive=True), tns2)
+
 class TaxonNamespaceIdentity(unittest.TestCase):
 
     def setUp(self):
@@ -897,5 +1001,24 @@ class TaxonNamespaceCloning(compare_and_validate.Comparator, unittest.TestCase):
             self.assertEqual(tns2.annotations[1].value, "y")
             self.tns1.label = "T1"
 
+class TaxonNamespaceAccessions(unittest.TestCase):
+
+    def test_new_taxon_namespace_from_accessions(self):
+        tns1 = TaxonNamespace(["x", "c", "b", "a", "y"])
+        tns1.remove_taxon_label("x")
+        tns1.remove_taxon_label("y")
+        tns1.sort()
+        taxon_accessions, num_accessions = taxonmodel.get_taxon_accessions(tns1)
+        self.assertEqual(taxon_accessions, [(3, "a"), (2, "b"), (1, "c")])
+        self.assertEqual(num_accessions, 5)
+        tns2 = taxonmodel.new_taxon_namespace_from_accessions(taxon_accessions, num_accessions)
+        self.assertEqual(tns2.labels(), tns1.labels())
+        self.assertEqual(tns2.all_taxa_bitmask(), tns1.all_taxa_bitmask())
+        for t1, t2 in zip(tns1, tns2):
+            self.assertEqual(tns2.taxon_bitmask(t2), tns1.taxon_bitmask(t1))
+            self.assertIs(tns2.get_taxon(t1.label), t2)
+        self.assertEqual(tns2.new_taxon("d").label, "d")
+        self.assertEqual(tns2.accession_index(tns2.get_taxon("d")), 5)
+
 if __name__ == "__main__":
     unittest.main()
@@ -23,7 +23,9 @@ Tests basic Tree copying etc.
 
 import unittest
 import dendropy
+from dendropy.datamodel import taxonmodel
 import copy
+import pickle
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -161,6 +163,148 @@ class TestTreeCopying(
                 compare_tree_annotations=True,
                 compare_taxon_annotations=False)
 
+class TestTreePickling(
+        curated_test_tree.CuratedTestTree,
+        compare_and_validate.Comparator,
+        unittest.TestCase):
+
+    def get_annotated_tree(self):
+        tree, anodes, lnodes, inodes = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        for idx, nd in enumerate(tree):
+            nd.edge.label = "E{}".format(idx)
+            nd.annotations.add_new("a{}".format(idx), idx)
+            nd.annotations.add_bound_attribute("label")
+            nd.edge.annotations.add_bound_attribute("label")
+        tree.annotations.add_new("a", 0)
+        tree.label = "hello"
+        tree.encode_bipartitions()
+        return tree
+
+    def test_pickle(self):
+        tree1 = self.get_annotated_tree()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            tree2 = pickle.loads(pickle.dumps(tree1, protocol))
+            self.compare_distinct_trees(tree1, tree2,
+                    taxon_namespace_scoped=False,
+                    compare_tree_annotations=True,
+                    compare_taxon_annotations=False)
+            for nd in tree2:
+                for a in nd.annotations:
+                    self.assertIs(a.annotations.target, a)
+                self.assertIs(nd.annotations.target, nd)
+                self.assertIs(nd.edge.head_node, nd)
+                self.assertIs(tree2.bipartition_edge_map[nd.edge.bipartition], nd.edge)
+            self.assertEqual(tree2.as_string("nexus"), tree1.as_string("nexus"))
+
+    def test_pickle_plain_tree(self):
+        tree1, anodes, lnodes, inodes = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        for idx, nd in enumerate(tree1):
+            nd.edge.label = "E{}".format(idx)
+        tree1.label = "hello"
+        tree1.encode_bipartitions()
+        self.assertIsNot(tree1._get_flat_node_state(tree1.seed_node), None)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            tree2 = pickle.loads(pickle.dumps(tree1, protocol))
+            self.compare_distinct_trees(tree1, tree2,
+                    taxon_namespace_scoped=False,
+                    compare_tree_annotations=True,
+                    compare_taxon_annotations=False)
+            self.assertEqual(
+                    [nd.edge.label for nd in tree2],
+                    [nd.edge.label for nd in tree1])
+            for nd in tree2:
+                self.assertIs(nd.edge.head_node, nd)
+                self.assertIs(tree2.bipartition_edge_map[nd.edge.bipartition], nd.edge)
+            self.assertEqual(tree2.as_string("nexus"), tree1.as_string("nexus"))
+        # other attributes are pickled with the nodes
+        tree1.seed_node.edge.rate = 1
+        self.assertIs(tree1._get_flat_node_state(tree1.seed_node), None)
+        tree2 = pickle.loads(pickle.dumps(tree1, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(tree2.seed_node.edge.rate, 1)
+
+    def test_pickle_deep_tree(self):
+        tree1 = dendropy.Tree()
+        nd = tree1.seed_node
+        for idx in range(sys.getrecursionlimit() * 3):
+            nd.new_child(taxon=tree1.taxon_namespace.require_taxon("T{}".format(idx)))
+            nd = nd.new_child(edge_length=idx)
+        tree2 = pickle.loads(pickle.dumps(tree1, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(len(tree2.nodes()), len(tree1.nodes()))
+        self.assertIs(tree2.seed_node.parent_node, None)
+        for nd1, nd2 in zip(tree1.postorder_node_iter(), tree2.postorder_node_iter()):
+            self.assertEqual(nd1.edge.length, nd2.edge.length)
+            self.assertEqual(len(nd1.child_nodes()), len(nd2.child_nodes()))
+            if nd1.parent_node is not None:
+                self.assertIn(nd2, nd2.parent_node.child_nodes())
+            if nd1.taxon is not None:
+                self.assertEqual(nd1.taxon.label, nd2.taxon.label)
+
+    def test_pickle_shared_taxon_namespace(self):
+        tree_list1 = dendropy.TreeList()
+        for idx in range(3):
+            tree1 = self.get_annotated_tree()
+            tree_list1.append(tree1, taxon_import_strategy="add")
+        taxonmodel.share_taxon_namespace(tree_list1.taxon_namespace)
+        try:
+            for tree1 in tree_list1:
+                tree2 = pickle.loads(pickle.dumps(tree1, pickle.HIGHEST_PROTOCOL))
+                self.assertIs(tree2.taxon_namespace, tree1.taxon_namespace)
+                self.compare_distinct_trees(tree1, tree2,
+                        taxon_namespace_scoped=True,
+                        compare_tree_annotations=True,
+                        compare_taxon_annotations=False)
+            tree_list2 = pickle.loads(pickle.dumps(tree_list1, pickle.HIGHEST_PROTOCOL))
+            self.assertIs(tree_list2.taxon_namespace, tree_list1.taxon_namespace)
+        finally:
+            taxonmodel.unshare_taxon_namespace(tree_list1.taxon_namespace)
+        taxon_namespace2 = pickle.loads(pickle.dumps(tree_list1.taxon_namespace, pickle.HIGHEST_PROTOCOL))
+        self.assertIsNot(taxon_namespace2, tree_list1.taxon_namespace)
+        self.assertEqual(
+                [t.label for t in taxon_namespace2],
+                [t.label for t in tree_list1.taxon_namespace])
+        self.assertIs(taxon_namespace2.get_taxon("a"), taxon_namespace2[0])
+
+class TestTreeElementAttributes(
+        curated_test_tree.CuratedTestTree,
+        unittest.TestCase):
+
+    def test_slots(self):
+        tree, anodes, lnodes, inodes = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        tree.encode_bipartitions()
+        nd = tree.seed_node
+        for obj in (nd, nd.edge, nd.taxon, nd.edge.bipartition):
+            self.assertTrue(hasattr(obj.__class__, "__slots__"))
+            # instance dictionary only allocated for other attributes
+            self.assertEqual(obj.__dict__, {})
+
+    def test_other_attributes(self):
+        tree, anodes, lnodes, inodes = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        for idx, nd in enumerate(tree):
+            nd.rank = idx
+            nd.edge.rate = idx * 2
+            nd.taxon.color = "c{}".format(idx)
+        tree2 = copy.deepcopy(tree)
+        tree3 = pickle.loads(pickle.dumps(tree, 0))
+        for t in (tree2, tree3):
+            for idx, nd in enumerate(t):
+                self.assertEqual(nd.rank, idx)
+                self.assertEqual(nd.edge.rate, idx * 2)
+                self.assertEqual(nd.taxon.color, "c{}".format(idx))
+
+    def test_comments(self):
+        nd = dendropy.Node()
+        self.assertIs(nd._comments, None)
+        nd.comments.append("x")
+        self.assertEqual(nd.comments, ["x"])
+        nd.comments = []
+        self.assertEqual(nd.comments, [])
+        nd2 = copy.deepcopy(nd)
+        self.assertEqual(nd2.comments, [])
+
 class TestSpecialTreeConstruction(
         curated_test_tree.CuratedTestTree,
         unittest.TestCase):
@@ -21,6 +21,8 @@
 Tests basic Tree structure and iteration.
 """
 
+import copy
+import pickle
 import unittest
 import dendropy
 import os
@@ -551,6 +553,130 @@ class TestTreeIterators(curated_test_tree.CuratedTestTree, unittest.TestCase):
             ancestors = [ch.label for ch in nd.ancestor_iter(inclusive=True, filter_fn=filter_fn)]
             self.assertEqual(ancestors, expected_ancestors)
 
+class TestTreeIterationCaching(curated_test_tree.CuratedTestTree, unittest.TestCase):
+
+    def check_iterators(self, tree):
+        seed_node = tree.seed_node
+        for i in range(2):
+            self.assertEqual(list(tree.preorder_node_iter()), list(seed_node.preorder_iter()))
+            self.assertEqual(list(tree.postorder_node_iter()), list(seed_node.postorder_iter()))
+            self.assertEqual(list(tree.leaf_node_iter()), list(seed_node.leaf_iter()))
+            self.assertEqual(tree.internal_nodes(True), list(seed_node.preorder_internal_node_iter(exclude_seed_node=True)))
+            self.assertEqual(tree.edges(), [nd.edge for nd in seed_node.preorder_iter()])
+            self.assertEqual(list(tree.postorder_edge_iter()), [nd.edge for nd in seed_node.postorder_iter()])
+            self.assertEqual(len(tree), len(seed_node.leaf_nodes()))
+
+    def test_structural_changes(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        self.check_iterators(tree)
+        self.assertEqual([nd.label for nd in tree], list(self.preorder_sequence))
+        nodes = dict((nd.label, nd) for nd in tree)
+        nodes["x"] = nodes["i"].new_child(label="x")
+        self.check_iterators(tree)
+        nodes["c"].remove_child(nodes["g"])
+        self.check_iterators(tree)
+        nodes["c"].insert_child(0, nodes["g"])
+        self.check_iterators(tree)
+        nodes["b"].set_child_nodes(reversed(nodes["b"].child_nodes()))
+        self.check_iterators(tree)
+        tree.ladderize()
+        self.check_iterators(tree)
+        tree.reseed_at(nodes["c"], suppress_unifurcations=False)
+        self.assertIs(tree.seed_node, nodes["c"])
+        self.check_iterators(tree)
+        tree.prune_nodes([nodes["x"], nodes["k"]])
+        self.check_iterators(tree)
+        tree.seed_node = nodes["b"]
+        self.check_iterators(tree)
+
+    def test_changes_to_other_trees(self):
+        tree1, anodes, lnodes, inodes = self.get_tree()
+        tree2, anodes, lnodes, inodes = self.get_tree()
+        tree1.nodes()
+        node_order = tree1._get_node_order(False)
+        self.assertIsNot(node_order, None)
+        nodes2 = dict((nd.label, nd) for nd in tree2)
+        nodes2["x"] = nodes2["i"].new_child(label="x")
+        nodes2["c"].remove_child(nodes2["g"])
+        tree2.ladderize()
+        tree2.reseed_at(nodes2["c"], suppress_unifurcations=False)
+        self.check_iterators(tree2)
+        self.assertIs(tree1._get_node_order(False), node_order)
+        self.check_iterators(tree1)
+        # moving a node to the other tree changes both
+        nodes1 = dict((nd.label, nd) for nd in tree1)
+        node_order = tree1._get_node_order(False)
+        nodes1["k"].parent_node = nodes2["x"]
+        self.assertIsNot(tree1._get_node_order(False), node_order)
+        self.check_iterators(tree1)
+        self.check_iterators(tree2)
+        # as do changes to a subtree added to the tree
+        subtree = dendropy.Node(label="y")
+        subtree.new_child(label="z")
+        nodes1["i"].add_child(subtree)
+        self.check_iterators(tree1)
+        subtree.child_nodes()[0].new_child(label="w")
+        self.check_iterators(tree1)
+
+    def test_changes_during_iteration(self):
+        for iter_name, node_iter_name, change_idx in (
+                ("preorder_node_iter", "preorder_iter", 0),
+                ("preorder_node_iter", "preorder_iter", 3),
+                ("postorder_node_iter", "postorder_iter", 0),
+                ("postorder_node_iter", "postorder_iter", 6),
+                ("leaf_node_iter", "leaf_iter", 1),
+                ):
+            visited = []
+            for is_cached in (True, False):
+                tree, anodes, lnodes, inodes = self.get_tree()
+                tree.nodes() # cache populated on next traversal
+                if is_cached:
+                    nodes = getattr(tree, iter_name)()
+                else:
+                    nodes = getattr(tree.seed_node, node_iter_name)()
+                labels = []
+                for idx, nd in enumerate(nodes):
+                    labels.append(nd.label)
+                    if idx == change_idx:
+                        nd.new_child(label="x")
+                        tree.find_node_with_label("l").new_child(label="y")
+                        tree.find_node_with_label("f").parent_node.remove_child(tree.find_node_with_label("f"))
+                visited.append(labels)
+            self.assertEqual(visited[0], visited[1])
+
+    def test_cache_built_on_repeated_traversal(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        self.assertEqual(tree.length(), sum(self.node_edge_lengths.values()))
+        self.assertIs(tree._node_orders[4], None)
+        self.assertEqual(len(tree.leaf_nodes()), len(lnodes))
+        self.assertIsNot(tree._node_orders[4], None)
+        self.assertIs(tree._node_orders[3], None)
+        tree.clear_traversal_cache()
+        self.assertIs(tree._node_orders, None)
+        tree.seed_node.new_child(label="x")
+        tree.nodes()
+        self.assertIs(tree._node_orders[3], None)
+        self.check_iterators(tree)
+
+    def test_cache_cleared_by_tree_list_operations(self):
+        tree, anodes, lnodes, inodes = self.get_tree(suppress_leaf_node_taxa=False)
+        tree_list = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+        tree.nodes()
+        tree.nodes()
+        self.assertIsNot(tree._node_orders[3], None)
+        tree_list.split_distribution()
+        self.assertIs(tree._node_orders, None)
+        tree_list.as_tree_array()
+        self.assertIs(tree._node_orders, None)
+
+    def test_copying(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        tree.nodes()
+        for tree2 in (copy.deepcopy(tree), pickle.loads(pickle.dumps(tree))):
+            self.assertIs(tree2._node_orders, None)
+            self.assertEqual([nd.label for nd in tree2], [nd.label for nd in tree])
+            self.assertTrue(set(tree2.nodes()).isdisjoint(tree.nodes()))
+
 class TreeRootingState(dendropytest.ExtendedTestCase):
 
     def test_is_rooted(self):
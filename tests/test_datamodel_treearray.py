@@ -20,6 +20,8 @@
 import unittest
 import os
 import sys
+import shutil
+import tempfile
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
 import dendropy
@@ -58,6 +60,78 @@ class TreeArrayBasicTreeAccession(unittest.TestCase):
             tree_array.add_tree(tree)
         self.verify_tree_array(tree_array, trees)
 
+    def check_read_from_files_in_parallel(self, path, schema, tree_offset):
+        tree_array1 = dendropy.TreeArray(is_rooted_trees=True)
+        tree_array1.read_from_files(
+                files=[path],
+                schema=schema,
+                rooting="force-rooted",
+                tree_offset=tree_offset)
+        tree_array2 = dendropy.TreeArray(is_rooted_trees=True)
+        tree_array2.read_from_files(
+                files=[path],
+                schema=schema,
+                rooting="force-rooted",
+                tree_offset=tree_offset,
+                num_processes=2)
+        self.assertEqual(len(tree_array1), len(tree_array2))
+        self.assertEqual(
+                tree_array1.taxon_namespace.labels(),
+                tree_array2.taxon_namespace.labels())
+        for idx in range(len(tree_array1)):
+            self.assertEqual(
+                    tree_array1.get_split_bitmask_and_edge_tuple(idx),
+                    tree_array2.get_split_bitmask_and_edge_tuple(idx))
+        self.assertEqual(
+                tree_array1.split_distribution.split_counts,
+                tree_array2.split_distribution.split_counts)
+        return tree_array1
+
+    def test_read_from_files_in_parallel(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.reference-trees.newick", "newick"),
+                ):
+            path = pathmap.tree_source_path(filename)
+            for tree_offset in (0, 3):
+                self.check_read_from_files_in_parallel(path, schema, tree_offset)
+
+    def test_read_from_files_in_parallel_with_accession_gaps(self):
+        path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        split_counts = []
+        for num_processes in (1, 2):
+            # taxa of the namespace not at the accession indexes of their
+            # positions in the namespace
+            taxon_namespace = dendropy.TaxonNamespace(["x", "Python regius"])
+            taxon_namespace.remove_taxon_label("x")
+            tree_array = dendropy.TreeArray(taxon_namespace=taxon_namespace)
+            tree_array.read_from_files(
+                    files=[path],
+                    schema="nexus",
+                    tree_offset=3,
+                    num_processes=num_processes)
+            self.assertIs(tree_array.taxon_namespace, taxon_namespace)
+            split_counts.append(tree_array.split_distribution.split_counts)
+        self.assertEqual(split_counts[0], split_counts[1])
+
+    def test_read_multiple_tree_blocks_in_parallel(self):
+        trees = self.get_trees()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "trees.nex")
+            with open(path, "w") as dest:
+                trees.taxon_namespace.write_to_stream(dest, "nexus")
+                for tree_block in (trees[:4], trees[4:10]):
+                    dest.write("BEGIN TREES;\n")
+                    for tree in tree_block:
+                        dest.write("    TREE t = {}\n".format(
+                            tree.as_string("newick", suppress_rooting=True).strip()))
+                    dest.write("END;\n")
+            for tree_offset in (0, 1, 3, 4, 6):
+                tree_array = self.check_read_from_files_in_parallel(path, "nexus", tree_offset)
+                self.assertEqual(len(tree_array), 10 - tree_offset)
+        finally:
+            shutil.rmtree(temp_dir)
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,6 +29,7 @@ from support import pathmap
 from dendropy.calculate import treemeasure
 from dendropy.calculate import probability
 from dendropy.calculate import combinatorics
+from dendropy.calculate import phylogeneticdistance
 
 class PhylogeneticDistanceMatrixCloneTest(unittest.TestCase):
 
@@ -45,12 +46,13 @@ class PhylogeneticDistanceMatrixCloneTest(unittest.TestCase):
         for src, dest in (
                     (pdm0._taxon_phylogenetic_distances, pdm1._taxon_phylogenetic_distances,),
                     (pdm0._taxon_phylogenetic_path_steps, pdm1._taxon_phylogenetic_path_steps,),
-                    (pdm0._mrca, pdm1._mrca,),
                 ):
             self.assertIsNot(src, dest)
             for t1 in src:
                 self.assertIn(t1, dest)
                 self.assertIsNot(src[t1], dest[t1])
+        self.assertIsNot(pdm0._taxon_mrca_nodes, pdm1._taxon_mrca_nodes)
+        self.assertEqual(pdm0._taxon_mrca_nodes, pdm1._taxon_mrca_nodes)
         for t1 in self.tree.taxon_namespace:
             for t2 in self.tree.taxon_namespace:
                 self.assertEqual(pdm0.patristic_distance(t1, t2), pdm1.patristic_distance(t1, t2))
@@ -857,6 +859,90 @@ class NodeToNodeDistancesTest(unittest.TestCase):
                     #     obs_mrca.edge.bipartition.leafset_bitmask))
                     self.assertIs(exp_mrca, obs_mrca)
 
+class MrcaIndexTest(unittest.TestCase):
+
+    def get_tree(self, tree_filename):
+        return dendropy.Tree.get_from_path(
+                src=pathmap.tree_source_path(tree_filename),
+                schema='newick',
+                rooting="force-rooted")
+
+    def test_node_queries(self):
+        for tree_filename in ("hiv1.newick", "pythonidae.mle.numbered-nodes.newick"):
+            tree = self.get_tree(tree_filename)
+            ndm = tree.node_distance_matrix()
+            mrca_index = tree.mrca_index()
+            self.assertIs(mrca_index.seed_node, tree.seed_node)
+            nodes = tree.nodes()
+            for nd1 in nodes:
+                self.assertEqual(mrca_index.depth(nd1), len(list(nd1.ancestor_iter())))
+                self.assertAlmostEqual(mrca_index.distance_from_root(nd1), nd1.distance_from_root())
+                ancestors = set(nd1.ancestor_iter(inclusive=True))
+                for nd2 in nodes:
+                    exp_mrca = nd2
+                    while exp_mrca not in ancestors:
+                        exp_mrca = exp_mrca.parent_node
+                    self.assertIs(mrca_index.mrca(nd1, nd2), exp_mrca)
+                    self.assertIs(ndm.mrca(nd1, nd2), exp_mrca)
+                    self.assertAlmostEqual(mrca_index.patristic_distance(nd1, nd2), ndm.patristic_distance(nd1, nd2))
+                    self.assertEqual(mrca_index.path_edge_count(nd1, nd2), ndm.path_edge_count(nd1, nd2))
+            leaves = tree.leaf_nodes()
+            self.assertIs(mrca_index.mrca(*leaves), tree.seed_node)
+            self.assertIs(mrca_index.mrca(leaves[0]), leaves[0])
+            with self.assertRaises(KeyError):
+                mrca_index.mrca(leaves[0], dendropy.Node())
+
+    def test_taxa_queries(self):
+        tree = self.get_tree("pythonidae.mle.numbered-nodes.newick")
+        tree.encode_bipartitions()
+        mrca_index = tree.mrca_index()
+        taxa = [nd.taxon for nd in tree.leaf_node_iter()]
+        for idx1, taxon1 in enumerate(taxa):
+            for taxon2 in taxa[idx1:idx1+7]:
+                exp_mrca = tree.mrca(leafset_bitmask=tree.taxon_namespace.taxa_bitmask(taxa=[taxon1, taxon2]))
+                self.assertIs(mrca_index.mrca(taxa=[taxon1, taxon2]), exp_mrca)
+                self.assertIs(tree.mrca(taxa=[taxon1, taxon2]), exp_mrca)
+                self.assertIs(tree.mrca(taxa=[taxon1, taxon2], start_node=exp_mrca), exp_mrca)
+                if exp_mrca._child_nodes:
+                    self.assertIs(tree.mrca(taxa=[taxon1, taxon2], start_node=exp_mrca._child_nodes[0]), None)
+        self.assertIs(mrca_index.mrca(taxa=[taxa[0], dendropy.Taxon("x")]), None)
+        pdm = tree.phylogenetic_distance_matrix()
+        for taxon1 in taxa[:10]:
+            for taxon2 in taxa:
+                self.assertIs(pdm.mrca(taxon1, taxon2), mrca_index.mrca(taxa=[taxon1, taxon2]))
+
+    def test_tree_mrca_after_changes(self):
+        tree = dendropy.Tree.get(data="[&R] (A,(B,(C,(D,E))));", schema="newick")
+        self.assertEqual(tree.mrca(taxon_labels=["C", "E"]).leaf_nodes()[0].taxon.label, "C")
+        nodes = dict((nd.taxon.label, nd) for nd in tree.leaf_node_iter())
+        self.assertIs(tree.mrca(taxon_labels=["A", "E"]), tree.seed_node)
+        # reassigning taxa is not tracked
+        nodes["A"].taxon, nodes["D"].taxon = nodes["D"].taxon, nodes["A"].taxon
+        self.assertIs(tree.mrca(taxon_labels=["A", "E"], is_bipartitions_updated=False), nodes["E"].parent_node)
+        # but restructuring the tree is
+        nodes["E"].parent_node.remove_child(nodes["E"])
+        nodes["C"].parent_node.add_child(nodes["E"])
+        self.assertIs(tree.mrca(taxon_labels=["C", "E"]), nodes["C"].parent_node)
+        self.assertIs(tree.mrca(taxon_labels=["B", "E"]), nodes["B"].parent_node)
+
+    def test_tree_mrca_with_changes_to_other_trees(self):
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.random.bd0301.tre"),
+                schema="nexus")[:10]
+        for tree in trees:
+            tree.encode_bipartitions()
+        bipartition_encodings = [tree.bipartition_encoding for tree in trees]
+        for tree_idx, tree in enumerate(trees):
+            # changes to the trees before this one
+            for other_tree in trees[:tree_idx]:
+                other_tree.reroot_at_edge(other_tree.leaf_nodes()[0].edge)
+            taxa = [nd.taxon for nd in tree.leaf_node_iter()][:3]
+            self.assertIs(tree.mrca(taxa=taxa), tree.mrca_index().mrca(taxa=taxa))
+            # not re-encoded, nor indexed
+            self.assertIs(tree.bipartition_encoding, bipartition_encodings[tree_idx])
+            for value in vars(tree).values():
+                self.assertNotIsInstance(value, phylogeneticdistance.MrcaIndex)
+
 class PhylogeneticPathTest(unittest.TestCase):
 
     def test1(self):
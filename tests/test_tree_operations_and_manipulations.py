@@ -23,6 +23,8 @@ Tests native tree structuring routines.
 
 import os
 import sys
+import copy
+import random
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 import unittest
@@ -914,6 +916,144 @@ class TestStructureExtraction(
                 taxon_namespace=source_tree1.taxon_namespace)
         self.assertEqual(treecompare.unweighted_robinson_foulds_distance(extracted_tree, expected_tree), 0.0)
 
+class IncrementalBipartitionUpdateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.nexus"),
+                schema="nexus")
+        self.rng = random.Random(1)
+
+    def check_bipartitions(self, tree, ref_tree):
+        encoded_bipartition_ids = set(id(b) for b in tree.bipartition_encoding)
+        self.assertEqual(len(encoded_bipartition_ids), len(tree.bipartition_encoding))
+        for nd, ref_nd in zip(tree.preorder_node_iter(), ref_tree.preorder_node_iter()):
+            bipartition = nd.edge.bipartition
+            ref_bipartition = ref_nd.edge.bipartition
+            self.assertIn(id(bipartition), encoded_bipartition_ids)
+            encoded_bipartition_ids.remove(id(bipartition))
+            self.assertEqual(bipartition.split_bitmask, ref_bipartition.split_bitmask)
+            self.assertEqual(bipartition.leafset_bitmask, ref_bipartition.leafset_bitmask)
+            self.assertEqual(bipartition.tree_leafset_bitmask, ref_bipartition.tree_leafset_bitmask)
+            self.assertEqual(bipartition.is_rooted, ref_bipartition.is_rooted)
+            self.assertFalse(bipartition.is_mutable)
+        self.assertEqual(len(encoded_bipartition_ids), 0)
+        self.assertEqual(set(tree.split_bitmask_edge_map), set(ref_tree.split_bitmask_edge_map))
+        for split_bitmask, edge in tree.split_bitmask_edge_map.items():
+            self.assertEqual(edge.bipartition.split_bitmask, split_bitmask)
+        for bipartition, edge in tree.bipartition_edge_map.items():
+            self.assertEqual(edge.bipartition, bipartition)
+
+    def check_operation(self, operation, is_rooted_values=(False, True)):
+        for is_rooted in is_rooted_values:
+            for tree in self.trees:
+                tree = copy.copy(tree)
+                tree.is_rooted = is_rooted
+                tree.encode_bipartitions()
+                tree.split_bitmask_edge_map
+                # not current on the copy: fully re-encoded
+                ref_tree = copy.copy(tree)
+                self.assertFalse(ref_tree._is_bipartition_encoding_current())
+                node_idx = self.rng.randrange(1, len(tree.nodes()))
+                for t in (tree, ref_tree):
+                    operation(t, list(t.preorder_node_iter())[node_idx])
+                self.assertTrue(tree._is_bipartition_encoding_current())
+                self.assertEqual(tree.as_string("newick"), ref_tree.as_string("newick"))
+                self.check_bipartitions(tree, ref_tree)
+
+    def test_reseed_at(self):
+        self.check_operation(lambda tree, nd: tree.reseed_at(nd, update_bipartitions=True))
+
+    def test_to_outgroup_position(self):
+        self.check_operation(lambda tree, nd: tree.to_outgroup_position(nd, update_bipartitions=True))
+
+    def test_reroot_at_node(self):
+        self.check_operation(lambda tree, nd: tree.reroot_at_node(nd, update_bipartitions=True))
+
+    def test_reroot_at_edge(self):
+        self.check_operation(lambda tree, nd: tree.reroot_at_edge(nd.edge,
+                length1=0.25,
+                length2=0.5,
+                update_bipartitions=True))
+
+    def test_repeated_rerooting(self):
+        for tree in self.trees:
+            tree.reroot_at_node(tree.seed_node, update_bipartitions=True)
+            tree.split_bitmask_edge_map
+            nodes = list(tree.postorder_node_iter())
+            for nd in self.rng.sample(nodes, 10):
+                tree.reroot_at_node(nd, update_bipartitions=True)
+                self.assertTrue(tree._is_bipartition_encoding_current())
+                ref_tree = copy.copy(tree)
+                ref_tree.encode_bipartitions()
+                self.check_bipartitions(tree, ref_tree)
+
+    def test_rerooting_tree_list(self):
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.nexus"),
+                schema="nexus")
+        num_encodings = [0]
+        def _counted(encode_bipartitions):
+            def _encode_bipartitions(*args, **kwargs):
+                num_encodings[0] += 1
+                return encode_bipartitions(*args, **kwargs)
+            return _encode_bipartitions
+        for tree in trees:
+            tree.encode_bipartitions()
+            tree.encode_bipartitions = _counted(tree.encode_bipartitions)
+        for rerooting_pass in range(2):
+            for tree in trees:
+                nd = self.rng.choice(tree.internal_nodes(exclude_seed_node=True))
+                tree.reroot_at_node(nd, update_bipartitions=True)
+                self.assertTrue(tree._is_bipartition_encoding_current())
+        # only updated incrementally: rerooting a tree does not change the
+        # structure of the others
+        self.assertEqual(num_encodings[0], 0)
+        for tree in trees:
+            del tree.encode_bipartitions
+            ref_tree = copy.copy(tree)
+            ref_tree.encode_bipartitions()
+            self.check_bipartitions(tree, ref_tree)
+
+    def test_reroot_at_midpoint(self):
+        for tree in self.trees:
+            tree.encode_bipartitions()
+            tree.reroot_at_midpoint(update_bipartitions=True)
+            self.assertTrue(tree._is_bipartition_encoding_current())
+            ref_tree = copy.copy(tree)
+            ref_tree.encode_bipartitions()
+            self.check_bipartitions(tree, ref_tree)
+
+    def test_prune_subtree(self):
+        self.check_operation(lambda tree, nd: tree.prune_subtree(nd, update_bipartitions=True))
+
+    def test_prune_taxa(self):
+        self.check_operation(lambda tree, nd: tree.prune_taxa(
+                [leaf.taxon for leaf in nd.leaf_iter()],
+                update_bipartitions=True))
+
+    def test_retain_taxa(self):
+        self.check_operation(lambda tree, nd: tree.retain_taxa(
+                [leaf.taxon for leaf in nd.leaf_iter()] + [tree.taxon_namespace[0]],
+                update_bipartitions=True))
+
+    def test_collapse_basal_bifurcation(self):
+        def _collapse_basal_bifurcation(tree, nd):
+            tree.reroot_at_edge(nd.edge, update_bipartitions=True)
+            tree.collapse_basal_bifurcation(update_bipartitions=True)
+        self.check_operation(_collapse_basal_bifurcation)
+
+    def test_changes_not_tracked(self):
+        for tree in self.trees:
+            tree.encode_bipartitions()
+            nd = tree.seed_node._child_nodes[0]
+            tree.seed_node.remove_child(nd)
+            self.assertFalse(tree._is_bipartition_encoding_current())
+            tree.reroot_at_node(tree.seed_node._child_nodes[0], update_bipartitions=True)
+            ref_tree = copy.copy(tree)
+            ref_tree.encode_bipartitions()
+            self.check_bipartitions(tree, ref_tree)
+
 class TreeRestructuring(dendropytest.ExtendedTestCase):
 
     def test_collapse_basal_bifurcation(self):